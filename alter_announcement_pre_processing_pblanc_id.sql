@@ -0,0 +1,39 @@
+-- announcement_pre_processing에 pblanc_id 컬럼 추가 (PBLN ID 중복 체크용)
+-- 기존: (origin_url LIKE '%PBLN_xxx%' OR scraping_url LIKE '%PBLN_xxx%') → 매 폴더마다 전체 테이블 스캔
+-- 변경: pblanc_id = 'PBLN_xxx' 인덱스 동등 조회
+--
+-- - announcement_pre_processor.py의 extract_pblanc_id()와 동일한 규칙
+--   (origin_url 우선, 없으면 scraping_url에서 'pblancId=PBLN_숫자' 추출)
+-- - STORED GENERATED COLUMN이므로 ALTER 시 기존 레코드가 자동으로 백필되고,
+--   이후 INSERT/UPDATE에서도 애플리케이션 변경 없이 값이 유지됨 (url_key_hash와 동일 방식)
+-- - MySQL 8.0 이상 필요 (REGEXP_SUBSTR)
+-- - 대용량 테이블은 테이블 재구성이 발생하므로 트래픽이 적은 시간에 실행 권장
+
+-- 1. 컬럼 추가 (기존 레코드 백필 포함)
+ALTER TABLE announcement_pre_processing
+    ADD COLUMN pblanc_id VARCHAR(30) GENERATED ALWAYS AS (
+        COALESCE(
+            REGEXP_SUBSTR(REGEXP_SUBSTR(origin_url, 'pblancId=PBLN_[0-9]+', 1, 1, 'c'), 'PBLN_[0-9]+'),
+            REGEXP_SUBSTR(REGEXP_SUBSTR(scraping_url, 'pblancId=PBLN_[0-9]+', 1, 1, 'c'), 'PBLN_[0-9]+')
+        )
+    ) STORED AFTER scraping_url;
+
+-- 2. 인덱스 추가 (PBLN ID → 사이트별 레코드 조회)
+ALTER TABLE announcement_pre_processing
+    ADD INDEX idx_pblanc_id (pblanc_id, site_code);
+
+-- 백필 결과 확인
+SELECT
+    site_code,
+    COUNT(*) AS total_records,
+    COUNT(pblanc_id) AS with_pblanc_id
+FROM announcement_pre_processing
+WHERE site_code IN ('bizInfo', 'smes24', 'kStartUp')
+GROUP BY site_code;
+
+-- 인덱스 사용 확인 (type=ref, key=idx_pblanc_id 이어야 함)
+EXPLAIN
+SELECT id, site_code
+FROM announcement_pre_processing
+WHERE pblanc_id = 'PBLN_000000000000000'
+AND site_code IN ('bizInfo', 'smes24', 'kStartUp');
@@ -0,0 +1,21 @@
+-- eminwon_url_registry에 조건부 요청(HTTP 캐시) 컬럼 추가
+-- 기존: 재확인 시 상세 페이지를 항상 다시 받아 파싱/저장/DB 갱신
+-- 변경: ETag / Last-Modified로 조건부 요청(304), 응답 본문 해시가 같으면 파싱 이후 단계 생략
+--
+-- - etag, last_modified: 서버 응답 헤더 원문 그대로 저장 (If-None-Match / If-Modified-Since로 재전송)
+-- - response_hash: 응답 본문(바이트) SHA-256
+--   content_hash는 content.md 기준이라 파싱 전에는 비교할 수 없으므로 별도 컬럼으로 관리
+-- - 컬럼이 없으면 eminwon_incremental_crawler.py는 기존 방식(무조건 재다운로드)으로 동작
+
+ALTER TABLE eminwon_url_registry
+    ADD COLUMN etag VARCHAR(255) NULL AFTER content_hash,
+    ADD COLUMN last_modified VARCHAR(64) NULL AFTER etag,
+    ADD COLUMN response_hash CHAR(64) NULL AFTER last_modified;
+
+-- 확인
+SELECT
+    COUNT(*) AS total_urls,
+    COUNT(etag) AS with_etag,
+    COUNT(last_modified) AS with_last_modified,
+    COUNT(response_hash) AS with_response_hash
+FROM eminwon_url_registry;
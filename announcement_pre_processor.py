@@ -12,15 +12,20 @@
 
 import sys
 import argparse
+import hashlib
 import json
+import multiprocessing
 import os
 import re
 import sys
 import time
 import unicodedata
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 # 프로젝트 루트를 Python path에 추가
 project_root = Path(__file__).parent
@@ -31,13 +36,257 @@ from src.config.config import ConfigManager
 from src.config.logConfig import setup_logging
 
 from src.models.announcementPrvDatabase import AnnouncementPrvDatabaseManager
+from src.utils.contentHeaderParser import (
+    extract_announcement_date,
+    extract_origin_url,
+    extract_scraping_url,
+    extract_title,
+    parse_content_header,
+    read_content_header,
+)
+from src.utils.directoryScanner import DirectoryScanner
 from src.utils.domainKeyExtractor import DomainKeyExtractor
+from src.utils.keywordSnapshot import ExclusionKeywordSnapshot, get_exclusion_snapshot
 # should_exclude_file, calculate_file_score는 더 이상 사용하지 않음 (규칙 기반 시스템으로 대체됨)
 
 logger = setup_logging(__name__)
 
 config = ConfigManager().get_config()
 
+# 프로세스 풀 모드(--workers N)에서 워커 프로세스별로 설정되는 전역 상태
+# - _db_write_lock: 모든 워커가 공유하는 DB 쓰기 락 (중복 체크 → UPSERT 구간 직렬화)
+# - _worker_processor: 워커 프로세스 전용 AnnouncementPreProcessor 인스턴스
+_db_write_lock = None
+_worker_processor = None
+
+# API 사이트 중복 판단 우선순위: bizInfo(1) > smes24(2) > kStartUp(3)
+_API_SITE_PRIORITY = {"bizInfo": 1, "smes24": 2, "kStartUp": 3}
+
+
+def _dedup_lookup_key(value: str) -> str:
+    """일괄 조회 결과 매칭용 키 (MySQL _ci 콜레이션처럼 대소문자/후행 공백 무시)."""
+    return value.rstrip().lower()
+
+
+def _url_key_hash(url_key: Optional[str]) -> Optional[str]:
+    """url_key_hash 생성 컬럼(md5(url_key))과 같은 값을 계산합니다."""
+    return hashlib.md5(url_key.encode()).hexdigest() if url_key else None
+
+
+def _duplicate_rank(row) -> tuple:
+    """중복 레코드 우선순위 정렬 키 (API 사이트 우선순위, 먼저 등록된 것 우선)."""
+    return (_API_SITE_PRIORITY.get(row.site_code, 99), row.created_at or datetime.min)
+
+
+_PBLANC_ID_PATTERN = re.compile(r"pblancId=(PBLN_\d+)")
+
+
+def _extract_pblanc_id(url: Optional[str]) -> Optional[str]:
+    """bizinfo.go.kr URL에서 pblancId(PBLN_xxx)를 추출합니다."""
+    if not url:
+        return None
+    match = _PBLANC_ID_PATTERN.search(url)
+    return match.group(1) if match else None
+
+
+def _tuple_in_clause(
+    columns: Tuple[str, ...], rows: List[Tuple[Any, ...]], prefix: str
+) -> Tuple[str, Dict[str, Any]]:
+    """(col1, col2) IN ((:p0_0, :p0_1), ...) 조건문과 바인딩 파라미터를 만듭니다."""
+    placeholders = []
+    params = {}
+    for i, values in enumerate(rows):
+        names = []
+        for j, value in enumerate(values):
+            name = f"{prefix}{i}_{j}"
+            params[name] = value
+            names.append(f":{name}")
+        placeholders.append(f"({', '.join(names)})")
+    return f"({', '.join(columns)}) IN ({', '.join(placeholders)})", params
+
+
+# 배치 기록 시 UPSERT 한 번(executemany → 다중 행 INSERT)에 담는 최대 행 수
+_UPSERT_CHUNK_SIZE = 100
+
+# 일반 INSERT with UPSERT (중복 처리)
+# created_at/updated_at은 컬럼 기본값(CURRENT_TIMESTAMP)을 사용합니다.
+# VALUES (...)에는 플레이스홀더만 둡니다 (NOW() 등 식이 있으면 pymysql executemany가 다중 행 INSERT로 묶지 않고 건별 실행).
+_UPSERT_SQL = """
+    INSERT INTO announcement_pre_processing (
+        folder_name, folder_path, site_type, site_code, content_md, combined_content,
+        attachment_filenames, attachment_files_list, exclusion_keyword, exclusion_reason,
+        title, origin_url, url_key, scraping_url, announcement_date,
+        processing_status, error_message
+    ) VALUES (
+        :folder_name, :folder_path, :site_type, :site_code, :content_md, :combined_content,
+        :attachment_filenames, :attachment_files_list, :exclusion_keyword, :exclusion_reason,
+        :title, :origin_url, :url_key, :scraping_url, :announcement_date,
+        :processing_status, :error_message
+    )
+    ON DUPLICATE KEY UPDATE
+        folder_name = VALUES(folder_name),
+        folder_path = VALUES(folder_path),
+        site_type = VALUES(site_type),
+        site_code = VALUES(site_code),
+        content_md = VALUES(content_md),
+        combined_content = VALUES(combined_content),
+        attachment_filenames = VALUES(attachment_filenames),
+        attachment_files_list = VALUES(attachment_files_list),
+        exclusion_keyword = VALUES(exclusion_keyword),
+        exclusion_reason = VALUES(exclusion_reason),
+        title = VALUES(title),
+        origin_url = VALUES(origin_url),
+        url_key = VALUES(url_key),
+        scraping_url = VALUES(scraping_url),
+        announcement_date = VALUES(announcement_date),
+        processing_status = VALUES(processing_status),
+        error_message = VALUES(error_message),
+        updated_at = NOW()
+"""
+
+# force: UPSERT 로직 with site_type 우선순위 (지자체 > API), 기본값 컬럼은 _UPSERT_SQL과 동일
+_FORCE_UPSERT_SQL = """
+    INSERT INTO announcement_pre_processing (
+        folder_name, folder_path, site_type, site_code, content_md, combined_content,
+        attachment_filenames, attachment_files_list, exclusion_keyword, exclusion_reason,
+        title, origin_url, url_key, scraping_url, announcement_date,
+        processing_status, error_message
+    ) VALUES (
+        :folder_name, :folder_path, :site_type, :site_code, :content_md, :combined_content,
+        :attachment_filenames, :attachment_files_list, :exclusion_keyword, :exclusion_reason,
+        :title, :origin_url, :url_key, :scraping_url, :announcement_date,
+        :processing_status, :error_message
+    )
+    ON DUPLICATE KEY UPDATE
+        folder_path = IF(
+            VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
+            site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
+            VALUES(folder_path),
+            folder_path
+        ),
+        site_type = IF(
+            VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
+            site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
+            VALUES(site_type),
+            site_type
+        ),
+        content_md = IF(
+            VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
+            site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
+            VALUES(content_md),
+            content_md
+        ),
+        combined_content = IF(
+            VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
+            site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
+            VALUES(combined_content),
+            combined_content
+        ),
+        attachment_filenames = IF(
+            VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
+            site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
+            VALUES(attachment_filenames),
+            attachment_filenames
+        ),
+        attachment_files_list = IF(
+            VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
+            site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
+            VALUES(attachment_files_list),
+            attachment_files_list
+        ),
+        exclusion_keyword = IF(
+            VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
+            site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
+            VALUES(exclusion_keyword),
+            exclusion_keyword
+        ),
+        exclusion_reason = IF(
+            VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
+            site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
+            VALUES(exclusion_reason),
+            exclusion_reason
+        ),
+        processing_status = IF(
+            VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
+            site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
+            VALUES(processing_status),
+            processing_status
+        ),
+        title = IF(
+            VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
+            site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
+            VALUES(title),
+            title
+        ),
+        origin_url = IF(
+            VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
+            site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
+            VALUES(origin_url),
+            origin_url
+        ),
+        url_key = IF(
+            VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
+            site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
+            VALUES(url_key),
+            url_key
+        ),
+        scraping_url = IF(
+            VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
+            site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
+            VALUES(scraping_url),
+            scraping_url
+        ),
+        announcement_date = IF(
+            VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
+            site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
+            VALUES(announcement_date),
+            announcement_date
+        ),
+        error_message = IF(
+            VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
+            site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
+            VALUES(error_message),
+            error_message
+        ),
+        updated_at = NOW()
+"""
+
+# announcement_duplicate_log INSERT (중복 스킵 로그는 preprocessing_id가 NULL)
+# _UPSERT_SQL과 같이 VALUES (...)에는 플레이스홀더만 둡니다 (배치 기록 시 executemany).
+_DUPLICATE_LOG_SQL = """
+    INSERT INTO announcement_duplicate_log (
+        preprocessing_id,
+        existing_preprocessing_id,
+        duplicate_type,
+        url_key_hash,
+        new_site_type,
+        new_site_code,
+        existing_site_type,
+        existing_site_code,
+        new_priority,
+        existing_priority,
+        new_folder_name,
+        existing_folder_name,
+        duplicate_detail,
+        error_message
+    ) VALUES (
+        :preprocessing_id,
+        :existing_preprocessing_id,
+        :duplicate_type,
+        :url_key_hash,
+        :new_site_type,
+        :new_site_code,
+        :existing_site_type,
+        :existing_site_code,
+        :new_priority,
+        :existing_priority,
+        :new_folder_name,
+        :existing_folder_name,
+        :duplicate_detail,
+        :error_message
+    )
+"""
+
 
 class AnnouncementPreProcessor:
     """공고 사전 처리 메인 클래스"""
@@ -48,6 +297,7 @@ class AnnouncementPreProcessor:
         attach_force: bool = False,
         site_code: str = None,
         lazy_init: bool = False,
+        write_batch_size: int = 0,
     ):
         # lazy_init 옵션이 True면 AttachmentProcessor를 나중에 초기화
         self._lazy_init = lazy_init
@@ -75,18 +325,26 @@ class AnnouncementPreProcessor:
             'port': db_url.port or 3306,
             'charset': 'utf8mb4'
         }
+        # domain_key_config는 첫 사용 시 한 번에 로드되고, 버전(행 수 + CRC32 합계)이
+        # 바뀐 경우에만 재로드되므로 인스턴스 생성 시 캐시를 비울 필요 없음
         self.url_key_extractor = DomainKeyExtractor(db_config=db_config)
 
-        # LRU 캐시 초기화 (domain_key_config 변경사항 즉시 반영)
-        # AnnouncementPreProcessor 인스턴스 생성 시마다 최신 domain_key_config를 로드
-        self.url_key_extractor.clear_cache()
-        logger.info("✅ DomainKeyExtractor LRU 캐시 초기화 완료 (domain_key_config 최신 반영)")
-
         # 데이터베이스 테이블 생성 (없는 경우)
         self._ensure_database_tables()
 
-        # 제외 키워드 로드
-        self.exclusion_keywords = self._load_exclusion_keywords()
+        # 제외 키워드 로드 (프로세스 공유 스냅샷)
+        self.exclusion_snapshot = self._load_exclusion_keywords()
+
+        # 사이트별 처리 완료 인덱스 {site_code: folder_name 집합 (_dedup_lookup_key로 정규화)}
+        # 실행 시작 시 사이트당 1회 조회하고, 저장 후 증분 갱신하여 건너뛰기 판단에 사용
+        self._processed_index = {}
+
+        # pblanc_id 컬럼 존재 여부 (None: 미확인, 첫 PBLN ID 조회 시 확인)
+        self._pblanc_id_column_available = None
+
+        # 배치 저장 모드 (0이면 폴더마다 즉시 저장/커밋)
+        self.write_batch_size = write_batch_size
+        self._pending_writes = []
 
     @property
     def attachment_processor(self):
@@ -154,38 +412,9 @@ class AnnouncementPreProcessor:
                 f"데이터베이스 초기화 실패: {e} - 계속 진행합니다 (DB 저장 불가)"
             )
 
-    def _load_exclusion_keywords(self) -> List[Dict[str, Any]]:
-        """데이터베이스에서 제외 키워드를 로드합니다."""
-        try:
-            from sqlalchemy import text
-
-            with self.db_manager.SessionLocal() as session:
-                result = session.execute(
-                    text(
-                        """
-                    SELECT EXCLUSION_ID, KEYWORD, DESCRIPTION
-                    FROM EXCLUSION_KEYWORDS
-                    WHERE IS_ACTIVE = TRUE
-                    ORDER BY EXCLUSION_ID
-                """
-                    )
-                )
-
-                keywords = []
-                for row in result:
-                    keywords.append(
-                        {"id": row[0], "keyword": row[1], "description": row[2]}
-                    )
-
-                if len(keywords) == 0:
-                    logger.error("⚠️ 제외 키워드가 0개 로드됨 - EXCLUSION_KEYWORDS 테이블 확인 필요")
-                else:
-                    logger.info(f"제외 키워드 로드 완료: {len(keywords)}개")
-                return keywords
-
-        except Exception as e:
-            logger.error(f"❌ 제외 키워드 로드 실패: {e} - 제외 키워드 체크가 작동하지 않습니다!")
-            return []
+    def _load_exclusion_keywords(self) -> ExclusionKeywordSnapshot:
+        """프로세스 공유 스냅샷에서 제외 키워드를 가져옵니다. (버전이 바뀐 경우에만 DB 재조회)"""
+        return get_exclusion_snapshot(self.db_manager.SessionLocal)
 
     def process_directory(self, directory_path: Path, site_code: str) -> bool:
         """
@@ -223,53 +452,15 @@ class AnnouncementPreProcessor:
             logger.error(f"사이트 디렉토리가 없음: {site_dir}")
             return []
 
-        target_directories = []
-
         # 모든 하위 디렉토리에서 content.md, JSON 파일 또는 attachments 폴더가 있는 디렉토리 찾기
         logger.info(f"디렉토리 검색 시작: {site_dir}")
 
-        # bizInfo, smes24, kStartUp은 플랫 구조 (직접 하위 디렉토리만 검색)
-        if site_code in ["bizInfo", "smes24", "kStartUp"]:
-            # 직접 하위 디렉토리만 검색 (더 빠름)
-            # 모든 API 사이트는 content.md가 반드시 있어야 함
-            for root_path in site_dir.iterdir():
-                if root_path.is_dir():
-                    has_content_md = (root_path / "content.md").exists()
-
-                    if has_content_md:
-                        # content.md가 있는 디렉토리만 처리
-                        target_directories.append(root_path)
-                        logger.debug(
-                            f"대상 디렉토리 발견: {root_path.relative_to(site_dir)}"
-                        )
-                    else:
-                        # content.md가 없는 디렉토리는 건너뛰기
-                        logger.debug(
-                            f"{site_code} 디렉토리 건너뛰기 (content.md 없음): {root_path.relative_to(site_dir)}"
-                        )
-        else:
-            # 다른 사이트는 재귀적으로 검색 (중첩 구조 가능)
-            for root_path in site_dir.rglob("*"):
-                if root_path.is_dir():
-                    # content.md 파일이 있거나 attachments 폴더가 있거나 JSON 파일이 있는 디렉토리만 대상으로 함
-                    has_content_md = (root_path / "content.md").exists()
-                    has_json = bool(list(root_path.glob("*.json")))
-                    # attachments 폴더 확인 최적화
-                    attachments_dir = root_path / "attachments"
-                    has_attachments = False
-                    if attachments_dir.exists():
-                        # 첫 번째 파일만 확인 (전체 디렉토리 순회 방지)
-                        try:
-                            next(attachments_dir.iterdir())
-                            has_attachments = True
-                        except StopIteration:
-                            has_attachments = False
-
-                    if has_content_md or has_attachments or has_json:
-                        target_directories.append(root_path)
-                        logger.debug(
-                            f"대상 디렉토리 발견: {root_path.relative_to(site_dir)}"
-                        )
+        # bizInfo, smes24, kStartUp은 플랫 구조 (직접 하위 디렉토리만 검색, content.md 필수)
+        # 다른 사이트는 재귀적으로 검색 (중첩 구조 가능)
+        # 이전 스캔 이후 변경되지 않은 디렉토리는 mtime 워터마크로 재조회 생략
+        target_directories = DirectoryScanner().scan(
+            site_dir, site_code, flat=site_code in ["bizInfo", "smes24", "kStartUp"]
+        )
 
         # 폴더명으로 정렬
         target_directories = sorted(target_directories, key=self._natural_sort_key)
@@ -280,9 +471,12 @@ class AnnouncementPreProcessor:
         if target_directories:
             logger.info(f"첫 5개 폴더: {[d.name for d in target_directories[:5]]}")
 
+        # 처리 완료 인덱스를 실행 시작 시점 기준으로 새로 구성 (사이트당 쿼리 1회)
+        processed_index = self._load_processed_index(site_code)
+
         # force 옵션이 없을 때만 이미 처리된 폴더 제외
         if not force:
-            processed_folders = set(self._get_processed_folders(site_code))
+            processed_folders = processed_index if processed_index is not None else set()
 
             filtered_directories = []
             for directory in target_directories:
@@ -292,7 +486,7 @@ class AnnouncementPreProcessor:
                     str(relative_path).replace("/", "_")
                 )
 
-                if folder_name not in processed_folders:
+                if _dedup_lookup_key(folder_name) not in processed_folders:
                     filtered_directories.append(directory)
                 else:
                     logger.debug(f"이미 처리된 폴더 건너뜀: {folder_name}")
@@ -309,8 +503,14 @@ class AnnouncementPreProcessor:
             )
             return target_directories
 
-    def _get_processed_folders(self, site_code: str) -> List[str]:
-        """이미 처리된 폴더 목록을 가져옵니다."""
+    def _load_processed_index(self, site_code: str) -> Optional[set]:
+        """
+        사이트의 처리 완료 인덱스(folder_name 집합)를 단일 쿼리로 DB에서 새로 읽어옵니다.
+
+        DB에는 _db_site_code(site_code)로 저장되어 있으므로 그 값으로 조회하고,
+        인덱스는 호출자의 site_code로 보관합니다.
+        조회 실패 시 인덱스를 만들지 않으며, 이후 체크는 건별 DB 조회로 폴백합니다.
+        """
         try:
             from sqlalchemy import text
 
@@ -318,22 +518,34 @@ class AnnouncementPreProcessor:
                 result = session.execute(
                     text(
                         """
-                    SELECT folder_name 
+                    SELECT folder_name
                     FROM announcement_pre_processing 
                     WHERE site_code = :site_code
                 """
                     ),
-                    {"site_code": site_code},
+                    {"site_code": self._db_site_code(site_code)},
                 )
 
-                return [row[0] for row in result]
+                # _ci 콜레이션 비교와 같도록 대소문자/후행 공백을 무시한 키로 보관
+                index = {_dedup_lookup_key(row.folder_name) for row in result}
+
+            self._processed_index[site_code] = index
+            logger.info(f"처리 완료 인덱스 로드: {site_code} (folder_name {len(index)}개)")
+            return index
 
         except Exception as e:
-            logger.error(f"처리된 폴더 목록 조회 실패: {e}")
-            return []
+            logger.error(f"처리 완료 인덱스 로드 실패 (건별 조회로 폴백): {e}")
+            self._processed_index.pop(site_code, None)
+            return None
+
+    def _register_processed(self, site_code: str, folder_name: str) -> None:
+        """저장된 레코드를 처리 완료 인덱스에 증분 반영합니다 (로드된 사이트만)."""
+        index = self._processed_index.get(site_code)
+        if index is not None:
+            index.add(_dedup_lookup_key(folder_name))
 
     def process_site_directories(
-        self, base_dir: Path, site_code: str, force: bool = False
+        self, base_dir: Path, site_code: str, force: bool = False, workers: int = 1
     ) -> Dict[str, int]:
         """
         특정 사이트의 모든 디렉토리를 처리합니다.
@@ -342,6 +554,7 @@ class AnnouncementPreProcessor:
             base_dir: 기본 디렉토리
             site_code: 사이트 코드
             force: 이미 처리된 항목도 다시 처리할지 여부
+            workers: 워커 프로세스 수 (2 이상이면 프로세스 풀로 병렬 처리)
 
         Returns:
             처리 결과 통계
@@ -367,6 +580,76 @@ class AnnouncementPreProcessor:
         # 시작 시간 기록
         start_time = time.time()
 
+        if workers > 1:
+            if self.write_batch_size > 0:
+                logger.warning("프로세스 풀 모드에서는 배치 저장을 사용하지 않습니다 (워커별 즉시 저장)")
+            self._process_directories_in_pool(
+                target_directories, site_dir, site_code, force, workers, results
+            )
+        else:
+            self._process_directories_sequentially(
+                target_directories, site_dir, site_code, force, results
+            )
+
+        # 종료 시간 및 통계 계산
+        end_time = time.time()
+        total_elapsed = end_time - start_time
+        processed_count = results["success"] + results["failed"]
+
+        print(f"\n{'='*60}")
+        print(
+            f"처리 완료: {results['success']}/{total_count} 성공 ({(results['success']/total_count)*100:.1f}%)"
+        )
+        print(f"건너뜀: {results['skipped']}, 실패: {results['failed']}")
+        print(f"")
+        print(f"📊 처리 시간 통계:")
+        print(f"   총 소요 시간: {total_elapsed:.1f}초 ({total_elapsed/60:.1f}분)")
+
+        if processed_count > 0:
+            avg_time_per_item = total_elapsed / processed_count
+            print(f"   처리한 항목당 평균 시간: {avg_time_per_item:.1f}초")
+
+        if results["success"] > 0:
+            avg_time_per_success = total_elapsed / results["success"]
+            print(f"   성공한 항목당 평균 시간: {avg_time_per_success:.1f}초")
+
+        if workers > 1 and results.get("item_time_total"):
+            print(f"   워커 수: {workers}개 (항목 처리 시간 합계: {results['item_time_total']:.1f}초)")
+
+        cache_stats = results.pop("cache_stats", None) or self.get_conversion_cache_stats()
+        if cache_stats and (cache_stats["hits"] or cache_stats["misses"]):
+            lookups = cache_stats["hits"] + cache_stats["misses"]
+            print(
+                f"   변환 캐시: 적중 {cache_stats['hits']}, 미스 {cache_stats['misses']} "
+                f"(적중률 {cache_stats['hits'] / lookups * 100:.1f}%)"
+            )
+
+        print(f"{'='*60}")
+
+        logger.info(
+            f"처리 완료 - 전체: {results['total']}, 성공: {results['success']}, 실패: {results['failed']}, 건너뜀: {results['skipped']}"
+        )
+
+        results.pop("item_time_total", None)
+        return results
+
+    def get_conversion_cache_stats(self) -> Optional[Dict[str, int]]:
+        """첨부파일 변환 캐시의 적중/미스 통계를 반환합니다 (AttachmentProcessor 미생성 시 None)."""
+        if self._attachment_processor is None:
+            return None
+        return self._attachment_processor.conversion_cache.get_stats()
+
+    def _process_directories_sequentially(
+        self,
+        target_directories: List[Path],
+        site_dir: Path,
+        site_code: str,
+        force: bool,
+        results: Dict[str, int],
+    ) -> None:
+        """대상 디렉토리를 현재 프로세스에서 하나씩 처리합니다."""
+        total_count = len(target_directories)
+
         for i, directory in enumerate(target_directories, 1):
             try:
                 # 개별 항목 시작 시간
@@ -410,35 +693,116 @@ class AnnouncementPreProcessor:
                 print(f"  ✗ 예외 발생: {str(e)[:100]}... ({error_elapsed:.1f}초)")
                 logger.error(f"처리 중 오류 ({directory}): {e}")
 
-        # 종료 시간 및 통계 계산
-        end_time = time.time()
-        total_elapsed = end_time - start_time
-        processed_count = results["success"] + results["failed"]
+            # 배치 저장 모드: 버퍼가 가득 차면 한 번에 기록
+            if self.write_batch_size > 0 and len(self._pending_writes) >= self.write_batch_size:
+                self._flush_pending_writes_into(results)
 
-        print(f"\n{'='*60}")
-        print(
-            f"처리 완료: {results['success']}/{total_count} 성공 ({(results['success']/total_count)*100:.1f}%)"
-        )
-        print(f"건너뜀: {results['skipped']}, 실패: {results['failed']}")
-        print(f"")
-        print(f"📊 처리 시간 통계:")
-        print(f"   총 소요 시간: {total_elapsed:.1f}초 ({total_elapsed/60:.1f}분)")
+        # 남은 배치 기록
+        self._flush_pending_writes_into(results)
 
-        if processed_count > 0:
-            avg_time_per_item = total_elapsed / processed_count
-            print(f"   처리한 항목당 평균 시간: {avg_time_per_item:.1f}초")
+    def _flush_pending_writes_into(self, results: Dict[str, int]) -> None:
+        """배치를 기록하고, 저장에 실패한 항목을 성공 → 실패로 다시 집계합니다."""
+        if not self._pending_writes:
+            return
 
-        if results["success"] > 0:
-            avg_time_per_success = total_elapsed / results["success"]
-            print(f"   성공한 항목당 평균 시간: {avg_time_per_success:.1f}초")
+        print(f"  💾 배치 저장: {len(self._pending_writes)}건")
+        failed_folders = self._flush_pending_writes()
 
-        print(f"{'='*60}")
+        for folder_name in failed_folders:
+            results["success"] -= 1
+            results["failed"] += 1
+            print(f"  ✗ 배치 저장 실패: {folder_name}")
 
-        logger.info(
-            f"처리 완료 - 전체: {results['total']}, 성공: {results['success']}, 실패: {results['failed']}, 건너뜀: {results['skipped']}"
-        )
+    def _process_directories_in_pool(
+        self,
+        target_directories: List[Path],
+        site_dir: Path,
+        site_code: str,
+        force: bool,
+        workers: int,
+        results: Dict[str, int],
+    ) -> None:
+        """
+        대상 디렉토리를 프로세스 풀로 병렬 처리합니다.
 
-        return results
+        첨부파일 변환(docling, hwp5, EasyOCR)은 CPU 바운드이므로 스레드가 아닌
+        프로세스로 분산합니다. 각 워커는 자체 AnnouncementPreProcessor를 한 번만
+        생성해 재사용하고, _save_processing_result는 공유 락으로 직렬화하여
+        중복 체크와 UPSERT 사이에 다른 워커가 끼어들지 않도록 합니다.
+        """
+        total_count = len(target_directories)
+
+        # 건너뛸 항목은 부모 프로세스에서 먼저 걸러냄 (순차 모드와 동일한 집계)
+        tasks = []
+        for directory in target_directories:
+            relative_path = directory.relative_to(site_dir)
+            folder_name = self._normalize_korean_text(
+                str(relative_path).replace("/", "_")
+            )
+
+            if not force and self._is_already_processed(folder_name, site_code):
+                print(f"  ✓ 이미 처리됨, 건너뜀: {folder_name}")
+                results["skipped"] += 1
+                continue
+
+            tasks.append((directory, folder_name))
+
+        if not tasks:
+            return
+
+        print(f"\n🚀 프로세스 풀 처리 시작: {len(tasks)}개 작업, {workers}개 워커")
+
+        # docling/torch 등은 fork 이후 안전하지 않으므로 spawn 컨텍스트 사용
+        mp_context = multiprocessing.get_context("spawn")
+        write_lock = mp_context.Lock()
+        results["item_time_total"] = 0.0
+        results["cache_stats"] = {"hits": 0, "misses": 0}
+        completed = results["skipped"]
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp_context,
+            initializer=_init_pool_worker,
+            initargs=(self.site_type, self.attach_force, site_code, write_lock),
+        ) as executor:
+            future_to_folder = {
+                executor.submit(
+                    _process_directory_in_worker, directory, site_code, folder_name, force
+                ): folder_name
+                for directory, folder_name in tasks
+            }
+
+            for future in as_completed(future_to_folder):
+                folder_name = future_to_folder[future]
+                completed += 1
+                progress_pct = (completed / total_count) * 100
+
+                try:
+                    success, item_elapsed, cache_delta = future.result()
+                    results["item_time_total"] += item_elapsed
+                    for stat_name in ("hits", "misses"):
+                        results["cache_stats"][stat_name] += cache_delta.get(stat_name, 0)
+
+                    if success:
+                        results["success"] += 1
+                        print(
+                            f"[{completed}/{total_count} : {progress_pct:.1f}%] "
+                            f"✓ {folder_name} ({item_elapsed:.1f}초)"
+                        )
+                    else:
+                        results["failed"] += 1
+                        print(
+                            f"[{completed}/{total_count} : {progress_pct:.1f}%] "
+                            f"✗ {folder_name} ({item_elapsed:.1f}초)"
+                        )
+
+                except Exception as e:
+                    results["failed"] += 1
+                    print(
+                        f"[{completed}/{total_count} : {progress_pct:.1f}%] "
+                        f"✗ {folder_name} - 예외 발생: {str(e)[:100]}..."
+                    )
+                    logger.error(f"워커 처리 중 오류 ({folder_name}): {e}")
 
     def process_directory_with_custom_name(
         self,
@@ -477,6 +841,7 @@ class AnnouncementPreProcessor:
 
             # 2. 특수 사이트 처리 (모두 content.md 읽기)
             content_md = ""
+            content_header = None
             title = None
             origin_url = None
             scraping_url = None
@@ -497,9 +862,10 @@ class AnnouncementPreProcessor:
                             return False
 
                         # content.md에서 기본 정보 추출
-                        title = self._extract_title_from_content(content_md)
-                        origin_url = self._extract_origin_url_from_content(content_md)
-                        scraping_url = self._extract_scraping_url_from_content(content_md)
+                        content_header = parse_content_header(content_md)
+                        title = content_header.title
+                        origin_url = content_header.origin_url
+                        scraping_url = content_header.scraping_url
 
                         # JSON 파일에서 announcement_date 보완 (우선순위: announcement.json → data.json → 기타)
                         priority_json_names = ["announcement.json", "data.json", "info.json"]
@@ -533,23 +899,19 @@ class AnnouncementPreProcessor:
                                     )
                                 else:
                                     # JSON에 없으면 content.md에서 추출
-                                    announcement_date_raw = self._extract_announcement_date_from_content(
-                                        content_md
-                                    )
+                                    announcement_date_raw = content_header.announcement_date
                                     if announcement_date_raw:
                                         announcement_date = self._convert_to_yyyymmdd(announcement_date_raw)
                             except Exception as e:
                                 logger.warning(
                                     f"{site_code} JSON 날짜 추출 실패, content.md 사용: {e}"
                                 )
-                                announcement_date_raw = self._extract_announcement_date_from_content(
-                                    content_md
-                                )
+                                announcement_date_raw = content_header.announcement_date
                                 if announcement_date_raw:
                                     announcement_date = self._convert_to_yyyymmdd(announcement_date_raw)
                         else:
                             # JSON 파일이 없으면 content.md에서 추출
-                            announcement_date_raw = self._extract_announcement_date_from_content(content_md)
+                            announcement_date_raw = content_header.announcement_date
                             if announcement_date_raw:
                                 announcement_date = self._convert_to_yyyymmdd(announcement_date_raw)
 
@@ -581,6 +943,8 @@ class AnnouncementPreProcessor:
                         if "DO_NOT_PROCESS" in content_md:
                             logger.info(f"⏭️  건너뜀 (ARCHIVED): {folder_name} - DO_NOT_PROCESS 플래그 감지")
                             return False
+
+                        content_header = parse_content_header(content_md)
                     except Exception as e:
                         logger.error(f"content.md 읽기 실패: {e}")
                         return self._save_processing_result(
@@ -599,9 +963,11 @@ class AnnouncementPreProcessor:
             # 3. content.md에서 정보 추출
             # 일반 사이트의 경우만 content.md에서 정보 추출 (API 사이트는 이미 추출함)
             if site_code not in ["kStartUp", "bizInfo", "smes24"]:
-                title = self._extract_title_from_content(content_md)
-                origin_url = self._extract_origin_url_from_content(content_md)
-                announcement_date_raw = self._extract_announcement_date_from_content(content_md)
+                if content_header is None:
+                    content_header = parse_content_header(content_md)
+                title = content_header.title
+                origin_url = content_header.origin_url
+                announcement_date_raw = content_header.announcement_date
                 if announcement_date_raw:
                     announcement_date = self._convert_to_yyyymmdd(announcement_date_raw)
 
@@ -634,7 +1000,11 @@ class AnnouncementPreProcessor:
 
             try:
                 combined_content, attachment_filenames, attachment_files_info = (
-                    self._process_attachments_separately(directory_path, title)
+                    self._process_attachments_separately(
+                        directory_path,
+                        title,
+                        attachment_urls=content_header.attachment_urls if content_header else None,
+                    )
                 )
                 logger.info(
                     f"첨부파일 내용 처리 완료: {len(combined_content)} 문자, 파일 {len(attachment_filenames)}개"
@@ -693,7 +1063,7 @@ class AnnouncementPreProcessor:
                 )
 
             # 6. 데이터베이스에 저장 (URL 정규화 적용)
-            record_id = self._save_processing_result(
+            saved = self._save_processing_result(
                 folder_name,
                 site_code,
                 content_md,
@@ -710,16 +1080,20 @@ class AnnouncementPreProcessor:
                 folder_path=folder_path_abs,
             )
 
-            if record_id:
-                logger.info(f"디렉토리 처리 완료: {folder_name}")
-                return True
-            else:
+            if not saved:
                 logger.error(f"디렉토리 처리 실패: {folder_name}")
                 return False
 
+            if self.write_batch_size > 0:
+                # 배치 모드: 저장 결과는 _flush_pending_writes_into에서 다시 집계
+                logger.info(f"디렉토리 처리 완료 (배치 저장 대기): {folder_name}")
+            else:
+                logger.info(f"디렉토리 처리 완료: {folder_name}")
+            return True
+
         except Exception as e:
             logger.error(f"디렉토리 처리 중 예상치 못한 오류: {e}")
-            result = self._save_processing_result(
+            return self._save_processing_result(
                 folder_name,
                 site_code,
                 "",
@@ -729,22 +1103,27 @@ class AnnouncementPreProcessor:
                 error_message=f"예상치 못한 오류: {e}",
                 folder_path=folder_path_abs,
             )
-            return result is not None
 
     def _check_exclusion_keywords(self, folder_name: str) -> List[str]:
         """폴더명에서 제외 키워드를 체크합니다."""
         matched_keywords = []
 
-        for keyword_info in self.exclusion_keywords:
-            keyword = keyword_info["keyword"].lower()
-            if keyword in folder_name.lower():
-                matched_keywords.append(keyword_info["keyword"])
-                logger.debug(f"제외 키워드 매칭: '{keyword}' in '{folder_name}'")
+        # 공유 스냅샷 갱신 확인 후 오토마톤으로 폴더명을 한 번만 탐색 (결과는 키워드 로드 순서)
+        snapshot = self.exclusion_snapshot = self._load_exclusion_keywords()
+        positions = snapshot.matcher.first_positions(folder_name)
+        for index in sorted(positions):
+            keyword = snapshot.keywords[index]["keyword"]
+            matched_keywords.append(keyword)
+            logger.debug(f"제외 키워드 매칭: '{keyword.lower()}' in '{folder_name}'")
 
         return matched_keywords
 
     def _check_folder_name_exists(self, folder_name: str, site_code: str) -> bool:
         """folder_name이 데이터베이스에 이미 존재하는지 확인합니다."""
+        index = self._processed_index.get(site_code)
+        if index is not None:
+            return _dedup_lookup_key(folder_name) in index
+
         try:
             from sqlalchemy import text
 
@@ -756,7 +1135,7 @@ class AnnouncementPreProcessor:
                     WHERE folder_name = :folder_name AND site_code = :site_code
                 """
                     ),
-                    {"folder_name": folder_name, "site_code": site_code},
+                    {"folder_name": folder_name, "site_code": self._db_site_code(site_code)},
                 )
 
                 count = result.scalar()
@@ -784,7 +1163,7 @@ class AnnouncementPreProcessor:
                     WHERE origin_url = :origin_url AND site_code = :site_code
                 """
                     ),
-                    {"origin_url": origin_url, "site_code": site_code},
+                    {"origin_url": origin_url, "site_code": self._db_site_code(site_code)},
                 )
 
                 count = result.scalar()
@@ -804,178 +1183,32 @@ class AnnouncementPreProcessor:
         return self._check_folder_name_exists(folder_name, site_code)
 
     def _extract_title_from_content(self, content_md: str) -> str:
-        """content.md에서 제목을 추출합니다.
-
-        우선순위:
-        1. **제목**: 패턴 (상세 페이지에서 추출된 공식 제목)
-        2. # 마크다운 헤더
-        3. 제목:, 공고명: 패턴
-        4. 첫 번째 줄
-        """
-        if not content_md:
-            return ""
-
-        lines = content_md.split("\n")
-
-        # 1단계: **제목**: 패턴 우선 검색 (가장 신뢰도 높음)
-        for line in lines[:10]:
-            line = line.strip()
-            if line.startswith("**제목**:"):
-                title = line.replace("**제목**:", "").strip()
-                if title:
-                    logger.debug(f"**제목** 패턴에서 제목 추출: {title}")
-                    return title
-
-        # 2단계: 기타 패턴 검색
-        for line in lines[:10]:
-            line = line.strip()
-            if line:
-                # # 마크다운 헤더
-                if line.startswith("#"):
-                    title = line.lstrip("#").strip()
-                    logger.debug(f"마크다운 헤더에서 제목 추출: {title}")
-                    return title
-
-                # 제목:, 공고명: 패턴
-                for prefix in ["제목:", "공고명:", "공고 제목:", "제목 :"]:
-                    if line.lower().startswith(prefix.lower()):
-                        title = line[len(prefix) :].strip()
-                        logger.debug(f"{prefix} 패턴에서 제목 추출: {title}")
-                        return title
-
-                # 첫 번째 일반 텍스트 줄 사용 (메타데이터 라인 제외)
-                if not line.startswith("**"):
-                    logger.debug(f"첫 번째 줄을 제목으로 사용: {line}")
-                    return line
-
-        return ""
+        """content.md에서 제목을 추출합니다. (규칙: contentHeaderParser.extract_title)"""
+        return extract_title(content_md)
 
     def _extract_origin_url_from_content(self, content_md: str) -> str:
         """content.md에서 원본 URL을 추출합니다."""
-        if not content_md:
-            return ""
-
-        # 원본 URL 패턴 찾기
-        origin_patterns = [
-            r"\*\*원본 URL\*\*[:\s]*(.+?)(?:\n|$)",
-            r"원본 URL[:\s]*(.+?)(?:\n|$)",
-            r"원본[:\s]*(.+?)(?:\n|$)",
-            r"(https?://[^\s\)]+(?:\.go\.kr|\.or\.kr)[^\s\)]*)",
-        ]
-
-        for pattern in origin_patterns:
-            matches = re.findall(pattern, content_md, re.IGNORECASE)
-            if matches:
-                url = matches[0].strip()
-                if url and url.startswith("http"):
-                    logger.debug(f"원본 URL 추출 성공: {url[:50]}...")
-                    return url
-
-        logger.debug("content.md에서 원본 URL을 찾을 수 없음")
-        return ""
+        return extract_origin_url(content_md)
 
     def _extract_scraping_url_from_content(self, content_md: str) -> str:
         """content.md에서 스크래핑 URL을 추출합니다."""
-        if not content_md:
-            return ""
-
-        # 스크래핑 URL 패턴 찾기
-        scraping_patterns = [
-            r"\*\*스크래핑 URL\*\*[:\s]*(.+?)(?:\n|$)",
-            r"스크래핑 URL[:\s]*(.+?)(?:\n|$)",
-            r"\*\*수집 URL\*\*[:\s]*(.+?)(?:\n|$)",
-            r"수집 URL[:\s]*(.+?)(?:\n|$)",
-        ]
-
-        for pattern in scraping_patterns:
-            matches = re.findall(pattern, content_md, re.IGNORECASE)
-            if matches:
-                url = matches[0].strip()
-                if url and url.startswith("http"):
-                    logger.debug(f"스크래핑 URL 추출 성공: {url[:50]}...")
-                    return url
-
-        logger.debug("content.md에서 스크래핑 URL을 찾을 수 없음")
-        return ""
+        return extract_scraping_url(content_md)
 
     def _extract_announcement_date_from_content(self, content_md: str) -> str:
         """content.md에서 공고일을 문자열로 추출합니다."""
-        if not content_md:
-            return ""
-
-        # 작성일 패턴 찾기 (마크다운 형식)
-        # 콜론(:) 뒤의 날짜만 정확히 캡처
-        # 중요: \s* 대신 [ \t]*를 사용 (\s는 개행도 포함해서 여러 줄을 건너뛰는 문제 발생)
-        date_patterns = [
-            r"\*\*작성일\*\*:[ \t]*([^\n]+)",  # **작성일**: 날짜 (같은 줄만)
-            r"\*\*작성일\*\*:\*\*[ \t]*([^\n]+)",  # **작성일:**: 날짜
-            r"작성일:[ \t]*([^\n]+)",  # 작성일: 날짜
-            r"\*\*등록일\*\*:[ \t]*([^\n]+)",  # **등록일**: 날짜
-            r"\*\*등록일\*\*:\*\*[ \t]*([^\n]+)",  # **등록일:**: 날짜
-            r"등록일:[ \t]*([^\n]+)",  # 등록일: 날짜
-            r"\*\*공고일\*\*:[ \t]*([^\n]+)",  # **공고일**: 날짜
-            r"\*\*공고일\*\*:\*\*[ \t]*([^\n]+)",  # **공고일:**: 날짜
-            r"공고일:[ \t]*([^\n]+)",  # 공고일: 날짜
-        ]
-
-        for pattern in date_patterns:
-            matches = re.findall(pattern, content_md, re.IGNORECASE)
-            if matches:
-                date_str = matches[0].strip()
-                if date_str:
-                    # 마크다운 볼드(**) 제거
-                    date_str = re.sub(r"\*+", "", date_str).strip()
-                    # 추가적인 정리 (공백 제거 등)
-                    date_str = date_str.strip()
-
-                    # 날짜 형식 검증 (최소한 연도가 포함되어야 함)
-                    if re.search(r"\d{4}", date_str):
-                        logger.debug(f"공고일 추출 성공: {date_str}")
-                        return date_str
-
-        logger.debug("content.md에서 공고일을 찾을 수 없음")
-        return ""
+        return extract_announcement_date(content_md)
 
     def _extract_attachment_urls_from_content(
         self, directory_path: Path
     ) -> Dict[str, str]:
         """content.md에서 첨부파일 다운로드 URL을 추출합니다."""
-        content_md_path = directory_path / "content.md"
         attachment_urls = {}
 
-        if not content_md_path.exists():
-            return attachment_urls
-
         try:
-            with open(content_md_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # **첨부파일**: 섹션 찾기
-            # 수정: 모든 첨부파일 라인을 추출하도록 패턴 개선
-            attachments_section = re.search(
-                r"\*\*첨부파일\*\*:\s*\n+((?:.*\n?)*?)(?=\n\*\*|\Z)",
-                content,
-                re.MULTILINE,
-            )
-
-            if attachments_section:
-                attachments_text = attachments_section.group(1)
-
-                # 모든 줄을 처리하여 번호. 파일명:URL 패턴 찾기
-                lines = attachments_text.strip().split("\n")
-                for line in lines:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    # [목록마커] [번호.] 파일명:URL 패턴 (하이픈/별표/불릿 및 번호 선택적, 콜론 앞뒤 공백 허용)
-                    # 예: "- 공고이미지_1.jpg: https://..." 또는 "1. 파일명.pdf: https://..."
-                    match = re.match(r"^(?:[-*•]\s*)?(?:\d+\.\s*)?(.+?)\s*:\s*(https?://\S+)", line)
-                    if match:
-                        filename = match.group(1).strip()
-                        url = match.group(2).strip()
-                        attachment_urls[filename] = url
-                        logger.debug(f"첨부파일 URL 매핑: {filename} -> {url[:50]}...")
+            content_header = read_content_header(directory_path)
+            if content_header is None:
+                return attachment_urls
+            attachment_urls = content_header.attachment_urls
 
             logger.info(
                 f"첨부파일 URL 추출 완료: {len(attachment_urls)}개, 키: {list(attachment_urls.keys())}"
@@ -1006,7 +1239,10 @@ class AnnouncementPreProcessor:
             return (float("inf"), folder_name)
 
     def _process_attachments_separately(
-        self, directory_path: Path, announcement_title: str = ""
+        self,
+        directory_path: Path,
+        announcement_title: str = "",
+        attachment_urls: Optional[Dict[str, str]] = None,
     ) -> tuple[str, List[str], List[Dict[str, Any]]]:
         """
         첨부파일들을 처리하여 내용을 결합하고 파일명 목록을 반환합니다.
@@ -1014,6 +1250,7 @@ class AnnouncementPreProcessor:
         Args:
             directory_path: 처리할 디렉토리 경로
             announcement_title: 공고 제목 (파일 우선순위 계산에 사용)
+            attachment_urls: 이미 파싱한 content.md의 첨부파일 URL (None이면 content.md를 읽어 추출)
 
         Returns:
             tuple: (combined_content, attachment_filenames, attachment_files_info)
@@ -1028,7 +1265,8 @@ class AnnouncementPreProcessor:
         attachment_files_info = []
 
         # content.md에서 파일 다운로드 URL 추출
-        attachment_urls = self._extract_attachment_urls_from_content(directory_path)
+        if attachment_urls is None:
+            attachment_urls = self._extract_attachment_urls_from_content(directory_path)
 
         # 처리 가능한 확장자 정의 (Excel 파일 제외)
         supported_extensions = {
@@ -1189,7 +1427,10 @@ class AnnouncementPreProcessor:
                         )
                         continue
 
-                    content = self.attachment_processor.process_single_file(file_path)
+                    # --attach-force면 변환 캐시도 무시하고 재변환
+                    content = self.attachment_processor.process_single_file(
+                        file_path, bypass_cache=self.attach_force
+                    )
 
                     if content and content.strip():
                         combined_content += f"\n\n=== {self._normalize_korean_text(file_path.name)} ===\n{content}"
@@ -1656,109 +1897,100 @@ class AnnouncementPreProcessor:
         }
         return priority_map.get(site_type, 0)
 
-    def _log_api_url_processing(
-        self,
-        session,
-        site_code: str,
-        url_key: str,
-        url_key_hash: str,
-        processing_status: str,
-        announcement_id: str = None,
-        announcement_url: str = None,
-        scraping_url: str = None,
-        preprocessing_id: int = None,
-        existing_preprocessing_id: int = None,
-        api_url_registry_id: int = None,
-        existing_site_type: str = None,
-        existing_site_code: str = None,
-        duplicate_reason: dict = None,
-        error_message: str = None,
-        title: str = None,
-        folder_name: str = None,
-    ) -> bool:
+    def _find_pblanc_duplicate_like(self, session, pblanc_id: str, site_code: str):
+        """
+        pblanc_id 컬럼이 없는 DB에서 URL LIKE 검색으로 동일 pblancId 레코드를 찾습니다.
+        우선순위: bizInfo(1) > smes24(2) > kStartUp(3), 같으면 먼저 등록된 것
         """
-        ⚠️ DEPRECATED: 이 함수는 더 이상 사용되지 않습니다.
-        api_url_processing_log 테이블은 사용하지 않으며,
-        announcement_duplicate_log로 대체되었습니다.
+        from sqlalchemy import text
+
+        return session.execute(
+            text("""
+                SELECT id, site_type, site_code, folder_name, url_key,
+                       processing_status, origin_url, scraping_url, created_at
+                FROM announcement_pre_processing
+                WHERE (origin_url LIKE :pattern OR scraping_url LIKE :pattern)
+                AND site_code != :current_site_code
+                AND site_code IN ('bizInfo', 'smes24', 'kStartUp')
+                AND processing_status = '성공'
+                ORDER BY
+                    CASE site_code
+                        WHEN 'bizInfo' THEN 1
+                        WHEN 'smes24' THEN 2
+                        WHEN 'kStartUp' THEN 3
+                        ELSE 99
+                    END,
+                    created_at ASC
+                LIMIT 1
+            """),
+            {
+                "pattern": f"%{pblanc_id}%",
+                "current_site_code": site_code
+            }
+        ).fetchone()
 
-        API URL 처리 시도를 로그에 기록합니다.
+    def _llm_processing_ids(self, session, preprocessing_ids: List[int]) -> set:
+        """
+        preprocessing_ids 중 LLM 배치 처리 중('pending', 'retrying')인 ID를 한 번의 쿼리로 조회합니다.
+        오류 시 빈 집합을 반환합니다 (처리 계속 진행).
+        """
+        if not preprocessing_ids:
+            return set()
 
-        Args:
-            session: SQLAlchemy 세션
-            site_code: 사이트 코드 (kStartUp, bizInfo, smes24, prv_* 등)
-            url_key: 정규화된 URL 키
-            url_key_hash: URL 키 해시 (MD5)
-            processing_status: 처리 상태
-                - 'new_inserted': 새로 삽입됨
-                - 'duplicate_updated': 중복이지만 업데이트됨 (우선순위 높음)
-                - 'duplicate_skipped': 중복이라 스킵됨 (우선순위 낮음)
-                - 'duplicate_preserved': 기존 데이터 유지됨
-                - 'failed': 처리 실패
-                - 'no_url_key': URL 정규화 실패
-            preprocessing_id: 생성/업데이트된 레코드 ID
-            existing_preprocessing_id: 이미 존재하던 레코드 ID
-            existing_site_type: 기존 레코드의 site_type
-            existing_site_code: 기존 레코드의 site_code
-            duplicate_reason: 중복 사유 (dict)
-            error_message: 오류 메시지
-            title: 공고 제목
-            folder_name: 폴더명
+        try:
+            from sqlalchemy import bindparam, text
 
-        Returns:
-            로그 기록 성공 여부
-        """
-        # 테이블이 존재하지 않으므로 아무 작업도 하지 않음
-        return True
+            # 실제 DB에 존재하는 상태만 체크 (in_progress, validating, finalizing는 즉시 동기화되지 않음)
+            rows = session.execute(
+                text("""
+                    SELECT DISTINCT ap_id
+                    FROM LLM_BATCH_ITEM
+                    WHERE ap_id IN :ap_ids
+                      AND STATUS IN ('pending', 'retrying')
+                """).bindparams(bindparam("ap_ids", expanding=True)),
+                {"ap_ids": preprocessing_ids},
+            )
+            return {row.ap_id for row in rows}
+
+        except Exception as e:
+            logger.warning(f"LLM 처리 상태 일괄 확인 실패 (계속 진행): {len(preprocessing_ids)}건, error={e}")
+            return set()
 
-    def _is_llm_processing(self, session, preprocessing_id: int) -> bool:
+    def _log_announcement_duplicate(self, session, **log_fields) -> bool:
         """
-        announcement_pre_processing 레코드가 LLM 배치 처리 중인지 확인합니다.
+        announcement_duplicate_log 테이블에 중복 처리 로그를 기록합니다.
 
         Args:
             session: SQLAlchemy 세션
-            preprocessing_id: 확인할 레코드 ID (announcement_pre_processing.id)
+            **log_fields: _duplicate_log_params 인자
 
         Returns:
-            LLM 처리 중이면 True, 아니면 False
+            로그 기록 성공 여부
         """
         try:
             from sqlalchemy import text
 
-            # LLM_BATCH_ITEM에서 ap_id가 preprocessing_id이고,
-            # STATUS가 처리 중인 상태('pending', 'retrying')인지 확인
-            # 실제 DB에 존재하는 상태만 체크 (in_progress, validating, finalizing는 즉시 동기화되지 않음)
-            result = session.execute(
-                text("""
-                    SELECT COUNT(*) as processing_count
-                    FROM LLM_BATCH_ITEM
-                    WHERE ap_id = :ap_id
-                      AND STATUS IN ('pending', 'retrying')
-                """),
-                {"ap_id": preprocessing_id}
-            ).fetchone()
-
-            processing_count = result.processing_count if result else 0
+            params = self._duplicate_log_params(**log_fields)
+            session.execute(text(_DUPLICATE_LOG_SQL), params)
+            # session.commit()는 호출하지 않음 (상위 함수에서 commit)
 
-            if processing_count > 0:
-                logger.debug(
-                    f"LLM 처리 중인 아이템 발견: preprocessing_id={preprocessing_id}, "
-                    f"processing_count={processing_count}"
-                )
-                return True
+            url_key_hash = params["url_key_hash"]
+            logger.debug(
+                f"중복 로그 기록 완료: {params['duplicate_type']} - "
+                f"preprocessing_id={params['preprocessing_id']}, "
+                f"domain_configured={log_fields.get('domain_configured', False)}, "
+                f"url_key_hash={url_key_hash[:16] if url_key_hash else 'None'}..."
+            )
 
-            return False
+            return True
 
         except Exception as e:
-            # 테이블이 없거나 오류 발생 시 안전하게 False 반환 (처리 계속 진행)
-            logger.warning(
-                f"LLM 처리 상태 확인 실패 (계속 진행): preprocessing_id={preprocessing_id}, "
-                f"error={e}"
-            )
+            logger.error(f"중복 로그 기록 실패: {e}")
+            # 로그 기록 실패해도 메인 처리는 계속 진행
             return False
 
-    def _log_announcement_duplicate(
+    def _duplicate_log_params(
         self,
-        session,
         preprocessing_id: int,
         url_key_hash: str,
         duplicate_type: str,
@@ -1769,12 +2001,11 @@ class AnnouncementPreProcessor:
         existing_record: dict = None,
         error_message: str = None,
         new_data: dict = None,
-    ) -> bool:
+    ) -> Dict[str, Any]:
         """
-        announcement_duplicate_log 테이블에 중복 처리 로그를 기록합니다.
+        announcement_duplicate_log 한 행의 바인딩 파라미터를 만듭니다.
 
         Args:
-            session: SQLAlchemy 세션
             preprocessing_id: 저장/업데이트된 레코드 ID
             url_key_hash: URL 키 해시 (MD5) - domain_key_config 없으면 NULL
             duplicate_type: 중복 유형
@@ -1792,182 +2023,358 @@ class AnnouncementPreProcessor:
             error_message: 에러 메시지 (오류 시)
 
         Returns:
-            로그 기록 성공 여부
+            _DUPLICATE_LOG_SQL 파라미터
         """
-        try:
-            from sqlalchemy import text
-            import json
-            from datetime import datetime
-
-            # 우선순위 계산
-            new_priority = self._get_priority(self.site_type)
-            existing_priority = None
-            existing_preprocessing_id = None
-            existing_site_type = None
-            existing_site_code = None
-            duplicate_detail = None
-
-            # 기존 레코드 정보 추출
-            if existing_record:
-                existing_preprocessing_id = existing_record.get('id')
-                existing_site_type = existing_record.get('site_type')
-                existing_site_code = existing_record.get('site_code')
-                existing_priority = self._get_priority(existing_site_type)
-
-                # 상세 정보 JSON 생성
-                if duplicate_type == 'replaced':
-                    decision = '기존 데이터 교체'
-                    reason = f'우선순위 높음: {self.site_type}({new_priority}) > {existing_site_type}({existing_priority})'
-                elif duplicate_type == 'kept_existing':
-                    decision = '기존 데이터 유지'
-                    reason = f'우선순위 낮음: {self.site_type}({new_priority}) < {existing_site_type}({existing_priority})'
-                elif duplicate_type == 'same_type_duplicate':
-                    decision = '최신 데이터로 업데이트'
-                    reason = f'우선순위 동일: {self.site_type}({new_priority}) = {existing_site_type}({existing_priority})'
-                else:
-                    decision = '알 수 없음'
-                    reason = f'duplicate_type={duplicate_type}'
-
-                # 변경된 필드 추적
-                changed_fields = {}
-                if new_data and existing_record:
-                    # 비교할 필드 목록
-                    compare_fields = ['title', 'folder_name', 'content_md', 'combined_content',
-                                     'attachment_filenames', 'exclusion_keyword', 'processing_status',
-                                     'announcement_date']
-
-                    for field in compare_fields:
-                        existing_value = existing_record.get(field)
-                        new_value = new_data.get(field)
-
-                        # 값이 다른 경우에만 기록
-                        if existing_value != new_value:
-                            # 긴 텍스트는 앞부분만 저장 (100자)
-                            if field in ['content_md', 'combined_content']:
-                                changed_fields[field] = {
-                                    'before': str(existing_value)[:100] + '...' if existing_value and len(str(existing_value)) > 100 else existing_value,
-                                    'after': str(new_value)[:100] + '...' if new_value and len(str(new_value)) > 100 else new_value,
-                                    'changed': True
-                                }
-                            else:
-                                changed_fields[field] = {
-                                    'before': existing_value,
-                                    'after': new_value,
-                                    'changed': True
-                                }
-
-                duplicate_detail = {
-                    'decision': decision,
-                    'reason': reason,
-                    'existing_folder': existing_record.get('folder_name'),
-                    'existing_url_key': existing_record.get('url_key'),
-                    'priority_comparison': f'{new_priority} vs {existing_priority}',
-                    'changed_fields': changed_fields if changed_fields else None,
-                    'domain': domain,
-                    'domain_configured': domain_configured,
-                    'timestamp': datetime.now().isoformat()
-                }
+        # 우선순위 계산
+        new_priority = self._get_priority(self.site_type)
+        existing_priority = None
+        existing_preprocessing_id = None
+        existing_site_type = None
+        existing_site_code = None
+        duplicate_detail = None
+
+        # 기존 레코드 정보 추출
+        if existing_record:
+            existing_preprocessing_id = existing_record.get('id')
+            existing_site_type = existing_record.get('site_type')
+            existing_site_code = existing_record.get('site_code')
+            existing_priority = self._get_priority(existing_site_type)
+
+            # 상세 정보 JSON 생성
+            if duplicate_type == 'replaced':
+                decision = '기존 데이터 교체'
+                reason = f'우선순위 높음: {self.site_type}({new_priority}) > {existing_site_type}({existing_priority})'
+            elif duplicate_type == 'kept_existing':
+                decision = '기존 데이터 유지'
+                reason = f'우선순위 낮음: {self.site_type}({new_priority}) < {existing_site_type}({existing_priority})'
+            elif duplicate_type == 'same_type_duplicate':
+                decision = '최신 데이터로 업데이트'
+                reason = f'우선순위 동일: {self.site_type}({new_priority}) = {existing_site_type}({existing_priority})'
+            else:
+                decision = '알 수 없음'
+                reason = f'duplicate_type={duplicate_type}'
+
+            # 변경된 필드 추적
+            changed_fields = {}
+            if new_data and existing_record:
+                # 비교할 필드 목록
+                compare_fields = ['title', 'folder_name', 'content_md', 'combined_content',
+                                 'attachment_filenames', 'exclusion_keyword', 'processing_status',
+                                 'announcement_date']
+
+                for field in compare_fields:
+                    existing_value = existing_record.get(field)
+                    new_value = new_data.get(field)
+
+                    # 값이 다른 경우에만 기록
+                    if existing_value != new_value:
+                        # 긴 텍스트는 앞부분만 저장 (100자)
+                        if field in ['content_md', 'combined_content']:
+                            changed_fields[field] = {
+                                'before': str(existing_value)[:100] + '...' if existing_value and len(str(existing_value)) > 100 else existing_value,
+                                'after': str(new_value)[:100] + '...' if new_value and len(str(new_value)) > 100 else new_value,
+                                'changed': True
+                            }
+                        else:
+                            changed_fields[field] = {
+                                'before': existing_value,
+                                'after': new_value,
+                                'changed': True
+                            }
 
-            elif duplicate_type == 'unconfigured_domain':
-                # domain_key_config에 없는 경우
-                duplicate_detail = {
-                    'decision': '신규 등록 (domain_key_config 없음)',
-                    'reason': 'domain_key_config 테이블에 설정이 없어서 중복 체크 생략',
-                    'domain': domain,
-                    'domain_configured': False,
-                    'timestamp': datetime.now().isoformat()
-                }
+            duplicate_detail = {
+                'decision': decision,
+                'reason': reason,
+                'existing_folder': existing_record.get('folder_name'),
+                'existing_url_key': existing_record.get('url_key'),
+                'priority_comparison': f'{new_priority} vs {existing_priority}',
+                'changed_fields': changed_fields if changed_fields else None,
+                'domain': domain,
+                'domain_configured': domain_configured,
+                'timestamp': datetime.now().isoformat()
+            }
 
-            elif duplicate_type == 'new_inserted':
-                # domain_key_config에 있지만 url_key_hash 중복 없음
-                duplicate_detail = {
-                    'decision': '신규 등록',
-                    'reason': 'url_key_hash 중복 없음',
-                    'domain': domain,
-                    'domain_configured': domain_configured,
-                    'timestamp': datetime.now().isoformat()
-                }
+        elif duplicate_type == 'unconfigured_domain':
+            # domain_key_config에 없는 경우
+            duplicate_detail = {
+                'decision': '신규 등록 (domain_key_config 없음)',
+                'reason': 'domain_key_config 테이블에 설정이 없어서 중복 체크 생략',
+                'domain': domain,
+                'domain_configured': False,
+                'timestamp': datetime.now().isoformat()
+            }
 
-            # 기존 폴더명 추출
-            existing_folder_name = None
-            if existing_record:
-                existing_folder_name = existing_record.get('folder_name')
-
-            # announcement_duplicate_log INSERT
-            sql = text("""
-                INSERT INTO announcement_duplicate_log (
-                    preprocessing_id,
-                    existing_preprocessing_id,
-                    duplicate_type,
-                    url_key_hash,
-                    new_site_type,
-                    new_site_code,
-                    existing_site_type,
-                    existing_site_code,
-                    new_priority,
-                    existing_priority,
-                    new_folder_name,
-                    existing_folder_name,
-                    duplicate_detail,
-                    error_message
-                ) VALUES (
-                    :preprocessing_id,
-                    :existing_preprocessing_id,
-                    :duplicate_type,
-                    :url_key_hash,
-                    :new_site_type,
-                    :new_site_code,
-                    :existing_site_type,
-                    :existing_site_code,
-                    :new_priority,
-                    :existing_priority,
-                    :new_folder_name,
-                    :existing_folder_name,
-                    :duplicate_detail,
-                    :error_message
-                )
-            """)
-
-            # JSON 직렬화
-            duplicate_detail_json = None
-            if duplicate_detail:
-                duplicate_detail_json = json.dumps(duplicate_detail, ensure_ascii=False)
-
-            # 파라미터 바인딩
-            params = {
-                'preprocessing_id': preprocessing_id,
-                'existing_preprocessing_id': existing_preprocessing_id,
-                'duplicate_type': duplicate_type,
-                'url_key_hash': url_key_hash,  # unconfigured_domain일 때 NULL
-                'new_site_type': self.site_type,
-                'new_site_code': site_code,
-                'existing_site_type': existing_site_type,
-                'existing_site_code': existing_site_code,
-                'new_priority': new_priority,
-                'existing_priority': existing_priority,
-                'new_folder_name': folder_name,
-                'existing_folder_name': existing_folder_name,
-                'duplicate_detail': duplicate_detail_json,
-                'error_message': error_message
+        elif duplicate_type == 'new_inserted':
+            # domain_key_config에 있지만 url_key_hash 중복 없음
+            duplicate_detail = {
+                'decision': '신규 등록',
+                'reason': 'url_key_hash 중복 없음',
+                'domain': domain,
+                'domain_configured': domain_configured,
+                'timestamp': datetime.now().isoformat()
             }
 
-            # 실행
-            session.execute(sql, params)
-            # session.commit()는 호출하지 않음 (상위 함수에서 commit)
+        # 기존 폴더명 추출
+        existing_folder_name = None
+        if existing_record:
+            existing_folder_name = existing_record.get('folder_name')
+
+        # JSON 직렬화
+        duplicate_detail_json = None
+        if duplicate_detail:
+            duplicate_detail_json = json.dumps(duplicate_detail, ensure_ascii=False)
+
+        # 파라미터 바인딩
+        return {
+            'preprocessing_id': preprocessing_id,
+            'existing_preprocessing_id': existing_preprocessing_id,
+            'duplicate_type': duplicate_type,
+            'url_key_hash': url_key_hash,  # unconfigured_domain일 때 NULL
+            'new_site_type': self.site_type,
+            'new_site_code': site_code,
+            'existing_site_type': existing_site_type,
+            'existing_site_code': existing_site_code,
+            'new_priority': new_priority,
+            'existing_priority': existing_priority,
+            'new_folder_name': folder_name,
+            'existing_folder_name': existing_folder_name,
+            'duplicate_detail': duplicate_detail_json,
+            'error_message': error_message
+        }
 
-            logger.debug(
-                f"중복 로그 기록 완료: {duplicate_type} - "
-                f"preprocessing_id={preprocessing_id}, "
-                f"domain_configured={domain_configured}, "
-                f"url_key_hash={url_key_hash[:16] if url_key_hash else 'None'}..."
+    def _skip_log_params(
+        self,
+        duplicate_type: str,
+        site_code: str,
+        folder_name: str,
+        existing,
+        url_key_hash: str = None,
+        new_site_type: str = None,
+        new_priority: int = None,
+        existing_priority: int = None,
+        duplicate_detail: str = None,
+    ) -> Dict[str, Any]:
+        """
+        저장하지 않고 건너뛴 경우(pblanc_id/scraping_url 중복, LLM 처리 중)의
+        announcement_duplicate_log 파라미터를 만듭니다. preprocessing_id는 NULL입니다.
+
+        Args:
+            existing: 우선된 기존 레코드 (id, site_type, site_code, folder_name 조회 결과)
+        """
+        return {
+            "preprocessing_id": None,
+            "existing_preprocessing_id": existing.id,
+            "duplicate_type": duplicate_type,
+            "url_key_hash": url_key_hash,
+            "new_site_type": new_site_type or self.site_type,
+            "new_site_code": site_code,
+            "existing_site_type": existing.site_type,
+            "existing_site_code": existing.site_code,
+            "new_priority": new_priority,
+            "existing_priority": existing_priority,
+            "new_folder_name": folder_name,
+            "existing_folder_name": existing.folder_name,
+            "duplicate_detail": duplicate_detail,
+            "error_message": None,
+        }
+
+    def _llm_skip_log_params(
+        self, site_code: str, folder_name: str, url_key: str, existing
+    ) -> Dict[str, Any]:
+        """LLM 처리 중인 레코드라 UPSERT를 건너뛴 경우의 중복 로그 파라미터"""
+        return self._skip_log_params(
+            "llm_processing_skip", site_code, folder_name, existing,
+            url_key_hash=_url_key_hash(url_key),
+            duplicate_detail=json.dumps({
+                "reason": "LLM 처리 중인 데이터로 UPSERT 스킵",
+                "url_key": url_key[:100],
+                "timestamp": datetime.now().isoformat()
+            }, ensure_ascii=False),
+        )
+
+    def _upsert_log_fields(
+        self,
+        params: Dict[str, Any],
+        record_id: int,
+        url_key_hash: Optional[str],
+        updated: bool,
+        existing,
+    ) -> Dict[str, Any]:
+        """
+        UPSERT 결과에 맞는 announcement_duplicate_log 인자(_duplicate_log_params)를 결정합니다.
+
+        Args:
+            params: _build_upsert_params 결과
+            record_id: 저장/업데이트된 레코드 ID
+            url_key_hash: DB에서 생성된 url_key_hash (url_key가 없으면 None)
+            updated: UPSERT가 기존 레코드를 UPDATE했는지 여부 (_is_upsert_update)
+            existing: UPSERT 전에 url_key로 조회한 기존 레코드 (없으면 None)
+        """
+        from urllib.parse import urlparse
+
+        origin_url = params["origin_url"]
+        url_key = params["url_key"]
+
+        if not url_key:
+            # url_key가 없음 → domain_key_config에 설정 없음 or URL 추출 실패
+            domain = None
+            if origin_url:
+                try:
+                    domain = urlparse(origin_url).netloc
+                except Exception as e:
+                    logger.warning(f"URL 파싱 실패: {origin_url}, {e}")
+
+            return {
+                "preprocessing_id": record_id,
+                "url_key_hash": None,
+                "duplicate_type": "unconfigured_domain",
+                "site_code": params["site_code"],
+                "folder_name": params["folder_name"],
+                "domain": domain,
+                "domain_configured": False,
+                "error_message": "URL 정규화 실패 (url_key 없음)",
+            }
+
+        parsed_url = urlparse(origin_url)
+        domain = parsed_url.netloc
+        current_priority = self._get_priority(self.site_type)
+
+        if not self.url_key_extractor.get_domain_config(domain, parsed_url.path):
+            # domain_key_config에 없는 경우 (API 외부 도메인 등) → 신규로 처리
+            logger.debug(
+                f"domain_key_config 없음: domain={domain}, url_key={url_key[:50]}... "
+                f"fallback으로 url_key 생성됨"
             )
+            duplicate_type = "new_inserted"
 
-            return True
+        elif not updated:
+            # 새로 INSERT됨
+            duplicate_type = "new_inserted"
+            logger.debug(f"새 레코드 삽입: ID={record_id}, url_key_hash={url_key_hash[:16]}...")
 
-        except Exception as e:
-            logger.error(f"중복 로그 기록 실패: {e}")
-            # 로그 기록 실패해도 메인 처리는 계속 진행
-            return False
+        else:
+            # UPDATE됨 (ON DUPLICATE KEY UPDATE 실행) → UPSERT 전 기존 레코드로 우선순위 비교
+            logger.debug(f"중복 감지 (기존 레코드 UPDATE): url_key_hash={url_key_hash[:16]}...")
+
+            if existing is None:
+                # url_key로 찾은 기존 레코드 없이 folder_name이 같은 레코드가 UPDATE됨
+                duplicate_type = "replaced"
+                logger.warning("UPSERT 전 url_key 기존 레코드 없음, 업데이트됨으로 간주")
+            else:
+                existing_priority = self._get_priority(existing.site_type)
+                if current_priority > existing_priority:
+                    duplicate_type = "replaced"
+                    logger.info(
+                        f"✓ 우선순위 높음: {self.site_type}({current_priority}) > "
+                        f"{existing.site_type}({existing_priority}) → 업데이트됨"
+                    )
+                elif current_priority == existing_priority:
+                    duplicate_type = "same_type_duplicate"
+                    logger.info(
+                        f"✓ 우선순위 동일: {self.site_type}({current_priority}) == "
+                        f"{existing.site_type}({existing_priority}) → 업데이트됨 (최신 데이터)"
+                    )
+                else:
+                    duplicate_type = "kept_existing"
+                    logger.info(
+                        f"⚠️  우선순위 낮음: {self.site_type}({current_priority}) < "
+                        f"{existing.site_type}({existing_priority}) → 기존 데이터 유지"
+                    )
+
+        existing_record = None
+        if existing is not None:
+            existing_record = {
+                "id": existing.id,
+                "site_type": existing.site_type,
+                "site_code": existing.site_code,
+                "folder_name": existing.folder_name,
+                "title": existing.title,
+                "content_md": existing.content_md,
+                "combined_content": existing.combined_content,
+                "attachment_filenames": existing.attachment_filenames,
+                "exclusion_keyword": existing.exclusion_keyword,
+                "processing_status": existing.processing_status,
+                "announcement_date": existing.announcement_date,
+                "url_key": url_key,  # url_key는 동일
+            }
+
+        # 변경 추적용 새 데이터 (UPSERT 파라미터와 컬럼명이 같음)
+        new_data = {
+            field: params[field]
+            for field in (
+                "title", "folder_name", "content_md", "combined_content", "attachment_filenames",
+                "exclusion_keyword", "processing_status", "announcement_date",
+            )
+        }
+
+        return {
+            "preprocessing_id": record_id,
+            "url_key_hash": url_key_hash,
+            "duplicate_type": duplicate_type,
+            "site_code": params["site_code"],
+            "folder_name": params["folder_name"],
+            "domain": domain,
+            "domain_configured": True,  # url_key가 있으므로 domain_key_config 있음
+            "existing_record": existing_record,
+            "new_data": new_data,
+        }
+
+    def _db_site_code(self, site_code: str) -> str:
+        """Homepage/Eminwon은 DB에 "prv_" 접두사를 붙인 site_code로 저장합니다."""
+        return ("prv_" + site_code) if self.site_type in ("Homepage", "Eminwon") else site_code
+
+    def _build_upsert_params(
+        self,
+        folder_name: str,
+        site_code: str,
+        content_md: str,
+        combined_content: str,
+        attachment_filenames: List[str] = None,
+        status: str = "성공",
+        exclusion_keywords: List[str] = None,
+        exclusion_reason: str = None,
+        error_message: str = None,
+        title: str = None,
+        origin_url: str = None,
+        url_key: str = None,
+        scraping_url: str = None,
+        announcement_date: str = None,
+        attachment_files_info: List[Dict[str, Any]] = None,
+        folder_path: str = None,
+    ) -> Dict[str, Any]:
+        """_UPSERT_SQL / _FORCE_UPSERT_SQL 바인딩 파라미터를 만듭니다."""
+        # JSON으로 직렬화
+        attachment_files_json = (
+            json.dumps(attachment_files_info, ensure_ascii=False)
+            if attachment_files_info
+            else None
+        )
+
+        return {
+            "folder_name": folder_name,
+            "folder_path": folder_path,
+            "site_type": self.site_type,
+            "site_code": self._db_site_code(site_code),
+            "content_md": content_md,
+            "combined_content": combined_content,
+            "attachment_filenames": (
+                ", ".join(attachment_filenames)
+                if attachment_filenames
+                else None
+            ),
+            "attachment_files_list": attachment_files_json,
+            "exclusion_keyword": (
+                ", ".join(exclusion_keywords) if exclusion_keywords else None
+            ),
+            "exclusion_reason": exclusion_reason,
+            "title": title,
+            "origin_url": origin_url,
+            "url_key": url_key,
+            "scraping_url": scraping_url,
+            "announcement_date": announcement_date,
+            "processing_status": status,
+            "error_message": error_message,
+        }
 
     def _save_processing_result(
         self,
@@ -1988,537 +2395,786 @@ class AnnouncementPreProcessor:
         announcement_date: str = None,
         attachment_files_info: List[Dict[str, Any]] = None,
         folder_path: str = None,
-    ) -> Optional[int]:
-        """처리 결과를 데이터베이스에 저장합니다."""
-        try:
-            from sqlalchemy import text
+    ) -> bool:
+        """
+        처리 결과를 데이터베이스에 저장합니다.
 
-            with self.db_manager.SessionLocal() as session:
-                # ================================================
-                # 🆕 PBLN ID 기반 통합 중복 체크 (2025-12-02)
-                # ================================================
-                # bizinfo.go.kr URL에서 pblancId(PBLN_xxx) 추출하여 중복 체크
-                # - 양방향 체크: smes24↔bizInfo, bizInfo↔smes24
-                # - URL 형식 차이에 강함 (쿼리 파라미터 순서 무관)
-                # - origin_url, scraping_url 모두에서 추출하여 비교
-                # ================================================
+        프로세스 풀 모드에서는 워커 간 공유 락을 잡고 저장하여
+        중복 체크(PBLN ID, scraping_url, url_key)와 UPSERT가 원자적으로 수행되도록 합니다.
 
-                # pblancId 추출 (scraping_url 체크에서도 사용하므로 외부 스코프에 정의)
-                pblanc_id = None
+        배치 모드(write_batch_size > 0)에서는 요청을 버퍼에 쌓기만 하고 True를 반환합니다.
+        실제 기록은 _flush_pending_writes에서 수행되며, 저장에 실패한 항목은 그 반환값으로 알려집니다.
 
-                if site_code in ['bizInfo', 'smes24', 'kStartUp']:
-                    import re
+        Returns:
+            저장(배치 모드에서는 버퍼링) 성공 여부
+        """
+        request = {
+            "folder_name": folder_name,
+            "site_code": site_code,
+            "content_md": content_md,
+            "combined_content": combined_content,
+            "attachment_filenames": attachment_filenames,
+            "status": status,
+            "exclusion_keywords": exclusion_keywords,
+            "exclusion_reason": exclusion_reason,
+            "error_message": error_message,
+            "force": force,
+            "title": title,
+            "origin_url": origin_url,
+            "url_key": url_key,
+            "scraping_url": scraping_url,
+            "announcement_date": announcement_date,
+            "attachment_files_info": attachment_files_info,
+            "folder_path": folder_path,
+        }
 
-                    # pblancId 추출 함수
-                    def extract_pblanc_id(url):
-                        if not url:
-                            return None
-                        match = re.search(r'pblancId=(PBLN_\d+)', url)
-                        return match.group(1) if match else None
+        if self.write_batch_size > 0:
+            self._pending_writes.append(request)
+            return True
 
-                    # origin_url 또는 scraping_url에서 pblancId 추출
-                    pblanc_id = extract_pblanc_id(origin_url) or extract_pblanc_id(scraping_url)
+        if _db_write_lock is None:
+            return self._write_processing_result(**request) is not None
 
-                    if pblanc_id:
-                        try:
-                            # 다른 사이트에서 동일 pblancId를 가진 레코드 검색
-                            # 우선순위: bizInfo(1) > smes24(2) > kStartUp(3)
-                            existing_by_pblanc = session.execute(
-                                text("""
-                                    SELECT id, site_type, site_code, folder_name, url_key,
-                                           processing_status, origin_url, scraping_url, created_at
-                                    FROM announcement_pre_processing
-                                    WHERE (origin_url LIKE :pattern OR scraping_url LIKE :pattern)
-                                    AND site_code != :current_site_code
-                                    AND site_code IN ('bizInfo', 'smes24', 'kStartUp')
-                                    AND processing_status = '성공'
-                                    ORDER BY
-                                        CASE site_code
-                                            WHEN 'bizInfo' THEN 1
-                                            WHEN 'smes24' THEN 2
-                                            WHEN 'kStartUp' THEN 3
-                                            ELSE 99
-                                        END,
-                                        created_at ASC
-                                    LIMIT 1
-                                """),
-                                {
-                                    "pattern": f"%{pblanc_id}%",
-                                    "current_site_code": site_code
-                                }
-                            ).fetchone()
-
-                            if existing_by_pblanc:
-                                # 우선순위 비교
-                                priority_map = {'bizInfo': 1, 'smes24': 2, 'kStartUp': 3}
-                                existing_priority = priority_map.get(existing_by_pblanc.site_code, 99)
-                                current_priority = priority_map.get(site_code, 99)
-
-                                if existing_priority <= current_priority:
-                                    # 기존 데이터 우선순위가 높거나 같음 → 현재 데이터 스킵
-                                    logger.info(
-                                        f"🚫 중복 스킵 (PBLN ID 기반): 동일 pblancId 발견\n"
-                                        f"   pblancId: {pblanc_id}\n"
-                                        f"   현재 데이터: site_code={site_code}, folder={folder_name}\n"
-                                        f"   기존 데이터: ID={existing_by_pblanc.id}, "
-                                        f"site_code={existing_by_pblanc.site_code}, "
-                                        f"folder={existing_by_pblanc.folder_name}\n"
-                                        f"   우선순위: {existing_by_pblanc.site_code}({existing_priority}) "
-                                        f">= {site_code}({current_priority})\n"
-                                        f"   → 기존 데이터 우선"
-                                    )
+        with _db_write_lock:
+            return self._write_processing_result(**request) is not None
 
-                                    # announcement_duplicate_log에 기록
-                                    try:
-                                        with self.db_manager.SessionLocal() as log_session:
-                                            log_session.execute(
-                                                text("""
-                                                    INSERT INTO announcement_duplicate_log (
-                                                        preprocessing_id, existing_preprocessing_id,
-                                                        duplicate_type, url_key_hash,
-                                                        new_site_type, new_site_code,
-                                                        existing_site_type, existing_site_code,
-                                                        new_priority, existing_priority,
-                                                        new_folder_name, existing_folder_name,
-                                                        duplicate_detail, created_at
-                                                    ) VALUES (
-                                                        NULL, :existing_preprocessing_id,
-                                                        :duplicate_type, :url_key_hash,
-                                                        :new_site_type, :new_site_code,
-                                                        :existing_site_type, :existing_site_code,
-                                                        :new_priority, :existing_priority,
-                                                        :new_folder_name, :existing_folder_name,
-                                                        :duplicate_detail, NOW()
-                                                    )
-                                                """),
-                                                {
-                                                    "existing_preprocessing_id": existing_by_pblanc.id,
-                                                    "duplicate_type": "pblanc_id_duplicate",
-                                                    "url_key_hash": None,
-                                                    "new_site_type": "api_scrap",
-                                                    "new_site_code": site_code,
-                                                    "existing_site_type": existing_by_pblanc.site_type,
-                                                    "existing_site_code": existing_by_pblanc.site_code,
-                                                    "new_priority": current_priority,
-                                                    "existing_priority": existing_priority,
-                                                    "new_folder_name": folder_name,
-                                                    "existing_folder_name": existing_by_pblanc.folder_name,
-                                                    "duplicate_detail": f"pblancId={pblanc_id}"
-                                                }
-                                            )
-                                            log_session.commit()
-                                            logger.debug("중복 로그 기록 완료 (PBLN ID 기반)")
-                                    except Exception as log_error:
-                                        logger.warning(f"중복 로그 기록 실패 (무시): {log_error}")
-
-                                    return existing_by_pblanc.id  # 기존 ID 반환하고 종료
+    def _flush_pending_writes(self) -> List[str]:
+        """
+        배치 모드에서 버퍼링된 저장 요청을 하나의 트랜잭션으로 기록합니다.
 
-                                else:
-                                    # 현재 데이터 우선순위가 더 높음 → 계속 진행
-                                    logger.info(
-                                        f"⚠️ PBLN ID 중복 발견하지만 현재 데이터 우선순위 높음: "
-                                        f"{site_code}({current_priority}) > "
-                                        f"{existing_by_pblanc.site_code}({existing_priority})\n"
-                                        f"   pblancId: {pblanc_id}\n"
-                                        f"   → 계속 진행"
-                                    )
+        Returns:
+            저장에 실패한 folder_name 목록
+        """
+        if not self._pending_writes:
+            return []
 
-                        except Exception as e:
-                            logger.error(f"PBLN ID 기반 중복 체크 실패 (계속 진행): {e}")
-                            # 에러 발생 시 기존 로직으로 폴백 (pblanc_id 초기화하여 scraping_url 체크 수행)
-                            pblanc_id = None
+        pending = self._pending_writes
+        self._pending_writes = []
 
-                # ================================================
-                # 🆕 API 사이트: scraping_url 기반 중복 체크
-                # ================================================
-                # API 사이트(bizInfo, smes24, kStartUp)는 scraping_url이 실제 데이터 출처
-                # origin_url은 다르지만 scraping_url이 같으면 동일 공고로 간주
-                # 🔧 통합 로직: pblanc_id가 있으면 PBLN ID 체크에서 이미 처리됨 → 스킵
-                if site_code in ['bizInfo', 'smes24', 'kStartUp'] and scraping_url and not pblanc_id:
-                    # 안전 장치: 빈 문자열이나 너무 짧은 URL 제외
-                    scraping_url_stripped = scraping_url.strip()
-                    if scraping_url_stripped and len(scraping_url_stripped) > 10:
-                        try:
-                            # scraping_url이 동일한 기존 레코드 검색
-                            # - 같은 site_code는 제외 (자기 자신 제외)
-                            # - 우선순위 순서: bizInfo(1) > smes24(2) > kStartUp(3)
-                            # - 같은 우선순위면 먼저 등록된 것 우선
-                            existing_by_scraping = session.execute(
-                                text("""
-                                    SELECT id, site_type, site_code, folder_name, url_key,
-                                           origin_url, scraping_url, created_at
-                                    FROM announcement_pre_processing
-                                    WHERE scraping_url = :scraping_url
-                                    AND site_code != :current_site_code
-                                    ORDER BY
-                                        CASE site_code
-                                            WHEN 'bizInfo' THEN 1
-                                            WHEN 'smes24' THEN 2
-                                            WHEN 'kStartUp' THEN 3
-                                            ELSE 99
-                                        END,
-                                        created_at ASC
-                                    LIMIT 1
-                                """),
-                                {
-                                    "scraping_url": scraping_url_stripped,
-                                    "current_site_code": site_code
-                                }
-                            ).fetchone()
-
-                            if existing_by_scraping:
-                                # 우선순위 비교
-                                priority_map = {'bizInfo': 1, 'smes24': 2, 'kStartUp': 3}
-                                existing_priority = priority_map.get(existing_by_scraping.site_code, 99)
-                                current_priority = priority_map.get(site_code, 99)
-
-                                if existing_priority <= current_priority:
-                                    # 기존 데이터 우선순위가 높거나 같음 → 현재 데이터 스킵
-                                    logger.info(
-                                        f"🚫 중복 스킵 (scraping_url 기반): "
-                                        f"동일 scraping_url 발견\n"
-                                        f"   현재 데이터: site_code={site_code}, "
-                                        f"folder={folder_name}\n"
-                                        f"   scraping_url: {scraping_url_stripped[:100]}"
-                                        f"{'...' if len(scraping_url_stripped) > 100 else ''}\n"
-                                        f"   기존 데이터: ID={existing_by_scraping.id}, "
-                                        f"site_code={existing_by_scraping.site_code}, "
-                                        f"folder={existing_by_scraping.folder_name}\n"
-                                        f"   우선순위: {existing_by_scraping.site_code}"
-                                        f"({existing_priority}) >= {site_code}({current_priority})\n"
-                                        f"   → 기존 데이터 우선 (지자체 원본 유지)"
-                                    )
+        if _db_write_lock is None:
+            return self._write_processing_results_batch(pending)
 
-                                    # announcement_duplicate_log에 기록
-                                    # 🔧 트랜잭션 경계 개선: 부분 커밋 제거 (독립 세션 사용)
-                                    try:
-                                        # 독립적인 세션에서 로그 기록 (메인 트랜잭션과 분리)
-                                        with self.db_manager.SessionLocal() as log_session:
-                                            log_session.execute(
-                                                text("""
-                                                    INSERT INTO announcement_duplicate_log (
-                                                        preprocessing_id, existing_preprocessing_id,
-                                                        duplicate_type, url_key_hash,
-                                                        new_site_type, new_site_code,
-                                                        existing_site_type, existing_site_code,
-                                                        new_folder_name, existing_folder_name,
-                                                        duplicate_detail, created_at
-                                                    ) VALUES (
-                                                        NULL, :existing_preprocessing_id,
-                                                        :duplicate_type, :url_key_hash,
-                                                        :new_site_type, :new_site_code,
-                                                        :existing_site_type, :existing_site_code,
-                                                        :new_folder_name, :existing_folder_name,
-                                                        :duplicate_detail, NOW()
-                                                    )
-                                                """),
-                                                {
-                                                    "existing_preprocessing_id": existing_by_scraping.id,
-                                                    "duplicate_type": "scraping_url_duplicate",
-                                                    "url_key_hash": url_key_hash,
-                                                    "new_site_type": site_type,
-                                                    "new_site_code": site_code,
-                                                    "existing_site_type": existing_by_scraping.site_type,
-                                                    "existing_site_code": existing_by_scraping.site_code,
-                                                    "new_folder_name": folder_name,
-                                                    "existing_folder_name": existing_by_scraping.folder_name,
-                                                    "duplicate_detail": f"scraping_url 중복: {scraping_url_stripped[:100]}"
-                                                }
-                                            )
-                                            log_session.commit()
-                                            logger.debug("중복 로그 기록 완료 (scraping_url 기반)")
-                                    except Exception as log_error:
-                                        logger.warning(f"중복 로그 기록 실패 (무시): {log_error}")
-
-                                    return existing_by_scraping.id  # 기존 ID 반환하고 종료
+        with _db_write_lock:
+            return self._write_processing_results_batch(pending)
 
-                                else:
-                                    # 현재 데이터 우선순위가 더 높음 → 계속 진행 (덮어쓰기)
-                                    logger.warning(
-                                        f"⚠️ 중복 발견하지만 현재 데이터 우선순위 높음: "
-                                        f"{site_code}({current_priority}) > "
-                                        f"{existing_by_scraping.site_code}({existing_priority})\n"
-                                        f"   기존 ID={existing_by_scraping.id} 유지하고 계속 진행"
-                                    )
-                                    # 계속 진행하여 UPSERT 로직으로 처리
+    def _lookup_scraping_url_duplicates(self, session, requests: List[Dict[str, Any]]) -> Dict[tuple, Any]:
+        """
+        API 사이트 요청의 scraping_url과 같은 다른 site_code 레코드를 site_code별 한 번의 쿼리로 조회합니다.
 
-                        except Exception as e:
-                            logger.error(f"scraping_url 기반 중복 체크 실패 (계속 진행): {e}")
-                            # 에러 발생 시 기존 로직으로 폴백
+        Returns:
+            {(site_code, scraping_url): 우선순위가 가장 높은 다른 사이트 레코드 또는 None}
+        """
+        from sqlalchemy import bindparam, text
+
+        scraping_urls_by_site = {}
+        for params in requests:
+            site_code = params["site_code"]
+            scraping_url = (params.get("scraping_url") or "").strip()
+            if site_code in _API_SITE_PRIORITY and len(scraping_url) > 10:
+                scraping_urls_by_site.setdefault(site_code, set()).add(scraping_url)
+
+        by_scraping_url = {}
+        for site_code, scraping_urls in scraping_urls_by_site.items():
+            by_scraping_url.update(
+                {(site_code, _dedup_lookup_key(url)): None for url in scraping_urls}
+            )
 
-                # UPSERT 실행 전에 기존 레코드 조회 (우선순위 비교 및 변경 추적을 위해)
-                # ⚠️ force 여부와 관계없이 조회 (force=False에서도 중복 로그 기록 필요)
-                # 🔒 FOR UPDATE: LLM 처리 체크와 UPSERT 사이의 Race Condition 방지
-                existing_record_before_upsert = None
-                if url_key:
-                    try:
-                        existing_record_before_upsert = session.execute(
-                            text("""
-                                SELECT id, site_type, site_code, folder_name,
-                                       title, content_md, combined_content,
-                                       attachment_filenames, exclusion_keyword,
-                                       processing_status, announcement_date
-                                FROM announcement_pre_processing
-                                WHERE url_key = :url_key
-                                LIMIT 1
-                                FOR UPDATE
-                            """),
-                            {"url_key": url_key}
-                        ).fetchone()
-
-                        if existing_record_before_upsert:
-                            logger.debug(
-                                f"UPSERT 전 기존 레코드 발견: ID={existing_record_before_upsert.id}, "
-                                f"site_type={existing_record_before_upsert.site_type}, "
-                                f"site_code={existing_record_before_upsert.site_code}"
-                            )
-
-                            # ================================================
-                            # 🆕 LLM 처리 중인지 확인 (중복 UPSERT 방지)
-                            # ================================================
-                            if self._is_llm_processing(session, existing_record_before_upsert.id):
-                                logger.warning(
-                                    f"⚠️ LLM 처리 중인 데이터 발견, UPSERT 스킵: "
-                                    f"ID={existing_record_before_upsert.id}, "
-                                    f"url_key={url_key[:50]}...\n"
-                                    f"   → LLM 처리 완료 후 재시도 필요"
-                                )
+            rows = session.execute(
+                text(
+                    """
+                    SELECT id, site_type, site_code, folder_name, url_key,
+                           origin_url, scraping_url, created_at
+                    FROM announcement_pre_processing
+                    WHERE scraping_url IN :scraping_urls
+                    AND site_code != :current_site_code
+                """
+                ).bindparams(bindparam("scraping_urls", expanding=True)),
+                {"scraping_urls": list(scraping_urls), "current_site_code": site_code},
+            )
 
-                                # announcement_duplicate_log에 기록
-                                # 🔧 트랜잭션 경계 개선: 부분 커밋 제거 (독립 세션 사용)
-                                try:
-                                    # 독립적인 세션에서 로그 기록 (메인 트랜잭션과 분리)
-                                    with self.db_manager.SessionLocal() as log_session:
-                                        log_session.execute(
-                                            text("""
-                                                INSERT INTO announcement_duplicate_log (
-                                                    preprocessing_id, existing_preprocessing_id,
-                                                    duplicate_type, url_key_hash,
-                                                    new_site_type, new_site_code,
-                                                    existing_site_type, existing_site_code,
-                                                    new_folder_name, existing_folder_name,
-                                                    duplicate_detail, created_at
-                                                ) VALUES (
-                                                    NULL, :existing_preprocessing_id,
-                                                    'llm_processing_skip', :url_key_hash,
-                                                    :new_site_type, :new_site_code,
-                                                    :existing_site_type, :existing_site_code,
-                                                    :new_folder_name, :existing_folder_name,
-                                                    :duplicate_detail, NOW()
-                                                )
-                                            """),
-                                            {
-                                                "existing_preprocessing_id": existing_record_before_upsert.id,
-                                                "url_key_hash": hashlib.md5(url_key.encode()).hexdigest() if url_key else None,
-                                                "new_site_type": self.site_type,
-                                                "new_site_code": site_code,
-                                                "existing_site_type": existing_record_before_upsert.site_type,
-                                                "existing_site_code": existing_record_before_upsert.site_code,
-                                                "new_folder_name": folder_name,
-                                                "existing_folder_name": existing_record_before_upsert.folder_name,
-                                                "duplicate_detail": json.dumps({
-                                                    "reason": "LLM 처리 중인 데이터로 UPSERT 스킵",
-                                                    "url_key": url_key[:100],
-                                                    "timestamp": datetime.now().isoformat()
-                                                }, ensure_ascii=False)
-                                            }
-                                        )
-                                        log_session.commit()
-                                        logger.debug("LLM 처리 중 스킵 로그 기록 완료")
-                                except Exception as log_error:
-                                    logger.warning(f"LLM 처리 중 스킵 로그 기록 실패 (무시): {log_error}")
-
-                                return existing_record_before_upsert.id  # 기존 ID 반환하고 종료
+            for row in rows:
+                lookup_key = (site_code, _dedup_lookup_key(row.scraping_url))
+                best = by_scraping_url.get(lookup_key)
+                if best is None or _duplicate_rank(row) < _duplicate_rank(best):
+                    by_scraping_url[lookup_key] = row
 
-                    except Exception as e:
-                        logger.warning(f"UPSERT 전 기존 레코드 조회 실패 (무시하고 계속): {e}")
+        return by_scraping_url
 
-                if force:
-                    # UPSERT 로직 with site_type 우선순위 (지자체 > API)
-                    sql = text(
-                        """
-                        INSERT INTO announcement_pre_processing (
-                            folder_name, folder_path, site_type, site_code, content_md, combined_content,
-                            attachment_filenames, attachment_files_list, exclusion_keyword, exclusion_reason,
-                            title, origin_url, url_key, scraping_url, announcement_date,
-                            processing_status, error_message, created_at, updated_at
-                        ) VALUES (
-                            :folder_name, :folder_path, :site_type, :site_code, :content_md, :combined_content,
-                            :attachment_filenames, :attachment_files_list, :exclusion_keyword, :exclusion_reason,
-                            :title, :origin_url, :url_key, :scraping_url, :announcement_date,
-                            :processing_status, :error_message, NOW(), NOW()
-                        )
-                        ON DUPLICATE KEY UPDATE
-                            folder_path = IF(
-                                VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
-                                site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
-                                VALUES(folder_path),
-                                folder_path
-                            ),
-                            site_type = IF(
-                                VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
-                                site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
-                                VALUES(site_type),
-                                site_type
-                            ),
-                            content_md = IF(
-                                VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
-                                site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
-                                VALUES(content_md),
-                                content_md
-                            ),
-                            combined_content = IF(
-                                VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
-                                site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
-                                VALUES(combined_content),
-                                combined_content
-                            ),
-                            attachment_filenames = IF(
-                                VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
-                                site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
-                                VALUES(attachment_filenames),
-                                attachment_filenames
-                            ),
-                            attachment_files_list = IF(
-                                VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
-                                site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
-                                VALUES(attachment_files_list),
-                                attachment_files_list
-                            ),
-                            exclusion_keyword = IF(
-                                VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
-                                site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
-                                VALUES(exclusion_keyword),
-                                exclusion_keyword
-                            ),
-                            exclusion_reason = IF(
-                                VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
-                                site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
-                                VALUES(exclusion_reason),
-                                exclusion_reason
-                            ),
-                            processing_status = IF(
-                                VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
-                                site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
-                                VALUES(processing_status),
-                                processing_status
-                            ),
-                            title = IF(
-                                VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
-                                site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
-                                VALUES(title),
-                                title
-                            ),
-                            origin_url = IF(
-                                VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
-                                site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
-                                VALUES(origin_url),
-                                origin_url
-                            ),
-                            url_key = IF(
-                                VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
-                                site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
-                                VALUES(url_key),
-                                url_key
-                            ),
-                            scraping_url = IF(
-                                VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
-                                site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
-                                VALUES(scraping_url),
-                                scraping_url
-                            ),
-                            announcement_date = IF(
-                                VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
-                                site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
-                                VALUES(announcement_date),
-                                announcement_date
-                            ),
-                            error_message = IF(
-                                VALUES(site_type) IN ('Eminwon', 'Homepage', 'Scraper') OR
-                                site_type NOT IN ('Eminwon', 'Homepage', 'Scraper'),
-                                VALUES(error_message),
-                                error_message
-                            ),
-                            updated_at = NOW()
-                    """
+    def _lookup_pblanc_duplicates(
+        self, session, requests: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Any]:
+        """
+        (site_code, pblanc_id) 요청별로 동일 pblancId를 가진 다른 API 사이트 레코드를 일괄 조회합니다.
+        pblanc_id 컬럼이 없는 DB에서는 건별 LIKE 검색으로 폴백합니다.
+
+        Returns:
+            {(site_code, pblanc_id): 우선순위가 가장 높은 다른 사이트 레코드 또는 None}
+        """
+        from sqlalchemy import bindparam, text
+
+        by_pblanc = {key: None for key in requests}
+        rows = []
+
+        if self._pblanc_id_column_available is not False:
+            try:
+                rows = session.execute(
+                    text("""
+                        SELECT id, site_type, site_code, folder_name, url_key, processing_status,
+                               origin_url, scraping_url, created_at, pblanc_id
+                        FROM announcement_pre_processing
+                        WHERE pblanc_id IN :pblanc_ids
+                        AND site_code IN ('bizInfo', 'smes24', 'kStartUp')
+                        AND processing_status = '성공'
+                    """).bindparams(bindparam("pblanc_ids", expanding=True)),
+                    {"pblanc_ids": sorted({pblanc_id for _, pblanc_id in by_pblanc})},
+                ).fetchall()
+                self._pblanc_id_column_available = True
+            except Exception as column_error:
+                if self._pblanc_id_column_available is None and "pblanc_id" in str(column_error):
+                    logger.warning(
+                        "pblanc_id 컬럼이 없어 LIKE 검색으로 폴백합니다 "
+                        "(alter_announcement_pre_processing_pblanc_id.sql 적용 필요)"
                     )
+                    self._pblanc_id_column_available = False
                 else:
-                    # 일반 INSERT with UPSERT (중복 처리)
-                    sql = text(
-                        """
-                        INSERT INTO announcement_pre_processing (
-                            folder_name, folder_path, site_type, site_code, content_md, combined_content,
-                            attachment_filenames, attachment_files_list, exclusion_keyword, exclusion_reason,
-                            title, origin_url, url_key, scraping_url, announcement_date,
-                            processing_status, error_message, created_at, updated_at
-                        ) VALUES (
-                            :folder_name, :folder_path, :site_type, :site_code, :content_md, :combined_content,
-                            :attachment_filenames, :attachment_files_list, :exclusion_keyword, :exclusion_reason,
-                            :title, :origin_url, :url_key, :scraping_url, :announcement_date,
-                            :processing_status, :error_message, NOW(), NOW()
+                    raise
+
+        if self._pblanc_id_column_available is False:
+            for site_code, pblanc_id in by_pblanc:
+                by_pblanc[(site_code, pblanc_id)] = self._find_pblanc_duplicate_like(
+                    session, pblanc_id, site_code
+                )
+            return by_pblanc
+
+        for row in rows:
+            for site_code in _API_SITE_PRIORITY:
+                lookup_key = (site_code, row.pblanc_id)
+                if row.site_code == site_code or lookup_key not in by_pblanc:
+                    continue
+                best = by_pblanc[lookup_key]
+                if best is None or _duplicate_rank(row) < _duplicate_rank(best):
+                    by_pblanc[lookup_key] = row
+
+        return by_pblanc
+
+    def _write_processing_results_batch(self, pending: List[Dict[str, Any]]) -> List[str]:
+        """
+        버퍼링된 저장 요청을 문장 종류별 일괄 쿼리로 기록하고 한 번만 커밋합니다.
+
+        중복 체크 조회, UPSERT, 레코드 ID 확인, 중복 로그, api_url_registry, EXCLUSION_COUNT를
+        각각 IN 조회 / executemany(다중 행 INSERT)로 수행합니다 (_write_batch_round).
+        일괄 기록이 실패하면 롤백하고 행마다 SAVEPOINT를 둔 건별 기록으로 다시 시도하여
+        한 건의 실패가 배치 전체를 되돌리지 않도록 합니다.
+
+        Returns:
+            저장에 실패한 folder_name 목록
+        """
+        try:
+            with self.db_manager.SessionLocal() as session:
+                try:
+                    failed_folders = []
+                    registrations = []
+                    for rows in self._split_batch_rounds(pending):
+                        round_failed, round_registrations = self._write_batch_round(session, rows)
+                        failed_folders.extend(round_failed)
+                        registrations.extend(round_registrations)
+                    session.commit()
+                except Exception as e:
+                    logger.warning(f"일괄 기록 실패, 건별 기록으로 재시도 ({len(pending)}건): {e}")
+                    session.rollback()
+                    failed_folders = self._write_rows_individually(session, pending)
+                    registrations = []  # 건별 기록은 저장하면서 인덱스에 반영함
+                    session.commit()
+
+            # 커밋된 레코드를 처리 완료 인덱스에 반영 (인덱스 키는 원본 site_code)
+            for registration in registrations:
+                self._register_processed(*registration)
+
+            logger.info(
+                f"배치 저장 완료: {len(pending) - len(failed_folders)}/{len(pending)}건 (커밋 1회)"
+            )
+            return failed_folders
+
+        except Exception as e:
+            logger.error(f"배치 저장 실패 ({len(pending)}건): {e}")
+            # 커밋되지 않은 항목이 처리 완료 인덱스에 반영되었을 수 있으므로 해당 사이트 인덱스를 DB에서 다시 로드
+            # (다시 로드하지 못하면 인덱스가 폐기되어 이후 체크는 건별 DB 조회로 폴백)
+            for site_code in {params["site_code"] for params in pending}:
+                if site_code in self._processed_index:
+                    self._load_processed_index(site_code)
+            return [params["folder_name"] for params in pending]
+
+    def _write_rows_individually(self, session, pending: List[Dict[str, Any]]) -> List[str]:
+        """
+        일괄 기록 실패 시 폴백: 요청마다 SAVEPOINT를 두고 _write_processing_result로 기록합니다.
+        중복 체크 조회는 행마다 새로 수행하므로 앞 행의 기록 결과가 뒤 행의 판단에 반영됩니다.
+        """
+        failed_folders = []
+
+        for params in pending:
+            savepoint = session.begin_nested()
+            record_id = self._write_processing_result(**params, batch_session=session)
+
+            if record_id is None:
+                savepoint.rollback()
+                failed_folders.append(params["folder_name"])
+            else:
+                savepoint.commit()
+
+        return failed_folders
+
+    def _split_batch_rounds(self, pending: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        같은 레코드/공고를 가리키는 요청(folder_name, url_key, pblancId, scraping_url이 같은 요청)이
+        한 라운드에 함께 들어가지 않도록 나눕니다. 뒤 요청은 앞 요청의 기록 결과를 보고 판단합니다.
+        """
+        rounds = []
+        last_round = {}
+
+        for request in pending:
+            keys = [("folder_name", _dedup_lookup_key(request["folder_name"]))]
+            if request["url_key"]:
+                keys.append(("url_key", _dedup_lookup_key(request["url_key"])))
+            pblanc_id = _extract_pblanc_id(request["origin_url"]) or _extract_pblanc_id(request["scraping_url"])
+            if pblanc_id:
+                keys.append(("pblanc_id", pblanc_id))
+            scraping_url = (request["scraping_url"] or "").strip()
+            if scraping_url:
+                keys.append(("scraping_url", _dedup_lookup_key(scraping_url)))
+
+            index = max((last_round[key] + 1 for key in keys if key in last_round), default=0)
+            if index == len(rounds):
+                rounds.append([])
+            rounds[index].append(request)
+            for key in keys:
+                last_round[key] = index
+
+        return rounds
+
+    def _write_batch_round(
+        self, session, rows: List[Dict[str, Any]]
+    ) -> Tuple[List[str], List[tuple]]:
+        """
+        서로 다른 레코드를 가리키는 요청들을 문장 종류별 일괄 쿼리로 기록합니다. (커밋하지 않음)
+
+        Returns:
+            (저장에 실패한 folder_name 목록, 처리 완료 인덱스에 반영할 _register_processed 인자 목록)
+        """
+        from sqlalchemy import text
+
+        lookups = self._lookup_duplicates(session, rows)
+
+        # 1. 중복 스킵 판단 (건별 저장과 같은 _duplicate_skip_log)
+        log_rows = []
+        to_upsert = []
+        for request in rows:
+            skip_log = self._duplicate_skip_log(request, lookups)
+            if skip_log is not None:
+                log_rows.append(skip_log)
+                continue
+
+            existing = None
+            if request["url_key"]:
+                existing = lookups["by_url_key"].get(_dedup_lookup_key(request["url_key"]))
+            params = self._build_upsert_params(
+                **{name: value for name, value in request.items() if name != "force"}
+            )
+            to_upsert.append((request, params, existing))
+
+        # 2. UPSERT (force 여부별 executemany → pymysql이 다중 행 INSERT ... ON DUPLICATE KEY UPDATE로 묶음)
+        for force in (False, True):
+            group = [params for request, params, _ in to_upsert if bool(request["force"]) == force]
+            for start in range(0, len(group), _UPSERT_CHUNK_SIZE):
+                session.execute(
+                    text(_FORCE_UPSERT_SQL if force else _UPSERT_SQL),
+                    group[start:start + _UPSERT_CHUNK_SIZE],
+                )
+
+        # 3. 저장된 레코드 ID / url_key_hash 일괄 확인
+        saved_records = self._resolve_saved_records(session, [params for _, params, _ in to_upsert])
+
+        failed_folders = []
+        registrations = []
+        registry_entries = []
+        keyword_counts = Counter()
+
+        for (request, params, existing), saved in zip(to_upsert, saved_records):
+            if saved is None:
+                logger.error(f"처리 결과 저장 실패: 저장된 레코드를 찾을 수 없음 ({request['folder_name']})")
+                failed_folders.append(request["folder_name"])
+                continue
+
+            url_key_hash = saved.url_key_hash if request["url_key"] else None
+
+            updated = self._is_upsert_update(params, existing, lookups)
+            log_rows.append(
+                self._duplicate_log_params(
+                    **self._upsert_log_fields(params, saved.id, url_key_hash, updated, existing)
+                )
+            )
+
+            if request["origin_url"] and params["site_code"] in _API_SITE_PRIORITY:
+                registry_entries.append({
+                    "preprocessing_id": saved.id,
+                    "site_code": params["site_code"],
+                    "folder_name": request["folder_name"],
+                    "url_key_hash": url_key_hash,
+                    "scraping_url": request["scraping_url"],
+                    "origin_url": request["origin_url"],
+                })
+
+            if request["status"] == "제외" and request["exclusion_keywords"]:
+                keyword_counts.update(request["exclusion_keywords"])
+
+            registrations.append((request["site_code"], request["folder_name"]))
+            logger.info(f"처리 결과 저장 완료: ID {saved.id}, 상태: {request['status']}")
+
+        # 4. announcement_duplicate_log (스킵 로그 포함, executemany 1회)
+        if log_rows:
+            try:
+                session.execute(text(_DUPLICATE_LOG_SQL), log_rows)
+            except Exception as e:
+                # 로그 기록 실패해도 메인 처리는 계속 진행
+                logger.error(f"중복 로그 일괄 기록 실패 ({len(log_rows)}건): {e}")
+
+        # 5. api_url_registry / EXCLUSION_COUNT
+        if registry_entries:
+            self._update_api_url_registry_batch(session, registry_entries)
+        if keyword_counts:
+            self._increment_exclusion_counts(session, keyword_counts)
+
+        return failed_folders, registrations
+
+    def _lookup_duplicates(self, session, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        요청들의 중복 체크/UPSERT 판단에 필요한 조회를 종류별 한 번의 쿼리로 수행합니다.
+        배치 라운드(_write_batch_round)와 건별 저장(_write_processing_result)이 함께 사용합니다.
+
+        Returns:
+            {
+                "by_pblanc": {(site_code, pblanc_id): 다른 사이트 레코드 또는 None},
+                "by_scraping_url": {(site_code, scraping_url): 다른 사이트 레코드 또는 None},
+                "by_url_key": {url_key: 기존 레코드 (FOR UPDATE)},
+                "llm_processing_ids": LLM 처리 중인 기존 레코드 ID 집합,
+                "existing_folders": 이미 있는 (folder_name, site_code) 집합,
+            }
+        """
+        from sqlalchemy import bindparam, text
+
+        # PBLN ID / scraping_url (API 사이트, pblancId가 없는 요청만 scraping_url로 체크)
+        pblanc_requests = []
+        scraping_requests = []
+        for request in rows:
+            if request["site_code"] not in _API_SITE_PRIORITY:
+                continue
+            pblanc_id = _extract_pblanc_id(request["origin_url"]) or _extract_pblanc_id(request["scraping_url"])
+            if pblanc_id:
+                pblanc_requests.append((request["site_code"], pblanc_id))
+            else:
+                scraping_requests.append(request)
+
+        lookups = {
+            "by_pblanc": self._lookup_pblanc_duplicates(session, pblanc_requests) if pblanc_requests else {},
+            "by_scraping_url": self._lookup_scraping_url_duplicates(session, scraping_requests),
+            "by_url_key": {},
+            "llm_processing_ids": set(),
+        }
+
+        # url_key 기존 레코드 (🔒 FOR UPDATE: LLM 처리 체크와 UPSERT 사이의 Race Condition 방지)
+        url_keys = sorted({request["url_key"] for request in rows if request["url_key"]})
+        if url_keys:
+            existing_rows = session.execute(
+                text("""
+                    SELECT id, site_type, site_code, folder_name, url_key,
+                           title, content_md, combined_content,
+                           attachment_filenames, exclusion_keyword,
+                           processing_status, announcement_date
+                    FROM announcement_pre_processing
+                    WHERE url_key IN :url_keys
+                    FOR UPDATE
+                """).bindparams(bindparam("url_keys", expanding=True)),
+                {"url_keys": url_keys},
+            )
+            for row in existing_rows:
+                lookups["by_url_key"].setdefault(_dedup_lookup_key(row.url_key), row)
+
+            lookups["llm_processing_ids"] = self._llm_processing_ids(
+                session, [row.id for row in lookups["by_url_key"].values()]
+            )
+
+        # folder_name 기존 레코드 (신규 INSERT / UPDATE 구분용)
+        condition, params = _tuple_in_clause(
+            ("folder_name", "site_code"),
+            [(request["folder_name"], self._db_site_code(request["site_code"])) for request in rows],
+            "folder",
+        )
+        lookups["existing_folders"] = {
+            (_dedup_lookup_key(row.folder_name), _dedup_lookup_key(row.site_code))
+            for row in session.execute(
+                text(f"SELECT folder_name, site_code FROM announcement_pre_processing WHERE {condition}"),
+                params,
+            )
+        }
+
+        return lookups
+
+    def _duplicate_skip_log(self, request: Dict[str, Any], lookups: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        기존 레코드가 우선하여 저장하지 않을 요청이면 중복 스킵 로그 파라미터를, 아니면 None을 반환합니다.
+        판단 순서: PBLN ID → scraping_url (API 사이트) → LLM 처리 중 (url_key)
+
+        Args:
+            lookups: _lookup_duplicates 결과
+        """
+        site_code = request["site_code"]
+        folder_name = request["folder_name"]
+        url_key = request["url_key"]
+
+        if site_code in _API_SITE_PRIORITY:
+            pblanc_id = _extract_pblanc_id(request["origin_url"]) or _extract_pblanc_id(request["scraping_url"])
+            scraping_url = (request["scraping_url"] or "").strip()
+
+            existing = None
+            if pblanc_id:
+                existing = lookups["by_pblanc"].get((site_code, pblanc_id))
+            elif len(scraping_url) > 10:
+                existing = lookups["by_scraping_url"].get((site_code, _dedup_lookup_key(scraping_url)))
+
+            if existing is not None:
+                current_priority = _API_SITE_PRIORITY[site_code]
+                existing_priority = _API_SITE_PRIORITY.get(existing.site_code, 99)
+                basis = "PBLN ID" if pblanc_id else "scraping_url"
+
+                if existing_priority <= current_priority:
+                    # 기존 데이터 우선순위가 높거나 같음 → 현재 데이터 스킵
+                    logger.info(
+                        f"🚫 중복 스킵 ({basis} 기반): 현재 데이터 site_code={site_code}, folder={folder_name} / "
+                        f"기존 데이터 ID={existing.id}, site_code={existing.site_code}, "
+                        f"folder={existing.folder_name} → 기존 데이터 우선"
+                    )
+                    if pblanc_id:
+                        return self._skip_log_params(
+                            "pblanc_id_duplicate", site_code, folder_name, existing,
+                            new_site_type="api_scrap",
+                            new_priority=current_priority,
+                            existing_priority=existing_priority,
+                            duplicate_detail=f"pblancId={pblanc_id}",
                         )
-                        ON DUPLICATE KEY UPDATE
-                            folder_name = VALUES(folder_name),
-                            folder_path = VALUES(folder_path),
-                            site_type = VALUES(site_type),
-                            site_code = VALUES(site_code),
-                            content_md = VALUES(content_md),
-                            combined_content = VALUES(combined_content),
-                            attachment_filenames = VALUES(attachment_filenames),
-                            attachment_files_list = VALUES(attachment_files_list),
-                            exclusion_keyword = VALUES(exclusion_keyword),
-                            exclusion_reason = VALUES(exclusion_reason),
-                            title = VALUES(title),
-                            origin_url = VALUES(origin_url),
-                            url_key = VALUES(url_key),
-                            scraping_url = VALUES(scraping_url),
-                            announcement_date = VALUES(announcement_date),
-                            processing_status = VALUES(processing_status),
-                            error_message = VALUES(error_message),
-                            updated_at = NOW()
-                    """
+                    return self._skip_log_params(
+                        "scraping_url_duplicate", site_code, folder_name, existing,
+                        url_key_hash=_url_key_hash(url_key),
+                        duplicate_detail=f"scraping_url 중복: {scraping_url[:100]}",
                     )
 
-                # JSON으로 직렬화
-                attachment_files_json = (
-                    json.dumps(attachment_files_info, ensure_ascii=False)
-                    if attachment_files_info
-                    else None
+                logger.info(
+                    f"⚠️ {basis} 중복 발견하지만 현재 데이터 우선순위 높음: "
+                    f"{site_code}({current_priority}) > {existing.site_code}({existing_priority}) → 계속 진행"
                 )
 
-                # Homepage 또는 Eminwon인 경우 DB에 저장할 site_code에 "prv_" 접두사 추가
-                # 단, 원본 site_code는 변경하지 않음 (API 업데이트 등에서 사용)
-                db_site_code = ("prv_" + site_code) if self.site_type in ("Homepage", "Eminwon") else site_code
+        existing = lookups["by_url_key"].get(_dedup_lookup_key(url_key)) if url_key else None
+        if existing is not None and existing.id in lookups["llm_processing_ids"]:
+            logger.warning(
+                f"⚠️ LLM 처리 중인 데이터 발견, UPSERT 스킵: ID={existing.id}, url_key={url_key[:50]}...\n"
+                f"   → LLM 처리 완료 후 재시도 필요"
+            )
+            return self._llm_skip_log_params(site_code, folder_name, url_key, existing)
+
+        return None
+
+    def _is_upsert_update(
+        self, params: Dict[str, Any], existing, lookups: Dict[str, Any]
+    ) -> bool:
+        """UPSERT 전에 url_key 또는 (folder_name, site_code)가 같은 레코드가 있었으면 UPDATE입니다."""
+        folder_key = (_dedup_lookup_key(params["folder_name"]), _dedup_lookup_key(params["site_code"]))
+        return existing is not None or folder_key in lookups["existing_folders"]
+
+    def _resolve_saved_records(self, session, upsert_params: List[Dict[str, Any]]) -> List[Any]:
+        """
+        UPSERT한 레코드의 (id, url_key_hash)를 (folder_name, site_code) IN 조회 한 번으로 확인합니다.
+        force UPSERT는 folder_name을 바꾸지 않으므로, 찾지 못한 요청은 url_key로 한 번 더 조회합니다.
+
+        Returns:
+            upsert_params와 같은 순서의 조회 결과 목록 (찾지 못하면 None)
+        """
+        from sqlalchemy import bindparam, text
+
+        if not upsert_params:
+            return []
+
+        condition, params = _tuple_in_clause(
+            ("folder_name", "site_code"),
+            [(p["folder_name"], p["site_code"]) for p in upsert_params],
+            "saved",
+        )
+        by_folder = {
+            (_dedup_lookup_key(row.folder_name), _dedup_lookup_key(row.site_code)): row
+            for row in session.execute(
+                text(
+                    f"SELECT id, folder_name, site_code, url_key_hash "
+                    f"FROM announcement_pre_processing WHERE {condition}"
+                ),
+                params,
+            )
+        }
+        saved_records = [
+            by_folder.get((_dedup_lookup_key(p["folder_name"]), _dedup_lookup_key(p["site_code"])))
+            for p in upsert_params
+        ]
+
+        missing_url_keys = sorted({
+            p["url_key"] for p, saved in zip(upsert_params, saved_records) if saved is None and p["url_key"]
+        })
+        if missing_url_keys:
+            by_url_key = {
+                _dedup_lookup_key(row.url_key): row
+                for row in session.execute(
+                    text("""
+                        SELECT id, url_key, url_key_hash
+                        FROM announcement_pre_processing
+                        WHERE url_key IN :url_keys
+                    """).bindparams(bindparam("url_keys", expanding=True)),
+                    {"url_keys": missing_url_keys},
+                )
+            }
+            saved_records = [
+                by_url_key.get(_dedup_lookup_key(p["url_key"])) if saved is None and p["url_key"] else saved
+                for p, saved in zip(upsert_params, saved_records)
+            ]
+
+        return saved_records
+
+    def _update_api_url_registry_batch(self, session, entries: List[Dict[str, Any]]) -> None:
+        """
+        배치로 저장된 API 사이트 레코드의 api_url_registry.preprocessing_id를 일괄 갱신합니다.
+
+        _update_api_url_registry와 같은 순서(folder_name → url_key_hash → scrap_url /
+        announcement_url(scraping_url → origin_url))로 단계마다 IN 조회 한 번으로 매칭하고,
+        매칭된 레코드를 UPDATE 한 번으로 갱신합니다.
+
+        Args:
+            entries: {"preprocessing_id", "site_code", "folder_name", "url_key_hash",
+                      "scraping_url", "origin_url"} 목록
+        """
+        try:
+            from sqlalchemy import bindparam, text
+
+            # (api_url_registry 매칭 식, 요청 값 키, site_code 조건 여부, 대상 사이트)
+            # api_url_registry.folder_name은 'output/data/{site_code}/{folder_id}' 형식
+            stages = [
+                ("SUBSTRING_INDEX(folder_name, '/', -1)", "folder_name", True, None),
+                ("url_key_hash", "url_key_hash", True, None),
+                ("scrap_url", "scraping_url", False, {"kStartUp"}),
+                ("announcement_url", "scraping_url", False, {"bizInfo", "smes24"}),
+                ("announcement_url", "origin_url", False, {"bizInfo", "smes24"}),
+            ]
+
+            assignments = {}  # api_url_registry.id → preprocessing_id
+            remaining = list(entries)
+
+            for match_expr, value_key, by_site, site_codes in stages:
+                candidates = [
+                    entry for entry in remaining
+                    if entry[value_key] and (site_codes is None or entry["site_code"] in site_codes)
+                ]
+                if not candidates:
+                    continue
+
+                groups = sorted({entry["site_code"] for entry in candidates}) if by_site else [None]
+                matched_entries = set()
+
+                for site_code in groups:
+                    group = [entry for entry in candidates if site_code in (None, entry["site_code"])]
+                    try:
+                        registry_ids = self._match_registry_ids(
+                            session, match_expr, [entry[value_key] for entry in group], site_code
+                        )
+                    except Exception as e:
+                        # url_key_hash 컬럼이 없을 수 있음 (다음 매칭 단계로 폴백)
+                        logger.debug(f"api_url_registry {match_expr} 매칭 실패, 다음 단계로 폴백: {e}")
+                        continue
+
+                    for entry in group:
+                        registry_id = registry_ids.get(_dedup_lookup_key(entry[value_key]))
+                        if registry_id is not None:
+                            assignments[registry_id] = entry["preprocessing_id"]
+                            matched_entries.add(id(entry))
+
+                remaining = [entry for entry in remaining if id(entry) not in matched_entries]
+
+            if assignments:
+                cases = []
+                params = {"registry_ids": list(assignments)}
+                for i, (registry_id, preprocessing_id) in enumerate(assignments.items()):
+                    cases.append(f"WHEN :registry_id_{i} THEN :preprocessing_id_{i}")
+                    params[f"registry_id_{i}"] = registry_id
+                    params[f"preprocessing_id_{i}"] = preprocessing_id
+
+                session.execute(
+                    text(f"""
+                        UPDATE api_url_registry
+                        SET preprocessing_id = CASE id {' '.join(cases)} END,
+                            update_at = NOW()
+                        WHERE id IN :registry_ids
+                    """).bindparams(bindparam("registry_ids", expanding=True)),
+                    params,
+                )
+                logger.info(f"✅ api_url_registry 일괄 업데이트: {len(assignments)}건")
+
+            for entry in remaining:
+                logger.warning(
+                    f"⚠️  API 사이트이지만 api_url_registry 업데이트 실패: "
+                    f"site_code={entry['site_code']}, origin_url={entry['origin_url'][:80]}..."
+                )
+
+        except Exception as e:
+            # 테이블이 존재하지 않거나 컬럼이 없는 경우 경고만 출력
+            logger.warning(f"api_url_registry 일괄 업데이트 실패 (무시하고 계속): {e}")
+
+    def _match_registry_ids(
+        self, session, match_expr: str, values: List[str], site_code: str = None
+    ) -> Dict[str, int]:
+        """api_url_registry에서 match_expr 값이 values에 있는 레코드를 찾아 {값: 먼저 등록된 id}로 반환합니다."""
+        from sqlalchemy import bindparam, text
+
+        site_condition = "AND site_code = :site_code" if site_code else ""
+        rows = session.execute(
+            text(f"""
+                SELECT id, {match_expr} AS match_value
+                FROM api_url_registry
+                WHERE {match_expr} IN :match_values
+                {site_condition}
+                ORDER BY id
+            """).bindparams(bindparam("match_values", expanding=True)),
+            {"match_values": sorted(set(values)), "site_code": site_code},
+        )
+
+        registry_ids = {}
+        for row in rows:
+            registry_ids.setdefault(_dedup_lookup_key(row.match_value), row.id)
+        return registry_ids
+
+    def _increment_exclusion_counts(self, session, keyword_counts: Counter) -> None:
+        """제외 처리된 키워드의 EXCLUSION_COUNT를 증가분별 UPDATE 한 번으로 올립니다."""
+        from sqlalchemy import bindparam, text
+
+        keywords_by_increment = {}
+        for keyword, count in keyword_counts.items():
+            keywords_by_increment.setdefault(count, []).append(keyword)
+
+        for increment, keywords in keywords_by_increment.items():
+            try:
+                session.execute(
+                    text("""
+                        UPDATE EXCLUSION_KEYWORDS
+                        SET EXCLUSION_COUNT = EXCLUSION_COUNT + :increment
+                        WHERE KEYWORD IN :keywords
+                        AND IS_ACTIVE = 1
+                    """).bindparams(bindparam("keywords", expanding=True)),
+                    {"increment": increment, "keywords": keywords},
+                )
+                logger.debug(f"EXCLUSION_COUNT 업데이트 완료: +{increment} {keywords}")
+            except Exception as e:
+                logger.warning(f"EXCLUSION_COUNT 업데이트 실패 (계속 진행): keywords={keywords}, error={e}")
+
+    def _write_processing_result(
+        self,
+        folder_name: str,
+        site_code: str,
+        content_md: str,
+        combined_content: str,
+        attachment_filenames: List[str] = None,
+        status: str = "성공",
+        exclusion_keywords: List[str] = None,
+        exclusion_reason: str = None,
+        error_message: str = None,
+        force: bool = False,
+        title: str = None,
+        origin_url: str = None,
+        url_key: str = None,
+        scraping_url: str = None,
+        announcement_date: str = None,
+        attachment_files_info: List[Dict[str, Any]] = None,
+        folder_path: str = None,
+        batch_session=None,
+    ) -> Optional[int]:
+        """
+        처리 결과를 데이터베이스에 저장합니다.
+
+        중복 체크는 배치 기록과 같은 _lookup_duplicates / _duplicate_skip_log로 수행합니다.
+        batch_session이 주어지면 (배치 폴백) 해당 세션에서 실행하고 커밋하지 않습니다.
+        """
+        try:
+            from sqlalchemy import text
 
-                params = {
+            with (
+                nullcontext(batch_session)
+                if batch_session is not None
+                else self.db_manager.SessionLocal()
+            ) as session:
+                request = {
                     "folder_name": folder_name,
-                    "folder_path": folder_path,
-                    "site_type": self.site_type,
-                    "site_code": db_site_code,
-                    "content_md": content_md,
-                    "combined_content": combined_content,
-                    "attachment_filenames": (
-                        ", ".join(attachment_filenames)
-                        if attachment_filenames
-                        else None
-                    ),
-                    "attachment_files_list": attachment_files_json,
-                    "exclusion_keyword": (
-                        ", ".join(exclusion_keywords) if exclusion_keywords else None
-                    ),
-                    "exclusion_reason": exclusion_reason,
-                    "title": title,
+                    "site_code": site_code,
                     "origin_url": origin_url,
                     "url_key": url_key,
                     "scraping_url": scraping_url,
-                    "announcement_date": announcement_date,
-                    "processing_status": status,
-                    "error_message": error_message,
                 }
 
+                # ================================================
+                # 중복 체크 (PBLN ID → scraping_url → LLM 처리 중)
+                # ================================================
+                # 🔒 url_key 기존 레코드는 FOR UPDATE로 조회: LLM 처리 체크와 UPSERT 사이의 Race Condition 방지
+                lookups = self._lookup_duplicates(session, [request])
+
+                skip_log = self._duplicate_skip_log(request, lookups)
+                if skip_log is not None:
+                    # announcement_duplicate_log에 기록 (같은 트랜잭션)
+                    try:
+                        session.execute(text(_DUPLICATE_LOG_SQL), skip_log)
+                        if batch_session is None:
+                            session.commit()
+                        logger.debug(f"중복 스킵 로그 기록 완료 ({skip_log['duplicate_type']})")
+                    except Exception as log_error:
+                        logger.warning(f"중복 스킵 로그 기록 실패 (무시): {log_error}")
+
+                    return skip_log["existing_preprocessing_id"]  # 기존 ID 반환하고 종료
+
+                existing_record_before_upsert = (
+                    lookups["by_url_key"].get(_dedup_lookup_key(url_key)) if url_key else None
+                )
+                if existing_record_before_upsert:
+                    logger.debug(
+                        f"UPSERT 전 기존 레코드 발견: ID={existing_record_before_upsert.id}, "
+                        f"site_type={existing_record_before_upsert.site_type}, "
+                        f"site_code={existing_record_before_upsert.site_code}"
+                    )
+
+                sql = text(_FORCE_UPSERT_SQL if force else _UPSERT_SQL)
+
+                # Homepage 또는 Eminwon인 경우 DB에 저장할 site_code에 "prv_" 접두사 추가
+                # 단, 원본 site_code는 변경하지 않음 (API 업데이트 등에서 사용)
+                db_site_code = self._db_site_code(site_code)
+
+                params = self._build_upsert_params(
+                    folder_name=folder_name,
+                    site_code=site_code,
+                    content_md=content_md,
+                    combined_content=combined_content,
+                    attachment_filenames=attachment_filenames,
+                    status=status,
+                    exclusion_keywords=exclusion_keywords,
+                    exclusion_reason=exclusion_reason,
+                    error_message=error_message,
+                    title=title,
+                    origin_url=origin_url,
+                    url_key=url_key,
+                    scraping_url=scraping_url,
+                    announcement_date=announcement_date,
+                    attachment_files_info=attachment_files_info,
+                    folder_path=folder_path,
+                )
+
                 result = session.execute(sql, params)
                 record_id = result.lastrowid
-                affected_rows = result.rowcount
 
                 # ================================================
                 # 🔧 url_key_hash 조회 (GENERATED COLUMN이므로 DB에서 자동 생성)
@@ -2537,262 +3193,18 @@ class AnnouncementPreProcessor:
                         logger.warning(f"url_key_hash 조회 실패: record_id={record_id}")
 
                 # ================================================
-                # 🆕 API URL 처리 로그 기록
+                # 🆕 announcement_duplicate_log 기록
                 # ================================================
-                # url_key가 없으면 'no_url_key' 상태로 기록
-                if not url_key:
-                    # ================================================
-                    # 🆕 api_url_processing_log 기록 (삭제 예정)
-                    # ================================================
-                    self._log_api_url_processing(
-                        session=session,
-                        site_code=db_site_code,  # ← site_code → db_site_code (일관성)
-                        url_key=None,
-                        url_key_hash=None,
-                        processing_status='no_url_key',
-                        preprocessing_id=record_id,
-                        title=title,
-                        folder_name=folder_name,
-                        error_message="URL 정규화 실패 (url_key 없음)"
-                    )
-
-                    # ================================================
-                    # 🆕 announcement_duplicate_log 기록 (신규)
-                    # ================================================
-                    # url_key가 없음 → domain_key_config에 설정 없음 or URL 추출 실패
-                    from urllib.parse import urlparse
-                    domain = None
-                    if origin_url:
-                        try:
-                            parsed_url = urlparse(origin_url)
-                            domain = parsed_url.netloc
-                        except Exception as e:
-                            logger.warning(f"URL 파싱 실패: {origin_url}, {e}")
-
-                    self._log_announcement_duplicate(
-                        session=session,
-                        preprocessing_id=record_id,
-                        url_key_hash=None,
-                        duplicate_type='unconfigured_domain',  # domain_key_config 없거나 URL 추출 실패
-                        site_code=db_site_code,
-                        folder_name=folder_name,
-                        domain=domain,
-                        domain_configured=False,
-                        existing_record=None,
-                        error_message="URL 정규화 실패 (url_key 없음)"
-                    )
-                else:
-                    # ⚠️ url_key_hash는 GENERATED COLUMN이므로 이미 위에서 DB 조회로 취득함
-                    # (line 2037-2047에서 조회)
-
-                    # domain_key_config 확인
-                    from urllib.parse import urlparse
-                    parsed_url = urlparse(origin_url)
-                    domain = parsed_url.netloc
-                    domain_has_config = self.url_key_extractor.get_domain_config(domain, parsed_url.path)
-
-                    # 처리 상태 결정
-                    processing_status = None
-                    existing_preprocessing_id = None
-                    existing_site_type = None
-                    existing_site_code = None
-                    duplicate_reason = None
-
-                    # domain_key_config 확인 및 처리
-                    if not domain_has_config:
-                        # domain_key_config에 없는 경우 (API 외부 도메인 등)
-                        logger.debug(
-                            f"domain_key_config 없음: domain={domain}, url_key={url_key[:50]}... "
-                            f"fallback으로 url_key 생성됨"
-                        )
-                        processing_status = 'new_inserted'  # domain_key_config 없어도 신규로 처리
-                        duplicate_reason = {
-                            "reason": f"domain_key_config not found, treated as new (domain={domain})",
-                            "domain": domain,
-                            "url_key": url_key
-                        }
-
-                    # domain_key_config 있는 경우: 정상 중복 체크
-                    elif affected_rows == 1:
-                        # 새로 INSERT됨
-                        processing_status = 'new_inserted'  # ← 중복 체크 결과 (duplicate_type용)
-                        logger.debug(f"새 레코드 삽입: ID={record_id}, url_key_hash={url_key_hash[:16]}...")
-
-                    elif affected_rows == 2:
-                        # UPDATE됨 (ON DUPLICATE KEY UPDATE 실행)
-                        logger.debug(f"중복 감지 (affected_rows=2): url_key_hash={url_key_hash[:16]}...")
-
-                        # UPSERT 전에 조회한 기존 레코드 정보 사용
-                        if existing_record_before_upsert:
-                            # 업데이트 전의 정확한 값으로 우선순위 비교
-                            existing_site_type = existing_record_before_upsert.site_type
-                            existing_site_code = existing_record_before_upsert.site_code
-                            existing_preprocessing_id = existing_record_before_upsert.id
-
-                            # 우선순위 비교
-                            current_priority = self._get_priority(self.site_type)
-                            existing_priority = self._get_priority(existing_site_type)
-
-                            if current_priority > existing_priority:
-                                # 현재가 더 높은 우선순위 → 업데이트됨
-                                processing_status = 'duplicate_updated'
-                                duplicate_reason = {
-                                    "reason": f"{self.site_type} (priority {current_priority}) > {existing_site_type} (priority {existing_priority})",
-                                    "current_priority": current_priority,
-                                    "existing_priority": existing_priority,
-                                    "updated": True
-                                }
-                                logger.info(
-                                    f"✓ 우선순위 높음: {self.site_type}({current_priority}) > "
-                                    f"{existing_site_type}({existing_priority}) → 업데이트됨"
-                                )
-                            elif current_priority == existing_priority:
-                                # 같은 우선순위 → 업데이트됨 (최신 데이터 우선)
-                                processing_status = 'duplicate_updated'
-                                duplicate_reason = {
-                                    "reason": f"{self.site_type} (priority {current_priority}) == {existing_site_type} (priority {existing_priority}), 최신 데이터 우선",
-                                    "current_priority": current_priority,
-                                    "existing_priority": existing_priority,
-                                    "updated": True
-                                }
-                                logger.info(
-                                    f"✓ 우선순위 동일: {self.site_type}({current_priority}) == "
-                                    f"{existing_site_type}({existing_priority}) → 업데이트됨 (최신 데이터)"
-                                )
-                            else:
-                                # 현재가 더 낮은 우선순위 → 기존 유지
-                                processing_status = 'duplicate_preserved'
-                                duplicate_reason = {
-                                    "reason": f"{self.site_type} (priority {current_priority}) < {existing_site_type} (priority {existing_priority})",
-                                    "current_priority": current_priority,
-                                    "existing_priority": existing_priority,
-                                    "updated": False
-                                }
-                                logger.info(
-                                    f"⚠️  우선순위 낮음: {self.site_type}({current_priority}) < "
-                                    f"{existing_site_type}({existing_priority}) → 기존 데이터 유지"
-                                )
-                        else:
-                            # UPSERT 전 조회 실패 → 업데이트됨으로 간주
-                            processing_status = 'duplicate_updated'
-                            duplicate_reason = {"reason": "UPSERT 전 기존 레코드 조회 실패, 업데이트됨으로 간주"}
-                            logger.warning("UPSERT 전 기존 레코드 조회 실패, 업데이트됨으로 간주")
-
-                    else:
-                        # 예상치 못한 경우
-                        processing_status = 'failed'
-                        duplicate_reason = {"reason": f"Unexpected affected_rows: {affected_rows}"}
-                        logger.warning(f"예상치 못한 affected_rows: {affected_rows}")
-
-                    # 로그 기록
-                    if processing_status:
-                        # ================================================
-                        # 🆕 api_url_processing_log 기록 (삭제 예정)
-                        # ================================================
-                        self._log_api_url_processing(
-                            session=session,
-                            site_code=db_site_code,  # ← site_code → db_site_code (일관성)
-                            url_key=url_key,
-                            url_key_hash=url_key_hash,
-                            processing_status=processing_status,
-                            announcement_url=origin_url,
-                            scraping_url=scraping_url,
-                            preprocessing_id=record_id,
-                            existing_preprocessing_id=existing_preprocessing_id,
-                            existing_site_type=existing_site_type,
-                            existing_site_code=existing_site_code,
-                            duplicate_reason=duplicate_reason,
-                            title=title,
-                            folder_name=folder_name
-                        )
-
-                        # ================================================
-                        # 🆕 announcement_duplicate_log 기록 (신규)
-                        # ================================================
-                        # ⚠️ 중요: processing_status는 "중복 체크 결과"를 나타내는 내부 변수
-                        #          announcement_pre_processing.processing_status 컬럼과는 다름!
-                        # processing_status 값:
-                        #   - 'new_inserted': affected_rows=1 (신규 INSERT)
-                        #   - 'duplicate_updated': affected_rows=2 (UPDATE됨)
-                        #   - 'duplicate_preserved': affected_rows=2 + 우선순위 낮음
-                        #   - 'failed': affected_rows 예상치 못한 값
-
-                        # duplicate_type 매핑
-                        duplicate_type_map = {
-                            'new_inserted': 'new_inserted',
-                            'duplicate_updated': 'replaced',  # 기본값 (우선순위 비교로 세부화)
-                            'duplicate_preserved': 'kept_existing',
-                            'failed': 'error'
-                        }
-
-                        # duplicate_type 결정
-                        announcement_duplicate_type = duplicate_type_map.get(processing_status, 'unknown')  # 기본값을 'unknown'으로 변경
-
-                        # unknown 타입 발생 시 상세 로그 기록
-                        if announcement_duplicate_type == 'unknown':
-                            logger.warning(
-                                f"⚠️  예상치 못한 processing_status: '{processing_status}' "
-                                f"(preprocessing_id={record_id}, affected_rows={affected_rows}, "
-                                f"url_key_hash={url_key_hash[:16] if url_key_hash else 'None'}...)"
-                            )
-
-                        # duplicate_updated의 경우 우선순위 비교로 세부 타입 결정
-                        if processing_status == 'duplicate_updated' and existing_record_before_upsert:
-                            current_priority = self._get_priority(self.site_type)
-                            existing_priority_value = self._get_priority(existing_record_before_upsert.site_type)
-
-                            if current_priority == existing_priority_value:
-                                # 우선순위 동일 → same_type_duplicate
-                                announcement_duplicate_type = 'same_type_duplicate'
-                            elif current_priority > existing_priority_value:
-                                # 우선순위 높음 → replaced
-                                announcement_duplicate_type = 'replaced'
-                            # current_priority < existing_priority_value는 이론적으로 발생하지 않음 (UPSERT 조건상)
-
-                        # existing_record dict 준비
-                        existing_record_dict = None
-                        if existing_record_before_upsert:
-                            existing_record_dict = {
-                                'id': existing_record_before_upsert.id,
-                                'site_type': existing_record_before_upsert.site_type,
-                                'site_code': existing_record_before_upsert.site_code,
-                                'folder_name': existing_record_before_upsert.folder_name,
-                                'title': existing_record_before_upsert.title,
-                                'content_md': existing_record_before_upsert.content_md,
-                                'combined_content': existing_record_before_upsert.combined_content,
-                                'attachment_filenames': existing_record_before_upsert.attachment_filenames,
-                                'exclusion_keyword': existing_record_before_upsert.exclusion_keyword,
-                                'processing_status': existing_record_before_upsert.processing_status,
-                                'announcement_date': existing_record_before_upsert.announcement_date,
-                                'url_key': url_key  # url_key는 동일
-                            }
-
-                        # new_data dict 준비
-                        new_data_dict = {
-                            'title': title,
-                            'folder_name': folder_name,
-                            'content_md': content_md,
-                            'combined_content': combined_content,
-                            'attachment_filenames': ", ".join(attachment_filenames) if attachment_filenames else None,
-                            'exclusion_keyword': ", ".join(exclusion_keywords) if exclusion_keywords else None,
-                            'processing_status': status,
-                            'announcement_date': announcement_date
-                        }
-
-                        # announcement_duplicate_log 기록
-                        self._log_announcement_duplicate(
-                            session=session,
-                            preprocessing_id=record_id,
-                            url_key_hash=url_key_hash,
-                            duplicate_type=announcement_duplicate_type,
-                            site_code=db_site_code,
-                            folder_name=folder_name,
-                            domain=domain,
-                            domain_configured=True,  # url_key가 있으므로 domain_key_config 있음
-                            existing_record=existing_record_dict,
-                            new_data=new_data_dict,
-                            error_message=None
-                        )
+                self._log_announcement_duplicate(
+                    session=session,
+                    **self._upsert_log_fields(
+                        params,
+                        record_id,
+                        url_key_hash,
+                        self._is_upsert_update(params, existing_record_before_upsert, lookups),
+                        existing_record_before_upsert,
+                    ),
+                )
 
                 # API 사이트인 경우 api_url_registry 테이블 업데이트 (commit 전에 실행)
                 api_registry_updated = False
@@ -2815,25 +3227,17 @@ class AnnouncementPreProcessor:
                 # ================================================
                 # processing_status가 '제외'인 경우 EXCLUSION_KEYWORDS 테이블의 EXCLUSION_COUNT 증가
                 if status == "제외" and exclusion_keywords:
-                    for keyword in exclusion_keywords:
-                        try:
-                            session.execute(
-                                text("""
-                                    UPDATE EXCLUSION_KEYWORDS
-                                    SET EXCLUSION_COUNT = EXCLUSION_COUNT + 1
-                                    WHERE KEYWORD = :keyword
-                                    AND IS_ACTIVE = 1
-                                """),
-                                {"keyword": keyword}
-                            )
-                            logger.debug(f"EXCLUSION_COUNT 업데이트 완료: keyword='{keyword}'")
-                        except Exception as e:
-                            logger.warning(f"EXCLUSION_COUNT 업데이트 실패 (계속 진행): keyword='{keyword}', error={e}")
-
-                # 모든 변경사항을 한 번에 커밋
-                session.commit()
+                    self._increment_exclusion_counts(session, Counter(exclusion_keywords))
+
+                # 모든 변경사항을 한 번에 커밋 (배치 모드는 배치 단위로 커밋)
+                if batch_session is None:
+                    session.commit()
                 logger.info(f"처리 결과 저장 완료: ID {record_id}, 상태: {status}")
 
+                # 처리 완료 인덱스 증분 갱신 (이후 건너뛰기 판단에 DB 조회 불필요)
+                # 인덱스 키는 호출자의 site_code (DB 조회는 _load_processed_index에서 _db_site_code로 수행)
+                self._register_processed(site_code, folder_name)
+
                 return record_id
 
         except Exception as e:
@@ -2841,6 +3245,52 @@ class AnnouncementPreProcessor:
             return None
 
 
+def _init_pool_worker(site_type: str, attach_force: bool, site_code: str, write_lock) -> None:
+    """프로세스 풀 워커 초기화: 프로세서를 한 번만 생성하고 DB 쓰기 락을 등록합니다."""
+    global _db_write_lock, _worker_processor
+
+    _db_write_lock = write_lock
+    _worker_processor = AnnouncementPreProcessor(
+        site_type=site_type,
+        attach_force=attach_force,
+        site_code=site_code,
+        lazy_init=False,
+    )
+
+    # 폴더명 중복 체크를 건별 DB 조회 대신 인덱스로 처리하도록 워커당 1회 로드
+    _worker_processor._load_processed_index(site_code)
+
+    # 워커는 변환 전용이므로 Docling 모델을 미리 로드해 첫 PDF 지연을 없앰
+    from src.utils.convertUtil import docling_converter_pool
+
+    docling_converter_pool.warm_up()
+    logger.info(f"워커 프로세스 초기화 완료: PID {os.getpid()}")
+
+
+def _process_directory_in_worker(
+    directory_path: Path, site_code: str, folder_name: str, force: bool
+) -> tuple[bool, float, Dict[str, int]]:
+    """
+    워커 프로세스에서 단일 디렉토리를 처리합니다.
+
+    Returns:
+        (성공 여부, 소요 시간, 이 항목에서 발생한 변환 캐시 적중/미스 수)
+    """
+    item_start_time = time.time()
+    cache_before = _worker_processor.get_conversion_cache_stats() or {}
+
+    success = _worker_processor.process_directory_with_custom_name(
+        directory_path, site_code, folder_name, force
+    )
+
+    cache_after = _worker_processor.get_conversion_cache_stats() or {}
+    cache_delta = {
+        name: cache_after.get(name, 0) - cache_before.get(name, 0)
+        for name in ("hits", "misses")
+    }
+    return success, time.time() - item_start_time, cache_delta
+
+
 def determine_site_type(directory_name: str, site_code: str) -> str:
     """디렉토리명과 사이트 코드에서 site_type을 결정합니다."""
     # 절대 경로 정규화 (대소문자 구분 없이)
@@ -2883,6 +3333,8 @@ def main():
   python announcement_pre_processor.py -d eminwon_data --site-code emw001
   python announcement_pre_processor.py -d scraped_data --site-code site001 --force
   python announcement_pre_processor.py -d eminwon_data --site-code emw001 --attach-force
+  python announcement_pre_processor.py -d eminwon_data --site-code emw001 --workers 4
+  python announcement_pre_processor.py -d scraped_data --site-code site001 --batch-size 100
         """,
     )
 
@@ -2904,6 +3356,20 @@ def main():
         help="첨부파일 강제 재처리 (기존 .md 파일 무시하고 원본 파일에서 다시 변환)",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="첨부파일 변환 병렬 워커 프로세스 수 (기본값: 1, 순차 처리)",
+    )
+
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=0,
+        help="DB 저장 배치 크기 (기본값: 0, 폴더마다 즉시 커밋 / 순차 처리에서만 적용)",
+    )
+
     args = parser.parse_args()
 
     try:
@@ -2957,12 +3423,14 @@ def main():
             site_type=site_type,
             attach_force=args.attach_force,
             site_code=args.site_code,
-            lazy_init=False,
+            # 프로세스 풀 모드에서는 워커만 변환하므로 부모는 AttachmentProcessor 로드 생략
+            lazy_init=args.workers > 1,
+            write_batch_size=args.batch_size if args.workers <= 1 else 0,
         )
 
         # 사이트 디렉토리 처리 실행
         results = processor.process_site_directories(
-            base_directory, args.site_code, args.force
+            base_directory, args.site_code, args.force, workers=args.workers
         )
 
         # 결과 출력
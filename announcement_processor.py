@@ -28,6 +28,7 @@ from src.utils.attachmentProcessor import AttachmentProcessor
 from src.utils.ollamaClient import AnnouncementAnalyzer
 from src.models.announcementDatabase import AnnouncementDatabaseManager, create_announcement_tables
 from src.utils.announcementFilter import AnnouncementFilter
+from src.utils.keywordSnapshot import ExclusionKeywordSnapshot, get_exclusion_snapshot
 
 logger = setup_logging(__name__)
 config = ConfigManager().get_config()
@@ -46,8 +47,8 @@ class AnnouncementProcessor:
         # 데이터베이스 테이블 생성 (없는 경우)
         self._ensure_database_tables()
         
-        # 제외 키워드 로드
-        self.exclusion_keywords = self._load_exclusion_keywords()
+        # 제외 키워드 로드 (프로세스 공유 스냅샷)
+        self.exclusion_snapshot = self._load_exclusion_keywords()
     
     def _ensure_database_tables(self):
         """데이터베이스 테이블이 존재하는지 확인하고 생성합니다."""
@@ -60,33 +61,9 @@ class AnnouncementProcessor:
         except Exception as e:
             logger.warning(f"데이터베이스 초기화 실패: {e} - 계속 진행합니다 (DB 저장 불가)")
     
-    def _load_exclusion_keywords(self) -> List[Dict[str, Any]]:
-        """데이터베이스에서 제외 키워드를 로드합니다."""
-        try:
-            from sqlalchemy import text
-            
-            with self.db_manager.SessionLocal() as session:
-                result = session.execute(text("""
-                    SELECT EXCLUSION_ID, KEYWORD, DESCRIPTION
-                    FROM EXCLUSION_KEYWORDS
-                    WHERE IS_ACTIVE = TRUE
-                    ORDER BY EXCLUSION_ID
-                """))
-                
-                keywords = []
-                for row in result:
-                    keywords.append({
-                        'id': row[0],
-                        'keyword': row[1],
-                        'description': row[2]
-                    })
-                
-                logger.info(f"제외 키워드 로드 완료: {len(keywords)}개")
-                return keywords
-                
-        except Exception as e:
-            logger.warning(f"제외 키워드 로드 실패: {e}")
-            return []
+    def _load_exclusion_keywords(self) -> ExclusionKeywordSnapshot:
+        """프로세스 공유 스냅샷에서 제외 키워드를 가져옵니다. (버전이 바뀐 경우에만 DB 재조회)"""
+        return get_exclusion_snapshot(self.db_manager.SessionLocal)
     
     def process_directory(self, directory_path: Path, site_code: str) -> bool:
         """
@@ -474,11 +451,13 @@ class AnnouncementProcessor:
         """폴더명에서 제외 키워드를 체크합니다."""
         matched_keywords = []
         
-        for keyword_info in self.exclusion_keywords:
-            keyword = keyword_info['keyword'].lower()
-            if keyword in folder_name.lower():
-                matched_keywords.append(keyword_info['keyword'])
-                logger.debug(f"제외 키워드 매칭: '{keyword}' in '{folder_name}'")
+        # 공유 스냅샷 갱신 확인 후 오토마톤으로 폴더명을 한 번만 탐색 (결과는 키워드 로드 순서)
+        snapshot = self.exclusion_snapshot = self._load_exclusion_keywords()
+        positions = snapshot.matcher.first_positions(folder_name)
+        for index in sorted(positions):
+            keyword = snapshot.keywords[index]['keyword']
+            matched_keywords.append(keyword)
+            logger.debug(f"제외 키워드 매칭: '{keyword.lower()}' in '{folder_name}'")
         
         return matched_keywords
     
@@ -652,7 +631,9 @@ class AnnouncementProcessor:
                         logger.info(f"첨부파일 변환 시작: {file_path.name}")
                         
                     try:
-                        content = self.attachment_processor.process_single_file(file_path)
+                        content = self.attachment_processor.process_single_file(
+                            file_path, bypass_cache=attach_force
+                        )
                         
                         if content and content.strip():
                             combined_content += f"\n\n=== {file_path.name} ===\n{content}"
@@ -8,6 +8,11 @@
 예시:
     python announcement_processor_parallel.py --site-code acci --data data.origin
     python announcement_processor_parallel.py --site-code cbt --workers 2
+    python announcement_processor_parallel.py --site-code cbt --workers 2 --llm-workers 4
+
+변환(첨부파일 → 마크다운)과 Ollama 분석은 별도 스레드에서 실행됩니다.
+변환 워커(--workers)가 준비한 내용을 대기열(--llm-queue-size)로 넘기면
+LLM 워커(--llm-workers)가 Ollama 요청을 동시에 유지하며 분석합니다.
 """
 
 import argparse
@@ -16,7 +21,6 @@ import os
 import sys
 import time
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
@@ -28,9 +32,12 @@ sys.path.insert(0, str(project_root))
 from src.config.config import ConfigManager
 from src.config.logConfig import setup_logging
 from src.utils.attachmentProcessor import AttachmentProcessor
+from src.utils.contentHeaderParser import extract_title
 from src.utils.ollamaClient import AnnouncementAnalyzer
 from src.models.announcementDatabase import AnnouncementDatabaseManager, create_announcement_tables
 from src.utils.announcementFilter import AnnouncementFilter
+from src.utils.keywordSnapshot import ExclusionKeywordSnapshot, get_exclusion_snapshot
+from src.utils.llmPipeline import ConversionLLMPipeline, PipelineFailure, get_llm_dispatch_settings
 
 logger = setup_logging(__name__)
 config = ConfigManager().get_config()
@@ -54,13 +61,28 @@ class ProcessingResult:
     error_message: Optional[str] = None
     processing_time: float = 0.0
 
+@dataclass
+class LLMJob:
+    """변환 단계에서 LLM 단계로 넘기는 작업 정보"""
+    task: ProcessingTask
+    record_id: Any
+    content_md: str
+    combined_content: str
+    start_time: float = 0.0
+
 class ParallelAnnouncementProcessor:
     """병렬 처리 버전의 공고 처리 클래스 (2개 워커 최적화)"""
     
-    def __init__(self, attach_force: bool = False, max_workers: int = 2):
+    def __init__(self, attach_force: bool = False, max_workers: int = 2, llm_workers: Optional[int] = None, llm_queue_size: Optional[int] = None):
         self.attach_force = attach_force
         self.max_workers = max_workers
         
+        # LLM 단계 설정 (미지정 시 config.ini [llm_dispatch])
+        default_llm_workers, default_llm_queue_size = get_llm_dispatch_settings()
+        self.llm_workers = llm_workers or default_llm_workers
+        self.llm_queue_size = llm_queue_size or default_llm_queue_size
+        self._pipeline: Optional[ConversionLLMPipeline] = None
+        
         # 스레드별 인스턴스를 위한 ThreadLocal 저장소
         self._local = threading.local()
         
@@ -70,8 +92,8 @@ class ParallelAnnouncementProcessor:
         # 데이터베이스 테이블 생성 (없는 경우)
         self._ensure_database_tables()
         
-        # 제외 키워드 로드 (한 번만)
-        self.exclusion_keywords = self._load_exclusion_keywords()
+        # 제외 키워드 로드 (프로세스 공유 스냅샷)
+        self.exclusion_snapshot = self._load_exclusion_keywords()
         
         # 통계 추적용
         self._stats_lock = threading.Lock()
@@ -103,6 +125,17 @@ class ParallelAnnouncementProcessor:
             self._local.filter
         )
     
+    def _get_llm_instances(self):
+        """LLM 워커 스레드용 로컬 인스턴스(분석기, DB 매니저)를 가져옵니다."""
+        if not hasattr(self._local, 'llm_initialized'):
+            self._local.llm_analyzer = AnnouncementAnalyzer()
+            self._local.llm_db_manager = AnnouncementDatabaseManager()
+            self._local.llm_initialized = True
+            
+            logger.info(f"LLM 워커 인스턴스 초기화 완료: {threading.current_thread().name}")
+        
+        return self._local.llm_analyzer, self._local.llm_db_manager
+    
     def _ensure_database_tables(self):
         """데이터베이스 테이블이 존재하는지 확인하고 생성합니다."""
         try:
@@ -114,33 +147,9 @@ class ParallelAnnouncementProcessor:
         except Exception as e:
             logger.warning(f"데이터베이스 초기화 실패: {e} - 계속 진행합니다 (DB 저장 불가)")
     
-    def _load_exclusion_keywords(self) -> List[Dict[str, Any]]:
-        """데이터베이스에서 제외 키워드를 로드합니다."""
-        try:
-            from sqlalchemy import text
-            
-            with self.global_db_manager.SessionLocal() as session:
-                result = session.execute(text("""
-                    SELECT EXCLUSION_ID, KEYWORD, DESCRIPTION
-                    FROM EXCLUSION_KEYWORDS
-                    WHERE IS_ACTIVE = TRUE
-                    ORDER BY EXCLUSION_ID
-                """))
-                
-                keywords = []
-                for row in result:
-                    keywords.append({
-                        'id': row[0],
-                        'keyword': row[1],
-                        'description': row[2]
-                    })
-                
-                logger.info(f"제외 키워드 로드 완료: {len(keywords)}개")
-                return keywords
-                
-        except Exception as e:
-            logger.warning(f"제외 키워드 로드 실패: {e}")
-            return []
+    def _load_exclusion_keywords(self) -> ExclusionKeywordSnapshot:
+        """프로세스 공유 스냅샷에서 제외 키워드를 가져옵니다. (버전이 바뀐 경우에만 DB 재조회)"""
+        return get_exclusion_snapshot(self.global_db_manager.SessionLocal)
     
     def _update_stats(self, stat_name: str, increment: int = 1):
         """통계를 스레드 안전하게 업데이트합니다."""
@@ -152,58 +161,13 @@ class ParallelAnnouncementProcessor:
         progress_pct = (completed / total) * 100 if total > 0 else 0
         print(f"[{worker_name}] [{completed}/{total} : {progress_pct:.1f}%] {folder_name} ({elapsed:.1f}초)")
     
-    def process_single_directory(self, task: ProcessingTask) -> ProcessingResult:
-        """단일 디렉토리를 처리합니다 (스레드 안전)."""
-        worker_name = threading.current_thread().name
-        start_time = time.time()
+    def _convert_directory(self, task: ProcessingTask, attachment_processor, db_manager):
+        """
+        변환 단계: content.md 읽기, 첨부파일 변환, 1차 DB 저장까지 수행합니다.
         
-        try:
-            # 스레드별 인스턴스 가져오기
-            attachment_processor, announcement_analyzer, db_manager, filter_instance = self._get_local_instances()
-            
-            logger.info(f"[{worker_name}] 디렉토리 처리 시작: {task.folder_name}")
-            
-            # 중복 처리 체크 (force 옵션이 없을 때만)
-            if not task.force:
-                if db_manager.is_already_processed(task.folder_name, task.site_code):
-                    elapsed = time.time() - start_time
-                    logger.info(f"[{worker_name}] 이미 처리된 폴더 건너뜀: {task.folder_name}")
-                    return ProcessingResult(
-                        task_id=task.task_id,
-                        folder_name=task.folder_name,
-                        success=True,
-                        processing_time=elapsed
-                    )
-            
-            # 실제 처리 로직 실행 (기존 process_directory_with_custom_name과 동일)
-            success = self._process_directory_core(
-                task, attachment_processor, announcement_analyzer, db_manager, filter_instance
-            )
-            
-            elapsed = time.time() - start_time
-            
-            return ProcessingResult(
-                task_id=task.task_id,
-                folder_name=task.folder_name,
-                success=success,
-                processing_time=elapsed
-            )
-            
-        except Exception as e:
-            elapsed = time.time() - start_time
-            error_msg = f"처리 중 예외 발생: {str(e)}"
-            logger.error(f"[{worker_name}] {error_msg} ({task.folder_name})")
-            
-            return ProcessingResult(
-                task_id=task.task_id,
-                folder_name=task.folder_name,
-                success=False,
-                error_message=error_msg,
-                processing_time=elapsed
-            )
-    
-    def _process_directory_core(self, task: ProcessingTask, attachment_processor, announcement_analyzer, db_manager, filter_instance) -> bool:
-        """디렉토리 처리 핵심 로직 (스레드별 인스턴스 사용)"""
+        Returns:
+            Ollama 분석이 필요하면 LLMJob, 여기서 처리가 끝나면 처리 결과(bool)
+        """
         directory_path = task.directory_path
         site_code = task.site_code
         folder_name = task.folder_name
@@ -295,6 +259,25 @@ class ParallelAnnouncementProcessor:
                         db_manager=db_manager
                     )
             
+            return LLMJob(task, record_id, content_md, combined_content)
+                
+        except Exception as e:
+            logger.error(f"디렉토리 처리 중 예상치 못한 오류: {e}")
+            return self._save_processing_result(
+                folder_name, site_code, "", "",
+                status="ollama", error_message=f"예상치 못한 오류: {e}",
+                db_manager=db_manager
+            )
+    
+    def _analyze_directory(self, job: LLMJob, announcement_analyzer, db_manager) -> bool:
+        """LLM 단계: content.md → 첨부파일 순으로 Ollama 분석 후 결과를 저장합니다."""
+        folder_name = job.task.folder_name
+        site_code = job.task.site_code
+        record_id = job.record_id
+        content_md = job.content_md
+        combined_content = job.combined_content
+        
+        try:
             # 6. content_md로 첫번째 ollama 분석
             print("  📋 1차 Ollama 분석 중 (content.md)...")
             first_response = None
@@ -380,8 +363,76 @@ class ParallelAnnouncementProcessor:
         # 병렬 처리 실행
         return self._execute_parallel_processing(tasks, site_code)
     
+    def _run_conversion_stage(self, task: ProcessingTask):
+        """파이프라인 변환 단계 (변환 워커 스레드에서 실행)"""
+        worker_name = threading.current_thread().name
+        start_time = time.time()
+        
+        try:
+            attachment_processor, _, db_manager, _ = self._get_local_instances()
+            
+            logger.info(f"[{worker_name}] 디렉토리 처리 시작: {task.folder_name}")
+            
+            # 중복 처리 체크 (force 옵션이 없을 때만)
+            if not task.force and db_manager.is_already_processed(task.folder_name, task.site_code):
+                logger.info(f"[{worker_name}] 이미 처리된 폴더 건너뜀: {task.folder_name}")
+                return ProcessingResult(
+                    task_id=task.task_id,
+                    folder_name=task.folder_name,
+                    success=True,
+                    processing_time=time.time() - start_time
+                )
+            
+            outcome = self._convert_directory(task, attachment_processor, db_manager)
+            
+            if isinstance(outcome, LLMJob):
+                # LLM 대기열이 가득 차면 여기서 대기 (backpressure)
+                outcome.start_time = start_time
+                self._pipeline.submit_llm(self._run_llm_stage, outcome)
+                return None
+            
+            return ProcessingResult(
+                task_id=task.task_id,
+                folder_name=task.folder_name,
+                success=bool(outcome),
+                processing_time=time.time() - start_time
+            )
+            
+        except Exception as e:
+            error_msg = f"처리 중 예외 발생: {str(e)}"
+            logger.error(f"[{worker_name}] {error_msg} ({task.folder_name})")
+            
+            return ProcessingResult(
+                task_id=task.task_id,
+                folder_name=task.folder_name,
+                success=False,
+                error_message=error_msg,
+                processing_time=time.time() - start_time
+            )
+    
+    def _run_llm_stage(self, job: LLMJob) -> ProcessingResult:
+        """파이프라인 LLM 단계 (LLM 워커 스레드에서 실행)"""
+        task = job.task
+        
+        try:
+            announcement_analyzer, db_manager = self._get_llm_instances()
+            success = self._analyze_directory(job, announcement_analyzer, db_manager)
+            error_msg = None
+        except Exception as e:
+            success = False
+            error_msg = f"분석 중 예외 발생: {str(e)}"
+            logger.error(f"[{threading.current_thread().name}] {error_msg} ({task.folder_name})")
+        
+        return ProcessingResult(
+            task_id=task.task_id,
+            folder_name=task.folder_name,
+            success=bool(success),
+            error_message=error_msg,
+            processing_time=time.time() - job.start_time
+        )
+    
     def _execute_parallel_processing(self, tasks: List[ProcessingTask], context_name: str = "") -> Dict[str, int]:
-        """작업 목록을 병렬로 처리합니다."""
+        """작업 목록을 변환 → LLM 파이프라인으로 처리합니다."""
         total_count = len(tasks)
         results = {"total": total_count, "success": 0, "failed": 0, "skipped": 0}
         
@@ -391,37 +442,36 @@ class ParallelAnnouncementProcessor:
         start_time = time.time()
         processed_count = 0
         
-        print(f"\n🚀 병렬 처리 시작: {context_name} ({total_count}개 작업, {self.max_workers}개 워커)")
+        print(f"\n🚀 병렬 처리 시작: {context_name} ({total_count}개 작업, 변환 워커 {self.max_workers}개, LLM 워커 {self.llm_workers}개)")
         print(f"{'='*60}")
         
-        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="Worker") as executor:
-            # 모든 작업을 submit
-            future_to_task = {executor.submit(self.process_single_directory, task): task for task in tasks}
+        with ConversionLLMPipeline(self.max_workers, self.llm_workers, self.llm_queue_size) as pipeline:
+            self._pipeline = pipeline
+            
+            for task in tasks:
+                pipeline.submit_conversion(self._run_conversion_stage, task)
             
             # 완료되는 대로 결과 처리
-            for future in as_completed(future_to_task):
-                task = future_to_task[future]
+            for result in pipeline.results(total_count):
                 processed_count += 1
                 
-                try:
-                    result = future.result()
-                    
-                    if result.success:
-                        results["success"] += 1
-                        status_icon = "✅"
-                        status_text = "성공"
-                    else:
-                        results["failed"] += 1
-                        status_icon = "❌"
-                        status_text = f"실패: {result.error_message or 'Unknown error'}"
-                    
-                    progress_pct = (processed_count / total_count) * 100
-                    print(f"[{processed_count}/{total_count} : {progress_pct:.1f}%] {status_icon} {result.folder_name} ({result.processing_time:.1f}초)")
-                    
-                except Exception as e:
+                if isinstance(result, PipelineFailure):
                     results["failed"] += 1
-                    print(f"[{processed_count}/{total_count}] ❌ {task.folder_name} - 예외: {str(e)[:50]}...")
-                    logger.error(f"Future 처리 중 오류: {e}")
+                    task = getattr(result.item, 'task', result.item)
+                    print(f"[{processed_count}/{total_count}] ❌ {task.folder_name} - 예외: {str(result.error)[:50]}...")
+                    continue
+                
+                if result.success:
+                    results["success"] += 1
+                    status_icon = "✅"
+                else:
+                    results["failed"] += 1
+                    status_icon = "❌"
+                
+                progress_pct = (processed_count / total_count) * 100
+                print(f"[{processed_count}/{total_count} : {progress_pct:.1f}%] {status_icon} {result.folder_name} ({result.processing_time:.1f}초)")
+            
+            stage_summaries = pipeline.summary_lines()
         
         total_elapsed = time.time() - start_time
         
@@ -433,11 +483,10 @@ class ParallelAnnouncementProcessor:
             avg_time = total_elapsed / results['success']
             print(f"성공한 항목당 평균 시간: {avg_time:.1f}초")
         
-        # 성능 향상 계산 (순차 대비 추정)
-        if results['success'] > 0:
-            estimated_sequential_time = total_elapsed * self.max_workers  # 대략적 추정
-            speedup_ratio = estimated_sequential_time / total_elapsed
-            print(f"예상 성능 향상: {speedup_ratio:.2f}x (대략적 추정)")
+        # 단계별 처리량 (변환/LLM이 겹쳐 진행된 정도 확인용)
+        for line in stage_summaries:
+            print(f"📊 {line}")
+            logger.info(f"[{context_name}] {line}")
         
         print(f"{'='*60}")
         
@@ -500,43 +549,19 @@ class ParallelAnnouncementProcessor:
         """폴더명에서 제외 키워드를 체크합니다."""
         matched_keywords = []
         
-        for keyword_info in self.exclusion_keywords:
-            keyword = keyword_info['keyword'].lower()
-            if keyword in folder_name.lower():
-                matched_keywords.append(keyword_info['keyword'])
-                logger.debug(f"제외 키워드 매칭: '{keyword}' in '{folder_name}'")
+        # 공유 스냅샷 갱신 확인 후 오토마톤으로 폴더명을 한 번만 탐색 (결과는 키워드 로드 순서)
+        snapshot = self.exclusion_snapshot = self._load_exclusion_keywords()
+        positions = snapshot.matcher.first_positions(folder_name)
+        for index in sorted(positions):
+            keyword = snapshot.keywords[index]['keyword']
+            matched_keywords.append(keyword)
+            logger.debug(f"제외 키워드 매칭: '{keyword.lower()}' in '{folder_name}'")
         
         return matched_keywords
     
     def _extract_title_from_content(self, content_md: str) -> str:
-        """content.md에서 제목을 추출합니다."""
-        if not content_md:
-            return ""
-        
-        lines = content_md.split('\n')
-        
-        # 첫 번째 비어있지 않은 줄을 찾기
-        for line in lines[:10]:  # 상위 10줄만 확인
-            line = line.strip()
-            if line:
-                # # 마크다운 헤더 제거
-                if line.startswith('#'):
-                    title = line.lstrip('#').strip()
-                    logger.debug(f"마크다운 헤더에서 제목 추출: {title}")
-                    return title
-                
-                # 제목:, 공고명: 패턴 확인
-                for prefix in ['제목:', '공고명:', '공고 제목:', '제목 :']:
-                    if line.lower().startswith(prefix.lower()):
-                        title = line[len(prefix):].strip()
-                        logger.debug(f"{prefix} 패턴에서 제목 추출: {title}")
-                        return title
-                
-                # 일반 텍스트인 경우 그대로 제목으로 사용 (첫 번째 줄)
-                logger.debug(f"첫 번째 줄을 제목으로 사용: {line}")
-                return line
-        
-        return ""
+        """content.md에서 제목을 추출합니다. (전처리기와 동일한 규칙: contentHeaderParser)"""
+        return extract_title(content_md)
     
     def _natural_sort_key(self, path: Path) -> tuple:
         """폴더명의 숫자 부분을 기준으로 자연 정렬을 위한 키를 생성합니다."""
@@ -602,7 +627,9 @@ class ParallelAnnouncementProcessor:
                         logger.info(f"첨부파일 변환 시작: {file_path.name}")
                         
                     try:
-                        content = attachment_processor.process_single_file(file_path)
+                        content = attachment_processor.process_single_file(
+                            file_path, bypass_cache=attach_force
+                        )
                         
                         if content and content.strip():
                             combined_content += f"\n\n=== {file_path.name} ===\n{content}"
@@ -951,6 +978,7 @@ def main():
 예시:
   python announcement_processor_parallel.py --site-code acci --data data.enhanced
   python announcement_processor_parallel.py --site-code cbt --data data.origin --workers 4
+  python announcement_processor_parallel.py --site-code cbt --workers 2 --llm-workers 4  # Ollama 요청 4개 동시 유지
   python announcement_processor_parallel.py --site-code acci  # 환경변수 DEFAULT_DIR 사용
   python announcement_processor_parallel.py --site-code acci --data data.enhanced -r  # 재귀적 처리
   python announcement_processor_parallel.py --site-code acci --attach-force  # 첨부파일 강제 재처리
@@ -977,6 +1005,18 @@ def main():
         help="병렬 처리에 사용할 워커 수 (기본값: 2, 권장: 2)"
     )
     
+    parser.add_argument(
+        "--llm-workers",
+        type=int,
+        help="동시에 유지할 Ollama 분석 요청 수 (기본값: config.ini [llm_dispatch] workers)"
+    )
+    
+    parser.add_argument(
+        "--llm-queue-size",
+        type=int,
+        help="변환 → LLM 대기열 크기, 가득 차면 변환 워커가 대기 (기본값: config.ini [llm_dispatch] queue_size)"
+    )
+    
     parser.add_argument(
         "--skip-processed", 
         action="store_true", 
@@ -1011,7 +1051,9 @@ def main():
         logger.info(f"병렬 공고 처리 프로그램 시작 (워커 수: {args.workers})")
         processor = ParallelAnnouncementProcessor(
             attach_force=args.attach_force,
-            max_workers=args.workers
+            max_workers=args.workers,
+            llm_workers=args.llm_workers,
+            llm_queue_size=args.llm_queue_size
         )
         
         # 병렬 처리 실행
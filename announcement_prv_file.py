@@ -29,9 +29,11 @@ sys.path.insert(0, str(project_root))
 from src.config.config import ConfigManager
 from src.config.logConfig import setup_logging
 from src.utils.attachmentProcessor import AttachmentProcessor
+from src.utils.contentHeaderParser import extract_announcement_date, extract_origin_url, extract_title
 from src.utils.ollamaClient import AnnouncementPrvAnalyzer
 from src.models.announcementPrvDatabase import AnnouncementPrvDatabaseManager, create_announcement_prv_tables
 from src.utils.announcementFilter import AnnouncementFilter
+from src.utils.keywordSnapshot import ExclusionKeywordSnapshot, get_exclusion_snapshot
 
 logger = setup_logging(__name__)
 config = ConfigManager().get_config()
@@ -58,8 +60,8 @@ class AnnouncementPrvProcessor:
         # 데이터베이스 테이블 생성 (없는 경우)
         self._ensure_database_tables()
         
-        # 제외 키워드 로드
-        self.exclusion_keywords = self._load_exclusion_keywords()
+        # 제외 키워드 로드 (프로세스 공유 스냅샷)
+        self.exclusion_snapshot = self._load_exclusion_keywords()
     
     def _ensure_database_tables(self):
         """데이터베이스 테이블이 존재하는지 확인하고 생성합니다."""
@@ -72,33 +74,9 @@ class AnnouncementPrvProcessor:
         except Exception as e:
             logger.warning(f"데이터베이스 초기화 실패: {e} - 계속 진행합니다 (DB 저장 불가)")
     
-    def _load_exclusion_keywords(self) -> List[Dict[str, Any]]:
-        """데이터베이스에서 제외 키워드를 로드합니다."""
-        try:
-            from sqlalchemy import text
-            
-            with self.db_manager.SessionLocal() as session:
-                result = session.execute(text("""
-                    SELECT EXCLUSION_ID, KEYWORD, DESCRIPTION
-                    FROM EXCLUSION_KEYWORDS
-                    WHERE IS_ACTIVE = TRUE
-                    ORDER BY EXCLUSION_ID
-                """))
-                
-                keywords = []
-                for row in result:
-                    keywords.append({
-                        'id': row[0],
-                        'keyword': row[1],
-                        'description': row[2]
-                    })
-                
-                logger.info(f"제외 키워드 로드 완료: {len(keywords)}개")
-                return keywords
-                
-        except Exception as e:
-            logger.warning(f"제외 키워드 로드 실패: {e}")
-            return []
+    def _load_exclusion_keywords(self) -> ExclusionKeywordSnapshot:
+        """프로세스 공유 스냅샷에서 제외 키워드를 가져옵니다. (버전이 바뀐 경우에만 DB 재조회)"""
+        return get_exclusion_snapshot(self.db_manager.SessionLocal)
     
     def _parse_date_filter(self, date_str: str) -> Optional[datetime]:
         """
@@ -884,11 +862,13 @@ class AnnouncementPrvProcessor:
         """폴더명에서 제외 키워드를 체크합니다."""
         matched_keywords = []
         
-        for keyword_info in self.exclusion_keywords:
-            keyword = keyword_info['keyword'].lower()
-            if keyword in folder_name.lower():
-                matched_keywords.append(keyword_info['keyword'])
-                logger.debug(f"제외 키워드 매칭: '{keyword}' in '{folder_name}'")
+        # 공유 스냅샷 갱신 확인 후 오토마톤으로 폴더명을 한 번만 탐색 (결과는 키워드 로드 순서)
+        snapshot = self.exclusion_snapshot = self._load_exclusion_keywords()
+        positions = snapshot.matcher.first_positions(folder_name)
+        for index in sorted(positions):
+            keyword = snapshot.keywords[index]['keyword']
+            matched_keywords.append(keyword)
+            logger.debug(f"제외 키워드 매칭: '{keyword.lower()}' in '{folder_name}'")
         
         return matched_keywords
     
@@ -1039,34 +1019,8 @@ class AnnouncementPrvProcessor:
         return ""
     
     def _extract_title_from_content(self, content_md: str) -> str:
-        """content.md에서 제목을 추출합니다."""
-        if not content_md:
-            return ""
-        
-        lines = content_md.split('\n')
-        
-        # 첫 번째 비어있지 않은 줄을 찾기
-        for line in lines[:10]:  # 상위 10줄만 확인
-            line = line.strip()
-            if line:
-                # # 마크다운 헤더 제거
-                if line.startswith('#'):
-                    title = line.lstrip('#').strip()
-                    logger.debug(f"마크다운 헤더에서 제목 추출: {title}")
-                    return title
-                
-                # 제목:, 공고명: 패턴 확인
-                for prefix in ['제목:', '공고명:', '공고 제목:', '제목 :']:
-                    if line.lower().startswith(prefix.lower()):
-                        title = line[len(prefix):].strip()
-                        logger.debug(f"{prefix} 패턴에서 제목 추출: {title}")
-                        return title
-                
-                # 일반 텍스트인 경우 그대로 제목으로 사용 (첫 번째 줄)
-                logger.debug(f"첫 번째 줄을 제목으로 사용: {line}")
-                return line
-        
-        return ""
+        """content.md에서 제목을 추출합니다. (전처리기와 동일한 규칙: contentHeaderParser)"""
+        return extract_title(content_md)
     
     def _extract_gov24_url_from_content(self, content_md: str) -> str:
         """content.md에서 정부24 URL을 추출합니다."""
@@ -1094,53 +1048,11 @@ class AnnouncementPrvProcessor:
     
     def _extract_origin_url_from_content(self, content_md: str) -> str:
         """content.md에서 원본 URL을 추출합니다."""
-        if not content_md:
-            return ""
-        
-        # 원본 URL 패턴 찾기
-        origin_patterns = [
-            r'\*\*원본 URL\*\*[:\s]*(.+?)(?:\n|$)',
-            r'원본 URL[:\s]*(.+?)(?:\n|$)',
-            r'원본[:\s]*(.+?)(?:\n|$)',
-            r'(https?://[^\s\)]+(?:\.go\.kr|\.or\.kr)[^\s\)]*)'
-        ]
-        
-        for pattern in origin_patterns:
-            matches = re.findall(pattern, content_md, re.IGNORECASE)
-            if matches:
-                url = matches[0].strip()
-                if url and url.startswith('http'):
-                    logger.debug(f"원본 URL 추출 성공: {url[:50]}...")
-                    return url
-        
-        logger.debug("content.md에서 원본 URL을 찾을 수 없음")
-        return ""
+        return extract_origin_url(content_md)
     
     def _extract_announcement_date_from_content(self, content_md: str) -> str:
-        """content.md에서 공고일을 문자열로 추출합니다 (날짜 필터링용과 별개)."""
-        if not content_md:
-            return ""
-        
-        # 작성일 패턴 찾기 (마크다운 형식)
-        date_patterns = [
-            r'\*\*작성일\*\*[:\s]*(.+?)(?:\n|$)',
-            r'작성일[:\s]*(.+?)(?:\n|$)',
-            r'\*\*등록일\*\*[:\s]*(.+?)(?:\n|$)',
-            r'등록일[:\s]*(.+?)(?:\n|$)',
-            r'\*\*공고일\*\*[:\s]*(.+?)(?:\n|$)',
-            r'공고일[:\s]*(.+?)(?:\n|$)'
-        ]
-        
-        for pattern in date_patterns:
-            matches = re.findall(pattern, content_md, re.IGNORECASE)
-            if matches:
-                date_str = matches[0].strip()
-                if date_str:
-                    logger.debug(f"공고일 추출 성공: {date_str}")
-                    return date_str
-        
-        logger.debug("content.md에서 공고일을 찾을 수 없음")
-        return ""
+        """content.md에서 공고일을 문자열로 추출합니다. (전처리기와 동일한 규칙: contentHeaderParser)"""
+        return extract_announcement_date(content_md)
     
     def _normalize_korean_text(self, text: str) -> str:
         """한글 텍스트를 NFC(Composed) 형태로 정규화합니다.
@@ -1253,7 +1165,9 @@ class AnnouncementPrvProcessor:
                         logger.info(f"첨부파일 변환 시작: {file_path.name}")
                         
                     try:
-                        content = self.attachment_processor.process_single_file(file_path)
+                        content = self.attachment_processor.process_single_file(
+                            file_path, bypass_cache=attach_force
+                        )
                         
                         if content and content.strip():
                             combined_content += f"\n\n=== {self._normalize_korean_text(file_path.name)} ===\n{content}"
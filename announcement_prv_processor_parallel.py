@@ -8,6 +8,10 @@
 예시:
     python announcement_prv_processor_parallel.py data.origin cbt
     python announcement_prv_processor_parallel.py  # 환경변수 사용
+
+content.md 읽기와 첨부파일 변환은 변환 워커(--workers), Ollama 분석은 LLM 워커(--llm-workers)가
+대기열(--llm-queue-size)을 사이에 두고 나눠서 실행합니다.
+(1차 분석 → 첨부파일 변환 → 2차 분석 순서로 두 단계를 오갑니다)
 """
 
 import argparse
@@ -17,7 +21,6 @@ import sys
 import time
 import unicodedata
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
@@ -29,9 +32,12 @@ sys.path.insert(0, str(project_root))
 from src.config.config import ConfigManager
 from src.config.logConfig import setup_logging
 from src.utils.attachmentProcessor import AttachmentProcessor
+from src.utils.contentHeaderParser import extract_title
 from src.utils.ollamaClient import AnnouncementPrvAnalyzer
 from src.models.announcementPrvDatabase import AnnouncementPrvDatabaseManager, create_announcement_prv_tables
 from src.utils.announcementFilter import AnnouncementFilter
+from src.utils.keywordSnapshot import ExclusionKeywordSnapshot, get_exclusion_snapshot
+from src.utils.llmPipeline import ConversionLLMPipeline, PipelineFailure, get_llm_dispatch_settings
 
 logger = setup_logging(__name__)
 config = ConfigManager().get_config()
@@ -55,13 +61,30 @@ class ProcessingResult:
     error_message: Optional[str] = None
     processing_time: float = 0.0
 
+@dataclass
+class LLMJob:
+    """단계 사이에 넘기는 작업 정보 (1차 분석 → 첨부파일 변환 → 2차 분석)"""
+    task: ProcessingTask
+    record_id: Any
+    content_md: str
+    first_response: Optional[Dict[str, Any]] = None
+    first_prompt: str = ""
+    combined_content: str = ""
+    start_time: float = 0.0
+
 class ParallelAnnouncementPrvProcessor:
     """병렬 처리 버전의 공고 처리 클래스 (2개 워커 최적화)"""
     
-    def __init__(self, attach_force: bool = False, max_workers: int = 2):
+    def __init__(self, attach_force: bool = False, max_workers: int = 2, llm_workers: Optional[int] = None, llm_queue_size: Optional[int] = None):
         self.attach_force = attach_force
         self.max_workers = max_workers
         
+        # LLM 단계 설정 (미지정 시 config.ini [llm_dispatch])
+        default_llm_workers, default_llm_queue_size = get_llm_dispatch_settings()
+        self.llm_workers = llm_workers or default_llm_workers
+        self.llm_queue_size = llm_queue_size or default_llm_queue_size
+        self._pipeline: Optional[ConversionLLMPipeline] = None
+        
         # 스레드별 인스턴스를 위한 ThreadLocal 저장소
         self._local = threading.local()
         
@@ -71,8 +94,8 @@ class ParallelAnnouncementPrvProcessor:
         # 데이터베이스 테이블 생성 (없는 경우)
         self._ensure_database_tables()
         
-        # 제외 키워드 로드 (한 번만)
-        self.exclusion_keywords = self._load_exclusion_keywords()
+        # 제외 키워드 로드 (프로세스 공유 스냅샷)
+        self.exclusion_snapshot = self._load_exclusion_keywords()
         
         # 통계 추적용
         self._stats_lock = threading.Lock()
@@ -104,6 +127,17 @@ class ParallelAnnouncementPrvProcessor:
             self._local.filter
         )
     
+    def _get_llm_instances(self):
+        """LLM 워커 스레드용 로컬 인스턴스(분석기, DB 매니저)를 가져옵니다."""
+        if not hasattr(self._local, 'llm_initialized'):
+            self._local.llm_analyzer = AnnouncementPrvAnalyzer()
+            self._local.llm_db_manager = AnnouncementPrvDatabaseManager()
+            self._local.llm_initialized = True
+            
+            logger.info(f"LLM 워커 인스턴스 초기화 완료: {threading.current_thread().name}")
+        
+        return self._local.llm_analyzer, self._local.llm_db_manager
+    
     def _ensure_database_tables(self):
         """데이터베이스 테이블이 존재하는지 확인하고 생성합니다."""
         try:
@@ -115,33 +149,9 @@ class ParallelAnnouncementPrvProcessor:
         except Exception as e:
             logger.warning(f"데이터베이스 초기화 실패: {e} - 계속 진행합니다 (DB 저장 불가)")
     
-    def _load_exclusion_keywords(self) -> List[Dict[str, Any]]:
-        """데이터베이스에서 제외 키워드를 로드합니다."""
-        try:
-            from sqlalchemy import text
-            
-            with self.global_db_manager.SessionLocal() as session:
-                result = session.execute(text("""
-                    SELECT EXCLUSION_ID, KEYWORD, DESCRIPTION
-                    FROM EXCLUSION_KEYWORDS
-                    WHERE IS_ACTIVE = TRUE
-                    ORDER BY EXCLUSION_ID
-                """))
-                
-                keywords = []
-                for row in result:
-                    keywords.append({
-                        'id': row[0],
-                        'keyword': row[1],
-                        'description': row[2]
-                    })
-                
-                logger.info(f"제외 키워드 로드 완료: {len(keywords)}개")
-                return keywords
-                
-        except Exception as e:
-            logger.warning(f"제외 키워드 로드 실패: {e}")
-            return []
+    def _load_exclusion_keywords(self) -> ExclusionKeywordSnapshot:
+        """프로세스 공유 스냅샷에서 제외 키워드를 가져옵니다. (버전이 바뀐 경우에만 DB 재조회)"""
+        return get_exclusion_snapshot(self.global_db_manager.SessionLocal)
     
     def _update_stats(self, stat_name: str, increment: int = 1):
         """통계를 스레드 안전하게 업데이트합니다."""
@@ -153,63 +163,16 @@ class ParallelAnnouncementPrvProcessor:
         progress_pct = (completed / total) * 100 if total > 0 else 0
         print(f"[{worker_name}] [{completed}/{total} : {progress_pct:.1f}%] {folder_name} ({elapsed:.1f}초)")
     
-    def process_single_directory(self, task: ProcessingTask) -> ProcessingResult:
-        """단일 디렉토리를 처리합니다 (스레드 안전)."""
-        worker_name = threading.current_thread().name
-        start_time = time.time()
+    def _convert_directory(self, task: ProcessingTask, db_manager):
+        """
+        변환 단계: content.md 읽기, 제외 키워드/제목 확인, 1차 DB 저장까지 수행합니다.
         
-        try:
-            # 스레드별 인스턴스 가져오기
-            attachment_processor, announcement_analyzer, db_manager, filter_instance = self._get_local_instances()
-            
-            logger.info(f"[{worker_name}] 디렉토리 처리 시작: {task.folder_name}")
-            
-            # 중복 처리 체크 (force 옵션이 없을 때만)
-            if not task.force:
-                if db_manager.is_already_processed(task.folder_name, task.site_code):
-                    elapsed = time.time() - start_time
-                    logger.info(f"[{worker_name}] 이미 처리된 폴더 건너뜀: {task.folder_name}")
-                    return ProcessingResult(
-                        task_id=task.task_id,
-                        folder_name=task.folder_name,
-                        success=True,
-                        processing_time=elapsed
-                    )
-            
-            # 실제 처리 로직 실행 (기존 process_directory_with_custom_name과 동일)
-            success = self._process_directory_core(
-                task, attachment_processor, announcement_analyzer, db_manager, filter_instance
-            )
-            
-            elapsed = time.time() - start_time
-            
-            return ProcessingResult(
-                task_id=task.task_id,
-                folder_name=task.folder_name,
-                success=success,
-                processing_time=elapsed
-            )
-            
-        except Exception as e:
-            elapsed = time.time() - start_time
-            error_msg = f"처리 중 예외 발생: {str(e)}"
-            logger.error(f"[{worker_name}] {error_msg} ({task.folder_name})")
-            
-            return ProcessingResult(
-                task_id=task.task_id,
-                folder_name=task.folder_name,
-                success=False,
-                error_message=error_msg,
-                processing_time=elapsed
-            )
-    
-    def _process_directory_core(self, task: ProcessingTask, attachment_processor, announcement_analyzer, db_manager, filter_instance) -> bool:
-        """디렉토리 처리 핵심 로직 (스레드별 인스턴스 사용)"""
+        Returns:
+            1차 분석이 필요하면 LLMJob, 여기서 처리가 끝나면 처리 결과(bool)
+        """
         directory_path = task.directory_path
         site_code = task.site_code
         folder_name = task.folder_name
-        attach_force = task.attach_force
-        force = task.force
         
         try:
             # 1. 제외 키워드 체크
@@ -280,6 +243,29 @@ class ParallelAnnouncementPrvProcessor:
                         db_manager=db_manager
                     )
             
+            return LLMJob(task, record_id, content_md)
+                
+        except Exception as e:
+            logger.error(f"디렉토리 처리 중 예상치 못한 오류: {e}")
+            return self._save_processing_result(
+                folder_name, site_code, "", "",
+                status="ollama", error_message=f"예상치 못한 오류: {e}",
+                db_manager=db_manager
+            )
+    
+    def _analyze_first(self, job: LLMJob, announcement_analyzer, db_manager):
+        """
+        LLM 단계: content.md로 1차 분석합니다.
+        
+        Returns:
+            지원사업이면 첨부파일 변환이 필요한 LLMJob, 아니면 처리 결과(bool)
+        """
+        folder_name = job.task.folder_name
+        site_code = job.task.site_code
+        record_id = job.record_id
+        content_md = job.content_md
+        
+        try:
             # 6. content_md로 첫번째 ollama 분석
             print("  📋 1차 Ollama 분석 중 (content.md)...")
             first_response = None
@@ -302,8 +288,36 @@ class ParallelAnnouncementPrvProcessor:
                     db_manager=db_manager
                 )
             
-            # 8. 지원사업인 경우 첨부파일 처리 시작
             logger.info("1차 분석 결과: 지원사업 확인됨 - 첨부파일 처리 시작")
+            job.first_response = first_response
+            job.first_prompt = first_prompt
+            return job
+                
+        except Exception as e:
+            logger.error(f"디렉토리 처리 중 예상치 못한 오류: {e}")
+            return self._save_processing_result(
+                folder_name, site_code, "", "",
+                status="ollama", error_message=f"예상치 못한 오류: {e}",
+                db_manager=db_manager
+            )
+    
+    def _convert_attachments(self, job: LLMJob, attachment_processor, db_manager):
+        """
+        변환 단계: 지원사업으로 확인된 공고의 첨부파일을 변환합니다.
+        
+        Returns:
+            2차 분석이 필요하면 LLMJob, 아니면 처리 결과(bool)
+        """
+        folder_name = job.task.folder_name
+        site_code = job.task.site_code
+        record_id = job.record_id
+        directory_path = job.task.directory_path
+        attach_force = job.task.attach_force
+        first_response = job.first_response
+        first_prompt = job.first_prompt
+        
+        try:
+            # 8. 지원사업인 경우 첨부파일 처리 시작
             print("  📂 첨부파일 변환 중...")
             
             combined_content = ""
@@ -341,20 +355,8 @@ class ParallelAnnouncementPrvProcessor:
             
             # 10. 2차 ollama 분석 (지원사업이지만 지원대상 정보가 부족한 경우)
             if combined_content.strip():
-                print("  📋 2차 Ollama 분석 중 (첨부파일만)...")
-                logger.info("2차 분석 시작 - 지원사업이지만 지원대상 정보 부족, 첨부파일만으로 재분석")
-                
-                # 첨부파일 내용만으로 2차 분석
-                second_response, second_prompt = self._analyze_with_ollama(combined_content, announcement_analyzer)
-                
-                # 최종 상태 결정 로직
-                final_status = self._determine_final_status(first_response, second_response)
-                
-                return self._update_processing_result(
-                    record_id, second_response, second_prompt, 
-                    first_response=first_response, status=final_status,
-                    db_manager=db_manager
-                )
+                job.combined_content = combined_content
+                return job
             else:
                 # 2차 분석이 필요하지만 첨부파일 내용이 없는 경우
                 logger.info("2차 분석 필요하지만 첨부파일 내용 없음 - 1차 결과만 사용")
@@ -372,6 +374,38 @@ class ParallelAnnouncementPrvProcessor:
                 db_manager=db_manager
             )
     
+    def _analyze_second(self, job: LLMJob, announcement_analyzer, db_manager) -> bool:
+        """LLM 단계: 첨부파일 내용만으로 2차 분석 후 최종 결과를 저장합니다."""
+        folder_name = job.task.folder_name
+        site_code = job.task.site_code
+        record_id = job.record_id
+        first_response = job.first_response
+        combined_content = job.combined_content
+        
+        try:
+            print("  📋 2차 Ollama 분석 중 (첨부파일만)...")
+            logger.info("2차 분석 시작 - 지원사업이지만 지원대상 정보 부족, 첨부파일만으로 재분석")
+            
+            # 첨부파일 내용만으로 2차 분석
+            second_response, second_prompt = self._analyze_with_ollama(combined_content, announcement_analyzer)
+            
+            # 최종 상태 결정 로직
+            final_status = self._determine_final_status(first_response, second_response)
+            
+            return self._update_processing_result(
+                record_id, second_response, second_prompt, 
+                first_response=first_response, status=final_status,
+                db_manager=db_manager
+            )
+                
+        except Exception as e:
+            logger.error(f"디렉토리 처리 중 예상치 못한 오류: {e}")
+            return self._save_processing_result(
+                folder_name, site_code, "", "",
+                status="ollama", error_message=f"예상치 못한 오류: {e}",
+                db_manager=db_manager
+            )
+    
     def process_prv_city_directories_parallel(self, base_dir: Path, city_path: str, recursive: bool = False, force: bool = False, attach_force: bool = False) -> Dict[str, int]:
         """PRV 2depth 구조에서 특정 시군의 디렉토리들을 병렬로 처리합니다."""
         db_site_code = "prv"
@@ -409,8 +443,94 @@ class ParallelAnnouncementPrvProcessor:
         # 병렬 처리 실행
         return self._execute_parallel_processing(tasks, city_path)
     
+    def _make_result(self, task: ProcessingTask, outcome, start_time: float, error_msg: Optional[str] = None) -> ProcessingResult:
+        return ProcessingResult(
+            task_id=task.task_id,
+            folder_name=task.folder_name,
+            success=bool(outcome) and error_msg is None,
+            error_message=error_msg,
+            processing_time=time.time() - start_time
+        )
+    
+    def _run_conversion_stage(self, task: ProcessingTask):
+        """파이프라인 변환 단계 - content.md 처리 (변환 워커 스레드에서 실행)"""
+        worker_name = threading.current_thread().name
+        start_time = time.time()
+        
+        try:
+            _, _, db_manager, _ = self._get_local_instances()
+            
+            logger.info(f"[{worker_name}] 디렉토리 처리 시작: {task.folder_name}")
+            
+            # 중복 처리 체크 (force 옵션이 없을 때만)
+            if not task.force and db_manager.is_already_processed(task.folder_name, task.site_code):
+                logger.info(f"[{worker_name}] 이미 처리된 폴더 건너뜀: {task.folder_name}")
+                return self._make_result(task, True, start_time)
+            
+            outcome = self._convert_directory(task, db_manager)
+            
+            if isinstance(outcome, LLMJob):
+                # LLM 대기열이 가득 차면 여기서 대기 (backpressure)
+                outcome.start_time = start_time
+                self._pipeline.submit_llm(self._run_first_analysis_stage, outcome)
+                return None
+            
+            return self._make_result(task, outcome, start_time)
+            
+        except Exception as e:
+            error_msg = f"처리 중 예외 발생: {str(e)}"
+            logger.error(f"[{worker_name}] {error_msg} ({task.folder_name})")
+            return self._make_result(task, False, start_time, error_msg)
+    
+    def _run_first_analysis_stage(self, job: LLMJob):
+        """파이프라인 LLM 단계 - 1차 분석 (LLM 워커 스레드에서 실행)"""
+        try:
+            announcement_analyzer, db_manager = self._get_llm_instances()
+            outcome = self._analyze_first(job, announcement_analyzer, db_manager)
+            
+            if isinstance(outcome, LLMJob):
+                # 첨부파일 변환은 변환 단계로 넘김 (LLM 워커는 대기하지 않음)
+                self._pipeline.submit_conversion(self._run_attachment_stage, outcome)
+                return None
+            
+            return self._make_result(job.task, outcome, job.start_time)
+            
+        except Exception as e:
+            error_msg = f"1차 분석 중 예외 발생: {str(e)}"
+            logger.error(f"[{threading.current_thread().name}] {error_msg} ({job.task.folder_name})")
+            return self._make_result(job.task, False, job.start_time, error_msg)
+    
+    def _run_attachment_stage(self, job: LLMJob):
+        """파이프라인 변환 단계 - 첨부파일 변환 (변환 워커 스레드에서 실행)"""
+        try:
+            attachment_processor, _, db_manager, _ = self._get_local_instances()
+            outcome = self._convert_attachments(job, attachment_processor, db_manager)
+            
+            if isinstance(outcome, LLMJob):
+                self._pipeline.submit_llm(self._run_second_analysis_stage, outcome)
+                return None
+            
+            return self._make_result(job.task, outcome, job.start_time)
+            
+        except Exception as e:
+            error_msg = f"첨부파일 변환 중 예외 발생: {str(e)}"
+            logger.error(f"[{threading.current_thread().name}] {error_msg} ({job.task.folder_name})")
+            return self._make_result(job.task, False, job.start_time, error_msg)
+    
+    def _run_second_analysis_stage(self, job: LLMJob) -> ProcessingResult:
+        """파이프라인 LLM 단계 - 2차 분석 (LLM 워커 스레드에서 실행)"""
+        try:
+            announcement_analyzer, db_manager = self._get_llm_instances()
+            outcome = self._analyze_second(job, announcement_analyzer, db_manager)
+            return self._make_result(job.task, outcome, job.start_time)
+            
+        except Exception as e:
+            error_msg = f"2차 분석 중 예외 발생: {str(e)}"
+            logger.error(f"[{threading.current_thread().name}] {error_msg} ({job.task.folder_name})")
+            return self._make_result(job.task, False, job.start_time, error_msg)
+    
     def _execute_parallel_processing(self, tasks: List[ProcessingTask], context_name: str = "") -> Dict[str, int]:
-        """작업 목록을 병렬로 처리합니다."""
+        """작업 목록을 변환 ↔ LLM 파이프라인으로 처리합니다."""
         total_count = len(tasks)
         results = {"total": total_count, "success": 0, "failed": 0, "skipped": 0}
         
@@ -420,37 +540,36 @@ class ParallelAnnouncementPrvProcessor:
         start_time = time.time()
         processed_count = 0
         
-        print(f"\n🚀 병렬 처리 시작: {context_name} ({total_count}개 작업, {self.max_workers}개 워커)")
+        print(f"\n🚀 병렬 처리 시작: {context_name} ({total_count}개 작업, 변환 워커 {self.max_workers}개, LLM 워커 {self.llm_workers}개)")
         print(f"{'='*60}")
         
-        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="Worker") as executor:
-            # 모든 작업을 submit
-            future_to_task = {executor.submit(self.process_single_directory, task): task for task in tasks}
+        with ConversionLLMPipeline(self.max_workers, self.llm_workers, self.llm_queue_size) as pipeline:
+            self._pipeline = pipeline
+            
+            for task in tasks:
+                pipeline.submit_conversion(self._run_conversion_stage, task)
             
             # 완료되는 대로 결과 처리
-            for future in as_completed(future_to_task):
-                task = future_to_task[future]
+            for result in pipeline.results(total_count):
                 processed_count += 1
                 
-                try:
-                    result = future.result()
-                    
-                    if result.success:
-                        results["success"] += 1
-                        status_icon = "✅"
-                        status_text = "성공"
-                    else:
-                        results["failed"] += 1
-                        status_icon = "❌"
-                        status_text = f"실패: {result.error_message or 'Unknown error'}"
-                    
-                    progress_pct = (processed_count / total_count) * 100
-                    print(f"     [{processed_count}/{total_count} : {progress_pct:.1f}%] {status_icon} {result.folder_name} ({result.processing_time:.1f}초)")
-                    
-                except Exception as e:
+                if isinstance(result, PipelineFailure):
                     results["failed"] += 1
-                    print(f"     [{processed_count}/{total_count}] ❌ {task.folder_name} - 예외: {str(e)[:50]}...")
-                    logger.error(f"Future 처리 중 오류: {e}")
+                    task = getattr(result.item, 'task', result.item)
+                    print(f"     [{processed_count}/{total_count}] ❌ {task.folder_name} - 예외: {str(result.error)[:50]}...")
+                    continue
+                
+                if result.success:
+                    results["success"] += 1
+                    status_icon = "✅"
+                else:
+                    results["failed"] += 1
+                    status_icon = "❌"
+                
+                progress_pct = (processed_count / total_count) * 100
+                print(f"     [{processed_count}/{total_count} : {progress_pct:.1f}%] {status_icon} {result.folder_name} ({result.processing_time:.1f}초)")
+            
+            stage_summaries = pipeline.summary_lines()
         
         total_elapsed = time.time() - start_time
         
@@ -461,6 +580,12 @@ class ParallelAnnouncementPrvProcessor:
         if results['success'] > 0:
             avg_time = total_elapsed / results['success']
             print(f"성공한 항목당 평균 시간: {avg_time:.1f}초")
+        
+        # 단계별 처리량 (변환/LLM이 겹쳐 진행된 정도 확인용)
+        for line in stage_summaries:
+            print(f"📊 {line}")
+            logger.info(f"[{context_name}] {line}")
+        
         print(f"{'='*60}")
         
         return results
@@ -482,7 +607,7 @@ class ParallelAnnouncementPrvProcessor:
         total_results = {"total": 0, "success": 0, "failed": 0, "skipped": 0}
         
         print(f"\n{'='*80}")
-        print(f"🚀 병렬 다중 사이트 공고 처리 시작: {len(site_directories)}개 사이트 ({self.max_workers}개 워커)")
+        print(f"🚀 병렬 다중 사이트 공고 처리 시작: {len(site_directories)}개 사이트 (변환 워커 {self.max_workers}개, LLM 워커 {self.llm_workers}개)")
         print(f"발견된 사이트: {[d.name for d in site_directories]}")
         print(f"{'='*80}")
         
@@ -540,7 +665,7 @@ class ParallelAnnouncementPrvProcessor:
         print(f"\n{'='*80}")
         print(f"🎉 전체 병렬 사이트 처리 완료!")
         print(f"{'='*80}")
-        print(f"워커 수: {self.max_workers}개")
+        print(f"워커 수: 변환 {self.max_workers}개, LLM {self.llm_workers}개")
         print(f"처리한 사이트: {len(site_directories)}개")
         print(f"전체 대상: {total_results['total']}개")
         print(f"처리 성공: {total_results['success']}개 ({(total_results['success']/max(total_results['total'], 1))*100:.1f}%)")
@@ -610,39 +735,19 @@ class ParallelAnnouncementPrvProcessor:
         """폴더명에서 제외 키워드를 체크합니다."""
         matched_keywords = []
         
-        for keyword_info in self.exclusion_keywords:
-            keyword = keyword_info['keyword'].lower()
-            if keyword in folder_name.lower():
-                matched_keywords.append(keyword_info['keyword'])
-                logger.debug(f"제외 키워드 매칭: '{keyword}' in '{folder_name}'")
+        # 공유 스냅샷 갱신 확인 후 오토마톤으로 폴더명을 한 번만 탐색 (결과는 키워드 로드 순서)
+        snapshot = self.exclusion_snapshot = self._load_exclusion_keywords()
+        positions = snapshot.matcher.first_positions(folder_name)
+        for index in sorted(positions):
+            keyword = snapshot.keywords[index]['keyword']
+            matched_keywords.append(keyword)
+            logger.debug(f"제외 키워드 매칭: '{keyword.lower()}' in '{folder_name}'")
         
         return matched_keywords
     
     def _extract_title_from_content(self, content_md: str) -> str:
-        """content.md에서 제목을 추출합니다."""
-        if not content_md:
-            return ""
-        
-        lines = content_md.split('\n')
-        
-        for line in lines[:10]:
-            line = line.strip()
-            if line:
-                if line.startswith('#'):
-                    title = line.lstrip('#').strip()
-                    logger.debug(f"마크다운 헤더에서 제목 추출: {title}")
-                    return title
-                
-                for prefix in ['제목:', '공고명:', '공고 제목:', '제목 :']:
-                    if line.lower().startswith(prefix.lower()):
-                        title = line[len(prefix):].strip()
-                        logger.debug(f"{prefix} 패턴에서 제목 추출: {title}")
-                        return title
-                
-                logger.debug(f"첫 번째 줄을 제목으로 사용: {line}")
-                return line
-        
-        return ""
+        """content.md에서 제목을 추출합니다. (전처리기와 동일한 규칙: contentHeaderParser)"""
+        return extract_title(content_md)
     
     def _normalize_korean_text(self, text: str) -> str:
         """한글 텍스트를 NFC(Composed) 형태로 정규화합니다."""
@@ -716,7 +821,9 @@ class ParallelAnnouncementPrvProcessor:
                         logger.error(f"첨부파일 .md 읽기 실패: {e}")
                 else:
                     try:
-                        content = attachment_processor.process_single_file(file_path)
+                        content = attachment_processor.process_single_file(
+                            file_path, bypass_cache=attach_force
+                        )
                         
                         if content and content.strip():
                             combined_content += f"\n\n=== {self._normalize_korean_text(file_path.name)} ===\n{content}"
@@ -1109,6 +1216,7 @@ def main():
 예시:
   python announcement_prv_processor_parallel.py --data data.enhanced
   python announcement_prv_processor_parallel.py --data data.origin --workers 4
+  python announcement_prv_processor_parallel.py --data data.origin --workers 2 --llm-workers 4  # Ollama 요청 4개 동시 유지
   python announcement_prv_processor_parallel.py  # 환경변수 DEFAULT_DIR 사용
   python announcement_prv_processor_parallel.py --data data.enhanced -r  # 재귀적 처리
   python announcement_prv_processor_parallel.py --data data.enhanced --attach-force  # 첨부파일 강제 재처리
@@ -1128,6 +1236,18 @@ def main():
         help="병렬 처리에 사용할 워커 수 (기본값: 2, 권장: 2)"
     )
     
+    parser.add_argument(
+        "--llm-workers",
+        type=int,
+        help="동시에 유지할 Ollama 분석 요청 수 (기본값: config.ini [llm_dispatch] workers)"
+    )
+    
+    parser.add_argument(
+        "--llm-queue-size",
+        type=int,
+        help="변환 → LLM 대기열 크기, 가득 차면 변환 워커가 대기 (기본값: config.ini [llm_dispatch] queue_size)"
+    )
+    
     parser.add_argument(
         "--skip-processed", 
         action="store_true", 
@@ -1162,7 +1282,9 @@ def main():
         logger.info(f"병렬 공고 처리 프로그램 시작 (워커 수: {args.workers})")
         processor = ParallelAnnouncementPrvProcessor(
             attach_force=args.attach_force,
-            max_workers=args.workers
+            max_workers=args.workers,
+            llm_workers=args.llm_workers,
+            llm_queue_size=args.llm_queue_size
         )
         
         # 모든 사이트 병렬 처리 실행
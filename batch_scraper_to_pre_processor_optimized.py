@@ -5,6 +5,7 @@
 - 타임아웃 문제 해결
 - 메모리 효율성 개선
 - 실패한 지역만 재처리 옵션
+- 상주 워커 서비스 사용 옵션 (--use-worker-service)
 """
 
 import os
@@ -25,7 +26,8 @@ import psutil
 class OptimizedBatchProcessor:
     def __init__(self, data_source: str = 'eminwon', date_str: Optional[str] = None,
                  max_workers: int = 2, force: bool = False, attach_force: bool = False,
-                 retry_failed: bool = False, timeout: int = 1200):
+                 retry_failed: bool = False, timeout: int = 1200,
+                 use_worker_service: bool = False, job_db: Optional[str] = None):
         """
         Args:
             data_source: 'eminwon' 또는 'homepage'
@@ -35,6 +37,8 @@ class OptimizedBatchProcessor:
             attach_force: 첨부파일 강제 재처리
             retry_failed: 실패한 항목만 재처리
             timeout: 프로세스 타임아웃 (초)
+            use_worker_service: 지역마다 프로세스를 띄우지 않고 상주 워커 서비스에 작업 위임
+            job_db: 워커 서비스 작업 큐 SQLite 파일 경로
         """
         self.data_source = data_source
         
@@ -56,6 +60,12 @@ class OptimizedBatchProcessor:
         self.attach_force = attach_force
         self.retry_failed = retry_failed
         self.timeout = timeout
+        self.use_worker_service = use_worker_service
+        
+        self.job_client = None
+        if self.use_worker_service:
+            from pre_processor_worker_service import PreProcessorJobClient, DEFAULT_JOB_DB
+            self.job_client = PreProcessorJobClient(Path(job_db) if job_db else DEFAULT_JOB_DB)
         
         self.setup_logging()
         
@@ -187,6 +197,10 @@ class OptimizedBatchProcessor:
             
             self.logger.info(f"[{region_name}] 처리 시작 ({len(announcement_folders)}개 공고)")
             
+            if self.job_client is not None:
+                self._process_region_via_service(region_path, normalized_site_code, result)
+                return result
+            
             # 명령어 구성
             cmd = [
                 sys.executable,
@@ -268,6 +282,45 @@ class OptimizedBatchProcessor:
         
         return result
     
+    def _process_region_via_service(self, region_path: Path, site_code: str, result: Dict[str, Any]):
+        """상주 워커 서비스에 지역 작업을 등록하고 완료될 때까지 기다립니다."""
+        region_name = region_path.name
+        
+        job_id = self.job_client.submit(
+            self.base_dir,
+            site_code,
+            force=self.force,
+            attach_force=self.attach_force,
+            timeout=self.timeout
+        )
+        result['job_id'] = job_id
+        
+        # 타임아웃은 서비스가 워커를 종료하여 적용함
+        # 여기서는 서비스가 내려가 있는 경우를 대비해 대기열 시간까지 고려한 상한만 둠
+        job = self.job_client.wait(job_id, max_wait=self.timeout * (self.stats['total_regions'] or 1))
+        
+        if job['status'] == 'success':
+            result['success'] = True
+            result['job_result'] = job.get('result')
+            self.stats['success'] += 1
+            self.logger.info(f"[{region_name}] ✅ 성공 (job {job_id})")
+            
+            # 처리 완료 마커 생성
+            if not self.retry_failed:
+                marker_file = region_path / '.processed'
+                marker_file.touch()
+        elif job['status'] == 'timeout':
+            result['error'] = job.get('error') or f'Timeout ({self.timeout}초 초과)'
+            self.stats['timeout'] += 1
+            self.stats['failed'] += 1
+            self.stats['failed_regions'].append(region_name)
+            self.logger.error(f"[{region_name}] ⏱️ 타임아웃 (job {job_id})")
+        else:
+            result['error'] = job.get('error') or json.dumps(job.get('result'), ensure_ascii=False)
+            self.stats['failed'] += 1
+            self.stats['failed_regions'].append(region_name)
+            self.logger.error(f"[{region_name}] ❌ 실패 (job {job_id})")
+    
     def save_failed_regions(self):
         """실패한 지역 목록 저장"""
         if self.stats['failed_regions']:
@@ -295,6 +348,8 @@ class OptimizedBatchProcessor:
             self.logger.info('강제 재처리 모드')
         if self.attach_force:
             self.logger.info('첨부파일 강제 재처리 모드')
+        if self.job_client is not None:
+            self.logger.info(f'상주 워커 서비스 사용: {self.job_client.db_path}')
         
         self.logger.info('='*60)
         
@@ -434,6 +489,18 @@ def main():
         help='이전 실행에서 실패한 항목만 재처리'
     )
     
+    parser.add_argument(
+        '--use-worker-service',
+        action='store_true',
+        help='지역마다 프로세스를 띄우지 않고 상주 워커 서비스(pre_processor_worker_service.py)에 작업 위임'
+    )
+    
+    parser.add_argument(
+        '--job-db',
+        type=str,
+        help='워커 서비스 작업 큐 SQLite 파일 경로 (기본값: logs/pre_processor_jobs.sqlite3)'
+    )
+    
     args = parser.parse_args()
     
     processor = OptimizedBatchProcessor(
@@ -443,7 +510,9 @@ def main():
         timeout=args.timeout,
         force=args.force,
         attach_force=args.attach_force,
-        retry_failed=args.retry_failed
+        retry_failed=args.retry_failed,
+        use_worker_service=args.use_worker_service,
+        job_db=args.job_db
     )
     
     success = processor.run()
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+contentHeaderParser 회귀 검증 및 성능 비교 스크립트
+
+공용 content.md 헤더 파서(src/utils/contentHeaderParser.py)를 각 처리기가 갖고 있던
+기존 추출 함수와 같은 입력으로 비교합니다.
+
+- 전처리기(announcement_pre_processor.py) 기존 규칙: 제목/원본 URL은 결과가 같아야 합니다.
+- 다른 처리기(announcement_prv_file.py, announcement_prv_processor.py 등) 기존 규칙:
+  같은 줄에 연도가 포함된 공고일이 있는데 새 파서가 빈 값을 반환하면 회귀로 봅니다.
+- 공고일을 헤더가 아닌 본문 문장("작성일 기준 ...")에서 가져오면 회귀로 봅니다.
+  (줄바꿈을 건너뛴 캡처, 메타데이터 줄을 제목으로 쓰던 동작은 의도된 차이로 집계만 합니다)
+
+사용법:
+    # 실제 content.md로 검증
+    python benchmark_content_header_parser.py data/kStartUp data/prv
+
+    # 실제 데이터가 없으면 무작위 헤더로 검증
+    python benchmark_content_header_parser.py --synthetic 20000
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+from src.utils.contentHeaderParser import (
+    extract_announcement_date,
+    extract_origin_url,
+    extract_title,
+    header_section,
+)
+
+# ---------------------------------------------------------------------------
+# 기존 구현 (비교 기준, 로깅 제외)
+# ---------------------------------------------------------------------------
+
+
+def legacy_pre_title(content_md):
+    """announcement_pre_processor.py 기존 _extract_title_from_content"""
+    if not content_md:
+        return ""
+
+    lines = content_md.split("\n")
+
+    for line in lines[:10]:
+        line = line.strip()
+        if line.startswith("**제목**:"):
+            title = line.replace("**제목**:", "").strip()
+            if title:
+                return title
+
+    for line in lines[:10]:
+        line = line.strip()
+        if line:
+            if line.startswith("#"):
+                return line.lstrip("#").strip()
+
+            for prefix in ["제목:", "공고명:", "공고 제목:", "제목 :"]:
+                if line.lower().startswith(prefix.lower()):
+                    return line[len(prefix) :].strip()
+
+            if not line.startswith("**"):
+                return line
+
+    return ""
+
+
+def legacy_variant_title(content_md):
+    """announcement_prv_file.py / announcement_prv_processor[_parallel].py /
+    announcement_processor_parallel.py 기존 _extract_title_from_content"""
+    if not content_md:
+        return ""
+
+    lines = content_md.split("\n")
+
+    for line in lines[:10]:
+        line = line.strip()
+        if line:
+            if line.startswith("#"):
+                return line.lstrip("#").strip()
+
+            for prefix in ["제목:", "공고명:", "공고 제목:", "제목 :"]:
+                if line.lower().startswith(prefix.lower()):
+                    return line[len(prefix) :].strip()
+
+            return line
+
+    return ""
+
+
+def legacy_origin_url(content_md):
+    """전처리기/PRV 처리기 공통 기존 _extract_origin_url_from_content"""
+    if not content_md:
+        return ""
+
+    origin_patterns = [
+        r"\*\*원본 URL\*\*[:\s]*(.+?)(?:\n|$)",
+        r"원본 URL[:\s]*(.+?)(?:\n|$)",
+        r"원본[:\s]*(.+?)(?:\n|$)",
+        r"(https?://[^\s\)]+(?:\.go\.kr|\.or\.kr)[^\s\)]*)",
+    ]
+
+    for pattern in origin_patterns:
+        matches = re.findall(pattern, content_md, re.IGNORECASE)
+        if matches:
+            url = matches[0].strip()
+            if url and url.startswith("http"):
+                return url
+    return ""
+
+
+def _legacy_date(content_md, date_patterns, strict):
+    if not content_md:
+        return ""
+
+    for pattern in date_patterns:
+        matches = re.findall(pattern, content_md, re.IGNORECASE)
+        if matches:
+            date_str = matches[0].strip()
+            if date_str:
+                if not strict:
+                    return date_str
+                date_str = re.sub(r"\*+", "", date_str).strip()
+                if re.search(r"\d{4}", date_str):
+                    return date_str
+    return ""
+
+
+def legacy_pre_date(content_md):
+    """announcement_pre_processor.py 기존 _extract_announcement_date_from_content"""
+    return _legacy_date(
+        content_md,
+        [
+            r"\*\*작성일\*\*:[ \t]*([^\n]+)",
+            r"\*\*작성일\*\*:\*\*[ \t]*([^\n]+)",
+            r"작성일:[ \t]*([^\n]+)",
+            r"\*\*등록일\*\*:[ \t]*([^\n]+)",
+            r"\*\*등록일\*\*:\*\*[ \t]*([^\n]+)",
+            r"등록일:[ \t]*([^\n]+)",
+            r"\*\*공고일\*\*:[ \t]*([^\n]+)",
+            r"\*\*공고일\*\*:\*\*[ \t]*([^\n]+)",
+            r"공고일:[ \t]*([^\n]+)",
+        ],
+        strict=True,
+    )
+
+
+def legacy_prv_processor_date(content_md):
+    """announcement_prv_processor.py 기존 _extract_announcement_date_from_content"""
+    return _legacy_date(
+        content_md,
+        [
+            r"\*\*작성일\*\*:\s*([^\n]+)",
+            r"\*\*작성일\*\*:\*\*\s*([^\n]+)",
+            r"작성일:\s*([^\n]+)",
+            r"\*\*등록일\*\*:\s*([^\n]+)",
+            r"\*\*등록일\*\*:\*\*\s*([^\n]+)",
+            r"등록일:\s*([^\n]+)",
+            r"\*\*공고일\*\*:\s*([^\n]+)",
+            r"\*\*공고일\*\*:\*\*\s*([^\n]+)",
+            r"공고일:\s*([^\n]+)",
+        ],
+        strict=True,
+    )
+
+
+def legacy_prv_file_date(content_md):
+    """announcement_prv_file.py 기존 _extract_announcement_date_from_content"""
+    return _legacy_date(
+        content_md,
+        [
+            r"\*\*작성일\*\*[:\s]*(.+?)(?:\n|$)",
+            r"작성일[:\s]*(.+?)(?:\n|$)",
+            r"\*\*등록일\*\*[:\s]*(.+?)(?:\n|$)",
+            r"등록일[:\s]*(.+?)(?:\n|$)",
+            r"\*\*공고일\*\*[:\s]*(.+?)(?:\n|$)",
+            r"공고일[:\s]*(.+?)(?:\n|$)",
+        ],
+        strict=False,
+    )
+
+
+# ---------------------------------------------------------------------------
+# 입력 생성
+# ---------------------------------------------------------------------------
+
+_DATE_LABELS = ["작성일", "등록일", "공고일"]
+_SEPARATORS = [":", ": ", " : ", " :", "\t:\t", " ", "  ", ""]
+_DATE_VALUES = ["2024.01.05", "2024-01-05", "2023/12/31", "2024년 3월 2일", "2024.1.5 14:00"]
+_NO_YEAR_VALUES = ["미정", "-", "추후 공지"]
+_TITLES = ["2024년 창업지원사업 공고", "소상공인 경영안정자금 지원", "[모집] 청년 일자리 사업"]
+_URLS = ["https://www.k-startup.go.kr/web/contents/bizpbanc.do?pbancSn=1", "https://www.seoul.go.kr/news/1"]
+_BODY = [
+    "",
+    "본문 내용입니다.",
+    "신청 자격: 중소기업",
+    "문의: 02-123-4567",
+    "※ 작성일 기준 3개월 이내 서류",
+    "서류는 작성일 기준 2023년 12월 31일까지 유효합니다.",
+    "공고일 현재 사업자등록 2022년 이후 기업",
+]
+_BODY_MARKERS = ["**내용**:", "## 공고 내용"]
+
+
+def _date_line(rng):
+    """(줄 목록, 같은 줄에 연도가 있는 공고일인지)"""
+    label = rng.choice(_DATE_LABELS)
+    separator = rng.choice(_SEPARATORS)
+    bold = rng.random() < 0.5
+    key = f"**{label}**" if bold else label
+    if bold and separator.startswith(":") and rng.random() < 0.2:
+        key = f"**{label}:**"
+        separator = separator[1:] or " "
+
+    if rng.random() < 0.15:
+        # 값이 다음 줄에 있는 경우 (기존 일부 규칙은 줄을 건너뛰어 캡처)
+        return [f"{key}{separator.rstrip()}", rng.choice(_DATE_VALUES)], False
+
+    if rng.random() < 0.15:
+        return [f"{key}{separator}{rng.choice(_NO_YEAR_VALUES)}"], False
+
+    # 볼드가 아닌 항목명은 바로 뒤에 콜론이 있어야 공고일로 인정
+    same_line = bold or separator.startswith(":")
+    return [f"{key}{separator}{rng.choice(_DATE_VALUES)}"], same_line
+
+
+def synthetic_documents(count, seed=0):
+    rng = random.Random(seed)
+    documents = []
+    for i in range(count):
+        lines = []
+        has_date = False
+
+        title_form = rng.randrange(5)
+        title = rng.choice(_TITLES)
+        if title_form == 0:
+            lines.append(f"# {title}")
+        elif title_form == 1:
+            lines.append(f"**제목**: {title}")
+        elif title_form == 2:
+            lines.append(f"{rng.choice(['제목:', '공고명:', '제목 :'])} {title}")
+        elif title_form == 3:
+            lines.append(title)
+
+        metadata = []
+        if rng.random() < 0.8:
+            metadata.append([f"{rng.choice(['**원본 URL**:', '원본 URL:', '**원본 URL** :'])} {rng.choice(_URLS)}"])
+        if rng.random() < 0.85:
+            date_lines, same_line = _date_line(rng)
+            metadata.append(date_lines)
+            has_date = same_line
+        if rng.random() < 0.3:
+            metadata.append(["**첨부파일**:"])
+        rng.shuffle(metadata)
+        for block in metadata:
+            lines.extend(block)
+            if rng.random() < 0.3:
+                lines.append("")
+
+        if rng.random() < 0.7:
+            lines.extend([rng.choice(_BODY_MARKERS), ""])
+        lines.extend(rng.choice(_BODY) for _ in range(rng.randrange(1, 6)))
+        documents.append((f"synthetic_{i + 1:05d}", "\n".join(lines), has_date))
+    return documents
+
+
+def collect_documents(paths):
+    documents = []
+    for path in map(Path, paths):
+        files = sorted(path.rglob("content.md")) if path.is_dir() else [path]
+        for file in files:
+            text = file.read_text(encoding="utf-8", errors="replace")
+            header = header_section(text)
+            has_date = any(
+                re.search(rf"(?:\*\*{label}\*\*[ \t]*:?|{label}:)[^\n]*\d{{4}}", header)
+                for label in _DATE_LABELS
+            )
+            documents.append((str(file), text, has_date))
+    return documents
+
+
+# ---------------------------------------------------------------------------
+# 비교
+# ---------------------------------------------------------------------------
+
+
+def main():
+    parser = argparse.ArgumentParser(description="contentHeaderParser 회귀 검증 및 성능 비교")
+    parser.add_argument("paths", nargs="*", help="content.md 파일 또는 이를 포함한 디렉토리")
+    parser.add_argument("--synthetic", type=int, default=0, help="무작위 헤더 문서 개수")
+    parser.add_argument("--seed", type=int, default=0, help="무작위 생성 시드")
+    parser.add_argument("--show", type=int, default=5, help="차이 예시 출력 개수")
+    args = parser.parse_args()
+
+    documents = collect_documents(args.paths)
+    if args.synthetic or not documents:
+        documents.extend(synthetic_documents(args.synthetic or 10000, args.seed))
+
+    legacy_dates = {
+        "전처리기": legacy_pre_date,
+        "prv_processor": legacy_prv_processor_date,
+        "prv_file": legacy_prv_file_date,
+    }
+
+    counts = Counter()
+    failures = []
+    differences = []
+    legacy_elapsed = new_elapsed = 0.0
+
+    for name, text, has_same_line_date in documents:
+        start = time.perf_counter()
+        old_pre_title = legacy_pre_title(text)
+        old_variant_title = legacy_variant_title(text)
+        old_origin = legacy_origin_url(text)
+        old_dates = {label: fn(text) for label, fn in legacy_dates.items()}
+        legacy_elapsed += time.perf_counter() - start
+
+        start = time.perf_counter()
+        title = extract_title(text)
+        origin = extract_origin_url(text)
+        date = extract_announcement_date(text)
+        new_elapsed += time.perf_counter() - start
+
+        # 전처리기 규칙과 같아야 하는 항목
+        if title != old_pre_title:
+            failures.append((name, "제목(전처리기)", old_pre_title, title))
+        if origin != old_origin:
+            failures.append((name, "원본 URL", old_origin, origin))
+
+        # 같은 줄에 연도가 있는 공고일을 놓치면 회귀
+        if has_same_line_date and not date:
+            failures.append((name, "공고일 누락", old_dates, date))
+
+        # 공고일은 헤더 구간에서만 가져와야 함
+        if date and date not in re.sub(r"\*+", "", header_section(text)):
+            failures.append((name, "본문 공고일", old_dates, date))
+
+        counts["제목 = 기존 처리기"] += title == old_variant_title
+        if title != old_variant_title:
+            differences.append((name, "제목(기존 처리기)", old_variant_title, title))
+        for label, old_date in old_dates.items():
+            same = date == re.sub(r"\*+", "", old_date).strip()
+            counts[f"공고일 = 기존 {label}"] += same
+            if not same and old_date:
+                differences.append((name, f"공고일(기존 {label})", old_date, date))
+
+    total = len(documents)
+    print("=" * 60)
+    print(f"문서 {total}개")
+    for label, value in counts.items():
+        print(f"  {label}: {value}/{total} ({value / total:.1%})")
+
+    if differences:
+        print("의도된 규칙 차이 (줄바꿈 건너뛰기, 메타데이터 줄 제목, 연도 없는 값 등) 예시:")
+        for name, field, old, new in differences[: args.show]:
+            print(f"  - {name} {field}: {old!r} → {new!r}")
+
+    print(f"기존 구현: {legacy_elapsed:.3f}초, 공용 파서: {new_elapsed:.3f}초")
+
+    if failures:
+        print(f"❌ 회귀 {len(failures)}건")
+        for name, field, old, new in failures[: args.show]:
+            print(f"  - {name} {field}: {old!r} → {new!r}")
+        return 1
+
+    print("✓ 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+textCleaner.clean_extracted_text 회귀 검증 및 성능 비교 스크립트
+
+문자 필터를 코드 포인트 분류 테이블(str.translate)로 바꾼 구현이
+기존 문자별 루프 구현과 바이트 단위로 같은 결과를 내는지 확인하고 처리 시간을 비교합니다.
+
+사용법:
+    # 실제 변환 결과(.md/.txt)로 검증 - HWP/PDF 변환 결과가 있는 attachments 폴더 등
+    python benchmark_text_cleaner.py data/kStartUp/*/attachments
+
+    # 변환 결과가 없으면 합성 코퍼스(한글/영문/한자/변환 노이즈 혼합)로 검증
+    python benchmark_text_cleaner.py --synthetic 20
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+import unicodedata
+from pathlib import Path
+
+from src.utils.textCleaner import (
+    REMOVAL_PATTERNS,
+    clean_extracted_text,
+    is_meaningful_char,
+    mask_date_patterns,
+    remove_guide_sections,
+    should_remove_char,
+)
+
+
+def legacy_clean_extracted_text(text, remove_guides=True):
+    """테이블 도입 전 clean_extracted_text (비교 기준, 로깅 제외)"""
+    if not text or not isinstance(text, str):
+        return ""
+
+    cleaned_text = text
+    if remove_guides:
+        cleaned_text = remove_guide_sections(cleaned_text)
+        cleaned_text = mask_date_patterns(cleaned_text)
+
+    for pattern in REMOVAL_PATTERNS:
+        if re.findall(pattern, cleaned_text):
+            cleaned_text = re.sub(pattern, "", cleaned_text)
+
+    final_chars = []
+    for char in cleaned_text:
+        if should_remove_char(char):
+            continue
+
+        if is_meaningful_char(char):
+            final_chars.append(char)
+        elif 0x4E00 <= ord(char) <= 0x9FFF:
+            if unicodedata.name(char, "").startswith("CJK IDEOGRAPH"):
+                final_chars.append(char)
+
+    result = "".join(final_chars)
+    result = re.sub(r"\s+", " ", result)
+    return result.strip()
+
+
+def collect_files(paths):
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(p for p in path.rglob("*") if p.suffix in (".md", ".txt")))
+        elif path.is_file():
+            files.append(path)
+    return files
+
+
+def synthetic_corpus(count, size=500_000, seed=0):
+    """한글/영문/숫자/기호/한자/변환 노이즈/제어 문자를 섞은 문서 생성"""
+    rng = random.Random(seed)
+    pools = [
+        ("가나다라마바사아자차카타파하 공고 지원사업 신청 자격 ", 40),
+        ("abcdefghijklmnopqrstuvwxyz ABCDEFG 0123456789 ", 20),
+        (".,;:!?'\"()[]{}<>/\\|~`@#$%^&*+=-_\n\t ", 15),
+        ("·※○●△▲□■◇◆▼▽◁▷①②③④⑤ⅰⅱⅲ→←↑↓℃％", 5),
+        ("中小企業支援事業申請資格", 5),
+        ("氠瑢捤獥汤捯湰灧慤桥矞硥潥啫樠桵猠摮", 5),
+        ("\x00\x01\x1f\x7f\x9f  ﻿�", 3),
+        ("ÀÉÎÕÜñßøåæ€£¥§¶†‡•…‰′″‹›", 3),
+        ("😀🎉✅❌", 2),
+        ("2024.03.31 2021년 3월 31일 12/25/2023 ", 2),
+    ]
+    alphabet = "".join(chars * weight for chars, weight in pools)
+    return [
+        (f"synthetic_{i + 1:02d}", "".join(rng.choices(alphabet, k=size)))
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="clean_extracted_text 회귀 검증 및 성능 비교")
+    parser.add_argument("paths", nargs="*", help="검증할 변환 결과 파일 또는 디렉토리 (.md, .txt)")
+    parser.add_argument("--synthetic", type=int, default=0, help="합성 문서 개수 (문서당 500K 문자)")
+    parser.add_argument("--no-guides", action="store_true", help="remove_guides=False로 비교")
+    args = parser.parse_args()
+
+    documents = [
+        (str(path), path.read_text(encoding="utf-8", errors="replace"))
+        for path in collect_files(args.paths)
+    ]
+    if args.synthetic or not documents:
+        documents.extend(synthetic_corpus(args.synthetic or 5))
+
+    remove_guides = not args.no_guides
+    legacy_total = table_total = 0.0
+    mismatches = 0
+    total_chars = 0
+
+    for name, text in documents:
+        start = time.perf_counter()
+        expected = legacy_clean_extracted_text(text, remove_guides)
+        legacy_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = clean_extracted_text(text, remove_guides)
+        table_elapsed = time.perf_counter() - start
+
+        legacy_total += legacy_elapsed
+        table_total += table_elapsed
+        total_chars += len(text)
+
+        if actual.encode("utf-8") != expected.encode("utf-8"):
+            mismatches += 1
+            print(f"❌ 결과 불일치: {name}")
+        else:
+            print(f"✓ {name}: {len(text):,}자 - 기존 {legacy_elapsed:.3f}초 / 테이블 {table_elapsed:.3f}초")
+
+    print("=" * 60)
+    print(f"문서 {len(documents)}개, 총 {total_chars:,}자, 불일치 {mismatches}개")
+    print(f"기존 구현: {legacy_total:.2f}초, 테이블 구현: {table_total:.2f}초")
+    if table_total > 0:
+        print(f"속도 향상: {legacy_total / table_total:.1f}배")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,7 @@ import os
 import re
 import json
 import time
+import asyncio
 import requests
 import mysql.connector
 from pathlib import Path
@@ -15,8 +16,27 @@ from tqdm import tqdm
 import hashlib
 import argparse
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# asyncio 모드 기본값
+ASYNC_PER_HOST_LIMIT = 2        # 도메인(지자체)별 동시 요청 수
+ASYNC_POLITENESS_DELAY = 0.5    # 같은 도메인에 대한 요청 간 최소 간격 (초)
+ASYNC_TOTAL_LIMIT = 50          # 전체 동시 연결 수
+ASYNC_REQUEST_TIMEOUT = 30
+
+
+def _registry_url_key(url):
+    """eminwon_url_registry 조회 결과 매칭용 키 (DB 콜레이션처럼 대소문자/후행 공백 무시)"""
+    return url.rstrip().lower()
+
+
 class EminwonIncrementalCrawler:
-    def __init__(self, test_mode=False, specific_regions=None):
+    def __init__(self, test_mode=False, specific_regions=None, async_mode=False,
+                 per_host_limit=ASYNC_PER_HOST_LIMIT, politeness_delay=ASYNC_POLITENESS_DELAY,
+                 recheck=False):
         import os
         # Load .env file if exists
         try:
@@ -49,52 +69,138 @@ class EminwonIncrementalCrawler:
             'new_found': 0,
             'downloaded': 0,
             'errors': 0,
-            'duplicates': 0
+            'duplicates': 0,
+            'updated': 0,
+            'unchanged': 0
         }
         
         self.test_mode = test_mode
         self.specific_regions = specific_regions
         
+        # 재확인 모드: 이미 등록된 URL도 조건부 요청으로 변경 여부 확인
+        # (etag/last_modified/response_hash 컬럼이 없으면 첫 조회 시 False로 전환)
+        self.recheck = recheck
+        self.http_cache_available = True
+        
+        # asyncio 모드 설정 (aiohttp 필요)
+        self.async_mode = async_mode
+        self.per_host_limit = per_host_limit
+        self.politeness_delay = politeness_delay
+        self._host_slots = {}
+        
         # Session for connection reuse
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
     
-    def check_url_exists(self, url):
-        """Check if URL already exists in database"""
-        conn = mysql.connector.connect(**self.db_config)
-        cursor = conn.cursor()
+    def find_registry_entries(self, urls):
+        """
+        Return registered urls with their HTTP cache fields (single IN query)
         
-        cursor.execute("""
-            SELECT id FROM eminwon_url_registry 
-            WHERE announcement_url = %s
-        """, (url,))
+        Returns:
+            {_registry_url_key(url): {'etag', 'last_modified', 'response_hash'}}
+            - 등록되지 않은 URL은 포함되지 않음
+        """
+        if not urls:
+            return {}
         
-        result = cursor.fetchone()
-        cursor.close()
-        conn.close()
+        conn = mysql.connector.connect(**self.db_config)
+        cursor = conn.cursor()
+        placeholders = ', '.join(['%s'] * len(urls))
         
-        return result is not None
+        try:
+            if self.http_cache_available:
+                try:
+                    cursor.execute(f"""
+                        SELECT announcement_url, etag, last_modified, response_hash
+                        FROM eminwon_url_registry
+                        WHERE announcement_url IN ({placeholders})
+                    """, list(urls))
+                    return {
+                        _registry_url_key(row[0]): {'etag': row[1], 'last_modified': row[2], 'response_hash': row[3]}
+                        for row in cursor.fetchall()
+                    }
+                except mysql.connector.Error as e:
+                    if e.errno != 1054:  # ER_BAD_FIELD_ERROR
+                        raise
+                    print("HTTP cache columns not found (run alter_eminwon_url_registry_http_cache.sql) - "
+                          "conditional requests disabled")
+                    self.http_cache_available = False
+            
+            cursor.execute(f"""
+                SELECT announcement_url FROM eminwon_url_registry
+                WHERE announcement_url IN ({placeholders})
+            """, list(urls))
+            return {
+                _registry_url_key(row[0]): {'etag': None, 'last_modified': None, 'response_hash': None}
+                for row in cursor.fetchall()
+            }
+        finally:
+            cursor.close()
+            conn.close()
+    
+    @staticmethod
+    def conditional_headers(cache):
+        """Build If-None-Match / If-Modified-Since headers from a registry entry"""
+        headers = {}
+        if cache:
+            if cache.get('etag'):
+                headers['If-None-Match'] = cache['etag']
+            if cache.get('last_modified'):
+                headers['If-Modified-Since'] = cache['last_modified']
+        return headers
+    
+    @staticmethod
+    def build_http_meta(response_headers, body):
+        """Extract validators and body hash from a 200 response"""
+        return {
+            'etag': response_headers.get('ETag'),
+            'last_modified': response_headers.get('Last-Modified'),
+            'response_hash': hashlib.sha256(body).hexdigest()
+        }
     
-    def save_to_database(self, region, folder_name, url, announcement_id, title, post_date, content_hash):
+    def save_to_database(self, region, folder_name, url, announcement_id, title, post_date, content_hash,
+                         http_meta=None):
         """Save new announcement URL to database"""
         conn = mysql.connector.connect(**self.db_config)
         cursor = conn.cursor()
         
         try:
-            insert_sql = """
-            INSERT INTO eminwon_url_registry 
-            (region, folder_name, announcement_url, announcement_id, title, post_date, content_hash)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-            ON DUPLICATE KEY UPDATE
-            last_checked_date = CURRENT_TIMESTAMP
-            """
+            if http_meta and self.http_cache_available:
+                # 재확인으로 내용이 바뀐 경우에도 해시/검증자를 갱신
+                insert_sql = """
+                INSERT INTO eminwon_url_registry 
+                (region, folder_name, announcement_url, announcement_id, title, post_date, content_hash,
+                 etag, last_modified, response_hash)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE
+                content_hash = VALUES(content_hash),
+                etag = VALUES(etag),
+                last_modified = VALUES(last_modified),
+                response_hash = VALUES(response_hash),
+                last_checked_date = CURRENT_TIMESTAMP
+                """
+                params = (
+                    region, folder_name, url, announcement_id,
+                    title, post_date, content_hash,
+                    http_meta['etag'], http_meta['last_modified'], http_meta['response_hash']
+                )
+            else:
+                insert_sql = """
+                INSERT INTO eminwon_url_registry 
+                (region, folder_name, announcement_url, announcement_id, title, post_date, content_hash)
+                VALUES (%s, %s, %s, %s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE
+                content_hash = VALUES(content_hash),
+                last_checked_date = CURRENT_TIMESTAMP
+                """
+                params = (
+                    region, folder_name, url, announcement_id, 
+                    title, post_date, content_hash
+                )
             
-            cursor.execute(insert_sql, (
-                region, folder_name, url, announcement_id, 
-                title, post_date, content_hash
-            ))
+            cursor.execute(insert_sql, params)
             
             conn.commit()
             return True
@@ -210,37 +316,62 @@ class EminwonIncrementalCrawler:
             print(f"Error fetching list page from {domain}: {e}")
             return None
     
-    def download_announcement(self, url, region, announcement_id, title):
-        """Download announcement content and save as content.md"""
+    def download_announcement(self, url, region, announcement_id, title, cache=None):
+        """
+        Download announcement content and save as content.md
+        
+        cache(등록된 URL의 etag/last_modified/response_hash)가 주어지면 조건부 요청을 보내고,
+        304 응답이거나 본문 해시가 같으면 파싱/저장/DB 갱신 없이 None을 반환합니다.
+        
+        Returns:
+            True (저장), False (오류), None (변경 없음)
+        """
         try:
-            response = self.session.get(url, timeout=30)
+            response = self.session.get(url, timeout=30, headers=self.conditional_headers(cache))
+            if response.status_code == 304:
+                return None
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract content
-            content_div = soup.select_one('.view_content')
-            if not content_div:
-                content_div = soup.select_one('#content')
+            http_meta = self.build_http_meta(response.headers, response.content)
+            if cache and cache.get('response_hash') == http_meta['response_hash']:
+                return None
             
-            if content_div:
-                content_text = content_div.get_text(strip=True)
-            else:
-                content_text = soup.get_text(strip=True)
+            content_md, post_date = self.build_content_md(response.text, url, title)
+            self.save_announcement(region, url, announcement_id, title, content_md, post_date, http_meta)
             
-            # Extract date
-            date_match = re.search(r'(\d{4}[-년]\s?\d{1,2}[-월]\s?\d{1,2})', response.text)
-            if date_match:
-                post_date = date_match.group(1)
-                # Normalize date format
-                post_date = re.sub(r'[년월]', '-', post_date).replace(' ', '')
-                if post_date.endswith('-'):
-                    post_date = post_date[:-1]
-            else:
-                post_date = datetime.now().strftime('%Y-%m-%d')
+            return True
             
-            # Create content.md format
-            content_md = f"""**제목**: {title}
+        except Exception as e:
+            print(f"Error downloading announcement {announcement_id}: {e}")
+            return False
+    
+    def build_content_md(self, html, url, title):
+        """Parse detail page HTML into content.md text. Returns (content_md, post_date)"""
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        # Extract content
+        content_div = soup.select_one('.view_content')
+        if not content_div:
+            content_div = soup.select_one('#content')
+        
+        if content_div:
+            content_text = content_div.get_text(strip=True)
+        else:
+            content_text = soup.get_text(strip=True)
+        
+        # Extract date
+        date_match = re.search(r'(\d{4}[-년]\s?\d{1,2}[-월]\s?\d{1,2})', html)
+        if date_match:
+            post_date = date_match.group(1)
+            # Normalize date format
+            post_date = re.sub(r'[년월]', '-', post_date).replace(' ', '')
+            if post_date.endswith('-'):
+                post_date = post_date[:-1]
+        else:
+            post_date = datetime.now().strftime('%Y-%m-%d')
+        
+        # Create content.md format
+        content_md = f"""**제목**: {title}
 
 **원본 URL**: {url}
 
@@ -250,36 +381,33 @@ class EminwonIncrementalCrawler:
 
 {content_text}
 """
-            
-            # Generate content hash
-            content_hash = hashlib.sha256(content_md.encode('utf-8')).hexdigest()
-            
-            # Create folder name
-            safe_title = re.sub(r'[<>:"/\\|?*]', '_', title[:100])
-            folder_name = f"{announcement_id}_{safe_title}"
-            
-            # Save to file system
-            region_dir = self.output_dir / region
-            region_dir.mkdir(parents=True, exist_ok=True)
-            
-            ann_dir = region_dir / folder_name
-            ann_dir.mkdir(exist_ok=True)
-            
-            content_path = ann_dir / 'content.md'
-            with open(content_path, 'w', encoding='utf-8') as f:
-                f.write(content_md)
-            
-            # Save to database
-            self.save_to_database(
-                region, folder_name, url, announcement_id,
-                title, post_date, content_hash
-            )
-            
-            return True
-            
-        except Exception as e:
-            print(f"Error downloading announcement {announcement_id}: {e}")
-            return False
+        return content_md, post_date
+    
+    def save_announcement(self, region, url, announcement_id, title, content_md, post_date, http_meta=None):
+        """Write content.md and register the URL in the database"""
+        # Generate content hash
+        content_hash = hashlib.sha256(content_md.encode('utf-8')).hexdigest()
+        
+        # Create folder name
+        safe_title = re.sub(r'[<>:"/\\|?*]', '_', title[:100])
+        folder_name = f"{announcement_id}_{safe_title}"
+        
+        # Save to file system
+        region_dir = self.output_dir / region
+        region_dir.mkdir(parents=True, exist_ok=True)
+        
+        ann_dir = region_dir / folder_name
+        ann_dir.mkdir(exist_ok=True)
+        
+        content_path = ann_dir / 'content.md'
+        with open(content_path, 'w', encoding='utf-8') as f:
+            f.write(content_md)
+        
+        # Save to database
+        return self.save_to_database(
+            region, folder_name, url, announcement_id,
+            title, post_date, content_hash, http_meta
+        )
     
     def process_region(self, region_name, domain):
         """Process a single region - check for new announcements"""
@@ -287,7 +415,9 @@ class EminwonIncrementalCrawler:
             'checked': 0,
             'new': 0,
             'downloaded': 0,
-            'duplicates': 0
+            'duplicates': 0,
+            'updated': 0,
+            'unchanged': 0
         }
         
         # Fetch recent pages (1-3 pages)
@@ -299,13 +429,25 @@ class EminwonIncrementalCrawler:
                 continue
             
             announcements = self.parse_list_page(html, domain)
+            registered = self.find_registry_entries([ann['url'] for ann in announcements])
             
             for ann in announcements:
                 region_stats['checked'] += 1
                 
                 # Check if URL exists in database
-                if self.check_url_exists(ann['url']):
+                cache = registered.get(_registry_url_key(ann['url']))
+                if cache is not None:
                     region_stats['duplicates'] += 1
+                    
+                    if self.recheck:
+                        result = self.download_announcement(
+                            ann['url'], region_name, ann['id'], ann['title'],
+                            cache=cache
+                        )
+                        if result is None:
+                            region_stats['unchanged'] += 1
+                        elif result:
+                            region_stats['updated'] += 1
                     continue
                 
                 # New announcement found
@@ -330,26 +472,200 @@ class EminwonIncrementalCrawler:
         
         return region_stats
     
-    def run_incremental_collection(self):
-        """Main incremental collection process"""
-        print("=" * 80)
-        print("Starting Eminwon Incremental Collection")
-        print(f"Output directory: {self.output_dir}")
-        print("=" * 80)
+    async def _async_request(self, http, domain, url, params=None, headers=None):
+        """
+        GET with per-host concurrency limit and politeness delay
         
-        # Filter regions if specified
-        if self.specific_regions:
-            regions_to_process = {
-                k: v for k, v in self.eminwon_config.items() 
-                if k in self.specific_regions
+        - 도메인별 세마포어로 동시 요청 수 제한 (per_host_limit)
+        - 같은 도메인에 대한 요청 시작 간격을 politeness_delay 이상 유지
+        
+        Returns:
+            (status, headers, body bytes, encoding)
+        """
+        if domain not in self._host_slots:
+            self._host_slots[domain] = {
+                'semaphore': asyncio.Semaphore(self.per_host_limit),
+                'lock': asyncio.Lock(),
+                'next_at': 0.0
             }
-        else:
-            regions_to_process = self.eminwon_config
+        slot = self._host_slots[domain]
         
-        print(f"Processing {len(regions_to_process)} regions...")
-        print("-" * 80)
+        async with slot['semaphore']:
+            loop = asyncio.get_running_loop()
+            async with slot['lock']:
+                wait = slot['next_at'] - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                slot['next_at'] = loop.time() + self.politeness_delay
+            
+            async with http.get(url, params=params, headers=headers) as response:
+                response.raise_for_status()
+                body = await response.read()
+                return response.status, response.headers, body, response.get_encoding()
+    
+    async def _async_get(self, http, domain, url, params=None):
+        """GET returning decoded text"""
+        _, _, body, encoding = await self._async_request(http, domain, url, params=params)
+        return body.decode(encoding, errors='replace')
+    
+    async def _async_fetch_list_page(self, http, domain, page=1):
+        """Async version of fetch_list_page"""
+        list_url = f"https://{domain}/emwp/gov/mogaha/ntis/web/ofr/action/OfrAction.do"
+        params = {
+            'jndinm': 'OfrNotAncmtEJB',
+            'context': 'NTIS',
+            'method': 'selectList',
+            'methodnm': 'selectListOfrNotAncmt',
+            'homepage_pbs_yn': 'Y',
+            'subCheck': 'Y',
+            'ofr_pageSize': '10',
+            'not_ancmt_se_code': '01,02,03,04,05',
+            'title': '고시공고',
+            'initValue': 'Y',
+            'countYn': 'Y',
+            'list_gubun': 'A',
+            'pageIndex': str(page)
+        }
         
-        # Process regions with thread pool
+        try:
+            return await self._async_get(http, domain, list_url, params=params)
+        except Exception as e:
+            print(f"Error fetching list page from {domain}: {e}")
+            return None
+    
+    async def _async_download_announcement(self, http, domain, ann, region_name, cache=None):
+        """Async version of download_announcement (파싱/저장은 스레드에서 실행)"""
+        try:
+            status, headers, body, encoding = await self._async_request(
+                http, domain, ann['url'], headers=self.conditional_headers(cache)
+            )
+            if status == 304:
+                return None
+            
+            http_meta = self.build_http_meta(headers, body)
+            if cache and cache.get('response_hash') == http_meta['response_hash']:
+                return None
+            
+            html = body.decode(encoding, errors='replace')
+            content_md, post_date = await asyncio.to_thread(
+                self.build_content_md, html, ann['url'], ann['title']
+            )
+            await asyncio.to_thread(
+                self.save_announcement,
+                region_name, ann['url'], ann['id'], ann['title'], content_md, post_date, http_meta
+            )
+            return True
+        except Exception as e:
+            print(f"Error downloading announcement {ann['id']}: {e}")
+            return False
+    
+    async def _async_process_region(self, http, region_name, domain):
+        """
+        Async version of process_region
+        
+        리스트 페이지를 받는 즉시 신규 공고의 상세 다운로드 태스크를 띄워
+        다음 리스트 페이지 요청과 상세 다운로드가 겹쳐서 진행되도록 합니다.
+        """
+        region_stats = {
+            'checked': 0,
+            'new': 0,
+            'downloaded': 0,
+            'duplicates': 0,
+            'updated': 0,
+            'unchanged': 0
+        }
+        
+        max_pages = 1 if self.test_mode else 3
+        download_tasks = []
+        recheck_tasks = []
+        
+        for page in range(1, max_pages + 1):
+            html = await self._async_fetch_list_page(http, domain, page)
+            if not html:
+                continue
+            
+            announcements = self.parse_list_page(html, domain)
+            region_stats['checked'] += len(announcements)
+            
+            registered = await asyncio.to_thread(
+                self.find_registry_entries, [ann['url'] for ann in announcements]
+            )
+            
+            for ann in announcements:
+                cache = registered.get(_registry_url_key(ann['url']))
+                if cache is not None:
+                    region_stats['duplicates'] += 1
+                    if self.recheck:
+                        recheck_tasks.append(asyncio.create_task(
+                            self._async_download_announcement(
+                                http, domain, ann, region_name, cache=cache
+                            )
+                        ))
+                    continue
+                
+                # In test mode, limit downloads
+                if self.test_mode and len(download_tasks) >= 2:
+                    break
+                
+                region_stats['new'] += 1
+                download_tasks.append(asyncio.create_task(
+                    self._async_download_announcement(http, domain, ann, region_name)
+                ))
+        
+        results = await asyncio.gather(*download_tasks)
+        region_stats['downloaded'] = sum(1 for ok in results if ok)
+        
+        recheck_results = await asyncio.gather(*recheck_tasks)
+        region_stats['unchanged'] = sum(1 for result in recheck_results if result is None)
+        region_stats['updated'] = sum(1 for result in recheck_results if result)
+        
+        return region_stats
+    
+    async def _run_async(self, regions_to_process):
+        """Process all regions concurrently on one aiohttp session (keep-alive)"""
+        connector = aiohttp.TCPConnector(
+            limit=ASYNC_TOTAL_LIMIT,
+            limit_per_host=self.per_host_limit,
+            ttl_dns_cache=300
+        )
+        timeout = aiohttp.ClientTimeout(total=ASYNC_REQUEST_TIMEOUT)
+        headers = {'User-Agent': self.session.headers['User-Agent']}
+        
+        async def run_region(region_name, domain):
+            try:
+                return region_name, await self._async_process_region(http, region_name, domain), None
+            except Exception as e:
+                return region_name, None, e
+        
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers) as http:
+            tasks = [
+                asyncio.create_task(run_region(region_name, domain))
+                for region_name, domain in regions_to_process.items()
+            ]
+            
+            for task in tqdm(asyncio.as_completed(tasks), total=len(tasks), desc="Processing regions"):
+                region_name, stats, error = await task
+                
+                if error is not None:
+                    self.stats['errors'] += 1
+                    tqdm.write(f"✗ {region_name:15} - Error: {error}")
+                    continue
+                
+                self._accumulate_region_stats(region_name, stats)
+    
+    def _accumulate_region_stats(self, region_name, stats):
+        self.stats['total_checked'] += stats['checked']
+        self.stats['new_found'] += stats['new']
+        self.stats['downloaded'] += stats['downloaded']
+        self.stats['duplicates'] += stats['duplicates']
+        self.stats['updated'] += stats['updated']
+        self.stats['unchanged'] += stats['unchanged']
+        
+        if stats['new'] > 0:
+            tqdm.write(f"✓ {region_name:15} - New: {stats['new']:3}, Downloaded: {stats['downloaded']:3}")
+    
+    def _run_threaded(self, regions_to_process):
+        """Process regions with thread pool (지역 내부는 순차 처리)"""
         with ThreadPoolExecutor(max_workers=5) as executor:
             futures = {}
             
@@ -363,18 +679,40 @@ class EminwonIncrementalCrawler:
                 
                 try:
                     stats = future.result(timeout=60)
-                    
-                    self.stats['total_checked'] += stats['checked']
-                    self.stats['new_found'] += stats['new']
-                    self.stats['downloaded'] += stats['downloaded']
-                    self.stats['duplicates'] += stats['duplicates']
-                    
-                    if stats['new'] > 0:
-                        tqdm.write(f"✓ {region_name:15} - New: {stats['new']:3}, Downloaded: {stats['downloaded']:3}")
+                    self._accumulate_region_stats(region_name, stats)
                         
                 except Exception as e:
                     self.stats['errors'] += 1
                     tqdm.write(f"✗ {region_name:15} - Error: {e}")
+    
+    def run_incremental_collection(self):
+        """Main incremental collection process"""
+        print("=" * 80)
+        print("Starting Eminwon Incremental Collection")
+        print(f"Output directory: {self.output_dir}")
+        print("=" * 80)
+        
+        # Filter regions if specified
+        if self.specific_regions:
+            regions_to_process = {
+                k: v for k, v in self.eminwon_config.items() 
+                if k in self.specific_regions
+            }
+        else:
+            regions_to_process = self.eminwon_config
+        
+        print(f"Processing {len(regions_to_process)} regions...")
+        print("-" * 80)
+        
+        if self.async_mode and aiohttp is None:
+            print("aiohttp is not installed - falling back to thread pool mode")
+            self.async_mode = False
+        
+        if self.async_mode:
+            # 지역 전체를 하나의 이벤트 루프에서 처리 (도메인별 동시성/간격 제한)
+            asyncio.run(self._run_async(regions_to_process))
+        else:
+            self._run_threaded(regions_to_process)
         
         # Print summary
         print("=" * 80)
@@ -384,6 +722,8 @@ class EminwonIncrementalCrawler:
         print(f"New announcements found: {self.stats['new_found']:,}")
         print(f"Successfully downloaded: {self.stats['downloaded']:,}")
         print(f"Duplicates (already in DB): {self.stats['duplicates']:,}")
+        if self.recheck:
+            print(f"Re-checked - updated: {self.stats['updated']:,}, unchanged: {self.stats['unchanged']:,}")
         print(f"Errors: {self.stats['errors']:,}")
         print("=" * 80)
         
@@ -404,12 +744,24 @@ def main():
     parser = argparse.ArgumentParser(description='Eminwon Incremental Crawler')
     parser.add_argument('--test', action='store_true', help='Run in test mode (limited crawling)')
     parser.add_argument('--regions', nargs='+', help='Specific regions to process')
+    parser.add_argument('--async', dest='async_mode', action='store_true',
+                        help='Use asyncio crawl mode (requires aiohttp)')
+    parser.add_argument('--per-host', type=int, default=ASYNC_PER_HOST_LIMIT,
+                        help=f'Concurrent requests per eminwon host in async mode (default: {ASYNC_PER_HOST_LIMIT})')
+    parser.add_argument('--recheck', action='store_true',
+                        help='Re-check already registered URLs with conditional requests')
+    parser.add_argument('--delay', type=float, default=ASYNC_POLITENESS_DELAY,
+                        help=f'Minimum seconds between requests to the same host in async mode (default: {ASYNC_POLITENESS_DELAY})')
     
     args = parser.parse_args()
     
     crawler = EminwonIncrementalCrawler(
         test_mode=args.test,
-        specific_regions=args.regions
+        specific_regions=args.regions,
+        async_mode=args.async_mode,
+        per_host_limit=args.per_host,
+        politeness_delay=args.delay,
+        recheck=args.recheck
     )
     
     crawler.run_incremental_collection()
@@ -13,7 +13,9 @@ Node.js 스크래퍼와 연동하여 새로운 공고만 수집하는 시스템
 import os
 import json
 import subprocess
+import threading
 import mysql.connector
+from mysql.connector import pooling
 import re
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -24,6 +26,17 @@ import argparse
 import logging
 import sys
 
+from src.utils.nodeScraperService import NodeDetailScraperService, NodeScraperServiceError
+
+# filter_new_announcements에서 IN (...) 한 번에 조회할 최대 URL 수
+URL_CHECK_BATCH_SIZE = 500
+
+# 지역 병렬 처리 워커 수 (커넥션 풀 크기 산정에 사용)
+REGION_WORKERS = 3
+
+# 상세 페이지 작업 타임아웃 (초)
+DETAIL_TIMEOUT = 60
+
 
 class EminwonIncrementalOrchestrator:
     def normalize_region_name(self, region: str) -> str:
@@ -31,7 +44,14 @@ class EminwonIncrementalOrchestrator:
         normalized = re.sub(r"(시|군|구)$", "", region)
         return normalized
 
-    def __init__(self, test_mode=False, specific_regions=None, verbose=False, target_date=None):
+    def normalize_registry_region(self, region: str) -> str:
+        """eminwon_url_registry.region 저장/조회용 지역명 정규화 - 구/군, 세 글자 이상의 시 제거"""
+        if region.endswith(("구", "군")) or (region.endswith("시") and len(region) > 2):
+            return region[:-1]
+        return region
+
+    def __init__(self, test_mode=False, specific_regions=None, verbose=False, target_date=None,
+                 use_detail_service=True):
         # Database configuration
         import os
 
@@ -52,6 +72,10 @@ class EminwonIncrementalOrchestrator:
             "collation": "utf8mb4_unicode_ci",
         }
 
+        # 워커(지역 처리 스레드)들이 공유하는 커넥션 풀 (첫 사용 시 생성)
+        self._db_pool = None
+        self._db_pool_lock = threading.Lock()
+
         # Load eminwon.json configuration
         with open("node/scraper/eminwon.json", "r", encoding="utf-8") as f:
             self.eminwon_config = json.load(f)
@@ -71,6 +95,11 @@ class EminwonIncrementalOrchestrator:
             "node/scraper/eminwon_detail_scraper.js"  # 개별 URL 처리용
         )
 
+        # 상세 페이지 상주 서비스 (브라우저 1개 유지, 첫 사용 시 시작)
+        self.use_detail_service = use_detail_service
+        self._detail_service = None
+        self._detail_service_lock = threading.Lock()
+
         # Statistics
         self.stats = {
             "total_checked": 0,
@@ -256,6 +285,103 @@ class EminwonIncrementalOrchestrator:
             self.logger.error(f"Error collecting list for {region}: {e}")
             return []
 
+    def _get_db_connection(self):
+        """풀에서 DB 연결을 가져옵니다 (close() 시 풀로 반환).
+
+        풀은 연결을 반환할 때 세션을 초기화하므로(pool_reset_session 기본값),
+        읽기 전용 사용 후 남은 트랜잭션/스냅샷이 다음 사용자에게 넘어가지 않습니다.
+        풀 생성 실패 또는 풀 고갈 시에는 단독 연결로 폴백합니다.
+        """
+        if self._db_pool is None:
+            with self._db_pool_lock:
+                if self._db_pool is None:
+                    try:
+                        self._db_pool = pooling.MySQLConnectionPool(
+                            pool_name="eminwon_orchestrator",
+                            pool_size=REGION_WORKERS + 1,
+                            **self.db_config,
+                        )
+                    except mysql.connector.Error as e:
+                        self.logger.warning(
+                            f"Connection pool creation failed, using direct connections: {e}"
+                        )
+                        self._db_pool = False
+
+        if self._db_pool:
+            try:
+                return self._db_pool.get_connection()
+            except mysql.connector.errors.PoolError:
+                self.logger.debug("Connection pool exhausted, opening a direct connection")
+
+        return mysql.connector.connect(**self.db_config)
+
+    def find_existing_urls(self, urls, region=None):
+        """Return the subset of urls that already exist in eminwon_url_registry
+
+        check_url_exists_in_db와 같은 규칙을 URL 목록 단위로 IN (...) 조회합니다.
+        1. announcement_url IN (...)
+        2. 1에서 찾지 못한 URL은 announcement_id IN (...) AND region LIKE 로 체크
+           (같은 지역 내에서만 ID 중복 체크)
+        """
+        existing = set()
+        if not urls:
+            return existing
+
+        # DB 콜레이션(utf8mb4_unicode_ci)과 같이 대소문자/후행 공백 무시하고 매칭
+        def lookup_key(value):
+            return value.rstrip().lower()
+
+        conn = self._get_db_connection()
+        cursor = conn.cursor()
+
+        try:
+            # 1. 정확한 URL로 일괄 체크
+            for start in range(0, len(urls), URL_CHECK_BATCH_SIZE):
+                chunk = urls[start : start + URL_CHECK_BATCH_SIZE]
+                placeholders = ", ".join(["%s"] * len(chunk))
+                cursor.execute(
+                    f"""
+                    SELECT announcement_url FROM eminwon_url_registry
+                    WHERE announcement_url IN ({placeholders})
+                    """,
+                    tuple(chunk),
+                )
+                found = {lookup_key(row[0]) for row in cursor.fetchall()}
+                existing.update(url for url in chunk if lookup_key(url) in found)
+
+            # 2. URL이 없는 항목은 announcement_id + region 조합으로 일괄 체크
+            if region:
+                urls_by_id = {}
+                for url in urls:
+                    if url in existing:
+                        continue
+                    id_match = re.search(r"not_ancmt_mgt_no=(\d+)", url)
+                    if id_match:
+                        urls_by_id.setdefault(id_match.group(1), []).append(url)
+
+                # 지역명 정규화 (구, 시, 군 제거)
+                normalized_region = self.normalize_registry_region(region)
+
+                announcement_ids = list(urls_by_id)
+                for start in range(0, len(announcement_ids), URL_CHECK_BATCH_SIZE):
+                    chunk = announcement_ids[start : start + URL_CHECK_BATCH_SIZE]
+                    placeholders = ", ".join(["%s"] * len(chunk))
+                    cursor.execute(
+                        f"""
+                        SELECT DISTINCT announcement_id FROM eminwon_url_registry
+                        WHERE announcement_id IN ({placeholders}) AND region LIKE %s
+                        """,
+                        (*chunk, f"%{normalized_region}%"),
+                    )
+                    for row in cursor.fetchall():
+                        existing.update(urls_by_id.get(str(row[0]), []))
+
+        finally:
+            cursor.close()
+            conn.close()
+
+        return existing
+
     def check_url_exists_in_db(self, url, region=None):
         """Check if URL already exists in database
 
@@ -264,7 +390,7 @@ class EminwonIncrementalOrchestrator:
         2. URL이 없으면 announcement_id + region 조합으로 체크
            (같은 지역 내에서만 ID 중복 체크)
         """
-        conn = mysql.connector.connect(**self.db_config)
+        conn = self._get_db_connection()
         cursor = conn.cursor()
 
         # URL에서 announcement_id 추출 (더 정확한 중복 체크)
@@ -274,62 +400,64 @@ class EminwonIncrementalOrchestrator:
 
         id_match = re.search(r"not_ancmt_mgt_no=(\d+)", url)
 
-        # 먼저 정확한 URL로 체크
-        cursor.execute(
-            """
-            SELECT id FROM eminwon_url_registry 
-            WHERE announcement_url = %s
-            """,
-            (url,),
-        )
-        result = cursor.fetchone()
-        # self.logger.info(f"id_match =====.   {id_match}")
-        # self.logger.info(f"result =====.   {result}")
-
-        # URL이 없고, announcement_id가 있으며, region이 제공된 경우
-        # 같은 지역 내에서만 ID 중복 체크
-        if not result and id_match and region:
-            announcement_id = id_match.group(1)
-
-            # 지역명 정규화 (구, 시, 군 제거)
-            normalized_region = region
-            if region.endswith("구"):
-                normalized_region = region[:-1]
-            elif region.endswith("시") and len(region) > 2:
-                normalized_region = region[:-1]
-            elif region.endswith("군"):
-                normalized_region = region[:-1]
-
+        try:
+            # 먼저 정확한 URL로 체크
             cursor.execute(
                 """
                 SELECT id FROM eminwon_url_registry 
-                WHERE announcement_id = %s AND region LIKE %s
-            """,
-                (announcement_id, f"%{normalized_region}%"),
+                WHERE announcement_url = %s
+                """,
+                (url,),
             )
+            result = cursor.fetchone()
+            # self.logger.info(f"id_match =====.   {id_match}")
+            # self.logger.info(f"result =====.   {result}")
+
+            # URL이 없고, announcement_id가 있으며, region이 제공된 경우
+            # 같은 지역 내에서만 ID 중복 체크
+            if not result and id_match and region:
+                announcement_id = id_match.group(1)
+
+                # 지역명 정규화 (구, 시, 군 제거)
+                normalized_region = self.normalize_registry_region(region)
+
+                cursor.execute(
+                    """
+                    SELECT id FROM eminwon_url_registry 
+                    WHERE announcement_id = %s AND region LIKE %s
+                """,
+                    (announcement_id, f"%{normalized_region}%"),
+                )
 
-            # self.logger.info(
-            #     f"SELECT id FROM eminwon_url_registry WHERE announcement_id = %s AND region LIKE %s ==> {announcement_id}, {normalized_region}"
-            # )
+                # self.logger.info(
+                #     f"SELECT id FROM eminwon_url_registry WHERE announcement_id = %s AND region LIKE %s ==> {announcement_id}, {normalized_region}"
+                # )
 
-            result = cursor.fetchone()
+                result = cursor.fetchone()
 
-        cursor.close()
-        conn.close()
+        finally:
+            cursor.close()
+            conn.close()
 
         return result is not None
 
     def filter_new_announcements(self, announcements, region=None):
-        """Filter announcements to find only new ones"""
+        """Filter announcements to find only new ones
+
+        목록 전체의 URL을 find_existing_urls로 한 번에 조회합니다 (URL마다 연결/조회하지 않음).
+        """
         new_announcements = []
         duplicate_details = []
 
+        urls = list(dict.fromkeys(ann.get("url") for ann in announcements if ann.get("url")))
+        existing_urls = self.find_existing_urls(urls, region)
+
         for ann in announcements:
             url = ann.get("url")
             if not url:
                 continue
 
-            if not self.check_url_exists_in_db(url, region):
+            if url not in existing_urls:
                 new_announcements.append(ann)
                 self.stats["new_found"] += 1
                 if self.verbose or self.test_mode:
@@ -404,26 +532,19 @@ class EminwonIncrementalOrchestrator:
                 f"Command: {' '.join(cmd[:8])}... --title '{ann_title}' --date '{ann_date}'"
             )
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            job_options = {
+                "region": normalized_region,
+                "url": announcement.get("url"),
+                "outputDir": str(self.output_dir / normalized_region),
+                "folderName": folder_name,
+                "announcementData": {"title": ann_title, "date": ann_date},
+            }
+            success, actual_title, error_output = self._run_detail_scraper(cmd, job_options)
 
-            if result.returncode == 0:
+            if success:
                 self.logger.info(f"  ✅ DOWNLOADED: [{ann_id}] {title[:50]}...")
                 self.stats["downloaded"] += 1
 
-                # Parse actual title from Node.js output
-                actual_title = None
-                try:
-                    # Node.js가 JSON으로 출력한 결과 파싱
-                    for line in result.stdout.split("\n"):
-                        if line.strip().startswith("{") and '"actualTitle"' in line:
-                            import json
-
-                            data = json.loads(line)
-                            actual_title = data.get("actualTitle")
-                            break
-                except Exception as e:
-                    self.logger.debug(f"Could not parse actual title: {e}")
-
                 # Use actual title if found, otherwise use list title
                 if actual_title and actual_title != "제목 없음":
                     # Create new folder name with actual title
@@ -459,11 +580,11 @@ class EminwonIncrementalOrchestrator:
             else:
                 self.logger.error(f"  ❌ FAILED: [{ann_id}] {title[:50]}...")
                 if self.verbose or self.test_mode:
-                    self.logger.debug(f"    Error: {result.stderr[:200]}")
+                    self.logger.debug(f"    Error: {error_output[:200]}")
                 self.stats["errors"] += 1
                 return False
 
-        except subprocess.TimeoutExpired:
+        except (subprocess.TimeoutExpired, TimeoutError):
             self.logger.error(
                 f"Timeout downloading: {announcement.get('title', 'Unknown')[:30]}"
             )
@@ -474,9 +595,68 @@ class EminwonIncrementalOrchestrator:
             self.stats["errors"] += 1
             return False
 
+    def _get_detail_service(self):
+        """상세 스크래퍼 상주 서비스 반환 (비활성화 시 None)"""
+        if not self.use_detail_service:
+            return None
+
+        with self._detail_service_lock:
+            if self._detail_service is None:
+                self._detail_service = NodeDetailScraperService(
+                    node_path=self.node_path,
+                    concurrency=REGION_WORKERS,
+                    log_stderr=self.verbose or self.test_mode,
+                )
+            return self._detail_service
+
+    def _run_detail_scraper(self, cmd, job_options):
+        """
+        상세 페이지 다운로드 실행
+
+        상주 서비스로 작업을 보내고, 서비스를 사용할 수 없으면
+        기존처럼 공고마다 node 프로세스를 실행합니다.
+
+        Returns:
+            (성공 여부, 페이지에서 추출한 실제 제목, 오류 출력)
+        """
+        service = self._get_detail_service()
+        if service is not None:
+            try:
+                response = service.submit("eminwon", job_options, timeout=DETAIL_TIMEOUT)
+                return (
+                    response.get("status") == "success",
+                    response.get("actualTitle"),
+                    response.get("error") or "",
+                )
+            except NodeScraperServiceError as e:
+                self.logger.warning(f"Detail service unavailable, falling back to node process: {e}")
+
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=DETAIL_TIMEOUT)
+
+        # Parse actual title from Node.js output
+        actual_title = None
+        try:
+            # Node.js가 JSON으로 출력한 결과 파싱
+            for line in result.stdout.split("\n"):
+                if line.strip().startswith("{") and '"actualTitle"' in line:
+                    data = json.loads(line)
+                    actual_title = data.get("actualTitle")
+                    break
+        except Exception as e:
+            self.logger.debug(f"Could not parse actual title: {e}")
+
+        return result.returncode == 0, actual_title, result.stderr
+
+    def close_detail_service(self):
+        """상세 스크래퍼 상주 서비스 종료"""
+        with self._detail_service_lock:
+            service, self._detail_service = self._detail_service, None
+        if service is not None:
+            service.close()
+
     def save_to_database(self, region, announcement, folder_name):
         """Save announcement info to database"""
-        conn = mysql.connector.connect(**self.db_config)
+        conn = self._get_db_connection()
         cursor = conn.cursor()
 
         try:
@@ -486,13 +666,7 @@ class EminwonIncrementalOrchestrator:
             ).hexdigest()
 
             # 지역명 정규화 (구, 시, 군 제거하여 DB와 일치시킴)
-            normalized_region = region
-            if region.endswith("구"):
-                normalized_region = region[:-1]
-            elif region.endswith("시") and len(region) > 2:
-                normalized_region = region[:-1]
-            elif region.endswith("군"):
-                normalized_region = region[:-1]
+            normalized_region = self.normalize_registry_region(region)
 
             # Normalize text to NFC (standard Korean form)
             import unicodedata
@@ -659,7 +833,7 @@ class EminwonIncrementalOrchestrator:
                     )
             else:
                 # Parallel processing for production
-                with ThreadPoolExecutor(max_workers=3) as executor:
+                with ThreadPoolExecutor(max_workers=REGION_WORKERS) as executor:
                     futures = {
                         executor.submit(self.process_region, region): region
                         for region in regions_to_process
@@ -733,6 +907,11 @@ def main():
         action="store_true",
         help="Show detailed Node.js collection logs",
     )
+    parser.add_argument(
+        "--no-detail-service",
+        action="store_true",
+        help="Run one node process per announcement instead of the long-lived detail scraper service",
+    )
 
     args = parser.parse_args()
 
@@ -747,7 +926,8 @@ def main():
         test_mode=args.test, 
         specific_regions=args.regions, 
         verbose=args.verbose,
-        target_date=target_date
+        target_date=target_date,
+        use_detail_service=not args.no_detail_service,
     )
 
     # 페이지 수 설정 (테스트 모드면 1, 아니면 지정값 또는 기본값 3)
@@ -757,7 +937,10 @@ def main():
     else:
         orchestrator.pages = args.pages
 
-    success = orchestrator.run()
+    try:
+        success = orchestrator.run()
+    finally:
+        orchestrator.close_detail_service()
     sys.exit(0 if success else 1)
 
 
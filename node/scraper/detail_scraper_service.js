@@ -0,0 +1,225 @@
+#!/usr/bin/env node
+
+/**
+ * 상세 페이지 스크래퍼 상주 서비스
+ *
+ * 공고마다 node 프로세스를 새로 띄우고 Chromium을 실행/종료하던 방식 대신,
+ * 하나의 프로세스가 브라우저를 유지한 채 stdin으로 작업을 받아 처리합니다.
+ * 작업마다 새 브라우저 컨텍스트를 만들어 쿠키/세션은 기존처럼 격리됩니다.
+ *
+ * 프로토콜 (JSON Lines):
+ *   stdin  <- {"id": "1", "type": "eminwon" | "unified", "options": {...}, "timeoutMs": 60000}
+ *   stdout -> {"event": "ready"}                       (브라우저 준비 완료 시 1회)
+ *   stdout -> {"id": "1", "status": "success", "actualTitle": "...", "folderName": "..."}
+ *   stdout -> {"id": "1", "status": "error", "error": "..."}
+ *
+ * stdout은 응답 전용이며, 스크래퍼 로그(console.log 포함)는 모두 stderr로 출력됩니다.
+ * stdin이 닫히면 진행 중인 작업을 마친 뒤 브라우저를 닫고 종료합니다.
+ */
+
+// 스크래퍼 내부의 console.log가 응답 채널(stdout)을 오염시키지 않도록 stderr로 전환
+console.log = (...args) => console.error(...args);
+
+const { chromium } = require('playwright');
+const readline = require('readline');
+const yargs = require('yargs');
+const EminwonDetailScraper = require('./eminwon_detail_scraper');
+const UnifiedDetailScraper = require('./unified_detail_scraper');
+
+const DEFAULT_TIMEOUT_MS = 60000;
+
+class DetailScraperService {
+    constructor(options = {}) {
+        this.concurrency = Math.max(1, options.concurrency || 3);
+        this.browser = null;
+        this.launching = null;
+        this.queue = [];
+        this.running = 0;
+        this.closed = false;
+        this.processed = 0;
+    }
+
+    send(message) {
+        process.stdout.write(JSON.stringify(message) + '\n');
+    }
+
+    async getBrowser() {
+        if (this.browser && this.browser.isConnected()) {
+            return this.browser;
+        }
+
+        // 동시에 여러 작업이 재시작을 요청해도 브라우저는 한 번만 실행
+        if (!this.launching) {
+            this.launching = chromium.launch({
+                headless: true,
+                args: ['--no-sandbox', '--disable-setuid-sandbox']
+            }).then(browser => {
+                browser.on('disconnected', () => {
+                    if (this.browser === browser) {
+                        console.error('[service] 브라우저 연결 끊김 - 다음 작업에서 재실행');
+                        this.browser = null;
+                    }
+                });
+                this.browser = browser;
+                return browser;
+            }).finally(() => {
+                this.launching = null;
+            });
+        }
+
+        return this.launching;
+    }
+
+    createScraper(job, browser) {
+        const options = { ...(job.options || {}), browser };
+
+        if (job.type === 'eminwon') {
+            return new EminwonDetailScraper(options);
+        }
+        if (job.type === 'unified') {
+            return new UnifiedDetailScraper(options);
+        }
+        throw new Error(`알 수 없는 작업 유형: ${job.type}`);
+    }
+
+    async runJob(job) {
+        const browser = await this.getBrowser();
+        const scraper = this.createScraper(job, browser);
+        const timeoutMs = job.timeoutMs || DEFAULT_TIMEOUT_MS;
+        let timer = null;
+
+        const work = (async () => {
+            try {
+                if (job.type === 'eminwon') {
+                    await scraper.init();
+                    await scraper.downloadDetailPage();
+                } else {
+                    // scrapeDetail은 init/close를 자체적으로 수행
+                    await scraper.scrapeDetail();
+                }
+            } catch (error) {
+                // 결과를 남기지 못하고 실패한 경우 실제 오류를 응답에 전달
+                if (!scraper.result) {
+                    return { status: 'error', error: error.message };
+                }
+            }
+            return scraper.result;
+        })();
+
+        const timeout = new Promise((_, reject) => {
+            timer = setTimeout(() => reject(new Error(`작업 시간 초과 (${timeoutMs}ms)`)), timeoutMs);
+        });
+
+        try {
+            const result = await Promise.race([work, timeout]);
+            if (!result) {
+                return { status: 'error', error: '스크래퍼 결과 없음' };
+            }
+            return result;
+        } finally {
+            clearTimeout(timer);
+            // 시간 초과 시 컨텍스트를 닫아 남은 페이지 작업을 중단시킴
+            if (scraper.context) {
+                await scraper.context.close().catch(() => {});
+            }
+            work.catch(() => {});
+        }
+    }
+
+    async handle(job) {
+        const startTime = Date.now();
+        let response;
+
+        try {
+            const result = await this.runJob(job);
+            response = {
+                id: job.id,
+                status: result.status,
+                actualTitle: result.actualTitle,
+                folderName: result.folderName || result.folder,
+                error: result.error
+            };
+        } catch (error) {
+            console.error(`[service] 작업 ${job.id} 실패: ${error.message}`);
+            response = { id: job.id, status: 'error', error: error.message };
+        }
+
+        response.elapsedMs = Date.now() - startTime;
+        this.processed++;
+        this.send(response);
+    }
+
+    enqueue(line) {
+        if (!line.trim()) {
+            return;
+        }
+
+        let job;
+        try {
+            job = JSON.parse(line);
+        } catch (error) {
+            console.error(`[service] 잘못된 작업 형식: ${line.slice(0, 200)}`);
+            return;
+        }
+
+        this.queue.push(job);
+        this.drain();
+    }
+
+    drain() {
+        while (this.running < this.concurrency && this.queue.length > 0) {
+            const job = this.queue.shift();
+            this.running++;
+            this.handle(job).finally(() => {
+                this.running--;
+                this.drain();
+            });
+        }
+
+        if (this.closed && this.running === 0 && this.queue.length === 0) {
+            this.shutdown();
+        }
+    }
+
+    async shutdown() {
+        console.error(`[service] 종료 - 처리한 작업 ${this.processed}개`);
+        if (this.browser) {
+            await this.browser.close().catch(() => {});
+        }
+        process.exit(0);
+    }
+
+    async start() {
+        try {
+            await this.getBrowser();
+        } catch (error) {
+            console.error(`[service] 브라우저 실행 실패: ${error.message}`);
+            process.exit(1);
+        }
+
+        this.send({ event: 'ready' });
+
+        const rl = readline.createInterface({ input: process.stdin, terminal: false });
+        rl.on('line', line => this.enqueue(line));
+        rl.on('close', () => {
+            this.closed = true;
+            this.drain();
+        });
+    }
+}
+
+if (require.main === module) {
+    const argv = yargs
+        .option('concurrency', {
+            alias: 'c',
+            type: 'number',
+            description: '동시에 처리할 작업 수 (작업마다 브라우저 컨텍스트 1개)',
+            default: 3
+        })
+        .help()
+        .argv;
+
+    new DetailScraperService({ concurrency: argv.concurrency }).start();
+}
+
+module.exports = DetailScraperService;
@@ -20,8 +20,12 @@ class EminwonDetailScraper {
         this.folderName = options.folderName;
         this.announcementData = options.announcementData || {}; // 리스트에서 받은 공고 데이터
 
-        this.browser = null;
+        // 상주 서비스(detail_scraper_service.js)에서는 브라우저를 공유하고 컨텍스트만 새로 생성
+        this.browser = options.browser || null;
+        this.ownsBrowser = !options.browser;
+        this.context = null;
         this.page = null;
+        this.result = null;
     }
 
     /**
@@ -147,12 +151,14 @@ class EminwonDetailScraper {
     }
 
     async init() {
-        this.browser = await chromium.launch({
-            headless: true,
-            args: ['--no-sandbox', '--disable-setuid-sandbox']
-        });
+        if (!this.browser) {
+            this.browser = await chromium.launch({
+                headless: true,
+                args: ['--no-sandbox', '--disable-setuid-sandbox']
+            });
+        }
 
-        const context = await this.browser.newContext({
+        this.context = await this.browser.newContext({
             userAgent: 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             viewport: { width: 1920, height: 1080 },
             locale: 'ko-KR',
@@ -161,7 +167,7 @@ class EminwonDetailScraper {
             }
         });
 
-        this.page = await context.newPage();
+        this.page = await this.context.newPage();
 
         // 다운로드 디렉토리 설정
         const downloadPath = path.join(this.outputDir, this.folderName, 'attachments');
@@ -427,11 +433,12 @@ class EminwonDetailScraper {
             const actualTitle = content.title || this.announcementData?.title || '제목 없음';
 
             // JSON으로 결과 출력 (Python에서 파싱용)
-            console.log(JSON.stringify({
+            this.result = {
                 status: 'success',
                 actualTitle: actualTitle,
                 folderName: this.folderName
-            }));
+            };
+            console.log(JSON.stringify(this.result));
 
             return true;
 
@@ -540,71 +547,89 @@ class EminwonDetailScraper {
             console.error('실행 중 오류:', error);
             process.exit(1);
         } finally {
+            await this.close();
+        }
+    }
+
+    /**
+     * 리소스 정리 - 공유 브라우저는 닫지 않고 이 작업의 컨텍스트만 닫음
+     */
+    async close() {
+        if (this.ownsBrowser) {
             if (this.browser) {
                 await this.browser.close();
             }
+        } else if (this.context) {
+            await this.context.close().catch(() => {});
         }
+        this.context = null;
+        this.page = null;
     }
 }
 
-// CLI 인터페이스
-const argv = yargs
-    .option('region', {
-        alias: 'r',
-        description: '지역명',
-        type: 'string',
-        demandOption: true
-    })
-    .option('url', {
-        alias: 'u',
-        description: '상세 페이지 URL',
-        type: 'string',
-        demandOption: true
-    })
-    .option('output-dir', {
-        alias: 'o',
-        description: '출력 디렉토리',
-        type: 'string'
-    })
-    .option('folder-name', {
-        alias: 'f',
-        description: '폴더명',
-        type: 'string',
-        demandOption: true
-    })
-    .option('title', {
-        description: '공고 제목 (리스트에서 가져온)',
-        type: 'string'
-    })
-    .option('date', {
-        description: '공고 날짜 (리스트에서 가져온)',
-        type: 'string'
-    })
-    .option('count', {
-        alias: 'c',
-        type: 'boolean',
-        description: 'URL만 추출하여 DB에 저장 (다운로드 없음)',
-        default: false
-    })
-    .option('batch-date', {
-        alias: 'b',
-        type: 'string',
-        description: '배치 날짜 (YYYY-MM-DD 형식)',
-        default: null
-    })
-    .help()
-    .argv;
-
-// 실행
-const scraper = new EminwonDetailScraper({
-    region: argv.region,
-    url: argv.url,
-    outputDir: argv['output-dir'],
-    folderName: argv['folder-name'],
-    announcementData: {
-        title: argv.title,
-        date: argv.date
-    }
-});
+// 스크립트가 직접 실행될 때만 CLI 실행 (상주 서비스에서는 클래스만 사용)
+if (require.main === module) {
+    // CLI 인터페이스
+    const argv = yargs
+        .option('region', {
+            alias: 'r',
+            description: '지역명',
+            type: 'string',
+            demandOption: true
+        })
+        .option('url', {
+            alias: 'u',
+            description: '상세 페이지 URL',
+            type: 'string',
+            demandOption: true
+        })
+        .option('output-dir', {
+            alias: 'o',
+            description: '출력 디렉토리',
+            type: 'string'
+        })
+        .option('folder-name', {
+            alias: 'f',
+            description: '폴더명',
+            type: 'string',
+            demandOption: true
+        })
+        .option('title', {
+            description: '공고 제목 (리스트에서 가져온)',
+            type: 'string'
+        })
+        .option('date', {
+            description: '공고 날짜 (리스트에서 가져온)',
+            type: 'string'
+        })
+        .option('count', {
+            alias: 'c',
+            type: 'boolean',
+            description: 'URL만 추출하여 DB에 저장 (다운로드 없음)',
+            default: false
+        })
+        .option('batch-date', {
+            alias: 'b',
+            type: 'string',
+            description: '배치 날짜 (YYYY-MM-DD 형식)',
+            default: null
+        })
+        .help()
+        .argv;
+
+    // 실행
+    const scraper = new EminwonDetailScraper({
+        region: argv.region,
+        url: argv.url,
+        outputDir: argv['output-dir'],
+        folderName: argv['folder-name'],
+        announcementData: {
+            title: argv.title,
+            date: argv.date
+        }
+    });
+
+    scraper.run();
+}
 
-scraper.run();
\ No newline at end of file
+module.exports = EminwonDetailScraper;
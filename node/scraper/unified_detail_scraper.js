@@ -26,6 +26,12 @@ class UnifiedDetailScraper {
         this.dataAction = options.dataAction || '';
         this.verbose = options.verbose || false;
 
+        // 상주 서비스(detail_scraper_service.js)에서는 브라우저를 공유하고 컨텍스트만 새로 생성
+        this.browser = options.browser || null;
+        this.ownsBrowser = !options.browser;
+        this.context = null;
+        this.result = null;
+
         // 설정 로드
         const configPath = path.join(__dirname, 'scrapers_config.json');
         const configs = JSON.parse(fs.readFileSync(configPath, 'utf8'));
@@ -60,18 +66,20 @@ class UnifiedDetailScraper {
     }
 
     async init() {
-        this.browser = await chromium.launch({
-            headless: true,
-            args: ['--no-sandbox', '--disable-setuid-sandbox']
-        });
+        if (!this.browser) {
+            this.browser = await chromium.launch({
+                headless: true,
+                args: ['--no-sandbox', '--disable-setuid-sandbox']
+            });
+        }
 
-        const context = await this.browser.newContext({
+        this.context = await this.browser.newContext({
             userAgent: 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             acceptDownloads: true,
             ignoreHTTPSErrors: true
         });
 
-        this.page = await context.newPage();
+        this.page = await this.context.newPage();
 
         // 다운로드 이벤트 처리
         this.page.on('download', async (download) => {
@@ -133,13 +141,14 @@ class UnifiedDetailScraper {
             const actualTitle = await this.extractActualTitle();
 
             // 성공 응답
-            console.log(JSON.stringify({
+            this.result = {
                 status: 'success',
                 site: this.siteCode,
                 folder: this.folderName,
                 actualTitle: actualTitle || this.title,
                 attachments: attachments.length
-            }));
+            };
+            console.log(JSON.stringify(this.result));
 
         } catch (error) {
             // 실패 공고 DB 기록
@@ -153,14 +162,19 @@ class UnifiedDetailScraper {
             }).catch(logErr => {});
 
             console.error(`[${this.siteCode}] 오류:`, error.message);
-            console.log(JSON.stringify({
+            this.result = {
                 status: 'error',
                 site: this.siteCode,
                 error: error.message
-            }));
+            };
+            console.log(JSON.stringify(this.result));
         } finally {
-            if (this.browser) {
-                await this.browser.close();
+            if (this.ownsBrowser) {
+                if (this.browser) {
+                    await this.browser.close();
+                }
+            } else if (this.context) {
+                await this.context.close().catch(() => {});
             }
         }
     }
@@ -408,59 +422,64 @@ class UnifiedDetailScraper {
     }
 }
 
-// CLI 설정
-const argv = yargs
-    .option('site', {
-        alias: 's',
-        type: 'string',
-        description: '사이트 코드 (anyang, wonju 등)',
-        demandOption: true
-    })
-    .option('url', {
-        alias: 'u',
-        type: 'string',
-        description: '공고 URL',
-        demandOption: true
-    })
-    .option('output-dir', {
-        alias: 'o',
-        type: 'string',
-        description: '출력 디렉토리',
-        demandOption: true
-    })
-    .option('folder-name', {
-        alias: 'f',
-        type: 'string',
-        description: '폴더명',
-        demandOption: true
-    })
-    .option('title', {
-        type: 'string',
-        description: '공고 제목'
-    })
-    .option('date', {
-        type: 'string',
-        description: '작성일'
-    })
-    .option('onclick', {
-        type: 'string',
-        description: 'onclick 속성'
-    })
-    .option('data-action', {
-        type: 'string',
-        description: 'data-action 속성'
-    })
-    .option('verbose', {
-        alias: 'v',
-        type: 'boolean',
-        description: '상세 로그 출력',
-        default: false
-    })
-    .help()
-    .alias('help', 'h')
-    .example('$0 --site anyang --url "https://..." --output-dir "./data" --folder-name "001_공고"', '안양시 상세 페이지 다운로드')
-    .argv;
-
-// 실행
-const scraper = new UnifiedDetailScraper(argv);
-scraper.scrapeDetail();
\ No newline at end of file
+// 스크립트가 직접 실행될 때만 CLI 실행 (상주 서비스에서는 클래스만 사용)
+if (require.main === module) {
+    // CLI 설정
+    const argv = yargs
+        .option('site', {
+            alias: 's',
+            type: 'string',
+            description: '사이트 코드 (anyang, wonju 등)',
+            demandOption: true
+        })
+        .option('url', {
+            alias: 'u',
+            type: 'string',
+            description: '공고 URL',
+            demandOption: true
+        })
+        .option('output-dir', {
+            alias: 'o',
+            type: 'string',
+            description: '출력 디렉토리',
+            demandOption: true
+        })
+        .option('folder-name', {
+            alias: 'f',
+            type: 'string',
+            description: '폴더명',
+            demandOption: true
+        })
+        .option('title', {
+            type: 'string',
+            description: '공고 제목'
+        })
+        .option('date', {
+            type: 'string',
+            description: '작성일'
+        })
+        .option('onclick', {
+            type: 'string',
+            description: 'onclick 속성'
+        })
+        .option('data-action', {
+            type: 'string',
+            description: 'data-action 속성'
+        })
+        .option('verbose', {
+            alias: 'v',
+            type: 'boolean',
+            description: '상세 로그 출력',
+            default: false
+        })
+        .help()
+        .alias('help', 'h')
+        .example('$0 --site anyang --url "https://..." --output-dir "./data" --folder-name "001_공고"', '안양시 상세 페이지 다운로드')
+        .argv;
+
+    // 실행
+    const scraper = new UnifiedDetailScraper(argv);
+    scraper.scrapeDetail();
+}
+
+module.exports = UnifiedDetailScraper;
@@ -0,0 +1,481 @@
+#!/usr/bin/env python3
+"""
+공고 사전 처리 상주 워커 서비스
+
+지역(region)/사이트 단위 작업을 SQLite 작업 테이블로 받아 처리하는 상주 서비스입니다.
+배치 오케스트레이터가 지역마다 `python announcement_pre_processor.py`를 새로 띄우면
+docling, hwp5, SQLAlchemy, langchain import와 DomainKeyExtractor 생성,
+EXCLUSION_KEYWORDS 로드 비용을 매번 다시 지불합니다.
+이 서비스는 워커 프로세스를 미리 띄워 두고 AnnouncementPreProcessor 인스턴스를
+재사용하므로 시작 비용은 워커당 한 번만 발생합니다.
+
+- 작업 큐: SQLite 파일 (기본값: logs/pre_processor_jobs.sqlite3)
+- 작업별 타임아웃: 감독 프로세스가 초과한 워커를 종료하고 새 워커로 교체
+- .processed 마커: 기존과 동일하게 오케스트레이터가 성공 시 생성
+
+사용법:
+    python pre_processor_worker_service.py --workers 2
+    python batch_scraper_to_pre_processor_optimized.py --source eminwon --use-worker-service
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import signal
+import sqlite3
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from src.config.logConfig import setup_logging
+
+logger = setup_logging(__name__)
+
+DEFAULT_JOB_DB = Path("logs") / "pre_processor_jobs.sqlite3"
+
+# 작업 상태
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_SUCCESS = "success"
+STATUS_FAILED = "failed"
+STATUS_TIMEOUT = "timeout"
+FINISHED_STATUSES = (STATUS_SUCCESS, STATUS_FAILED, STATUS_TIMEOUT)
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    """작업 DB 연결을 생성하고 테이블을 보장합니다."""
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    conn = sqlite3.connect(str(db_path), timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS pre_processor_jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            base_dir TEXT NOT NULL,
+            site_code TEXT NOT NULL,
+            force INTEGER NOT NULL DEFAULT 0,
+            attach_force INTEGER NOT NULL DEFAULT 0,
+            timeout INTEGER NOT NULL DEFAULT 1200,
+            status TEXT NOT NULL DEFAULT 'pending',
+            worker_pid INTEGER,
+            enqueued_at REAL NOT NULL,
+            started_at REAL,
+            finished_at REAL,
+            result_json TEXT,
+            error TEXT
+        )
+        """
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_jobs_status ON pre_processor_jobs (status, id)"
+    )
+    return conn
+
+
+class PreProcessorJobClient:
+    """작업 테이블에 지역 작업을 등록하고 결과를 기다리는 클라이언트"""
+
+    def __init__(self, db_path: Path = DEFAULT_JOB_DB):
+        self.db_path = Path(db_path)
+
+    def submit(
+        self,
+        base_dir: Path,
+        site_code: str,
+        force: bool = False,
+        attach_force: bool = False,
+        timeout: int = 1200,
+    ) -> int:
+        """작업을 등록하고 job id를 반환합니다."""
+        conn = _connect(self.db_path)
+        try:
+            cursor = conn.execute(
+                """
+                INSERT INTO pre_processor_jobs
+                    (base_dir, site_code, force, attach_force, timeout, status, enqueued_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    str(Path(base_dir).resolve()),
+                    site_code,
+                    int(force),
+                    int(attach_force),
+                    int(timeout),
+                    STATUS_PENDING,
+                    time.time(),
+                ),
+            )
+            return cursor.lastrowid
+        finally:
+            conn.close()
+
+    def get(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """작업 상태를 조회합니다."""
+        conn = _connect(self.db_path)
+        try:
+            row = conn.execute(
+                "SELECT * FROM pre_processor_jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            return dict(row) if row else None
+        finally:
+            conn.close()
+
+    def wait(
+        self, job_id: int, max_wait: Optional[float] = None, poll_interval: float = 1.0
+    ) -> Dict[str, Any]:
+        """
+        작업이 끝날 때까지 기다립니다.
+
+        Args:
+            job_id: 작업 ID
+            max_wait: 최대 대기 시간 (초). 서비스가 내려가 있을 때 무한 대기 방지용
+            poll_interval: 상태 확인 간격 (초)
+
+        Returns:
+            작업 레코드 (status가 success/failed/timeout 중 하나)
+        """
+        deadline = time.time() + max_wait if max_wait else None
+
+        while True:
+            job = self.get(job_id)
+            if job and job["status"] in FINISHED_STATUSES:
+                if job.get("result_json"):
+                    job["result"] = json.loads(job["result_json"])
+                return job
+
+            if deadline and time.time() > deadline:
+                error = f"워커 서비스 응답 없음 ({max_wait:.0f}초 대기)"
+                if not self.cancel_pending(job_id, error):
+                    # 취소 직전에 서비스가 가져간 작업: 이미 끝났으면 그 결과를 반환
+                    job = self.get(job_id)
+                    if job and job["status"] in FINISHED_STATUSES:
+                        if job.get("result_json"):
+                            job["result"] = json.loads(job["result_json"])
+                        return job
+                return {"id": job_id, "status": STATUS_TIMEOUT, "error": error}
+
+            time.sleep(poll_interval)
+
+    def cancel_pending(self, job_id: int, error: str) -> bool:
+        """
+        아직 시작되지 않은 작업을 timeout으로 기록해 서비스가 나중에 실행하지 않도록 합니다.
+
+        Returns:
+            취소했으면 True, 이미 실행 중이거나 끝난 작업이면 False
+        """
+        conn = _connect(self.db_path)
+        try:
+            cursor = conn.execute(
+                """
+                UPDATE pre_processor_jobs
+                SET status = ?, finished_at = ?, error = ?
+                WHERE id = ? AND status = ?
+                """,
+                (STATUS_TIMEOUT, time.time(), error, job_id, STATUS_PENDING),
+            )
+            return cursor.rowcount > 0
+        finally:
+            conn.close()
+
+
+def _claim_next_job(conn: sqlite3.Connection) -> Optional[sqlite3.Row]:
+    """대기 중인 작업 하나를 원자적으로 가져옵니다."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        row = conn.execute(
+            "SELECT * FROM pre_processor_jobs WHERE status = ? ORDER BY id LIMIT 1",
+            (STATUS_PENDING,),
+        ).fetchone()
+
+        if row is None:
+            conn.execute("COMMIT")
+            return None
+
+        conn.execute(
+            """
+            UPDATE pre_processor_jobs
+            SET status = ?, worker_pid = ?, started_at = ?
+            WHERE id = ?
+            """,
+            (STATUS_RUNNING, os.getpid(), time.time(), row["id"]),
+        )
+        conn.execute("COMMIT")
+        return row
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def _finish_job(
+    conn: sqlite3.Connection,
+    job_id: int,
+    status: str,
+    result: Optional[Dict[str, Any]] = None,
+    error: Optional[str] = None,
+) -> None:
+    """작업 결과를 기록합니다. 이미 타임아웃 처리된 작업은 덮어쓰지 않습니다."""
+    conn.execute(
+        """
+        UPDATE pre_processor_jobs
+        SET status = ?, finished_at = ?, result_json = ?, error = ?
+        WHERE id = ? AND status = ?
+        """,
+        (
+            status,
+            time.time(),
+            json.dumps(result, ensure_ascii=False) if result is not None else None,
+            error,
+            job_id,
+            STATUS_RUNNING,
+        ),
+    )
+
+
+def _worker_loop(db_path: str, poll_interval: float) -> None:
+    """
+    워커 프로세스 메인 루프.
+
+    (site_type, attach_force) 조합별로 AnnouncementPreProcessor를 한 번만 생성하고
+    이후 작업에서 재사용합니다.
+    """
+    # 무거운 import는 워커 프로세스에서 한 번만 수행
+    from announcement_pre_processor import AnnouncementPreProcessor, determine_site_type
+    from src.utils.convertUtil import docling_converter_pool
+
+    docling_converter_pool.warm_up()
+
+    # Ctrl+C는 감독 프로세스가 처리
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    processors: Dict[tuple, AnnouncementPreProcessor] = {}
+    conn = _connect(Path(db_path))
+
+    logger.info(f"워커 시작: PID {os.getpid()}")
+
+    while True:
+        job = _claim_next_job(conn)
+        if job is None:
+            time.sleep(poll_interval)
+            continue
+
+        job_id = job["id"]
+        base_dir = Path(job["base_dir"])
+        site_code = job["site_code"]
+        attach_force = bool(job["attach_force"])
+
+        logger.info(f"[job {job_id}] 처리 시작: {site_code} ({base_dir})")
+
+        try:
+            site_type = determine_site_type(str(base_dir), site_code)
+            if site_type == "Unknown":
+                _finish_job(
+                    conn, job_id, STATUS_FAILED,
+                    error=f"site_type을 결정할 수 없습니다: {base_dir}",
+                )
+                continue
+
+            key = (site_type, attach_force)
+            processor = processors.get(key)
+            if processor is None:
+                processor = AnnouncementPreProcessor(
+                    site_type=site_type,
+                    attach_force=attach_force,
+                    site_code=site_code,
+                    lazy_init=False,
+                )
+                processors[key] = processor
+                logger.info(f"[job {job_id}] 프로세서 생성: {key}")
+
+            processor.site_code = site_code
+            results = processor.process_site_directories(
+                base_dir, site_code, bool(job["force"])
+            )
+
+            # CLI와 동일한 기준: 실패 항목이 있으면 실패
+            status = STATUS_FAILED if results["failed"] > 0 else STATUS_SUCCESS
+            _finish_job(conn, job_id, status, result=results)
+            logger.info(f"[job {job_id}] 완료: {status} {results}")
+
+        except Exception as e:
+            logger.error(f"[job {job_id}] 처리 중 오류: {e}")
+            _finish_job(conn, job_id, STATUS_FAILED, error=str(e))
+
+
+class PreProcessorWorkerService:
+    """워커 프로세스를 띄우고 작업 타임아웃을 감시하는 감독 프로세스"""
+
+    def __init__(
+        self,
+        db_path: Path = DEFAULT_JOB_DB,
+        workers: int = 2,
+        poll_interval: float = 1.0,
+    ):
+        self.db_path = Path(db_path)
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self._mp_context = multiprocessing.get_context("spawn")
+        self._processes: Dict[int, multiprocessing.Process] = {}
+        self._running = True
+
+    def _spawn_worker(self) -> None:
+        process = self._mp_context.Process(
+            target=_worker_loop,
+            args=(str(self.db_path), self.poll_interval),
+            daemon=True,
+        )
+        process.start()
+        self._processes[process.pid] = process
+
+    def _recover_orphaned_jobs(self, conn: sqlite3.Connection) -> None:
+        """이전 서비스 실행 중 running 상태로 남은 작업을 대기 상태로 되돌립니다."""
+        cursor = conn.execute(
+            """
+            UPDATE pre_processor_jobs
+            SET status = ?, worker_pid = NULL, started_at = NULL
+            WHERE status = ?
+            """,
+            (STATUS_PENDING, STATUS_RUNNING),
+        )
+        if cursor.rowcount:
+            logger.warning(f"중단된 작업 {cursor.rowcount}개를 대기 상태로 복구")
+
+    def _enforce_timeouts(self, conn: sqlite3.Connection) -> None:
+        """타임아웃을 넘긴 작업의 워커를 종료하고 작업을 timeout으로 기록합니다."""
+        now = time.time()
+        rows = conn.execute(
+            "SELECT id, worker_pid, started_at, timeout FROM pre_processor_jobs WHERE status = ?",
+            (STATUS_RUNNING,),
+        ).fetchall()
+
+        for row in rows:
+            if row["started_at"] is None or now - row["started_at"] <= row["timeout"]:
+                continue
+
+            pid = row["worker_pid"]
+            logger.error(f"[job {row['id']}] ⏱️ 타임아웃 ({row['timeout']}초 초과), 워커 {pid} 종료")
+
+            conn.execute(
+                """
+                UPDATE pre_processor_jobs
+                SET status = ?, finished_at = ?, error = ?
+                WHERE id = ? AND status = ?
+                """,
+                (
+                    STATUS_TIMEOUT,
+                    now,
+                    f"Timeout ({row['timeout']}초 초과)",
+                    row["id"],
+                    STATUS_RUNNING,
+                ),
+            )
+
+            process = self._processes.pop(pid, None)
+            if process is not None:
+                process.terminate()
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.kill()
+
+    def _reap_dead_workers(self, conn: sqlite3.Connection) -> None:
+        """비정상 종료된 워커의 작업을 실패 처리하고 워커 수를 유지합니다."""
+        for pid, process in list(self._processes.items()):
+            if process.is_alive():
+                continue
+
+            self._processes.pop(pid)
+            conn.execute(
+                """
+                UPDATE pre_processor_jobs
+                SET status = ?, finished_at = ?, error = ?
+                WHERE worker_pid = ? AND status = ?
+                """,
+                (
+                    STATUS_FAILED,
+                    time.time(),
+                    f"워커 비정상 종료 (exitcode={process.exitcode})",
+                    pid,
+                    STATUS_RUNNING,
+                ),
+            )
+            logger.warning(f"워커 {pid} 종료됨 (exitcode={process.exitcode})")
+
+        while self._running and len(self._processes) < self.workers:
+            self._spawn_worker()
+
+    def _handle_signal(self, signum, frame) -> None:
+        logger.info(f"종료 신호 수신: {signum}")
+        self._running = False
+
+    def run(self) -> None:
+        """서비스를 실행합니다."""
+        signal.signal(signal.SIGINT, self._handle_signal)
+        signal.signal(signal.SIGTERM, self._handle_signal)
+
+        conn = _connect(self.db_path)
+        self._recover_orphaned_jobs(conn)
+
+        logger.info("=" * 60)
+        logger.info("공고 사전 처리 워커 서비스 시작")
+        logger.info(f"작업 DB: {self.db_path}")
+        logger.info(f"워커: {self.workers}개")
+        logger.info("=" * 60)
+
+        try:
+            while self._running:
+                self._enforce_timeouts(conn)
+                self._reap_dead_workers(conn)
+                time.sleep(self.poll_interval)
+        finally:
+            for process in self._processes.values():
+                process.terminate()
+            for process in self._processes.values():
+                process.join(timeout=5)
+
+            self._recover_orphaned_jobs(conn)
+            conn.close()
+            logger.info(f"워커 서비스 종료: {datetime.now().isoformat()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="공고 사전 처리 상주 워커 서비스")
+
+    parser.add_argument(
+        "--workers", type=int, default=2, help="워커 프로세스 수 (기본값: 2)"
+    )
+
+    parser.add_argument(
+        "--job-db",
+        type=str,
+        default=str(DEFAULT_JOB_DB),
+        help=f"작업 큐 SQLite 파일 경로 (기본값: {DEFAULT_JOB_DB})",
+    )
+
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=1.0,
+        help="작업 확인 간격 (초, 기본값: 1.0)",
+    )
+
+    args = parser.parse_args()
+
+    service = PreProcessorWorkerService(
+        db_path=Path(args.job_db),
+        workers=args.workers,
+        poll_interval=args.poll_interval,
+    )
+    service.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -63,6 +63,15 @@ class ConfigManager:
                 "file_processing_timeout": int,
                 "progress_report_interval": int,
             },
+            "conversion_cache": {
+                "enabled": bool,
+                "cache_dir": str,
+                "max_size_mb": int,
+            },
+            "directory_scan": {
+                "incremental": bool,
+                "state_dir": str,
+            },
             "md_field_merge": {
                 "enabled": bool,
                 "log_level": int,
@@ -82,6 +91,19 @@ class ConfigManager:
                 "log_exclusions": bool,
                 "db_logging": bool,
             },
+            "keyword_snapshot": {
+                "check_interval_seconds": int,
+            },
+            "llm_dispatch": {
+                "workers": int,
+                "queue_size": int,
+            },
+            "llm_cache": {
+                "enabled": bool,
+                "cache_dir": str,
+                "max_size_mb": int,
+                "ttl_hours": float,
+            },
             "logging": {
                 "console_output": bool,
                 "file_output": bool,
@@ -2,11 +2,12 @@
 공고 분류를 위한 키워드 매칭 및 분류 유틸리티
 """
 
-import json
 import logging
 import re
 from pathlib import Path
 
+from src.utils.keywordSnapshot import get_classification_snapshot
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,67 +16,20 @@ class AnnouncementClassifier:
 
     def __init__(self):
         self.keywords_cache = None
+        self._keyword_snapshot = None
         self.load_keywords()
 
-    def load_keywords(self):
-        """데이터베이스에서 키워드를 로드"""
-        try:
-            from sqlalchemy import text
-
-            from src.models.database import SessionLocal
-
-            db = SessionLocal()
-
-            result = db.execute(
-                text(
-                    """
-                SELECT KEYWORD, KEYWORD_TYPE, INDUSTRY_CATEGORY, SYNONYMS, WEIGHT
-                FROM CLASSIFICATION_KEYWORDS
-                WHERE IS_ACTIVE = TRUE
-            """
-                )
-            )
-
-            keywords = result.fetchall()
-
-            self.keywords_cache = {
-                "SMALL_BUSINESS": [],
-                "SME": [],
-                "STARTUP": [],
-                "SOCIAL_ENTERPRISE": [],
-                "INDUSTRY": [],
-            }
-
-            for keyword, kw_type, industry_cat, synonyms_json, weight in keywords:
-                try:
-                    synonyms = json.loads(synonyms_json) if synonyms_json else [keyword]
-                except json.JSONDecodeError:
-                    synonyms = [keyword]
-
-                keyword_info = {
-                    "keyword": keyword,
-                    "synonyms": synonyms,
-                    "weight": weight,
-                    "industry_category": industry_cat,
-                }
-
-                if kw_type in self.keywords_cache:
-                    self.keywords_cache[kw_type].append(keyword_info)
-
-            db.close()
-            logger.info(
-                f"키워드 로드 완료: {sum(len(v) for v in self.keywords_cache.values())}개"
-            )
+    def load_keywords(self, force_check: bool = False):
+        """분류 키워드 로드 (프로세스 공유 스냅샷, 버전이 바뀐 경우에만 DB 재조회)"""
+        snapshot = get_classification_snapshot(force_check=force_check)
+        self._keyword_snapshot = snapshot
+        self.keywords_cache = snapshot.keywords_cache
+        return snapshot
 
-        except Exception as e:
-            logger.error(f"키워드 로딩 실패: {e}")
-            self.keywords_cache = {
-                "SMALL_BUSINESS": [],
-                "SME": [],
-                "STARTUP": [],
-                "SOCIAL_ENTERPRISE": [],
-                "INDUSTRY": [],
-            }
+    def reload_keywords(self):
+        """키워드 캐시 및 매칭 오토마톤 재로드"""
+        self.load_keywords(force_check=True)
+        logger.info("분류 키워드 캐시 재로드 완료")
 
     def extract_text_from_files(self, folder_path: Path) -> dict[str, str]:
         """폴더에서 모든 파일의 텍스트 추출 - 품질 최적화"""
@@ -997,7 +951,10 @@ class AnnouncementClassifier:
             "confidence_score": 0,
         }
 
-        if not self.keywords_cache:
+        # 공유 스냅샷 갱신 확인 (확인 주기 이내면 DB 조회 없음)
+        snapshot = self.load_keywords()
+
+        if not snapshot.keywords_cache:
             return analysis_result
 
         # 텍스트 전처리
@@ -1011,26 +968,30 @@ class AnnouncementClassifier:
             "SOCIAL_ENTERPRISE": 0,
         }
 
-        # 1. 일반 키워드 매칭
-        for kw_type, keywords in self.keywords_cache.items():
-            if kw_type == "INDUSTRY":
-                continue  # 업종 키워드는 별도 처리
+        # 1. 전체 키워드/동의어를 한 번에 탐색 (키워드 슬롯별 동의어 첫 매칭 위치)
+        positions_by_slot = {}
+        for index, position in snapshot.matcher.first_positions(text).items():
+            slot, synonym = snapshot.entries[index]
+            positions_by_slot.setdefault(slot, {})[synonym] = position
+
+        # 2. 매칭된 키워드만 맥락 검증 (일반 키워드 → 업종 키워드 순)
+        for slot in sorted(positions_by_slot):
+            kw_type, keyword_info = snapshot.slots[slot]
+            match_info = self._match_keyword_in_text(
+                text, keyword_info, positions_by_slot[slot]
+            )
+            if not match_info:
+                continue
 
-            for keyword_info in keywords:
-                match_info = self._match_keyword_in_text(text, keyword_info)
-                if match_info:
-                    analysis_result["matched_keywords"].append(match_info)
-                    type_scores[kw_type] += match_info["weight"]
-
-        # 2. 업종 키워드 매칭
-        for keyword_info in self.keywords_cache.get("INDUSTRY", []):
-            match_info = self._match_keyword_in_text(text, keyword_info)
-            if match_info:
+            if kw_type == "INDUSTRY":
                 match_info["industry_category"] = keyword_info.get("industry_category")
                 analysis_result["industry_keywords"].append(match_info)
                 type_scores["SMALL_BUSINESS"] += match_info[
                     "weight"
                 ]  # 업종 키워드는 소상공인으로 분류
+            else:
+                analysis_result["matched_keywords"].append(match_info)
+                type_scores[kw_type] += match_info["weight"]
 
         # 3. 분류 타입 결정
         analysis_result["classification_type"] = self._determine_classification_type(
@@ -1040,16 +1001,26 @@ class AnnouncementClassifier:
 
         return analysis_result
 
-    def _match_keyword_in_text(self, text: str, keyword_info: dict) -> dict | None:
-        """텍스트에서 맥락 기반 키워드 매칭"""
+    def _match_keyword_in_text(
+        self, text: str, keyword_info: dict, positions: dict | None = None
+    ) -> dict | None:
+        """텍스트에서 맥락 기반 키워드 매칭
+
+        positions가 주어지면 (오토마톤으로 찾은 {동의어: 첫 매칭 위치})
+        텍스트를 다시 탐색하지 않습니다.
+        """
 
         keyword = keyword_info["keyword"].lower()
         synonyms = [s.lower() for s in keyword_info.get("synonyms", [keyword])]
 
         for synonym in synonyms:
-            if synonym in text:
-                # 매칭 위치와 맥락 확인
+            if positions is None:
                 position = text.find(synonym)
+            else:
+                position = positions.get(synonym, -1)
+
+            if position >= 0:
+                # 매칭 위치와 맥락 확인
                 context = text[max(0, position - 30) : position + len(synonym) + 30]
 
                 # 맥락 기반 검증 - 네거티브 키워드 체크
@@ -8,6 +8,8 @@ import logging
 import re
 from pathlib import Path
 
+from src.utils.keywordSnapshot import get_exclusion_snapshot
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,46 +18,18 @@ class AnnouncementFilter:
 
     def __init__(self):
         self.exclusion_keywords_cache = None
+        self.exclusion_matcher = None
         self.support_content_keywords = None
         self.load_exclusion_keywords()
         self._load_support_content_patterns()
 
-    def load_exclusion_keywords(self):
-        """데이터베이스에서 제외 키워드를 로드"""
-        try:
-            from sqlalchemy import text
-
-            from src.models.database import SessionLocal
-
-            db = SessionLocal()
-
-            result = db.execute(
-                text(
-                    """
-                SELECT EXCLUSION_ID, KEYWORD, DESCRIPTION
-                FROM EXCLUSION_KEYWORDS
-                WHERE IS_ACTIVE = TRUE
-                ORDER BY EXCLUSION_ID
-            """
-                )
-            )
-
-            keywords = result.fetchall()
-
-            self.exclusion_keywords_cache = []
-            for exclusion_id, keyword, description in keywords:
-                self.exclusion_keywords_cache.append(
-                    {"id": exclusion_id, "keyword": keyword, "description": description}
-                )
-
-            db.close()
-            logger.info(
-                f"제외 키워드 로드 완료: {len(self.exclusion_keywords_cache)}개"
-            )
-
-        except Exception as e:
-            logger.error(f"제외 키워드 로딩 실패: {e}")
-            self.exclusion_keywords_cache = []
+    def load_exclusion_keywords(self, force_check: bool = False):
+        """제외 키워드 로드 (프로세스 공유 스냅샷, 버전이 바뀐 경우에만 DB 재조회)"""
+        snapshot = get_exclusion_snapshot(force_check=force_check)
+        self.exclusion_keywords_cache = snapshot.keywords
+        # 제목 검사용 매칭 오토마톤 (키워드 순서 = exclusion_keywords_cache 순서)
+        self.exclusion_matcher = snapshot.matcher
+        return snapshot
 
     def _load_support_content_patterns(self):
         """지원내용 감지를 위한 패턴 로드"""
@@ -187,29 +161,31 @@ class AnnouncementFilter:
             "should_exclude": False,
         }
 
-        if not self.exclusion_keywords_cache:
+        # 공유 스냅샷 갱신 확인 (확인 주기 이내면 DB 조회 없음)
+        snapshot = self.load_exclusion_keywords()
+
+        if not snapshot.keywords:
             return False, exclusion_info
 
         # 공고 제목에서 제외 키워드 검사
         title = exclusion_info["announcement_title"].lower()
 
         matched_keywords = []
-        for keyword_info in self.exclusion_keywords_cache:
-            keyword = keyword_info["keyword"].lower()
-
-            if keyword in title:
-                matched_keywords.append(
-                    {
-                        "keyword_id": keyword_info["id"],
-                        "keyword": keyword_info["keyword"],
-                        "description": keyword_info["description"],
-                        "position": title.find(keyword),
-                    }
-                )
+        positions = snapshot.matcher.first_positions(title)
+        for index in sorted(positions):
+            keyword_info = snapshot.keywords[index]
+            matched_keywords.append(
+                {
+                    "keyword_id": keyword_info["id"],
+                    "keyword": keyword_info["keyword"],
+                    "description": keyword_info["description"],
+                    "position": positions[index],
+                }
+            )
 
-                logger.debug(
-                    f"제외 키워드 매칭: '{keyword_info['keyword']}' in '{exclusion_info['announcement_title']}'"
-                )
+            logger.debug(
+                f"제외 키워드 매칭: '{keyword_info['keyword']}' in '{exclusion_info['announcement_title']}'"
+            )
 
         if matched_keywords:
             exclusion_info["matched_exclusion_keywords"] = matched_keywords
@@ -628,6 +604,6 @@ class AnnouncementFilter:
 
     def reload_keywords(self):
         """키워드 캐시 재로드"""
-        self.load_exclusion_keywords()
+        self.load_exclusion_keywords(force_check=True)
         self._load_support_content_patterns()
         logger.info("제외 키워드 캐시 재로드 완료")
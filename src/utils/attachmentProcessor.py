@@ -21,6 +21,7 @@ from typing import Dict, List, Tuple, Optional
 try:
     from src.config.config import ConfigManager
     from src.config.logConfig import setup_logging
+    from src.utils.conversionCache import ConversionCache
     from src.utils.convertUtil import (
         convert_pdf_to_md_docling,
         convert_pdf_to_md_markitdown,
@@ -34,6 +35,7 @@ try:
         from src.utils.imageOcrUtil import (
             ImageOCRProcessor,
             find_image_files_in_directory,
+            get_shared_ocr_processor,
         )
 
         OCR_AVAILABLE = True
@@ -41,6 +43,7 @@ try:
         OCR_AVAILABLE = False
         ImageOCRProcessor = None
         find_image_files_in_directory = None
+        get_shared_ocr_processor = None
 
 except ImportError as e:
     # 절대 import 시도
@@ -53,6 +56,7 @@ except ImportError as e:
 
     from src.config.config import ConfigManager
     from src.config.logConfig import setup_logging
+    from src.utils.conversionCache import ConversionCache
     from src.utils.convertUtil import (
         convert_pdf_to_md_docling,
         convert_pdf_to_md_markitdown,
@@ -66,6 +70,7 @@ except ImportError as e:
         from src.utils.imageOcrUtil import (
             ImageOCRProcessor,
             find_image_files_in_directory,
+            get_shared_ocr_processor,
         )
 
         OCR_AVAILABLE = True
@@ -73,6 +78,7 @@ except ImportError as e:
         OCR_AVAILABLE = False
         ImageOCRProcessor = None
         find_image_files_in_directory = None
+        get_shared_ocr_processor = None
 
 logger = setup_logging(__name__)
 config = ConfigManager().get_config()
@@ -89,13 +95,19 @@ class AttachmentProcessor:
             "office": [".pptx", ".docx", ".xlsx"],
         }
         self.ocr_processor = None
+        self.conversion_cache = ConversionCache()
 
-    def process_directory_attachments(self, directory_path: Path) -> Dict[str, str]:
+    def process_directory_attachments(
+        self, directory_path: Path, bypass_cache: bool = False
+    ) -> Dict[str, str]:
         """
         디렉토리의 첨부파일들을 처리합니다.
 
+        파일별로 변환 캐시를 먼저 확인하고, 새로 변환한 결과는 캐시에 저장합니다.
+
         Args:
             directory_path: 처리할 디렉토리 경로
+            bypass_cache: True면 캐시 조회를 건너뛰고 재변환 (결과는 캐시에 갱신)
 
         Returns:
             {filename: converted_content} 형태의 딕셔너리
@@ -111,19 +123,19 @@ class AttachmentProcessor:
         results = {}
 
         # PDF 파일 처리
-        pdf_results = self._process_pdf_files(attachments_dir)
+        pdf_results = self._process_pdf_files(attachments_dir, bypass_cache)
         results.update(pdf_results)
 
         # HWP 파일 처리
-        hwp_results = self._process_hwp_files(attachments_dir)
+        hwp_results = self._process_hwp_files(attachments_dir, bypass_cache)
         results.update(hwp_results)
 
         # 이미지 파일 처리
-        image_results = self._process_image_files(attachments_dir)
+        image_results = self._process_image_files(attachments_dir, bypass_cache)
         results.update(image_results)
 
         # Office 파일 처리 (pptx, docx, xlsx)
-        office_results = self._process_office_files(attachments_dir)
+        office_results = self._process_office_files(attachments_dir, bypass_cache)
         results.update(office_results)
 
         # 결과를 .md 파일로 저장
@@ -132,11 +144,61 @@ class AttachmentProcessor:
         logger.info(f"첨부파일 처리 완료: {len(results)}개 파일 변환됨")
         return results
 
-    def process_single_file(self, file_path: Path) -> Optional[str]:
-        """단일 파일을 처리하여 텍스트 내용을 반환합니다."""
+    def process_single_file(
+        self, file_path: Path, bypass_cache: bool = False
+    ) -> Optional[str]:
+        """
+        단일 파일을 처리하여 텍스트 내용을 반환합니다.
+
+        변환 캐시를 먼저 확인하고, 없으면 변환한 뒤 결과를 캐시에 저장합니다.
+
+        Args:
+            file_path: 변환할 파일 경로
+            bypass_cache: True면 캐시 조회를 건너뛰고 재변환 (결과는 캐시에 갱신)
+        """
 
         logger.info(f"단일 파일을 처리하여 텍스트 내용을 반환합니다. ====> {file_path}")
 
+        cache_key, cached_content = self._lookup_conversion_cache(
+            file_path, bypass_cache
+        )
+        if cached_content is not None:
+            return cached_content
+
+        content = self._convert_single_file(file_path)
+        self._store_conversion_cache(cache_key, content)
+
+        return content
+
+    def _lookup_conversion_cache(
+        self, file_path: Path, bypass_cache: bool = False
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """변환 캐시 키와 캐시된 내용을 반환합니다 (미적중·우회 시 내용은 None, 캐시 비활성 시 키도 None)."""
+        if not self.conversion_cache.enabled:
+            # 비활성 캐시에는 조회/저장하지 않으므로 파일 해시를 계산하지 않음
+            return None, None
+
+        cache_key = None
+        try:
+            cache_key = self.conversion_cache.compute_key(file_path)
+            if not bypass_cache:
+                cached_content = self.conversion_cache.get(cache_key)
+                if cached_content is not None:
+                    logger.info(f"변환 캐시 적중: {file_path.name} ({len(cached_content)} 문자)")
+                    return cache_key, cached_content
+        except Exception as e:
+            logger.warning(f"변환 캐시 조회 실패 (변환 계속): {e}")
+        return cache_key, None
+
+    def _store_conversion_cache(
+        self, cache_key: Optional[str], content: Optional[str]
+    ) -> None:
+        """비어 있지 않은 변환 결과만 캐시에 저장합니다."""
+        if cache_key and content and content.strip():
+            self.conversion_cache.put(cache_key, content)
+
+    def _convert_single_file(self, file_path: Path) -> Optional[str]:
+        """확장자에 맞는 변환기로 단일 파일을 변환합니다."""
         try:
             file_extension = file_path.suffix.lower()
             filename = file_path.stem
@@ -239,7 +301,8 @@ class AttachmentProcessor:
                 logger.warning("OCR 기능을 사용할 수 없음")
                 return None
 
-            processor = ImageOCRProcessor(lazy_init=False)
+            # 프로세스 공유 OCR 엔진 사용 (EasyOCR 모델은 프로세스당 1회만 로드)
+            processor = get_shared_ocr_processor()
 
             # 이미지가 절대 경로인 경우 부모 디렉토리를 base_dir로 사용
             base_dir = image_file.parent
@@ -447,7 +510,9 @@ class AttachmentProcessor:
             logger.error(f"ZIP 파일 처리 실패 ({zip_file}): {e}")
             return None
 
-    def _process_pdf_files(self, attachments_dir: Path) -> Dict[str, str]:
+    def _process_pdf_files(
+        self, attachments_dir: Path, bypass_cache: bool = False
+    ) -> Dict[str, str]:
         """PDF 파일들을 처리합니다."""
         results = {}
 
@@ -458,6 +523,13 @@ class AttachmentProcessor:
             for pdf_file in pdf_files:
                 filename = pdf_file.stem
 
+                cache_key, cached_content = self._lookup_conversion_cache(
+                    pdf_file, bypass_cache
+                )
+                if cached_content is not None:
+                    results[filename] = cached_content
+                    continue
+
                 logger.info(f"PDF 파일 처리 중: {pdf_file.name}")
 
                 # 최종 출력 파일 경로 (PDF 파일과 같은 위치)
@@ -491,6 +563,7 @@ class AttachmentProcessor:
                         with open(final_output, "r", encoding="utf-8") as f:
                             content = f.read()
                         results[filename] = content
+                        self._store_conversion_cache(cache_key, content)
                         logger.info(
                             f"PDF 변환 성공: {pdf_file.name} -> {final_output.name}"
                         )
@@ -504,7 +577,9 @@ class AttachmentProcessor:
 
         return results
 
-    def _process_hwp_files(self, attachments_dir: Path) -> Dict[str, str]:
+    def _process_hwp_files(
+        self, attachments_dir: Path, bypass_cache: bool = False
+    ) -> Dict[str, str]:
         """HWP 파일들을 처리합니다."""
         results = {}
 
@@ -517,6 +592,13 @@ class AttachmentProcessor:
             for hwp_file in hwp_files:
                 filename = hwp_file.stem
 
+                cache_key, cached_content = self._lookup_conversion_cache(
+                    hwp_file, bypass_cache
+                )
+                if cached_content is not None:
+                    results[filename] = cached_content
+                    continue
+
                 logger.info(f"HWP 파일 처리 중: {hwp_file.name}")
 
                 # 최종 출력 파일 경로 (HWP 파일과 같은 위치)
@@ -536,6 +618,7 @@ class AttachmentProcessor:
                         text_content = process_hwp_with_fallback(hwp_file)
                         if text_content:
                             results[filename] = text_content
+                            self._store_conversion_cache(cache_key, text_content)
                             # HWP 파일과 같은 위치에 MD 파일 저장
                             with open(final_output, "w", encoding="utf-8") as f:
                                 f.write(text_content)
@@ -552,6 +635,7 @@ class AttachmentProcessor:
                         with open(final_output, "r", encoding="utf-8") as f:
                             content = f.read()
                         results[filename] = content
+                        self._store_conversion_cache(cache_key, content)
                         logger.info(
                             f"HWP 변환 성공: {hwp_file.name} -> {final_output.name}"
                         )
@@ -565,7 +649,9 @@ class AttachmentProcessor:
 
         return results
 
-    def _process_image_files(self, attachments_dir: Path) -> Dict[str, str]:
+    def _process_image_files(
+        self, attachments_dir: Path, bypass_cache: bool = False
+    ) -> Dict[str, str]:
         """이미지 파일들을 OCR로 처리합니다."""
         results = {}
 
@@ -579,28 +665,46 @@ class AttachmentProcessor:
             # 기존 함수 활용하여 이미지 파일 찾기
             image_files = find_image_files_in_directory(attachments_dir)
 
+            # 캐시 적중 이미지는 OCR 대상에서 제외
+            cache_keys = {}
+            pending_files = []
+            for image_file in image_files:
+                cache_key, cached_content = self._lookup_conversion_cache(
+                    image_file, bypass_cache
+                )
+                if cached_content is not None:
+                    results[image_file.stem] = cached_content
+                else:
+                    cache_keys[image_file] = cache_key
+                    pending_files.append(image_file)
+            image_files = pending_files
+
             if not image_files:
                 logger.info("처리할 이미지 파일이 없음")
                 return results
 
-            # OCR 프로세서 지연 초기화
+            # OCR 프로세서 지연 초기화 (프로세스 공유 인스턴스)
             if self.ocr_processor is None:
                 logger.info("OCR 프로세서 초기화 중...")
-                self.ocr_processor = ImageOCRProcessor(lazy_init=False)
+                self.ocr_processor = get_shared_ocr_processor()
+
+            # 폴더 내 이미지를 한 번에 OCR 처리 (같은 크기끼리 배치 실행)
+            logger.info(f"이미지 파일 OCR 처리 중: {len(image_files)}개")
+            extracted_texts = self.ocr_processor.extract_texts_from_image_files(
+                image_files
+            )
 
             for image_file in image_files:
                 filename = image_file.stem
 
-                logger.info(f"이미지 파일 OCR 처리 중: {image_file.name}")
-
                 try:
-                    # 기존 OCR 함수 사용
-                    extracted_text = self.ocr_processor.extract_text_from_image_file(
-                        image_file, attachments_dir
-                    )
+                    extracted_text = extracted_texts.get(image_file)
 
                     if extracted_text and extracted_text.strip():
                         results[filename] = extracted_text
+                        self._store_conversion_cache(
+                            cache_keys.get(image_file), extracted_text
+                        )
                         logger.info(
                             f"이미지 OCR 성공: {image_file.name}, {len(extracted_text)} 문자"
                         )
@@ -617,7 +721,9 @@ class AttachmentProcessor:
 
         return results
 
-    def _process_office_files(self, attachments_dir: Path) -> Dict[str, str]:
+    def _process_office_files(
+        self, attachments_dir: Path, bypass_cache: bool = False
+    ) -> Dict[str, str]:
         """Office 파일들(pptx, docx, xlsx)을 처리합니다."""
         results = {}
 
@@ -630,6 +736,13 @@ class AttachmentProcessor:
             for office_file in office_files:
                 filename = office_file.stem
 
+                cache_key, cached_content = self._lookup_conversion_cache(
+                    office_file, bypass_cache
+                )
+                if cached_content is not None:
+                    results[filename] = cached_content
+                    continue
+
                 logger.info(f"Office 파일 처리 중: {office_file.name}")
 
                 try:
@@ -637,6 +750,7 @@ class AttachmentProcessor:
 
                     if content and content.strip():
                         results[filename] = content
+                        self._store_conversion_cache(cache_key, content)
                         logger.info(f"Office 변환 성공: {office_file.name}")
                     else:
                         logger.error(f"Office 변환 실패: {office_file.name}")
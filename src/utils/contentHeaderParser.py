@@ -0,0 +1,251 @@
+"""
+content.md 메타데이터(헤더) 파서
+
+스크래퍼가 생성하는 content.md는 상단에 제목/원본 URL/작성일/첨부파일 등
+메타데이터가 모여 있습니다. 기존에는 항목마다 re.findall로 문서 전체를 훑고
+(본문이 수백 KB인 경우도 있음) 첨부파일 URL은 파일을 다시 읽어서 추출했습니다.
+
+이 모듈은 원본 URL/스크래핑 URL/공고일을 헤더 구간(본문 시작 표시인 "**내용**" 줄 또는
+첫 "##" 소제목 전까지, 표시가 없으면 문서 전체)에서만 미리 컴파일한 패턴의 search로 찾고,
+한 번 읽은 content.md로 모든 항목을 채운 ContentHeader를 반환합니다.
+본문에 나오는 "작성일 기준 ..." 같은 문장이 헤더의 날짜보다 먼저 매칭되지 않습니다.
+제목은 상위 TITLE_SCAN_LINES줄, 첨부파일은 본문 뒤에 오므로 문서 전체에서 찾습니다.
+
+추출 규칙은 announcement_pre_processor.py의 기존 규칙과 같고, 공고일은 다른 처리기들이
+받아들이던 "**등록일** : 날짜", "**작성일** 날짜" 형식도 같은 줄에 한해 허용합니다.
+(findall(...)[0]과 search(...).group(1)은 같은 첫 매칭을 반환)
+기존 추출 함수와의 비교는 benchmark_content_header_parser.py로 확인할 수 있습니다.
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.config.logConfig import setup_logging
+
+logger = setup_logging(__name__)
+
+# 제목 탐색 범위 (상위 줄 수)
+TITLE_SCAN_LINES = 10
+
+TITLE_PREFIXES = ["제목:", "공고명:", "공고 제목:", "제목 :"]
+
+ORIGIN_URL_PATTERNS = [
+    re.compile(r"\*\*원본 URL\*\*[:\s]*(.+?)(?:\n|$)", re.IGNORECASE),
+    re.compile(r"원본 URL[:\s]*(.+?)(?:\n|$)", re.IGNORECASE),
+    re.compile(r"원본[:\s]*(.+?)(?:\n|$)", re.IGNORECASE),
+    re.compile(r"(https?://[^\s\)]+(?:\.go\.kr|\.or\.kr)[^\s\)]*)", re.IGNORECASE),
+]
+
+SCRAPING_URL_PATTERNS = [
+    re.compile(r"\*\*스크래핑 URL\*\*[:\s]*(.+?)(?:\n|$)", re.IGNORECASE),
+    re.compile(r"스크래핑 URL[:\s]*(.+?)(?:\n|$)", re.IGNORECASE),
+    re.compile(r"\*\*수집 URL\*\*[:\s]*(.+?)(?:\n|$)", re.IGNORECASE),
+    re.compile(r"수집 URL[:\s]*(.+?)(?:\n|$)", re.IGNORECASE),
+]
+
+# 본문 시작 표시 ("**내용**:" 줄 또는 "##" 소제목)
+BODY_START_PATTERN = re.compile(r"^(?:\*\*내용\*\*|##)", re.MULTILINE)
+
+# 항목명 뒤의 날짜를 같은 줄에서만 캡처
+# - 볼드 항목명은 콜론 생략/앞뒤 공백 허용: "**작성일** 날짜", "**등록일** : 날짜"
+# - 일반 항목명은 항목명 바로 뒤 콜론 필수: "등록일: 날짜" (문장 속 "작성일 기준 ..."과 구분)
+# 중요: \s* 대신 [ \t]*를 사용 (\s는 개행도 포함해서 여러 줄을 건너뛰는 문제 발생)
+DATE_PATTERNS = [
+    re.compile(r"\*\*작성일\*\*[ \t]*:?[ \t]*([^\n]+)", re.IGNORECASE),  # **작성일**: 날짜 (같은 줄만)
+    re.compile(r"\*\*작성일\*\*:\*\*[ \t]*([^\n]+)", re.IGNORECASE),  # **작성일:**: 날짜
+    re.compile(r"작성일:[ \t]*([^\n]+)", re.IGNORECASE),  # 작성일: 날짜
+    re.compile(r"\*\*등록일\*\*[ \t]*:?[ \t]*([^\n]+)", re.IGNORECASE),  # **등록일**: 날짜
+    re.compile(r"\*\*등록일\*\*:\*\*[ \t]*([^\n]+)", re.IGNORECASE),  # **등록일:**: 날짜
+    re.compile(r"등록일:[ \t]*([^\n]+)", re.IGNORECASE),  # 등록일: 날짜
+    re.compile(r"\*\*공고일\*\*[ \t]*:?[ \t]*([^\n]+)", re.IGNORECASE),  # **공고일**: 날짜
+    re.compile(r"\*\*공고일\*\*:\*\*[ \t]*([^\n]+)", re.IGNORECASE),  # **공고일:**: 날짜
+    re.compile(r"공고일:[ \t]*([^\n]+)", re.IGNORECASE),  # 공고일: 날짜
+]
+
+_BOLD_MARKS = re.compile(r"\*+")
+_YEAR = re.compile(r"\d{4}")
+
+# **첨부파일**: 섹션 (다음 **항목** 또는 문서 끝까지)
+ATTACHMENT_SECTION_PATTERN = re.compile(
+    r"\*\*첨부파일\*\*:\s*\n+((?:.*\n?)*?)(?=\n\*\*|\Z)", re.MULTILINE
+)
+
+# [목록마커] [번호.] 파일명:URL (하이픈/별표/불릿 및 번호 선택적, 콜론 앞뒤 공백 허용)
+# 예: "- 공고이미지_1.jpg: https://..." 또는 "1. 파일명.pdf: https://..."
+ATTACHMENT_LINE_PATTERN = re.compile(r"^(?:[-*•]\s*)?(?:\d+\.\s*)?(.+?)\s*:\s*(https?://\S+)")
+
+
+@dataclass
+class ContentHeader:
+    """content.md 메타데이터"""
+
+    title: str = ""
+    origin_url: str = ""
+    scraping_url: str = ""
+    announcement_date: str = ""  # 원문 문자열 (YYYYMMDD 변환 전)
+    attachment_urls: Dict[str, str] = field(default_factory=dict)  # 파일명 -> 다운로드 URL
+
+
+def header_section(content_md: str) -> str:
+    """본문 시작 표시 전까지의 헤더 구간을 반환합니다. 표시가 없으면 전체를 반환합니다."""
+    match = BODY_START_PATTERN.search(content_md)
+    return content_md[: match.start()] if match else content_md
+
+
+def extract_title(content_md: str) -> str:
+    """
+    content.md에서 제목을 추출합니다.
+
+    우선순위:
+    1. **제목**: 패턴 (상세 페이지에서 추출된 공식 제목)
+    2. # 마크다운 헤더
+    3. 제목:, 공고명: 패턴
+    4. 첫 번째 줄
+    """
+    if not content_md:
+        return ""
+
+    # 상위 줄만 분리 (본문 전체를 split하지 않음)
+    lines = content_md.split("\n", TITLE_SCAN_LINES)[:TITLE_SCAN_LINES]
+
+    # 1단계: **제목**: 패턴 우선 검색 (가장 신뢰도 높음)
+    for line in lines:
+        line = line.strip()
+        if line.startswith("**제목**:"):
+            title = line.replace("**제목**:", "").strip()
+            if title:
+                logger.debug(f"**제목** 패턴에서 제목 추출: {title}")
+                return title
+
+    # 2단계: 기타 패턴 검색
+    for line in lines:
+        line = line.strip()
+        if line:
+            # # 마크다운 헤더
+            if line.startswith("#"):
+                title = line.lstrip("#").strip()
+                logger.debug(f"마크다운 헤더에서 제목 추출: {title}")
+                return title
+
+            # 제목:, 공고명: 패턴
+            lowered = line.lower()
+            for prefix in TITLE_PREFIXES:
+                if lowered.startswith(prefix.lower()):
+                    title = line[len(prefix) :].strip()
+                    logger.debug(f"{prefix} 패턴에서 제목 추출: {title}")
+                    return title
+
+            # 첫 번째 일반 텍스트 줄 사용 (메타데이터 라인 제외)
+            if not line.startswith("**"):
+                logger.debug(f"첫 번째 줄을 제목으로 사용: {line}")
+                return line
+
+    return ""
+
+
+def _first_url(content_md: str, patterns) -> str:
+    """패턴 순서대로 첫 매칭을 찾아 http로 시작하면 반환합니다."""
+    for pattern in patterns:
+        match = pattern.search(content_md)
+        if match:
+            url = match.group(1).strip()
+            if url and url.startswith("http"):
+                return url
+    return ""
+
+
+def extract_origin_url(content_md: str) -> str:
+    """content.md에서 원본 URL을 추출합니다."""
+    if not content_md:
+        return ""
+
+    url = _first_url(header_section(content_md), ORIGIN_URL_PATTERNS)
+    if url:
+        logger.debug(f"원본 URL 추출 성공: {url[:50]}...")
+    else:
+        logger.debug("content.md에서 원본 URL을 찾을 수 없음")
+    return url
+
+
+def extract_scraping_url(content_md: str) -> str:
+    """content.md에서 스크래핑 URL을 추출합니다."""
+    if not content_md:
+        return ""
+
+    url = _first_url(header_section(content_md), SCRAPING_URL_PATTERNS)
+    if url:
+        logger.debug(f"스크래핑 URL 추출 성공: {url[:50]}...")
+    else:
+        logger.debug("content.md에서 스크래핑 URL을 찾을 수 없음")
+    return url
+
+
+def extract_announcement_date(content_md: str) -> str:
+    """content.md에서 공고일을 문자열로 추출합니다."""
+    if not content_md:
+        return ""
+
+    header = header_section(content_md)
+    for pattern in DATE_PATTERNS:
+        match = pattern.search(header)
+        if match:
+            date_str = match.group(1).strip()
+            if date_str:
+                # 마크다운 볼드(**) 제거
+                date_str = _BOLD_MARKS.sub("", date_str).strip()
+
+                # 날짜 형식 검증 (최소한 연도가 포함되어야 함)
+                if _YEAR.search(date_str):
+                    logger.debug(f"공고일 추출 성공: {date_str}")
+                    return date_str
+
+    logger.debug("content.md에서 공고일을 찾을 수 없음")
+    return ""
+
+
+def extract_attachment_urls(content_md: str) -> Dict[str, str]:
+    """content.md의 **첨부파일**: 섹션에서 파일명 -> 다운로드 URL 매핑을 추출합니다."""
+    attachment_urls = {}
+    if not content_md:
+        return attachment_urls
+
+    attachments_section = ATTACHMENT_SECTION_PATTERN.search(content_md)
+    if not attachments_section:
+        return attachment_urls
+
+    for line in attachments_section.group(1).strip().split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+
+        match = ATTACHMENT_LINE_PATTERN.match(line)
+        if match:
+            filename = match.group(1).strip()
+            url = match.group(2).strip()
+            attachment_urls[filename] = url
+            logger.debug(f"첨부파일 URL 매핑: {filename} -> {url[:50]}...")
+
+    return attachment_urls
+
+
+def parse_content_header(content_md: str) -> ContentHeader:
+    """content.md 문자열에서 모든 메타데이터를 추출합니다."""
+    return ContentHeader(
+        title=extract_title(content_md),
+        origin_url=extract_origin_url(content_md),
+        scraping_url=extract_scraping_url(content_md),
+        announcement_date=extract_announcement_date(content_md),
+        attachment_urls=extract_attachment_urls(content_md),
+    )
+
+
+def read_content_header(directory_path: Path) -> Optional[ContentHeader]:
+    """디렉토리의 content.md를 한 번 읽어 메타데이터를 반환합니다. 파일이 없으면 None."""
+    content_md_path = Path(directory_path) / "content.md"
+    if not content_md_path.exists():
+        return None
+
+    with open(content_md_path, "r", encoding="utf-8") as f:
+        return parse_content_header(f.read())
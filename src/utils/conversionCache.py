@@ -0,0 +1,86 @@
+"""
+첨부파일 변환 결과 캐시 (내용 주소 기반)
+
+bizInfo/smes24/kStartUp 미러처럼 동일한 PDF/HWP가 여러 사이트·날짜에 반복해서
+올라오는 경우, 파일 내용 해시 + 변환기 버전을 키로 변환 결과(마크다운)를
+로컬 디스크에 저장해 두고 재사용합니다.
+
+캐시 구조:
+{cache_dir}/
+├── ab/
+│   └── ab12...ef.md    # sha256(파일 내용 + 확장자 + 변환기 버전)
+└── ...
+
+저장/LRU 정리 방식은 ShardedDiskCache를 따릅니다.
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Optional
+
+from src.config.config import ConfigManager
+from src.config.logConfig import setup_logging
+from src.utils.shardedDiskCache import ShardedDiskCache
+
+logger = setup_logging(__name__)
+
+# 변환 로직(convertUtil, imageOcrUtil 등)을 변경하면 이 값을 올려 기존 캐시를 무효화
+CONVERTER_VERSION = "2"
+
+# 변환 결과에 영향을 주는 라이브러리 (버전이 바뀌면 자동으로 다른 키 사용)
+_CONVERTER_PACKAGES = ("docling", "markitdown", "pyhwp", "easyocr")
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _build_converter_signature() -> str:
+    """변환기 버전 + 설치된 변환 라이브러리 버전으로 서명 문자열을 만듭니다."""
+    from importlib import metadata
+
+    parts = [f"converter={CONVERTER_VERSION}"]
+    for package in _CONVERTER_PACKAGES:
+        try:
+            parts.append(f"{package}={metadata.version(package)}")
+        except metadata.PackageNotFoundError:
+            parts.append(f"{package}=none")
+    return ";".join(parts)
+
+
+class ConversionCache(ShardedDiskCache):
+    """첨부파일 → 마크다운 변환 결과를 저장하는 디스크 캐시"""
+
+    ENTRY_SUFFIX = ".md"
+    CACHE_LABEL = "변환 캐시"
+
+    def __init__(
+        self,
+        cache_dir: Optional[str | Path] = None,
+        max_size_mb: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ):
+        cache_config = ConfigManager().get_section("conversion_cache")
+
+        super().__init__(
+            cache_dir or cache_config.get("cache_dir", "cache/conversion/"),
+            max_size_mb or cache_config.get("max_size_mb", 2048),
+            cache_config.get("enabled", True) if enabled is None else enabled,
+        )
+        self._signature = _build_converter_signature()
+
+    def compute_key(self, file_path: Path) -> str:
+        """파일 내용, 확장자, 변환기 서명으로 캐시 키를 계산합니다."""
+        hasher = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+
+        # 같은 바이트라도 확장자에 따라 변환 경로가 달라지므로 키에 포함
+        hasher.update(file_path.suffix.lower().encode("utf-8"))
+        hasher.update(self._signature.encode("utf-8"))
+        return hasher.hexdigest()
+
+    def _dump_entry(self, content: str) -> bytes:
+        return content.encode("utf-8")
+
+    def _load_entry(self, entry_path: Path, data: str) -> Optional[str]:
+        return data
@@ -3,6 +3,7 @@ import os
 import re
 import shutil
 import sys
+import threading
 import traceback
 from contextlib import closing
 from pathlib import Path
@@ -1350,6 +1351,119 @@ def strToInt(data) -> int:
         return 0
 
 
+def _create_docling_converter():
+    """
+    표 구조 인식과 OCR이 활성화된 Docling DocumentConverter를 생성합니다.
+
+    Raises:
+        ImportError: docling이 설치되지 않은 경우
+    """
+    from docling.document_converter import (
+        DocumentConverter,
+        PdfFormatOption,
+    )
+    from docling.datamodel.base_models import InputFormat
+    from docling.datamodel.pipeline_options import (
+        PdfPipelineOptions,
+        TableStructureOptions,
+    )
+
+    # 표 구조 보존 옵션 설정 (사용자 요구사항)
+    try:
+        table_options = TableStructureOptions(
+            do_cell_matching=False,  # 셀 매칭 활성화
+        )
+
+        pipeline_options = PdfPipelineOptions(
+            do_table_structure=True,  # 표 구조 인식 활성화
+            table_structure_options=table_options,
+        )
+
+        pipeline_options.do_ocr = True
+        pipeline_options.ocr_options.use_gpu = False
+
+        pdf_format_options = PdfFormatOption(pipeline_options=pipeline_options)
+        converter = DocumentConverter(
+            format_options={InputFormat.PDF: pdf_format_options}
+        )
+        logger.info("표 구조 인식 활성화된 DocumentConverter 생성 완료")
+    except Exception as opt_error:
+        logger.warning(f"고급 옵션 설정 실패, 기본 변환기 사용: {opt_error}")
+        converter = DocumentConverter()
+
+    return converter
+
+
+class DoclingConverterPool:
+    """
+    프로세스 단위로 공유되는 Docling DocumentConverter 풀
+
+    DocumentConverter는 생성 후 첫 변환 시 레이아웃/표 구조 모델을 로드하므로
+    PDF마다 새로 만들면 매번 모델을 다시 읽게 됩니다.
+    한 번 만든 변환기를 반납받아 재사용하고, 동시에 변환하는 스레드 수만큼만
+    (최대 max_size개) 추가로 생성합니다.
+    """
+
+    def __init__(self, max_size: int = 2):
+        self.max_size = max_size
+        self._idle = []
+        self._created = 0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        """변환기를 빌려옵니다. 모두 사용 중이고 상한에 도달했으면 반납될 때까지 대기합니다."""
+        with self._condition:
+            while not self._idle and self._created >= self.max_size:
+                self._condition.wait()
+
+            if self._idle:
+                return self._idle.pop()
+
+            # 생성 중 실패하면 슬롯을 되돌리기 위해 먼저 예약
+            self._created += 1
+
+        try:
+            converter = _create_docling_converter()
+        except BaseException:
+            with self._condition:
+                self._created -= 1
+                self._condition.notify()
+            raise
+
+        logger.info(f"Docling 변환기 생성 ({self._created}/{self.max_size})")
+        return converter
+
+    def release(self, converter) -> None:
+        """사용이 끝난 변환기를 반납합니다."""
+        with self._condition:
+            self._idle.append(converter)
+            self._condition.notify()
+
+    def warm_up(self) -> bool:
+        """
+        변환기를 미리 생성하고 PDF 파이프라인(모델)을 로드해 둡니다.
+
+        워커 프로세스 시작 시 호출하면 첫 PDF의 지연 시간에 모델 로딩이 포함되지 않습니다.
+        """
+        try:
+            with Timer("Docling 변환기 워밍업", totalTimeChk=False):
+                converter = self.acquire()
+                try:
+                    from docling.datamodel.base_models import InputFormat
+
+                    if hasattr(converter, "initialize_pipeline"):
+                        converter.initialize_pipeline(InputFormat.PDF)
+                finally:
+                    self.release(converter)
+            return True
+        except Exception as e:
+            logger.warning(f"Docling 변환기 워밍업 실패 (첫 변환 시 로드): {e}")
+            return False
+
+
+docling_converter_pool = DoclingConverterPool()
+
+
 def convert_pdf_to_md_docling(pdf_path: str, output_path: str = None) -> bool:
     """
     Docling을 사용하여 PDF 파일을 Markdown으로 변환합니다.
@@ -1368,141 +1482,111 @@ def convert_pdf_to_md_docling(pdf_path: str, output_path: str = None) -> bool:
             return False
 
         with Timer(f"PDF 파일 변환 (Docling): {pdf_path}", totalTimeChk=False):
+            # 프로세스 공용 DocumentConverter 사용 (레이아웃/표 모델 재로딩 방지)
             try:
-                from docling.document_converter import (
-                    DocumentConverter,
-                    PdfFormatOption,
-                )
-                from docling.datamodel.base_models import InputFormat
-                from docling.datamodel.pipeline_options import (
-                    OcrOptions,
-                    PdfPipelineOptions,
-                    TableStructureOptions,
-                )
-
-                logger.info("!!docling IMPORT!!!")
+                converter = docling_converter_pool.acquire()
             except ImportError as e:
                 logger.error(f"Docling 라이브러리를 import할 수 없습니다: {e}")
                 logger.info("pip install docling을 실행해주세요")
                 return False
 
-            # 표 구조 보존 옵션 설정 (사용자 요구사항)
             try:
-                table_options = TableStructureOptions(
-                    do_cell_matching=False,  # 셀 매칭 활성화
-                )
-
-                pipeline_options = PdfPipelineOptions(
-                    do_table_structure=True,  # 표 구조 인식 활성화
-                    table_structure_options=table_options,
-                )
-
-                pipeline_options.do_ocr = True
-                pipeline_options.ocr_options.use_gpu = False
-
-                pdf_format_options = PdfFormatOption(pipeline_options=pipeline_options)
-                converter = DocumentConverter(
-                    format_options={InputFormat.PDF: pdf_format_options}
-                )
-                logger.info("표 구조 인식 활성화된 DocumentConverter 생성 완료")
-            except Exception as opt_error:
-                logger.warning(f"고급 옵션 설정 실패, 기본 변환기 사용: {opt_error}")
-                converter = DocumentConverter()
-
-            # PDF 파일 유효성 검사 (개선된 버전)
-            try:
-                with open(pdf_path, "rb") as f:
-                    header = f.read(4)
-                    if header != b"%PDF":
-                        logger.warning(
-                            f"유효하지 않은 PDF 파일 (헤더 불일치): {pdf_path}"
-                        )
-                        return False
-
-                    # PDF 파일 구조 기본 검사 - 더 큰 범위를 검사하거나 건너뛰기
-                    # Root 객체는 파일 어디에나 있을 수 있으므로 전체 파일을 검사하거나
-                    # 또는 이 검사를 건너뛰고 변환 시도를 하는 것이 더 좋을 수 있음
-                    file_size = os.path.getsize(pdf_path)
-                    if file_size > 0:
-                        # 파일이 비어있지 않으면 변환 시도
-                        f.seek(0)
-                        # 파일이 너무 크면 처음 10KB만 확인, 작으면 전체 확인
-                        check_size = min(10240, file_size)  # 10KB 또는 파일 전체
-                        content = f.read(check_size)
-
-                        # Root 객체가 없어도 경고만 출력하고 변환 시도
-                        if b"/Root" not in content:
+                # PDF 파일 유효성 검사 (개선된 버전)
+                try:
+                    with open(pdf_path, "rb") as f:
+                        header = f.read(4)
+                        if header != b"%PDF":
                             logger.warning(
-                                f"PDF 파일에 Root 객체가 처음 {check_size}바이트 내에 없음: {pdf_path}"
+                                f"유효하지 않은 PDF 파일 (헤더 불일치): {pdf_path}"
                             )
-                            logger.info(
-                                "Root 객체가 뒤쪽에 있을 수 있으니 변환 시도를 계속합니다..."
-                            )
-                            # return False를 제거하여 변환 계속 진행
-                    else:
-                        logger.error(f"PDF 파일이 비어있음: {pdf_path}")
-                        return False
+                            return False
+
+                        # PDF 파일 구조 기본 검사 - 더 큰 범위를 검사하거나 건너뛰기
+                        # Root 객체는 파일 어디에나 있을 수 있으므로 전체 파일을 검사하거나
+                        # 또는 이 검사를 건너뛰고 변환 시도를 하는 것이 더 좋을 수 있음
+                        file_size = os.path.getsize(pdf_path)
+                        if file_size > 0:
+                            # 파일이 비어있지 않으면 변환 시도
+                            f.seek(0)
+                            # 파일이 너무 크면 처음 10KB만 확인, 작으면 전체 확인
+                            check_size = min(10240, file_size)  # 10KB 또는 파일 전체
+                            content = f.read(check_size)
+
+                            # Root 객체가 없어도 경고만 출력하고 변환 시도
+                            if b"/Root" not in content:
+                                logger.warning(
+                                    f"PDF 파일에 Root 객체가 처음 {check_size}바이트 내에 없음: {pdf_path}"
+                                )
+                                logger.info(
+                                    "Root 객체가 뒤쪽에 있을 수 있으니 변환 시도를 계속합니다..."
+                                )
+                                # return False를 제거하여 변환 계속 진행
+                        else:
+                            logger.error(f"PDF 파일이 비어있음: {pdf_path}")
+                            return False
 
-            except Exception as e:
-                logger.error(f"PDF 파일 읽기 실패: {e}")
-                # 읽기 실패해도 변환은 시도해볼 수 있음
-                logger.info("PDF 파일 읽기 실패했지만 변환 시도를 계속합니다...")
+                except Exception as e:
+                    logger.error(f"PDF 파일 읽기 실패: {e}")
+                    # 읽기 실패해도 변환은 시도해볼 수 있음
+                    logger.info("PDF 파일 읽기 실패했지만 변환 시도를 계속합니다...")
 
-            # PDF 변환 실행
-            try:
-                conversion_result = converter.convert(pdf_path)
+                # PDF 변환 실행
+                try:
+                    conversion_result = converter.convert(pdf_path)
 
-                # Markdown으로 내보내기
-                markdown_content = conversion_result.document.export_to_markdown()
-                # logger.info(markdown_content)
+                    # Markdown으로 내보내기
+                    markdown_content = conversion_result.document.export_to_markdown()
+                    # logger.info(markdown_content)
 
-                # 내용이 비어있는지 확인
-                if not markdown_content or not markdown_content.strip():
-                    logger.warning(f"Docling 변환 결과가 비어있음: {pdf_path}")
-                    return convert_pdf_to_md_markitdown_fallback(pdf_path, output_path)
+                    # 내용이 비어있는지 확인
+                    if not markdown_content or not markdown_content.strip():
+                        logger.warning(f"Docling 변환 결과가 비어있음: {pdf_path}")
+                        return convert_pdf_to_md_markitdown_fallback(pdf_path, output_path)
 
-                # 파일에 저장
-                with open(output_path, "w", encoding="utf-8") as f:
-                    f.write(markdown_content)
+                    # 파일에 저장
+                    with open(output_path, "w", encoding="utf-8") as f:
+                        f.write(markdown_content)
 
-                logger.info(f"Docling PDF 변환 완료: {output_path}")
-                return True
+                    logger.info(f"Docling PDF 변환 완료: {output_path}")
+                    return True
 
-            except UnicodeDecodeError as ude:
-                logger.warning(f"Docling PDF 인코딩 오류 감지: {pdf_path} - {ude}")
+                except UnicodeDecodeError as ude:
+                    logger.warning(f"Docling PDF 인코딩 오류 감지: {pdf_path} - {ude}")
 
-                # 인코딩 자동 감지 및 재시도
-                detected_encoding = _detect_pdf_encoding(pdf_path)
-                if detected_encoding and detected_encoding.lower() != 'utf-8':
-                    logger.info(f"감지된 인코딩: {detected_encoding}, 재변환 시도")
-                    try:
-                        # 감지된 인코딩으로 PDF 재처리 시도
-                        conversion_result = converter.convert(pdf_path)
-                        markdown_content = conversion_result.document.export_to_markdown()
+                    # 인코딩 자동 감지 및 재시도
+                    detected_encoding = _detect_pdf_encoding(pdf_path)
+                    if detected_encoding and detected_encoding.lower() != 'utf-8':
+                        logger.info(f"감지된 인코딩: {detected_encoding}, 재변환 시도")
+                        try:
+                            # 감지된 인코딩으로 PDF 재처리 시도
+                            conversion_result = converter.convert(pdf_path)
+                            markdown_content = conversion_result.document.export_to_markdown()
 
-                        if markdown_content and markdown_content.strip():
-                            # 인코딩 수정 후 저장
-                            try:
-                                # 감지된 인코딩으로 디코드 후 UTF-8로 재인코딩
-                                if isinstance(markdown_content, bytes):
-                                    markdown_content = markdown_content.decode(detected_encoding, errors='replace')
+                            if markdown_content and markdown_content.strip():
+                                # 인코딩 수정 후 저장
+                                try:
+                                    # 감지된 인코딩으로 디코드 후 UTF-8로 재인코딩
+                                    if isinstance(markdown_content, bytes):
+                                        markdown_content = markdown_content.decode(detected_encoding, errors='replace')
 
-                                with open(output_path, "w", encoding="utf-8") as f:
-                                    f.write(markdown_content)
+                                    with open(output_path, "w", encoding="utf-8") as f:
+                                        f.write(markdown_content)
 
-                                logger.info(f"인코딩 수정 후 Docling 변환 완료: {output_path}")
-                                return True
-                            except Exception as enc_e:
-                                logger.warning(f"인코딩 변환 실패: {enc_e}")
-                    except Exception as retry_e:
-                        logger.warning(f"인코딩 수정 후 재시도 실패: {retry_e}")
-
-                logger.info(f"인코딩 오류로 markitdown 폴백: {pdf_path}")
-                return convert_pdf_to_md_markitdown_fallback(pdf_path, output_path)
-            except Exception as conv_e:
-                logger.warning(f"Docling 변환 실행 중 오류: {pdf_path} - {conv_e}")
-                logger.info(f"Docling 변환 실패, markitdown 폴백: {pdf_path}")
-                return convert_pdf_to_md_markitdown_fallback(pdf_path, output_path)
+                                    logger.info(f"인코딩 수정 후 Docling 변환 완료: {output_path}")
+                                    return True
+                                except Exception as enc_e:
+                                    logger.warning(f"인코딩 변환 실패: {enc_e}")
+                        except Exception as retry_e:
+                            logger.warning(f"인코딩 수정 후 재시도 실패: {retry_e}")
+
+                    logger.info(f"인코딩 오류로 markitdown 폴백: {pdf_path}")
+                    return convert_pdf_to_md_markitdown_fallback(pdf_path, output_path)
+                except Exception as conv_e:
+                    logger.warning(f"Docling 변환 실행 중 오류: {pdf_path} - {conv_e}")
+                    logger.info(f"Docling 변환 실패, markitdown 폴백: {pdf_path}")
+                    return convert_pdf_to_md_markitdown_fallback(pdf_path, output_path)
+            finally:
+                docling_converter_pool.release(converter)
 
     except UnicodeDecodeError as e:
         logger.warning(f"Docling PDF 인코딩 오류: {pdf_path} - {e}")
@@ -0,0 +1,214 @@
+"""
+사전 처리 대상 디렉토리 스캐너 (os.scandir + mtime 워터마크)
+
+수십만 개 항목이 쌓이는 incremental 트리에서 rglob + exists/glob/iterdir 조합은
+디렉토리마다 여러 번의 시스템 콜을 발생시킵니다. 이 스캐너는 os.scandir로 한 번
+읽어 디렉토리를 분류하고, 사이트별 상태 파일에 디렉토리 mtime/inode를 기록해
+다음 실행 시 변경되지 않은 디렉토리는 목록을 다시 읽지 않습니다.
+
+상태 파일 구조:
+{state_dir}/{site_code}_{루트 경로 해시}.json
+{
+    "version": 1,
+    "root": "/abs/path/to/site_dir",
+    "flat": false,
+    "dirs": {"상대경로": [mtime_ns, inode, flags, [하위 디렉토리명, ...]], ...}
+}
+
+- 디렉토리 mtime은 직속 항목이 추가/삭제/이름 변경될 때만 바뀌므로,
+  mtime/inode가 같으면 저장된 분류 결과와 하위 디렉토리 목록을 그대로 사용합니다.
+- 하위 디렉토리의 변경은 상위 디렉토리 mtime에 전파되지 않으므로 변경되지 않은
+  디렉토리도 stat 1회로 재확인하며 내려갑니다 (scandir는 변경된 디렉토리만 수행).
+- 같은 site_code라도 루트(--data 경로)가 다르면 별도 상태 파일을 사용하므로,
+  여러 데이터 디렉토리를 번갈아 처리해도 서로의 상태를 덮어쓰지 않습니다.
+- 스캔이 끝까지 성공한 경우에만 임시 파일 → os.replace로 상태를 기록합니다.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.config.config import ConfigManager
+from src.config.logConfig import setup_logging
+
+logger = setup_logging(__name__)
+
+STATE_VERSION = 1
+
+# 디렉토리 분류 플래그
+FLAG_CONTENT_MD = 1
+FLAG_JSON = 2
+FLAG_NOT_EMPTY = 4
+
+
+class DirectoryScanner:
+    """사이트 디렉토리에서 사전 처리 대상 디렉토리를 찾는 증분 스캐너"""
+
+    def __init__(
+        self,
+        state_dir: Optional[str | Path] = None,
+        incremental: Optional[bool] = None,
+    ):
+        scan_config = ConfigManager().get_section("directory_scan")
+
+        self.incremental = (
+            scan_config.get("incremental", True) if incremental is None else incremental
+        )
+        self.state_dir = Path(state_dir or scan_config.get("state_dir", "cache/scan_state/"))
+        self.stats = {"listed": 0, "reused": 0}
+
+    @staticmethod
+    def _resolve_root(site_dir: Path) -> str:
+        return str(Path(site_dir).resolve())
+
+    def _state_path(self, site_code: str, site_dir: Path) -> Path:
+        root_hash = hashlib.md5(self._resolve_root(site_dir).encode("utf-8")).hexdigest()[:12]
+        return self.state_dir / f"{site_code}_{root_hash}.json"
+
+    def _load_state(self, site_code: str, site_dir: Path, flat: bool) -> Dict[str, list]:
+        """이전 스캔 상태를 읽습니다. 루트/구조가 다르거나 손상되었으면 빈 상태."""
+        if not self.incremental:
+            return {}
+
+        state_path = self._state_path(site_code, site_dir)
+        try:
+            with open(state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"스캔 상태 파일 읽기 실패, 전체 스캔 진행 ({state_path.name}): {e}")
+            return {}
+
+        if (
+            state.get("version") != STATE_VERSION
+            or state.get("root") != self._resolve_root(site_dir)
+            or state.get("flat") != flat
+        ):
+            logger.info(f"스캔 상태 불일치, 전체 스캔 진행: {site_code}")
+            return {}
+
+        return state.get("dirs", {})
+
+    def _save_state(self, site_code: str, site_dir: Path, flat: bool, dirs: Dict[str, list]) -> None:
+        """스캔 상태를 원자적으로 기록합니다."""
+        state_path = self._state_path(site_code, site_dir)
+        state = {
+            "version": STATE_VERSION,
+            "root": self._resolve_root(site_dir),
+            "flat": flat,
+            "dirs": dirs,
+        }
+
+        try:
+            self.state_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.state_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(state, f, ensure_ascii=False, separators=(",", ":"))
+                os.replace(tmp_path, state_path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            logger.warning(f"스캔 상태 파일 저장 실패 ({state_path.name}): {e}")
+
+    def _list_directory(self, path: str) -> tuple[int, List[str]]:
+        """디렉토리를 한 번 읽어 분류 플래그와 하위 디렉토리 목록을 반환합니다."""
+        flags = 0
+        subdirs = []
+
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    flags |= FLAG_NOT_EMPTY
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    elif entry.name == "content.md":
+                        flags |= FLAG_CONTENT_MD
+                    elif entry.name.endswith(".json"):
+                        flags |= FLAG_JSON
+        except OSError as e:
+            logger.warning(f"디렉토리 읽기 실패 ({path}): {e}")
+
+        return flags, subdirs
+
+    def scan(self, site_dir: Path, site_code: str, flat: bool = False) -> List[Path]:
+        """
+        사전 처리 대상 디렉토리를 찾습니다.
+
+        Args:
+            site_dir: 사이트 디렉토리
+            site_code: 사이트 코드 (상태 파일명, 루트 경로 해시와 함께 사용)
+            flat: True이면 직속 하위 디렉토리만 검사 (API 사이트, content.md 필수)
+
+        Returns:
+            대상 디렉토리 목록 (정렬되지 않음)
+        """
+        start_time = time.time()
+        self.stats = {"listed": 0, "reused": 0}
+
+        old_dirs = self._load_state(site_code, site_dir, flat)
+        new_dirs = {}
+
+        root_stat = os.stat(site_dir)
+        stack = [(str(site_dir), ".", root_stat, 0)]
+
+        while stack:
+            path, rel, st, depth = stack.pop()
+
+            cached = old_dirs.get(rel)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_ino:
+                flags, subdirs = cached[2], cached[3]
+                self.stats["reused"] += 1
+            else:
+                flags, subdirs = self._list_directory(path)
+                self.stats["listed"] += 1
+
+            new_dirs[rel] = [st.st_mtime_ns, st.st_ino, flags, subdirs]
+
+            # 플랫 구조는 직속 하위 디렉토리까지만 확인
+            if flat and depth >= 1:
+                continue
+
+            for name in subdirs:
+                child_path = os.path.join(path, name)
+                try:
+                    child_stat = os.stat(child_path, follow_symlinks=False)
+                except FileNotFoundError:
+                    continue
+                child_rel = name if rel == "." else f"{rel}/{name}"
+                stack.append((child_path, child_rel, child_stat, depth + 1))
+
+        target_directories = []
+        for rel, (_, _, flags, _) in new_dirs.items():
+            if rel == ".":
+                continue
+
+            if flat:
+                # 모든 API 사이트는 content.md가 반드시 있어야 함
+                is_target = bool(flags & FLAG_CONTENT_MD)
+            else:
+                # content.md, JSON 파일 또는 비어 있지 않은 attachments 폴더가 있는 디렉토리
+                attachments = new_dirs.get(f"{rel}/attachments")
+                has_attachments = bool(attachments and attachments[2] & FLAG_NOT_EMPTY)
+                is_target = bool(flags & (FLAG_CONTENT_MD | FLAG_JSON)) or has_attachments
+
+            if is_target:
+                target_directories.append(site_dir / rel)
+
+        if self.incremental:
+            self._save_state(site_code, site_dir, flat, new_dirs)
+
+        logger.info(
+            f"디렉토리 스캔 완료: {site_code} - 디렉토리 {len(new_dirs)}개 "
+            f"(재조회 {self.stats['listed']}, 상태 재사용 {self.stats['reused']}), "
+            f"대상 {len(target_directories)}개, {time.time() - start_time:.1f}초"
+        )
+
+        return target_directories
@@ -8,31 +8,61 @@
 - 단일/다중 키 파라미터 모두 지원
 
 특징:
-- LRU 캐시로 도메인 설정 캐싱 (DB 쿼리 최소화)
+- 활성 domain_key_config 전체를 한 번에 읽어 도메인별 메모리 인덱스로 보관
+  (경로 패턴 사전 컴파일, JSON 필터 사전 파싱 → URL 키 추출은 메모리 연산만 수행)
+- refresh_interval마다 행 수 + CRC32 합계(버전)만 조회, 바뀐 경우에만 재로드
 - 단일 키, 이중 키, 삼중+ 키 모두 지원
 - 쿼리 파라미터 및 경로 기반 추출 지원
 """
 
+import hashlib
 import json
 import re
-from functools import lru_cache
+import threading
+import time
 from typing import Optional, List, Dict, Tuple
 from urllib.parse import urlparse, parse_qs
 import mysql.connector
 from mysql.connector import pooling
 
 
+# 컴파일 캐시에 없는 패턴 표시 (잘못된 패턴은 None으로 저장)
+_NOT_COMPILED = object()
+
+
 class DomainKeyExtractor:
     """도메인별 URL 키 추출기"""
 
-    def __init__(self, db_connection_pool=None, db_config=None):
+    # 설정 변경 감지용 버전 (활성 행 수, 행 CRC32 합계)
+    CONFIG_VERSION_SQL = """
+        SELECT
+            COUNT(*),
+            COALESCE(SUM(CRC32(CONCAT_WS('|',
+                domain, site_code, key_params, extraction_method,
+                path_pattern, query_param_filter
+            ))), 0)
+        FROM domain_key_config
+        WHERE is_active = TRUE
+    """
+
+    def __init__(self, db_connection_pool=None, db_config=None, refresh_interval: Optional[float] = 60):
         """
         Args:
             db_connection_pool: MySQL connection pool (선택)
             db_config: DB 설정 딕셔너리 (pool 없을 때)
+            refresh_interval: 설정 버전 확인 주기 (초, None이면 최초 1회만 로드)
         """
         self.pool = db_connection_pool
         self.db_config = db_config
+        self.refresh_interval = refresh_interval
+
+        # 도메인 설정 인덱스 {domain: [config, ...]} (None: 미로드)
+        self._config_index: Optional[Dict[str, List[Dict]]] = None
+        self._config_version: Optional[Tuple[int, int]] = None
+        self._compiled_patterns: Dict[str, Optional[re.Pattern]] = {}
+        self._checked_at = 0.0
+        self._loaded_at = None
+        self._index_lock = threading.Lock()
 
         # 폴백용 기본 우선순위 (DB 설정 없을 때)
         self.fallback_priority = [
@@ -89,10 +119,122 @@ class DomainKeyExtractor:
         else:
             raise ValueError("DB connection pool or config required")
 
-    @lru_cache(maxsize=2000)
+    def _ensure_configs(self, force: bool = False):
+        """
+        도메인 설정 인덱스 준비 (최초 1회 전체 로드, 이후 주기적으로 버전만 확인)
+
+        Args:
+            force: 확인 주기와 관계없이 버전을 즉시 확인
+        """
+        if not force and self._config_index is not None:
+            if self.refresh_interval is None:
+                return
+            if time.monotonic() - self._checked_at < self.refresh_interval:
+                return
+
+        with self._index_lock:
+            # 대기 중 다른 스레드가 먼저 확인했으면 생략
+            if not force and self._config_index is not None and (
+                self.refresh_interval is None
+                or time.monotonic() - self._checked_at < self.refresh_interval
+            ):
+                return
+
+            conn = None
+            try:
+                conn = self._get_connection()
+                cursor = conn.cursor()
+                cursor.execute(self.CONFIG_VERSION_SQL)
+                row = cursor.fetchone()
+                cursor.close()
+                version = (int(row[0]), int(row[1]))
+
+                if self._config_index is None or version != self._config_version:
+                    self._load_configs(conn, version)
+
+            except Exception as e:
+                # 기존 인덱스 유지 (최초 로드 실패면 빈 인덱스, 다음 확인 주기에 재시도)
+                print(f"⚠️  도메인 설정 로드 실패: {e}")
+                if self._config_index is None:
+                    self._config_index = {}
+
+            finally:
+                if conn is not None:
+                    conn.close()
+                self._checked_at = time.monotonic()
+
+    def _load_configs(self, conn, version: Tuple[int, int]):
+        """활성 domain_key_config 전체를 한 번에 읽어 도메인별 인덱스 생성"""
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute("""
+            SELECT
+                domain,
+                site_code,
+                key_params,
+                extraction_method,
+                path_pattern,
+                query_param_filter
+            FROM domain_key_config
+            WHERE is_active = TRUE
+            ORDER BY
+                CASE
+                    WHEN path_pattern IS NOT NULL THEN 1
+                    ELSE 2
+                END
+        """)
+        results = cursor.fetchall()
+        cursor.close()
+
+        index = {}
+        patterns = {}
+        for result in results:
+            try:
+                # JSON 문자열을 리스트/딕셔너리로 변환
+                result['key_params'] = json.loads(result['key_params'])
+                # query_param_filter가 있으면 JSON 파싱
+                if result.get('query_param_filter'):
+                    result['query_param_filter'] = json.loads(result['query_param_filter'])
+            except (TypeError, ValueError) as e:
+                print(f"⚠️  도메인 설정 파싱 실패: {result.get('domain')} - {e}")
+                continue
+
+            # 경로 패턴 사전 컴파일 (fragment용 /#/ 제거 패턴 포함)
+            pattern = result.get('path_pattern')
+            if pattern:
+                for variant in (pattern, pattern.replace('/#/', '/')):
+                    if variant not in patterns:
+                        try:
+                            patterns[variant] = re.compile(variant)
+                        except re.error as e:
+                            print(f"⚠️  잘못된 path_pattern: {result['domain']} - {variant} ({e})")
+                            patterns[variant] = None
+
+            # 도메인 내 순서는 쿼리 정렬(path_pattern 있는 설정 우선) 유지
+            # 호스트명은 대소문자를 구분하지 않으므로 소문자로 인덱싱
+            index.setdefault(result['domain'].lower(), []).append(result)
+
+        self._compiled_patterns = patterns
+        self._config_index = index
+        self._config_version = version
+        self._loaded_at = time.time()
+        print(f"✅ 도메인 설정 로드 완료: {len(index)}개 도메인, {len(results)}개 설정")
+
+    def _search(self, pattern: str, value: str):
+        """사전 컴파일된 패턴으로 검색 (잘못된 패턴은 매칭 실패)"""
+        compiled = self._compiled_patterns.get(pattern, _NOT_COMPILED)
+        if compiled is _NOT_COMPILED:
+            try:
+                compiled = re.compile(pattern)
+            except re.error:
+                compiled = None
+            self._compiled_patterns[pattern] = compiled
+        if compiled is None:
+            return None
+        return compiled.search(value)
+
     def get_domain_configs(self, domain: str) -> List[Dict]:
         """
-        도메인의 모든 설정 조회 (게시판별 설정 포함, 캐시됨)
+        도메인의 모든 설정 조회 (게시판별 설정 포함, 메모리 인덱스)
 
         Args:
             domain: 도메인 (예: www.k-startup.go.kr)
@@ -106,44 +248,8 @@ class DomainKeyExtractor:
                 'path_pattern': None
             }, ...]
         """
-        try:
-            conn = self._get_connection()
-            cursor = conn.cursor(dictionary=True)
-
-            cursor.execute("""
-                SELECT
-                    domain,
-                    site_code,
-                    key_params,
-                    extraction_method,
-                    path_pattern,
-                    query_param_filter
-                FROM domain_key_config
-                WHERE domain = %s AND is_active = TRUE
-                ORDER BY
-                    CASE
-                        WHEN path_pattern IS NOT NULL THEN 1
-                        ELSE 2
-                    END
-            """, (domain,))
-
-            results = cursor.fetchall()
-            cursor.close()
-            conn.close()
-
-            if results:
-                # JSON 문자열을 리스트/딕셔너리로 변환
-                for result in results:
-                    result['key_params'] = json.loads(result['key_params'])
-                    # query_param_filter가 있으면 JSON 파싱
-                    if result.get('query_param_filter'):
-                        result['query_param_filter'] = json.loads(result['query_param_filter'])
-
-            return results if results else []
-
-        except Exception as e:
-            print(f"⚠️  도메인 설정 조회 실패: {domain} - {e}")
-            return []
+        self._ensure_configs()
+        return self._config_index.get(domain.lower(), [])
 
     def get_domain_config(self, domain: str, path: str = None, query_params: Dict = None) -> Optional[Dict]:
         """
@@ -157,8 +263,10 @@ class DomainKeyExtractor:
         Returns:
             매칭된 설정 또는 None
         """
-        configs = self.get_domain_configs(domain)
+        return self._select_config(self.get_domain_configs(domain), path, query_params)
 
+    def _select_config(self, configs: List[Dict], path: str = None, query_params: Dict = None) -> Optional[Dict]:
+        """도메인 설정 목록에서 경로 + 쿼리 파라미터 필터에 맞는 설정 선택"""
         if not configs:
             return None
 
@@ -169,7 +277,7 @@ class DomainKeyExtractor:
                 path_match = True
                 if config.get('path_pattern'):
                     if path:
-                        path_match = bool(re.search(config['path_pattern'], path))
+                        path_match = bool(self._search(config['path_pattern'], path))
                     else:
                         path_match = False  # path_pattern 있는데 path 없으면 매칭 실패
 
@@ -224,37 +332,50 @@ class DomainKeyExtractor:
         """
         try:
             parsed = urlparse(url)
-            domain = parsed.netloc
-            path = parsed.path
-            fragment = parsed.fragment  # 🆕 fragment 추가 (예: #/pbanc/532)
-            # Phase 15: keep_blank_values=True로 빈 파라미터도 유지
-            # 예: ?searchCtgry=&integrDeptCode= → {'searchCtgry': [''], 'integrDeptCode': ['']}
-            query_params = parse_qs(parsed.query, keep_blank_values=True)
-
-            # 1. 도메인 설정 조회 (경로 + 쿼리 파라미터 필터 매칭 지원)
-            # 🆕 fragment가 있으면 path 대신 fragment를 사용하여 설정 조회
-            search_path = fragment if fragment else path
-            config = self.get_domain_config(domain, search_path, query_params)
-
-            if config:
-                # 설정된 방법으로 추출
-                if config['extraction_method'] == 'query_params':
-                    return self._extract_by_query_params(domain, query_params, config['key_params'])
-                elif config['extraction_method'] == 'path_pattern':
-                    # 🆕 path_pattern은 fragment 또는 path에 적용
-                    return self._extract_by_path_pattern(domain, search_path, config['path_pattern'])
-                elif config['extraction_method'] == 'mixed':
-                    return self._extract_mixed(domain, parsed, query_params, config)
-
-            # 2. 설정 없으면 NULL 반환 (fallback 비활성화)
-            # domain_key_config에 설정되지 않은 도메인은 url_key를 생성하지 않음
-            # 이는 중복 체크가 불가능한 URL에 대해 부정확한 url_key 생성을 방지함
-            return None
+            return self._extract_parsed(parsed, self.get_domain_configs(parsed.netloc))
 
         except Exception as e:
             print(f"⚠️  URL 키 추출 실패: {url} - {e}")
             return None
 
+    def _extract_parsed(self, parsed, configs: List[Dict]) -> Optional[str]:
+        """
+        urlparse 결과와 해당 도메인 설정 목록으로 키 추출
+
+        Args:
+            parsed: urlparse 결과
+            configs: 도메인 설정 목록 (get_domain_configs 결과)
+        """
+        # 설정 없으면 NULL 반환 (fallback 비활성화)
+        # domain_key_config에 설정되지 않은 도메인은 url_key를 생성하지 않음
+        # 이는 중복 체크가 불가능한 URL에 대해 부정확한 url_key 생성을 방지함
+        if not configs:
+            return None
+
+        domain = parsed.netloc
+        path = parsed.path
+        fragment = parsed.fragment  # 🆕 fragment 추가 (예: #/pbanc/532)
+        # Phase 15: keep_blank_values=True로 빈 파라미터도 유지
+        # 예: ?searchCtgry=&integrDeptCode= → {'searchCtgry': [''], 'integrDeptCode': ['']}
+        query_params = parse_qs(parsed.query, keep_blank_values=True)
+
+        # 1. 도메인 설정 선택 (경로 + 쿼리 파라미터 필터 매칭 지원)
+        # 🆕 fragment가 있으면 path 대신 fragment를 사용하여 설정 조회
+        search_path = fragment if fragment else path
+        config = self._select_config(configs, search_path, query_params)
+
+        if config:
+            # 설정된 방법으로 추출
+            if config['extraction_method'] == 'query_params':
+                return self._extract_by_query_params(domain, query_params, config['key_params'])
+            elif config['extraction_method'] == 'path_pattern':
+                # 🆕 path_pattern은 fragment 또는 path에 적용
+                return self._extract_by_path_pattern(domain, search_path, config['path_pattern'])
+            elif config['extraction_method'] == 'mixed':
+                return self._extract_mixed(domain, parsed, query_params, config)
+
+        return None
+
     def _extract_by_query_params(
         self, domain: str, query_params: Dict, key_params: List[str]
     ) -> Optional[str]:
@@ -337,7 +458,7 @@ class DomainKeyExtractor:
         # 예: /#/pbanc/([0-9]+) → /pbanc/([0-9]+)
         pattern = pattern.replace('/#/', '/')
 
-        match = re.search(pattern, path)
+        match = self._search(pattern, path)
         if match:
             # 매칭된 그룹들을 키로 사용
             groups = match.groups()
@@ -369,7 +490,7 @@ class DomainKeyExtractor:
         # 경로에서 값만 추출 (domain 제외)
         path_value = None
         if config.get('path_pattern'):
-            match = re.search(config['path_pattern'], parsed.path)
+            match = self._search(config['path_pattern'], parsed.path)
             if match and match.groups():
                 path_value = '_'.join(str(g) for g in match.groups())
 
@@ -439,6 +560,53 @@ class DomainKeyExtractor:
 
         return None
 
+    def bulk_extract_keys(self, urls: List[str]) -> Tuple[List[Optional[str]], List[Optional[str]]]:
+        """
+        여러 URL에서 키와 키 해시 일괄 추출
+
+        설정 인덱스 버전 확인은 배치당 1회만 수행하고, URL을 도메인별로 묶어
+        도메인 설정을 한 번만 조회합니다. 설정이 없는 도메인의 URL은
+        쿼리 파싱 없이 바로 None으로 처리합니다.
+
+        Args:
+            urls: URL 리스트
+
+        Returns:
+            (url_keys, url_key_hashes) - urls와 같은 순서의 리스트
+            url_key_hash는 DB GENERATED COLUMN과 같은 MD5(url_key), 키가 없으면 None
+        """
+        self._ensure_configs()
+        index = self._config_index
+
+        url_keys: List[Optional[str]] = [None] * len(urls)
+
+        # 도메인별 그룹화 (urlparse는 URL당 1회)
+        groups: Dict[str, List[Tuple[int, object]]] = {}
+        for i, url in enumerate(urls):
+            try:
+                parsed = urlparse(url)
+            except Exception as e:
+                print(f"⚠️  URL 키 추출 실패: {url} - {e}")
+                continue
+            groups.setdefault(parsed.netloc.lower(), []).append((i, parsed))
+
+        for domain, items in groups.items():
+            configs = index.get(domain)
+            if not configs:
+                continue
+
+            for i, parsed in items:
+                try:
+                    url_keys[i] = self._extract_parsed(parsed, configs)
+                except Exception as e:
+                    print(f"⚠️  URL 키 추출 실패: {urls[i]} - {e}")
+
+        url_key_hashes = [
+            hashlib.md5(url_key.encode('utf-8')).hexdigest() if url_key else None
+            for url_key in url_keys
+        ]
+        return url_keys, url_key_hashes
+
     def bulk_extract(self, urls: List[str]) -> List[Tuple[str, Optional[str]]]:
         """
         여러 URL에서 키 일괄 추출
@@ -449,11 +617,8 @@ class DomainKeyExtractor:
         Returns:
             [(url, url_key), ...] 튜플 리스트
         """
-        results = []
-        for url in urls:
-            url_key = self.extract_url_key(url)
-            results.append((url, url_key))
-        return results
+        url_keys, _ = self.bulk_extract_keys(urls)
+        return list(zip(urls, url_keys))
 
     def validate_url_key(self, url: str, expected_key: str) -> bool:
         """
@@ -470,20 +635,21 @@ class DomainKeyExtractor:
         return extracted_key == expected_key
 
     def clear_cache(self):
-        """도메인 설정 캐시 클리어"""
-        self.get_domain_configs.cache_clear()
-        print("✅ 도메인 설정 캐시 클리어 완료")
+        """도메인 설정 인덱스 즉시 재로드 (버전과 관계없이 전체 조회)"""
+        with self._index_lock:
+            self._config_version = None
+        self._ensure_configs(force=True)
+        print("✅ 도메인 설정 인덱스 재로드 완료")
 
     def get_cache_info(self) -> Dict:
-        """캐시 통계 조회"""
-        cache_info = self.get_domain_configs.cache_info()
+        """도메인 설정 인덱스 정보 조회"""
+        index = self._config_index or {}
         return {
-            'hits': cache_info.hits,
-            'misses': cache_info.misses,
-            'maxsize': cache_info.maxsize,
-            'currsize': cache_info.currsize,
-            'hit_rate': cache_info.hits / (cache_info.hits + cache_info.misses)
-                if (cache_info.hits + cache_info.misses) > 0 else 0
+            'domains': len(index),
+            'configs': sum(len(configs) for configs in index.values()),
+            'version': self._config_version,
+            'loaded_at': self._loaded_at,
+            'compiled_patterns': sum(1 for p in self._compiled_patterns.values() if p is not None),
         }
 
 
@@ -528,12 +694,12 @@ if __name__ == "__main__":
         print(f"추출된 키:")
         print(f"  {url_key}")
 
-    # 캐시 통계
+    # 설정 인덱스 정보
     print("\n" + "=" * 60)
-    print("캐시 통계")
+    print("도메인 설정 인덱스")
     print("=" * 60)
     cache_info = extractor.get_cache_info()
-    print(f"  Hits: {cache_info['hits']}")
-    print(f"  Misses: {cache_info['misses']}")
-    print(f"  Hit Rate: {cache_info['hit_rate']:.2%}")
-    print(f"  Cache Size: {cache_info['currsize']}/{cache_info['maxsize']}")
+    print(f"  Domains: {cache_info['domains']}")
+    print(f"  Configs: {cache_info['configs']}")
+    print(f"  Compiled Patterns: {cache_info['compiled_patterns']}")
+    print(f"  Version: {cache_info['version']}")
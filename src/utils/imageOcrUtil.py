@@ -7,6 +7,7 @@ import base64
 import io
 from math import log
 import re
+import threading
 from pathlib import Path
 
 # 선택적 import - OCR 기능을 사용할 때만 로드
@@ -27,6 +28,9 @@ except ImportError:
 try:
     from PIL import Image
 
+    # Pillow 9.1+는 Image.Resampling, 이전 버전은 Image.BICUBIC
+    BICUBIC = getattr(Image, "Resampling", Image).BICUBIC
+
     PIL_AVAILABLE = True
 except ImportError:
     PIL_AVAILABLE = False
@@ -53,6 +57,81 @@ except ImportError:
 
 logger = setup_logging(__name__)
 
+# 긴 변 기준 최대 해상도 - 이보다 큰 이미지(포스터 등)는 축소 후 OCR 수행
+OCR_MAX_IMAGE_DIMENSION = 2048
+
+# EasyOCR 인식 단계 배치 크기
+OCR_RECOGNIZER_BATCH_SIZE = 8
+
+# EasyOCR 결과 채택 최소 신뢰도
+OCR_MIN_CONFIDENCE = 0.2
+
+# 프로세스 단위로 공유하는 EasyOCR 리더 (모델 가중치 로드는 프로세스당 1회)
+_shared_reader = None
+_shared_reader_langs = None
+_shared_reader_failed = False
+_shared_reader_lock = threading.Lock()
+# torch 추론은 스레드 안전을 보장하지 않으므로 readtext 호출을 직렬화
+_shared_reader_infer_lock = threading.Lock()
+
+_shared_processor = None
+_shared_processor_lock = threading.Lock()
+
+
+def _get_shared_easyocr_reader():
+    """
+    프로세스 공유 EasyOCR 리더를 반환합니다. 최초 호출 시에만 모델을 로드합니다.
+
+    Returns:
+        (reader, supported_langs) 튜플. 초기화에 실패하면 (None, None)
+    """
+    global _shared_reader, _shared_reader_langs, _shared_reader_failed
+
+    if _shared_reader is not None or _shared_reader_failed:
+        return _shared_reader, _shared_reader_langs
+
+    with _shared_reader_lock:
+        if _shared_reader is not None or _shared_reader_failed:
+            return _shared_reader, _shared_reader_langs
+
+        try:
+            # 한국어와 영어 지원 확인 및 리더 초기화
+            logger.info("EasyOCR 리더 초기화 중... (우선순위 1)")
+
+            # ko, en 지원 여부는 설치된 모델에 따라 다름
+            # 모델이 없으면 자동으로 다운로드함
+            try:
+                _shared_reader = easyocr.Reader(["ko", "en"], gpu=True)
+                _shared_reader_langs = ["ko", "en"]
+                logger.info("EasyOCR 리더 초기화 완료 (한국어, 영어)")
+            except Exception as lang_error:
+                # 한국어 모델이 없으면 영어만 사용
+                logger.warning(f"한국어 모델 로드 실패: {lang_error}")
+                logger.info("영어 전용 모드로 시도...")
+                _shared_reader = easyocr.Reader(["en"], gpu=True)
+                _shared_reader_langs = ["en"]
+                logger.info("EasyOCR 리더 초기화 완료 (영어만)")
+
+        except Exception as e:
+            logger.warning(f"EasyOCR 초기화 실패, Tesseract로 폴백: {e}")
+            _shared_reader = None
+            _shared_reader_langs = None
+            # 실패한 초기화를 이미지마다 반복하지 않도록 기록
+            _shared_reader_failed = True
+
+    return _shared_reader, _shared_reader_langs
+
+
+def get_shared_ocr_processor() -> "ImageOCRProcessor":
+    """프로세스 공유 ImageOCRProcessor 인스턴스를 반환합니다."""
+    global _shared_processor
+
+    if _shared_processor is None:
+        with _shared_processor_lock:
+            if _shared_processor is None:
+                _shared_processor = ImageOCRProcessor(lazy_init=False)
+    return _shared_processor
+
 
 class ImageOCRProcessor:
     """이미지 OCR 처리를 담당하는 클래스"""
@@ -75,29 +154,10 @@ class ImageOCRProcessor:
     def _initialize_reader(self):
         """OCR 리더를 지연 초기화합니다."""
         try:
-            # 1. EasyOCR 우선 초기화 (우선순위 1)
+            # 1. EasyOCR 우선 초기화 (우선순위 1) - 프로세스 공유 리더 사용
             if EASYOCR_AVAILABLE:
-                try:
-                    # 한국어와 영어 지원 확인 및 리더 초기화
-                    logger.info("EasyOCR 리더 초기화 중... (우선순위 1)")
-
-                    # ko, en 지원 여부는 설치된 모델에 따라 다름
-                    # 모델이 없으면 자동으로 다운로드함
-                    try:
-                        self.reader = easyocr.Reader(["ko", "en"], gpu=True)
-                        self.supported_langs = ["ko", "en"]
-                        logger.info("EasyOCR 리더 초기화 완료 (한국어, 영어)")
-                    except Exception as lang_error:
-                        # 한국어 모델이 없으면 영어만 사용
-                        logger.warning(f"한국어 모델 로드 실패: {lang_error}")
-                        logger.info("영어 전용 모드로 시도...")
-                        self.reader = easyocr.Reader(["en"], gpu=True)
-                        self.supported_langs = ["en"]
-                        logger.info("EasyOCR 리더 초기화 완료 (영어만)")
-
-                except Exception as e:
-                    logger.warning(f"EasyOCR 초기화 실패, Tesseract로 폴백: {e}")
-                    self.reader = None
+                self.reader, self.supported_langs = _get_shared_easyocr_reader()
+                if self.reader is None:
                     self.use_easyocr_first = False
 
             # 2. Tesseract 폴백 확인 (우선순위 2)
@@ -257,6 +317,168 @@ class ImageOCRProcessor:
             logger.error(f"이미지 파일 OCR 처리 중 오류 ({image_path}): {e}")
             return None
 
+    def extract_texts_from_image_files(
+        self, image_files: list[Path]
+    ) -> dict[Path, str | None]:
+        """
+        같은 폴더의 여러 이미지를 한 번에 OCR 처리합니다.
+        축소 후 크기가 같은 이미지끼리는 EasyOCR readtext_batched로 묶어서 실행합니다.
+
+        Args:
+            image_files: 이미지 파일 경로 목록
+
+        Returns:
+            {이미지 경로: 추출된 텍스트 또는 None}
+        """
+        results = {}
+
+        if not PIL_AVAILABLE:
+            logger.error(
+                "PIL(Pillow) 패키지가 설치되지 않았습니다. pip install Pillow로 설치해주세요."
+            )
+            return {image_file: None for image_file in image_files}
+
+        if self.use_easyocr_first and EASYOCR_AVAILABLE and self.reader is None:
+            self._initialize_reader()
+
+        # EasyOCR을 쓸 수 없으면 기존 단건 처리로 진행
+        if self.reader is None or not self.use_easyocr_first:
+            for image_file in image_files:
+                results[image_file] = self.extract_text_from_image_file(
+                    image_file, image_file.parent
+                )
+            return results
+
+        from PIL import Image as PILImage
+        import numpy as np
+
+        # 1. 이미지 로드 및 축소 후 크기별로 그룹화
+        prepared = {}
+        groups = {}
+        for image_file in image_files:
+            try:
+                with PILImage.open(image_file) as image:
+                    image.load()
+                    image = self._prepare_image(image)
+                prepared[image_file] = image
+                groups.setdefault(image.size, []).append(image_file)
+            except Exception as e:
+                logger.error(f"이미지 파일 로드 실패 ({image_file}): {e}")
+                results[image_file] = None
+
+        # 2. EasyOCR 실행 (같은 크기 그룹은 배치 처리)
+        for size, group_files in groups.items():
+            arrays = [np.array(prepared[image_file]) for image_file in group_files]
+            try:
+                if len(arrays) > 1 and hasattr(self.reader, "readtext_batched"):
+                    logger.debug(f"EasyOCR 배치 실행: {len(arrays)}개 이미지 ({size[0]}x{size[1]})")
+                    with _shared_reader_infer_lock:
+                        batch_results = self.reader.readtext_batched(
+                            arrays, batch_size=OCR_RECOGNIZER_BATCH_SIZE
+                        )
+                else:
+                    batch_results = [self._readtext(array) for array in arrays]
+            except Exception as easyocr_error:
+                logger.warning(f"EasyOCR 배치 실패, 개별 처리로 폴백: {easyocr_error}")
+                batch_results = [
+                    self._readtext_or_none(image_file, array)
+                    for image_file, array in zip(group_files, arrays)
+                ]
+
+            for image_file, ocr_result in zip(group_files, batch_results):
+                text = self._combine_easyocr_results(ocr_result) if ocr_result else None
+
+                # 3. EasyOCR에서 텍스트를 얻지 못한 이미지는 Tesseract로 폴백
+                if not text:
+                    text = self._perform_tesseract(prepared[image_file])
+
+                if text:
+                    logger.info(
+                        f"이미지 파일에서 텍스트 추출 성공: {image_file.name}, {len(text)} 문자"
+                    )
+                else:
+                    logger.warning(
+                        f"이미지 파일에서 텍스트를 추출할 수 없습니다: {image_file.name}"
+                    )
+                results[image_file] = text
+
+        return results
+
+    def _prepare_image(self, image: Image.Image) -> Image.Image:
+        """
+        OCR 입력용으로 이미지를 RGB로 변환하고 긴 변이 OCR_MAX_IMAGE_DIMENSION을
+        넘지 않도록 축소합니다.
+        """
+        # RGB 모드로 변환 (RGBA, P 등 다른 모드 대응)
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+
+        width, height = image.size
+        longest = max(width, height)
+        if longest > OCR_MAX_IMAGE_DIMENSION:
+            scale = OCR_MAX_IMAGE_DIMENSION / longest
+            new_size = (max(1, int(width * scale)), max(1, int(height * scale)))
+            logger.debug(f"OCR 입력 이미지 축소: {width}x{height} -> {new_size[0]}x{new_size[1]}")
+            image = image.resize(new_size, resample=BICUBIC)
+
+        return image
+
+    def _readtext(self, image_array):
+        """공유 리더로 readtext를 실행합니다 (프로세스 내 직렬화)."""
+        with _shared_reader_infer_lock:
+            return self.reader.readtext(
+                image_array, batch_size=OCR_RECOGNIZER_BATCH_SIZE
+            )
+
+    def _readtext_or_none(self, image_file: Path, image_array):
+        """이미지 한 장을 EasyOCR로 처리하고, 실패하면 None을 반환합니다."""
+        try:
+            return self._readtext(image_array)
+        except Exception as e:
+            logger.warning(f"EasyOCR 개별 처리 실패 ({image_file.name}): {e}")
+            return None
+
+    def _combine_easyocr_results(self, results) -> str | None:
+        """EasyOCR 결과에서 신뢰도 기준을 넘는 텍스트만 줄바꿈으로 결합합니다."""
+        extracted_texts = []
+        for bbox, text, confidence in results:
+            # 신뢰도가 0.2 이상인 텍스트만 사용 (0.5에서 하향 조정)
+            # 중요 지역명 등이 0.4 정도 신뢰도로 나오는 경우 포함
+            if confidence >= OCR_MIN_CONFIDENCE:
+                extracted_texts.append(text.strip())
+
+        if extracted_texts:
+            return "\n".join(extracted_texts)  # 줄바꿈으로 결합하여 레이아웃 보존
+        return None
+
+    def _perform_tesseract(self, image: Image.Image) -> str | None:
+        """Tesseract로 OCR을 수행합니다 (폴백)."""
+        if not (self.use_tesseract and TESSERACT_AVAILABLE):
+            return None
+
+        try:
+            logger.debug("Tesseract OCR 실행 중... (폴백)")
+            # Tesseract 설정
+            custom_config = r'--oem 3 --psm 6'  # OEM 3: Default, PSM 6: 균일한 텍스트 블록
+
+            # Tesseract OCR 실행
+            text = pytesseract.image_to_string(
+                image,
+                lang=self.tesseract_lang,
+                config=custom_config
+            )
+
+            if text and text.strip():
+                logger.debug(f"Tesseract OCR 성공 (폴백): {len(text.strip())} 문자 추출")
+                return text.strip()
+            else:
+                logger.debug("Tesseract OCR에서도 텍스트를 찾지 못함")
+
+        except Exception as tesseract_error:
+            logger.error(f"Tesseract OCR 실패: {tesseract_error}")
+
+        return None
+
     def _perform_ocr(self, image: Image.Image) -> str | None:
         """
         PIL Image에 대해 OCR을 수행합니다.
@@ -274,9 +496,8 @@ class ImageOCRProcessor:
                 logger.error("잘못된 입력 타입입니다. PIL Image 객체가 필요합니다.")
                 return None
 
-            # RGB 모드로 변환 (RGBA, P 등 다른 모드 대응)
-            if image.mode != "RGB":
-                image = image.convert("RGB")
+            # RGB 변환 및 해상도 제한
+            image = self._prepare_image(image)
 
             # 1. EasyOCR 우선 시도 (우선순위 1)
             if self.use_easyocr_first and EASYOCR_AVAILABLE:
@@ -291,18 +512,10 @@ class ImageOCRProcessor:
                         image_array = np.array(image)
 
                         # EasyOCR에 numpy 배열 전달
-                        results = self.reader.readtext(image_array)
+                        results = self._readtext(image_array)
                         if results:
-                            # 결과 텍스트 결합
-                            extracted_texts = []
-                            for bbox, text, confidence in results:
-                                # 신뢰도가 0.3 이상인 텍스트만 사용 (0.5에서 하향 조정)
-                                # 중요 지역명 등이 0.4 정도 신뢰도로 나오는 경우 포함
-                                if confidence >= 0.2:
-                                    extracted_texts.append(text.strip())
-
-                            if extracted_texts:
-                                combined_text = "\n".join(extracted_texts)  # 줄바꿈으로 결합하여 레이아웃 보존
+                            combined_text = self._combine_easyocr_results(results)
+                            if combined_text:
                                 logger.debug(f"EasyOCR 성공: {len(combined_text)} 문자 추출")
                                 return combined_text
 
@@ -312,27 +525,9 @@ class ImageOCRProcessor:
                         logger.warning(f"EasyOCR 실패, Tesseract로 폴백: {easyocr_error}")
 
             # 2. Tesseract 폴백 (우선순위 2)
-            if self.use_tesseract and TESSERACT_AVAILABLE:
-                try:
-                    logger.debug("Tesseract OCR 실행 중... (폴백)")
-                    # Tesseract 설정
-                    custom_config = r'--oem 3 --psm 6'  # OEM 3: Default, PSM 6: 균일한 텍스트 블록
-
-                    # Tesseract OCR 실행
-                    text = pytesseract.image_to_string(
-                        image,
-                        lang=self.tesseract_lang,
-                        config=custom_config
-                    )
-
-                    if text and text.strip():
-                        logger.debug(f"Tesseract OCR 성공 (폴백): {len(text.strip())} 문자 추출")
-                        return text.strip()
-                    else:
-                        logger.debug("Tesseract OCR에서도 텍스트를 찾지 못함")
-
-                except Exception as tesseract_error:
-                    logger.error(f"Tesseract OCR 실패: {tesseract_error}")
+            text = self._perform_tesseract(image)
+            if text:
+                return text
 
             # 모든 OCR 실패
             logger.warning("EasyOCR과 Tesseract 모두에서 텍스트를 추출할 수 없습니다")
@@ -359,9 +554,9 @@ def extract_images_from_markdown(md_content: str, md_file_path: Path) -> list[st
         logger.info("마크다운에 처리할 이미지가 없어서 OCR 처리를 건너뜁니다")
         return []
 
-    # 이미지가 있을 때만 OCR 프로세서 초기화
+    # 이미지가 있을 때만 OCR 프로세서 초기화 (프로세스 공유 인스턴스)
     logger.info("이미지 발견됨 - OCR 프로세서 초기화 시작")
-    ocr_processor = ImageOCRProcessor(lazy_init=False)
+    ocr_processor = get_shared_ocr_processor()
     extracted_texts = []
     base_dir = md_file_path.parent
 
@@ -501,8 +696,8 @@ def extract_text_from_image(image_path: str) -> str | None:
             logger.warning(f"이미지 파일을 찾을 수 없습니다: {image_path}")
             return None
 
-        # ImageOCRProcessor 인스턴스 생성 및 처리
-        processor = ImageOCRProcessor(lazy_init=False)
+        # 공유 ImageOCRProcessor 인스턴스로 처리
+        processor = get_shared_ocr_processor()
         return processor.extract_text_from_image_file(
             image_path_obj, image_path_obj.parent
         )
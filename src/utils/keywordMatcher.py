@@ -0,0 +1,115 @@
+"""
+다중 키워드 매칭기 (Aho-Corasick 오토마톤)
+
+분류 키워드/제외 키워드 검사는 키워드(동의어)마다 `keyword in text`와 `text.find`를
+반복해서 키워드 테이블이 커질수록 비용이 늘어났습니다. 이 모듈은 키워드 로드 시
+오토마톤을 한 번 만들어 두고, 텍스트를 한 번만 훑어 모든 키워드의 매칭 위치를 찾습니다.
+
+- 매칭은 겹치는 경우도 모두 찾습니다 ("중소기업"과 "기업"이 모두 매칭)
+- ignore_case=True이면 키워드와 텍스트를 모두 lower()로 비교하며,
+  위치는 기존 코드와 같이 lower()된 텍스트 기준입니다
+- 빈 키워드는 무시합니다
+"""
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+class KeywordMatcher:
+    """키워드 목록으로 만든 Aho-Corasick 오토마톤
+
+    키워드는 입력 순서의 인덱스로 식별합니다. 같은 문자열의 키워드가 여러 개면
+    모두 매칭 결과에 포함됩니다.
+    """
+
+    def __init__(self, keywords: Iterable[str], ignore_case: bool = True):
+        self.ignore_case = ignore_case
+        self.keywords: List[str] = [
+            (keyword or "").lower() if ignore_case else (keyword or "")
+            for keyword in keywords
+        ]
+
+        # 노드별 전이(goto), 실패 링크(fail), 해당 노드에서 끝나는 키워드 인덱스(output)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+        self._build()
+
+    def _build(self) -> None:
+        goto = self._goto
+        outputs: List[List[int]] = [[]]
+
+        for index, keyword in enumerate(self.keywords):
+            if not keyword:
+                continue
+            node = 0
+            for ch in keyword:
+                next_node = goto[node].get(ch)
+                if next_node is None:
+                    next_node = len(goto)
+                    goto[node][ch] = next_node
+                    goto.append({})
+                    outputs.append([])
+                node = next_node
+            outputs[node].append(index)
+
+        # BFS로 실패 링크 계산, 실패 노드의 출력을 합쳐 두어 탐색 시 링크를 따라갈 필요 없음
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                queue.append(child)
+                state = fail[node]
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                target = goto[state].get(ch, 0)
+                fail[child] = target if target != child else 0
+                outputs[child].extend(outputs[fail[child]])
+
+        self._fail = fail
+        self._output = [tuple(output) for output in outputs]
+
+    def __len__(self) -> int:
+        return sum(1 for keyword in self.keywords if keyword)
+
+    def _prepare(self, text: str) -> str:
+        if not text:
+            return ""
+        return text.lower() if self.ignore_case else text
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """
+        텍스트의 모든 키워드 매칭을 끝 위치 순서로 반환합니다.
+
+        Yields:
+            (start, end, keyword_index) - text[start:end]가 키워드
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        keywords = self.keywords
+
+        node = 0
+        for position, ch in enumerate(self._prepare(text)):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if output[node]:
+                end = position + 1
+                for index in output[node]:
+                    yield end - len(keywords[index]), end, index
+
+    def first_positions(self, text: str) -> Dict[int, int]:
+        """
+        텍스트에 포함된 키워드별 첫 매칭 시작 위치를 반환합니다.
+        (`keyword in text` / `text.find(keyword)`와 같은 결과)
+
+        Returns:
+            {keyword_index: start}
+        """
+        positions: Dict[int, int] = {}
+        for start, _end, index in self.iter_matches(text):
+            if index not in positions:
+                positions[index] = start
+        return positions
@@ -0,0 +1,275 @@
+"""
+프로세스 공유 키워드 스냅샷 (제외 키워드 / 분류 키워드)
+
+전처리기, 공고 처리기, AnnouncementFilter, AnnouncementClassifier가 생성될 때마다
+(병렬 처리기는 워커 스레드마다) EXCLUSION_KEYWORDS / CLASSIFICATION_KEYWORDS를
+각각 조회하고 매칭 오토마톤을 새로 만들었습니다. 이 모듈은 테이블별 스냅샷을
+프로세스당 한 번 로드해 모든 인스턴스가 읽기 전용으로 공유하도록 합니다.
+
+갱신 방식:
+- check_interval_seconds마다 활성 행 수 + 행 CRC32 합계(버전)만 조회
+- 버전이 바뀐 경우에만 전체 키워드를 다시 읽고 새 스냅샷으로 교체
+- 스냅샷 객체는 교체만 하고 수정하지 않으므로 사용 중인 스레드에 영향 없음
+- 조회 실패 시 기존 스냅샷 유지 (최초 로드 실패면 빈 스냅샷)
+"""
+
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.config.config import ConfigManager
+from src.config.logConfig import setup_logging
+from src.utils.keywordMatcher import KeywordMatcher
+
+logger = setup_logging(__name__)
+
+DEFAULT_CHECK_INTERVAL_SECONDS = 60
+
+CLASSIFICATION_TYPES = ("SMALL_BUSINESS", "SME", "STARTUP", "SOCIAL_ENTERPRISE", "INDUSTRY")
+
+EXCLUSION_VERSION_SQL = """
+    SELECT COUNT(*),
+           COALESCE(SUM(CRC32(CONCAT_WS('|', EXCLUSION_ID, KEYWORD, DESCRIPTION))), 0)
+    FROM EXCLUSION_KEYWORDS
+    WHERE IS_ACTIVE = TRUE
+"""
+
+EXCLUSION_LOAD_SQL = """
+    SELECT EXCLUSION_ID, KEYWORD, DESCRIPTION
+    FROM EXCLUSION_KEYWORDS
+    WHERE IS_ACTIVE = TRUE
+    ORDER BY EXCLUSION_ID
+"""
+
+CLASSIFICATION_VERSION_SQL = """
+    SELECT COUNT(*),
+           COALESCE(SUM(CRC32(CONCAT_WS('|', KEYWORD, KEYWORD_TYPE, INDUSTRY_CATEGORY, SYNONYMS, WEIGHT))), 0)
+    FROM CLASSIFICATION_KEYWORDS
+    WHERE IS_ACTIVE = TRUE
+"""
+
+CLASSIFICATION_LOAD_SQL = """
+    SELECT KEYWORD, KEYWORD_TYPE, INDUSTRY_CATEGORY, SYNONYMS, WEIGHT
+    FROM CLASSIFICATION_KEYWORDS
+    WHERE IS_ACTIVE = TRUE
+"""
+
+
+@dataclass(frozen=True)
+class ExclusionKeywordSnapshot:
+    """EXCLUSION_KEYWORDS 스냅샷 (matcher 키워드 인덱스 = keywords 인덱스)"""
+
+    version: Optional[Tuple[int, int]] = None
+    keywords: List[Dict[str, Any]] = field(default_factory=list)
+    matcher: KeywordMatcher = field(default_factory=lambda: KeywordMatcher([]))
+
+
+@dataclass(frozen=True)
+class ClassificationKeywordSnapshot:
+    """CLASSIFICATION_KEYWORDS 스냅샷
+
+    keywords_cache: {분류 타입: [keyword_info, ...]}
+    slots: 매칭 순서의 (분류 타입, keyword_info) 목록 (일반 키워드 → 업종 키워드)
+    entries: matcher 키워드 인덱스별 (slot, 소문자 동의어)
+    """
+
+    version: Optional[Tuple[int, int]] = None
+    keywords_cache: Dict[str, List[Dict[str, Any]]] = field(
+        default_factory=lambda: {kw_type: [] for kw_type in CLASSIFICATION_TYPES}
+    )
+    slots: List[Tuple[str, Dict[str, Any]]] = field(default_factory=list)
+    entries: List[Tuple[int, str]] = field(default_factory=list)
+    matcher: KeywordMatcher = field(default_factory=lambda: KeywordMatcher([]))
+
+
+def _default_session_factory():
+    from src.models.database import SessionLocal
+
+    return SessionLocal
+
+
+def _load_exclusion_snapshot(session, version) -> ExclusionKeywordSnapshot:
+    from sqlalchemy import text
+
+    keywords = [
+        {"id": row[0], "keyword": row[1], "description": row[2]}
+        for row in session.execute(text(EXCLUSION_LOAD_SQL))
+    ]
+
+    if len(keywords) == 0:
+        logger.error("⚠️ 제외 키워드가 0개 로드됨 - EXCLUSION_KEYWORDS 테이블 확인 필요")
+    else:
+        logger.info(f"제외 키워드 로드 완료: {len(keywords)}개")
+
+    return ExclusionKeywordSnapshot(
+        version=version,
+        keywords=keywords,
+        matcher=KeywordMatcher(keyword_info["keyword"] for keyword_info in keywords),
+    )
+
+
+def _load_classification_snapshot(session, version) -> ClassificationKeywordSnapshot:
+    from sqlalchemy import text
+
+    keywords_cache = {kw_type: [] for kw_type in CLASSIFICATION_TYPES}
+
+    for keyword, kw_type, industry_cat, synonyms_json, weight in session.execute(
+        text(CLASSIFICATION_LOAD_SQL)
+    ):
+        try:
+            synonyms = json.loads(synonyms_json) if synonyms_json else [keyword]
+        except json.JSONDecodeError:
+            synonyms = [keyword]
+
+        if kw_type in keywords_cache:
+            keywords_cache[kw_type].append(
+                {
+                    "keyword": keyword,
+                    "synonyms": synonyms,
+                    "weight": weight,
+                    "industry_category": industry_cat,
+                }
+            )
+
+    # 기존 매칭 순서 유지: 일반 키워드(타입 순) → 업종 키워드
+    slots = [
+        (kw_type, keyword_info)
+        for kw_type in CLASSIFICATION_TYPES
+        if kw_type != "INDUSTRY"
+        for keyword_info in keywords_cache[kw_type]
+    ]
+    slots.extend(("INDUSTRY", keyword_info) for keyword_info in keywords_cache["INDUSTRY"])
+
+    entries = []
+    for slot, (_, keyword_info) in enumerate(slots):
+        keyword = keyword_info["keyword"].lower()
+        for synonym in keyword_info.get("synonyms", [keyword]):
+            entries.append((slot, synonym.lower()))
+
+    logger.info(f"키워드 로드 완료: {sum(len(v) for v in keywords_cache.values())}개")
+
+    return ClassificationKeywordSnapshot(
+        version=version,
+        keywords_cache=keywords_cache,
+        slots=slots,
+        entries=entries,
+        matcher=KeywordMatcher(synonym for _, synonym in entries),
+    )
+
+
+class _SnapshotSource:
+    """버전 조회로 갱신 여부를 판단하는 테이블별 스냅샷 보관소"""
+
+    def __init__(self, name: str, version_sql: str, loader: Callable, empty: Callable):
+        self.name = name
+        self.version_sql = version_sql
+        self.loader = loader
+        self.empty = empty
+        self._snapshot = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, session_factory=None, force_check: bool = False):
+        snapshot = self._snapshot
+        if (
+            snapshot is not None
+            and not force_check
+            and time.monotonic() - self._checked_at < _check_interval()
+        ):
+            return snapshot
+
+        with self._lock:
+            # 대기 중 다른 스레드가 먼저 확인했으면 그 결과 사용
+            if (
+                self._snapshot is not None
+                and not force_check
+                and time.monotonic() - self._checked_at < _check_interval()
+            ):
+                return self._snapshot
+
+            self._snapshot = self._refresh(session_factory or _default_session_factory())
+            self._checked_at = time.monotonic()
+            return self._snapshot
+
+    def _refresh(self, session_factory):
+        current = self._snapshot
+        session = None
+        try:
+            from sqlalchemy import text
+
+            session = session_factory()
+            row = session.execute(text(self.version_sql)).fetchone()
+            version = (int(row[0]), int(row[1]))
+
+            if current is not None and current.version == version:
+                return current
+
+            if current is not None:
+                logger.info(f"{self.name} 변경 감지 - 스냅샷 재로드 (버전 {current.version} → {version})")
+            return self.loader(session, version)
+
+        except Exception as e:
+            logger.error(f"❌ {self.name} 로드 실패: {e}")
+            # 기존 스냅샷 유지, 최초 실패면 빈 스냅샷 (다음 확인 주기에 재시도)
+            return current if current is not None else self.empty()
+
+        finally:
+            if session is not None:
+                session.close()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._snapshot = None
+            self._checked_at = 0.0
+
+
+def _check_interval() -> float:
+    global _CHECK_INTERVAL
+    if _CHECK_INTERVAL is None:
+        try:
+            section = ConfigManager().get_section("keyword_snapshot")
+            _CHECK_INTERVAL = float(
+                section.get("check_interval_seconds", DEFAULT_CHECK_INTERVAL_SECONDS)
+            )
+        except Exception:
+            _CHECK_INTERVAL = DEFAULT_CHECK_INTERVAL_SECONDS
+    return _CHECK_INTERVAL
+
+
+_CHECK_INTERVAL: Optional[float] = None
+
+_exclusion_source = _SnapshotSource(
+    "제외 키워드", EXCLUSION_VERSION_SQL, _load_exclusion_snapshot, ExclusionKeywordSnapshot
+)
+_classification_source = _SnapshotSource(
+    "분류 키워드",
+    CLASSIFICATION_VERSION_SQL,
+    _load_classification_snapshot,
+    ClassificationKeywordSnapshot,
+)
+
+
+def get_exclusion_snapshot(session_factory=None, force_check: bool = False) -> ExclusionKeywordSnapshot:
+    """
+    제외 키워드 스냅샷을 반환합니다.
+
+    Args:
+        session_factory: SQLAlchemy 세션 팩토리 (기본: src.models.database.SessionLocal)
+        force_check: 확인 주기와 관계없이 버전을 즉시 조회
+    """
+    return _exclusion_source.get(session_factory, force_check)
+
+
+def get_classification_snapshot(
+    session_factory=None, force_check: bool = False
+) -> ClassificationKeywordSnapshot:
+    """분류 키워드 스냅샷을 반환합니다. (인자는 get_exclusion_snapshot과 동일)"""
+    return _classification_source.get(session_factory, force_check)
+
+
+def invalidate_snapshots() -> None:
+    """다음 조회 시 전체 키워드를 다시 읽도록 스냅샷을 비웁니다."""
+    _exclusion_source.invalidate()
+    _classification_source.invalidate()
@@ -0,0 +1,209 @@
+"""
+변환 → LLM 분석 2단계 처리 파이프라인
+
+병렬 공고 처리기는 워커 스레드 하나가 첨부파일 변환(docling/HWP)과 Ollama 분석을
+차례로 수행해서, 변환이 오래 걸리는 동안 Ollama 서버가 놀고 분석 중에는 변환이 멈췄습니다.
+이 모듈은 두 단계를 별도 스레드로 나누고 크기 제한 큐로 연결해 변환과 분석이 겹쳐 진행되도록 합니다.
+
+- 변환 단계: ThreadPoolExecutor (conversion_workers개)
+- LLM 단계: llm_workers개 디스패치 스레드 → Ollama generate 요청을 최대 llm_workers개 동시에 유지
+- LLM 대기열(queue_size)이 가득 차면 변환 워커가 빈 자리가 날 때까지 대기 (backpressure)
+- 단계별 처리 건수 / 처리 시간 / 대기 시간 / 최대 동시 실행 수를 집계
+
+작업 함수는 item 하나를 받아 최종 결과를 반환하거나, 다음 단계로 넘긴 경우 None을 반환합니다.
+예외가 발생하면 PipelineFailure(item, error)가 결과로 전달되므로 결과 수집이 멈추지 않습니다.
+
+주의: LLM 단계 작업 안에서 submit_llm을 호출하면 대기열이 가득 찼을 때 교착될 수 있으므로
+LLM 단계에서 후속 작업은 submit_conversion으로만 넘깁니다.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, List, Optional
+
+from src.config.config import ConfigManager
+from src.config.logConfig import setup_logging
+
+logger = setup_logging(__name__)
+
+DEFAULT_LLM_WORKERS = 2
+DEFAULT_LLM_QUEUE_SIZE = 4
+
+_STOP = object()
+
+
+def get_llm_dispatch_settings() -> tuple[int, int]:
+    """config.ini [llm_dispatch]의 (workers, queue_size)를 반환합니다."""
+    section = ConfigManager().get_section("llm_dispatch")
+    workers = section.get("workers") or DEFAULT_LLM_WORKERS
+    queue_size = section.get("queue_size") or DEFAULT_LLM_QUEUE_SIZE
+    return int(workers), int(queue_size)
+
+
+@dataclass
+class PipelineFailure:
+    """작업 함수에서 처리되지 않은 예외가 발생한 경우의 결과"""
+
+    item: Any
+    error: Exception
+
+
+class StageStats:
+    """단계별 처리량 집계 (스레드 안전)"""
+
+    def __init__(self, name: str, workers: int):
+        self.name = name
+        self.workers = workers
+        self.completed = 0
+        self.failed = 0
+        self.busy_seconds = 0.0
+        self.blocked_seconds = 0.0  # 다음 단계 대기열이 가득 차서 기다린 시간 (busy_seconds에 포함)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def track(self):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        start = time.monotonic()
+        succeeded = False
+        try:
+            yield
+            succeeded = True
+        finally:
+            elapsed = time.monotonic() - start
+            with self._lock:
+                self.in_flight -= 1
+                self.busy_seconds += elapsed
+                if succeeded:
+                    self.completed += 1
+                else:
+                    self.failed += 1
+
+    def add_blocked(self, seconds: float) -> None:
+        with self._lock:
+            self.blocked_seconds += seconds
+
+    def summary(self, elapsed: float) -> str:
+        """단계 처리량 요약 문자열 (elapsed: 파이프라인 전체 경과 시간)"""
+        with self._lock:
+            count = self.completed + self.failed
+            working = self.busy_seconds - self.blocked_seconds
+            throughput = count / elapsed if elapsed > 0 else 0.0
+            average = working / count if count else 0.0
+            utilization = working / (elapsed * self.workers) if elapsed > 0 and self.workers else 0.0
+
+            text = (
+                f"{self.name} 단계: {count}건 (실패 {self.failed}), "
+                f"처리량 {throughput:.2f}건/초, 평균 {average:.1f}초/건, "
+                f"동시 실행 최대 {self.max_in_flight}/{self.workers}, 가동률 {utilization:.0%}"
+            )
+            if self.blocked_seconds:
+                text += f", 대기열 대기 {self.blocked_seconds:.1f}초"
+            return text
+
+
+class ConversionLLMPipeline:
+    """변환 스레드 풀과 LLM 디스패치 스레드를 크기 제한 큐로 연결한 파이프라인
+
+    사용 예:
+        with ConversionLLMPipeline(2, 4, 8) as pipeline:
+            for task in tasks:
+                pipeline.submit_conversion(convert, task)
+            for result in pipeline.results(len(tasks)):
+                ...
+    """
+
+    def __init__(self, conversion_workers: int, llm_workers: int, llm_queue_size: int):
+        self.conversion = StageStats("변환", max(1, conversion_workers))
+        self.llm = StageStats("LLM", max(1, llm_workers))
+        self._llm_queue: queue.Queue = queue.Queue(maxsize=max(1, llm_queue_size))
+        self._results: queue.Queue = queue.Queue()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._threads: List[threading.Thread] = []
+        self._started_at = 0.0
+
+    def __enter__(self) -> "ConversionLLMPipeline":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close(cancel=exc_type is not None)
+
+    def start(self) -> None:
+        self._started_at = time.monotonic()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.conversion.workers, thread_name_prefix="Worker"
+        )
+        for i in range(self.llm.workers):
+            thread = threading.Thread(target=self._llm_worker, name=f"LLM_{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+        logger.info(
+            f"파이프라인 시작: 변환 워커 {self.conversion.workers}개, "
+            f"LLM 워커 {self.llm.workers}개, 대기열 {self._llm_queue.maxsize}개"
+        )
+
+    def submit_conversion(self, fn: Callable[[Any], Any], item: Any) -> None:
+        """변환 단계에 작업을 넣습니다. (대기열 제한 없음)"""
+        self._executor.submit(self._run, self.conversion, fn, item)
+
+    def submit_llm(self, fn: Callable[[Any], Any], item: Any) -> None:
+        """LLM 단계 대기열에 작업을 넣습니다. 대기열이 가득 차면 빈 자리가 날 때까지 대기합니다."""
+        start = time.monotonic()
+        self._llm_queue.put((fn, item))
+        waited = time.monotonic() - start
+        if waited > 0.01:
+            self.conversion.add_blocked(waited)
+
+    def results(self, total: int) -> Iterator[Any]:
+        """완료되는 순서대로 결과 total개를 반환합니다."""
+        for _ in range(total):
+            yield self._results.get()
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self._started_at if self._started_at else 0.0
+
+    def summary_lines(self) -> List[str]:
+        elapsed = self.elapsed
+        return [self.conversion.summary(elapsed), self.llm.summary(elapsed)]
+
+    def close(self, cancel: bool = False) -> None:
+        # 변환 단계를 먼저 정리 (변환 워커가 LLM 대기열에 넣는 중일 수 있으므로 LLM 스레드는 나중에 종료)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=cancel)
+            self._executor = None
+
+        for _ in self._threads:
+            self._llm_queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def _llm_worker(self) -> None:
+        while True:
+            job = self._llm_queue.get()
+            if job is _STOP:
+                return
+            fn, item = job
+            self._run(self.llm, fn, item)
+
+    def _run(self, stats: StageStats, fn: Callable[[Any], Any], item: Any) -> None:
+        try:
+            with stats.track():
+                result = fn(item)
+        except Exception as e:
+            logger.error(f"{stats.name} 단계 작업 중 처리되지 않은 예외: {e}")
+            result = PipelineFailure(item, e)
+
+        if result is not None:
+            self._results.put(result)
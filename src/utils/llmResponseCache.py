@@ -0,0 +1,105 @@
+"""
+LLM 응답 캐시 (프롬프트 해시 기반)
+
+reprocess_announcements.py, title_support_reprocessor.py, --force 등으로 같은 공고를
+다시 처리하면 내용과 프롬프트가 바이트 단위로 같아도 Ollama 생성을 처음부터 다시 수행했습니다.
+(model, 시스템 프롬프트 해시, 사용자 프롬프트 해시, 생성 옵션)을 키로 응답 원문을
+로컬 디스크에 저장해 두고, 입력이 바뀐 생성만 실제로 요청합니다.
+
+캐시 구조:
+{cache_dir}/
+├── 3f/
+│   └── 3f9a...c1.json    # {"created_at": ..., "model": ..., "response": ...}
+└── ...
+
+- ttl_hours가 지난 항목은 미스로 처리하고 삭제합니다.
+- 저장/LRU 정리 방식은 ConversionCache와 같은 ShardedDiskCache를 따릅니다.
+- 응답 파싱에 실패한 경우 호출 측에서 discard()로 항목을 지워 다음 처리 때 다시 생성합니다.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.config.config import ConfigManager
+from src.config.logConfig import setup_logging
+from src.utils.shardedDiskCache import ShardedDiskCache
+
+logger = setup_logging(__name__)
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache(ShardedDiskCache):
+    """LLM 생성 결과를 저장하는 디스크 캐시"""
+
+    ENTRY_SUFFIX = ".json"
+    CACHE_LABEL = "LLM 응답 캐시"
+
+    def __init__(
+        self,
+        cache_dir: Optional[str | Path] = None,
+        max_size_mb: Optional[int] = None,
+        ttl_hours: Optional[float] = None,
+        enabled: Optional[bool] = None,
+    ):
+        cache_config = ConfigManager().get_section("llm_cache")
+
+        super().__init__(
+            cache_dir or cache_config.get("cache_dir", "cache/llm/"),
+            max_size_mb or cache_config.get("max_size_mb", 512),
+            cache_config.get("enabled", True) if enabled is None else enabled,
+        )
+        ttl_hours = ttl_hours if ttl_hours is not None else cache_config.get("ttl_hours", 720)
+        self.ttl_seconds = float(ttl_hours) * 3600  # 0 이하면 만료 없음
+        self.stats["expired"] = 0
+
+    @staticmethod
+    def compute_key(
+        model: str, system_prompt: str, user_prompt: str, options: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """(모델, 시스템 프롬프트 해시, 사용자 프롬프트 해시, 옵션)으로 캐시 키를 계산합니다."""
+        key_source = json.dumps(
+            {
+                "model": model,
+                "system": _sha256(system_prompt),
+                "user": _sha256(user_prompt),
+                "options": options or {},
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return _sha256(key_source)
+
+    def _dump_entry(self, response: str, model: str = "") -> bytes:
+        return json.dumps(
+            {"created_at": time.time(), "model": model, "response": response},
+            ensure_ascii=False,
+        ).encode("utf-8")
+
+    def _load_entry(self, entry_path: Path, data: str) -> Optional[str]:
+        entry = json.loads(data)
+        if self.ttl_seconds > 0 and time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            self._remove(entry_path)
+            self._count("expired")
+            return None
+        return entry.get("response")
+
+
+_shared_cache: Optional[LLMResponseCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_llm_response_cache() -> LLMResponseCache:
+    """프로세스 공유 캐시 인스턴스를 반환합니다. (분석기가 스레드마다 생성되어도 통계/크기 추적 공유)"""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_lock:
+            if _shared_cache is None:
+                _shared_cache = LLMResponseCache()
+    return _shared_cache
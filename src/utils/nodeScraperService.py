@@ -0,0 +1,230 @@
+"""
+Node.js 상세 스크래퍼 상주 서비스 클라이언트
+
+공고마다 `node eminwon_detail_scraper.js ...` 프로세스를 띄우면 매번 Node 런타임 기동과
+Chromium 실행/종료 비용이 발생합니다. 이 클라이언트는 node/scraper/detail_scraper_service.js를
+한 번 실행해 두고 stdin/stdout JSON Lines로 작업을 주고받습니다.
+
+- 여러 스레드에서 동시에 submit() 호출 가능 (작업 id로 응답 매칭)
+- 서비스가 비정상 종료되면 다음 작업에서 자동 재시작 (최대 max_restarts회)
+- 시작 실패/재시작 한도 초과 시 NodeScraperServiceError → 호출 측에서 기존 프로세스 방식으로 대체
+"""
+
+import itertools
+import json
+import logging
+import subprocess
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SERVICE_SCRIPT = "node/scraper/detail_scraper_service.js"
+
+# Node 측 작업 타임아웃 이후 응답을 기다리는 추가 시간 (초)
+RESPONSE_GRACE_SECONDS = 15
+
+
+class NodeScraperServiceError(Exception):
+    """상주 서비스를 사용할 수 없는 경우 (시작 실패, 비정상 종료 등)"""
+
+
+class NodeDetailScraperService:
+    """detail_scraper_service.js 프로세스를 관리하고 작업을 전달하는 클라이언트"""
+
+    def __init__(
+        self,
+        node_path: str = "node",
+        script_path: str = DEFAULT_SERVICE_SCRIPT,
+        concurrency: int = 3,
+        startup_timeout: int = 60,
+        max_restarts: int = 3,
+        log_stderr: bool = False,
+    ):
+        self.node_path = node_path
+        self.script_path = script_path
+        self.concurrency = concurrency
+        self.startup_timeout = startup_timeout
+        self.max_restarts = max_restarts
+        self.log_stderr = log_stderr
+
+        self._process: Optional[subprocess.Popen] = None
+        self._ready = threading.Event()
+        self._lock = threading.Lock()  # 프로세스 시작/종료
+        self._write_lock = threading.Lock()  # stdin 쓰기
+        self._pending: Dict[str, dict] = {}
+        self._pending_lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._starts = 0
+        self._disabled = False
+
+    def _start(self) -> subprocess.Popen:
+        """서비스 프로세스를 시작하고 ready 응답을 기다립니다. (_lock 보유 상태에서 호출)"""
+        if not Path(self.script_path).exists():
+            self._disabled = True
+            raise NodeScraperServiceError(f"서비스 스크립트 없음: {self.script_path}")
+
+        if self._starts > self.max_restarts:
+            self._disabled = True
+            raise NodeScraperServiceError(f"재시작 한도 초과 ({self.max_restarts}회)")
+
+        self._starts += 1
+        self._ready = threading.Event()
+
+        try:
+            process = subprocess.Popen(
+                [self.node_path, self.script_path, "--concurrency", str(self.concurrency)],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                bufsize=1,
+            )
+        except OSError as e:
+            self._disabled = True
+            raise NodeScraperServiceError(f"서비스 실행 실패: {e}")
+
+        self._process = process
+        threading.Thread(target=self._read_stdout, args=(process, self._ready), daemon=True).start()
+        threading.Thread(target=self._read_stderr, args=(process,), daemon=True).start()
+
+        started = self._ready.wait(self.startup_timeout)
+        if not started or self._process is not process or process.poll() is not None:
+            self._kill(process)
+            self._disabled = True
+            raise NodeScraperServiceError("서비스 시작 실패 (ready 응답 없음)")
+
+        logger.info(f"상세 스크래퍼 서비스 시작 (pid={process.pid}, 동시 작업 {self.concurrency}개)")
+        return process
+
+    def _read_stdout(self, process: subprocess.Popen, ready: threading.Event) -> None:
+        """응답 라인을 읽어 대기 중인 작업에 전달합니다."""
+        for line in process.stdout:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                logger.debug(f"서비스 응답 파싱 실패: {line[:200]}")
+                continue
+
+            if message.get("event") == "ready":
+                ready.set()
+                continue
+
+            with self._pending_lock:
+                waiter = self._pending.pop(str(message.get("id")), None)
+            if waiter is not None:
+                waiter["response"] = message
+                waiter["event"].set()
+
+        # 프로세스 종료 - 시작 대기를 깨우고, 이 프로세스에 전달된 작업은 모두 실패 처리
+        # (_process를 먼저 비워야 이후 submit()이 죽은 프로세스에 작업을 보내지 않음)
+        if self._process is process:
+            self._process = None
+        ready.set()
+        with self._pending_lock:
+            orphaned = [
+                self._pending.pop(job_id)
+                for job_id, waiter in list(self._pending.items())
+                if waiter["process"] is process
+            ]
+        for waiter in orphaned:
+            waiter["event"].set()
+
+        if orphaned:
+            logger.warning(f"상세 스크래퍼 서비스 종료됨, 진행 중 작업 {len(orphaned)}개 실패 처리")
+
+    def _read_stderr(self, process: subprocess.Popen) -> None:
+        """stderr 파이프가 가득 차지 않도록 계속 읽습니다."""
+        for line in process.stderr:
+            if self.log_stderr and line.strip():
+                logger.debug(f"[node] {line.rstrip()}")
+
+    def _kill(self, process: subprocess.Popen) -> None:
+        if process.poll() is None:
+            process.kill()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                pass
+
+    def _ensure_running(self) -> subprocess.Popen:
+        with self._lock:
+            if self._disabled:
+                raise NodeScraperServiceError("서비스 비활성화됨")
+            process = self._process
+            if process is None or process.poll() is not None:
+                process = self._start()
+            return process
+
+    def submit(self, job_type: str, options: Dict[str, Any], timeout: int = 60) -> Dict[str, Any]:
+        """
+        상세 페이지 작업을 실행하고 응답을 반환합니다.
+
+        Args:
+            job_type: "eminwon" 또는 "unified"
+            options: 스크래퍼 생성자 옵션 (CLI 인자와 동일한 값)
+            timeout: 작업 타임아웃 (초)
+
+        Returns:
+            {"status": "success" | "error", "actualTitle", "folderName", "error", "elapsedMs"}
+
+        Raises:
+            NodeScraperServiceError: 서비스를 사용할 수 없음 (호출 측 대체 실행 필요)
+            TimeoutError: 작업 응답 시간 초과
+        """
+        process = self._ensure_running()
+
+        job_id = str(next(self._ids))
+        waiter = {"event": threading.Event(), "response": None, "process": process}
+        with self._pending_lock:
+            self._pending[job_id] = waiter
+        if self._process is not process:
+            with self._pending_lock:
+                self._pending.pop(job_id, None)
+            raise NodeScraperServiceError("작업 전달 전 서비스 종료")
+
+        job = {"id": job_id, "type": job_type, "options": options, "timeoutMs": timeout * 1000}
+        try:
+            with self._write_lock:
+                process.stdin.write(json.dumps(job, ensure_ascii=False) + "\n")
+                process.stdin.flush()
+        except (BrokenPipeError, OSError, ValueError) as e:
+            with self._pending_lock:
+                self._pending.pop(job_id, None)
+            raise NodeScraperServiceError(f"작업 전달 실패: {e}")
+
+        if not waiter["event"].wait(timeout + RESPONSE_GRACE_SECONDS):
+            # Node 측 타임아웃도 동작하지 않았다면 서비스가 멈춘 것으로 보고 재시작
+            with self._pending_lock:
+                self._pending.pop(job_id, None)
+            logger.warning("상세 스크래퍼 서비스 응답 없음, 프로세스 재시작")
+            with self._lock:
+                if self._process is process:
+                    self._kill(process)
+            raise TimeoutError(f"상세 스크래퍼 응답 시간 초과 ({timeout}초)")
+
+        if waiter["response"] is None:
+            raise NodeScraperServiceError("작업 처리 중 서비스 종료")
+
+        return waiter["response"]
+
+    def close(self) -> None:
+        """stdin을 닫아 진행 중 작업을 마치고 종료하도록 합니다."""
+        with self._lock:
+            process = self._process
+            self._process = None
+
+        if process is None or process.poll() is not None:
+            return
+
+        try:
+            process.stdin.close()
+            process.wait(timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            self._kill(process)
@@ -14,14 +14,19 @@ Ollama를 통해 공고 내용을 분석하고 다음 정보를 추출합니다:
 import json
 import os
 import logging
+import threading
+import time
 import requests
-from typing import Dict, Optional, Any
+from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional, Any, Sequence
 from pathlib import Path
 
 try:
     from src.config.config import ConfigManager
     from src.config.logConfig import setup_logging
     from src.utils.encodingValidator import EncodingValidator, JSONSanitizer
+    from src.utils.llmResponseCache import LLMResponseCache, get_llm_response_cache
 except ImportError:
     # 절대 import 시도
     import sys
@@ -33,6 +38,7 @@ except ImportError:
 
     from src.config.config import ConfigManager
     from src.config.logConfig import setup_logging
+    from src.utils.llmResponseCache import LLMResponseCache, get_llm_response_cache
 
 # 환경변수에서 로그 레벨 읽기
 try:
@@ -50,6 +56,201 @@ try:
 except:
     config = {}
 
+# 연결 타임아웃은 생성 타임아웃(OLLAMA_TIMEOUT, 읽기)과 분리
+OLLAMA_CONNECT_TIMEOUT = float(os.getenv("OLLAMA_CONNECT_TIMEOUT", "5"))
+OLLAMA_HEALTH_TIMEOUT = float(os.getenv("OLLAMA_HEALTH_TIMEOUT", "5"))
+# 백그라운드 헬스 체크 주기 (초)
+OLLAMA_HEALTH_INTERVAL = float(os.getenv("OLLAMA_HEALTH_INTERVAL", "30"))
+# 연속 연결 실패가 이 횟수에 도달하면 헬스 체크로 복구될 때까지 요청 차단
+OLLAMA_FAILURE_THRESHOLD = int(os.getenv("OLLAMA_FAILURE_THRESHOLD", "3"))
+# 프로세스 공유 세션의 커넥션 풀 크기 (동시 요청 스레드 수 이상)
+OLLAMA_POOL_SIZE = int(os.getenv("OLLAMA_POOL_SIZE", "10"))
+# 스트리밍 생성 사용 여부, 스트리밍 중 필수 키를 모두 가진 JSON 객체가 완성되면 생성 중단 여부
+OLLAMA_STREAM = os.getenv("OLLAMA_STREAM", "true").lower() == "true"
+OLLAMA_EARLY_STOP = os.getenv("OLLAMA_EARLY_STOP", "true").lower() == "true"
+
+# 프로세스별 공유 세션/헬스 모니터 {(pid, api_url): ...}
+# pid를 키에 포함해 fork된 자식 프로세스는 부모의 소켓/스레드를 재사용하지 않음
+_shared_lock = threading.Lock()
+_shared_sessions: Dict[tuple, requests.Session] = {}
+_health_monitors: Dict[tuple, "OllamaHealthMonitor"] = {}
+
+
+def get_shared_session(api_url: str) -> requests.Session:
+    """api_url별 프로세스 공유 requests.Session (keep-alive 커넥션 풀)을 반환합니다."""
+    key = (os.getpid(), api_url)
+    with _shared_lock:
+        session = _shared_sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=OLLAMA_POOL_SIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update({"Content-Type": "application/json"})
+            _shared_sessions[key] = session
+        return session
+
+
+def get_health_monitor(api_url: str) -> "OllamaHealthMonitor":
+    """api_url별 프로세스 공유 헬스 모니터를 반환합니다."""
+    key = (os.getpid(), api_url)
+    session = get_shared_session(api_url)
+    with _shared_lock:
+        monitor = _health_monitors.get(key)
+        if monitor is None:
+            monitor = OllamaHealthMonitor(api_url, session)
+            _health_monitors[key] = monitor
+        return monitor
+
+
+@dataclass
+class GenerationMetrics:
+    """generate 호출 1회의 지연/처리량"""
+    streamed: bool
+    ttft: Optional[float] = None  # 요청 전송 → 첫 토큰 (초, 비스트리밍은 모델 로드 + 프롬프트 처리 시간)
+    total_time: float = 0.0
+    tokens: int = 0
+    tokens_per_second: Optional[float] = None
+    prompt_tokens: Optional[int] = None
+    early_stopped: bool = False
+
+    def summary(self) -> str:
+        ttft = f"{self.ttft:.2f}초" if self.ttft is not None else "-"
+        tps = f"{self.tokens_per_second:.1f}" if self.tokens_per_second is not None else "-"
+        text = f"TTFT {ttft}, {self.tokens}토큰, {tps} tokens/s, 전체 {self.total_time:.2f}초"
+        if self.early_stopped:
+            text += " (JSON 완성 후 조기 종료)"
+        return text
+
+
+class _JSONObjectScanner:
+    """
+    스트리밍 텍스트에서 필수 키를 모두 가진 완결된 최상위 JSON 객체를 찾습니다.
+
+    문자열/이스케이프를 구분해 중괄호 깊이를 추적하고, 깊이가 0으로 돌아오면
+    json.loads로 확인합니다. 파싱되지 않거나 필수 키가 없는 후보(설명 문장 속 예시 객체,
+    복구가 필요한 JSON)는 버리고 계속 탐색하므로 이 경우에는 생성이 끝까지 진행됩니다.
+    """
+
+    def __init__(self, required_keys: Sequence[str]):
+        self.required_keys = tuple(required_keys)
+        self.text = ""
+        self.pos = 0
+        self.start = None
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+
+    def feed(self, chunk: str) -> Optional[str]:
+        """텍스트 조각을 추가하고, 필수 키를 모두 가진 JSON 객체가 완성되면 그 문자열을 반환합니다."""
+        self.text += chunk
+        text = self.text
+
+        while self.pos < len(text):
+            ch = text[self.pos]
+            self.pos += 1
+
+            if self.start is None:
+                if ch == "{":
+                    self.start = self.pos - 1
+                    self.depth = 1
+                continue
+
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif ch == "\\":
+                    self.escape = True
+                elif ch == '"':
+                    self.in_string = False
+                continue
+
+            if ch == '"':
+                self.in_string = True
+            elif ch == "{":
+                self.depth += 1
+            elif ch == "}":
+                self.depth -= 1
+                if self.depth == 0:
+                    candidate = text[self.start:self.pos]
+                    self.start = None
+                    try:
+                        parsed = json.loads(candidate)
+                    except ValueError:
+                        continue
+                    if isinstance(parsed, dict) and all(key in parsed for key in self.required_keys):
+                        return candidate
+
+        return None
+
+
+class OllamaHealthMonitor:
+    """
+    Ollama 서버 상태 서킷 브레이커
+
+    - 요청마다 헬스 체크를 보내지 않고, 백그라운드 스레드가 OLLAMA_HEALTH_INTERVAL마다 /api/tags 확인
+    - 생성 요청의 연결 실패가 OLLAMA_FAILURE_THRESHOLD회 연속되면 차단(open)
+    - 차단 중에는 is_available()이 즉시 False, 헬스 체크 성공 시 복구
+    """
+
+    def __init__(self, api_url: str, session: requests.Session):
+        self.health_url = f"{api_url.replace('/api', '')}/api/tags"
+        self.session = session
+        self._available: Optional[bool] = None  # None: 아직 확인 전
+        self._failures = 0
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def _probe(self) -> bool:
+        try:
+            response = self.session.get(
+                self.health_url, timeout=(OLLAMA_CONNECT_TIMEOUT, OLLAMA_HEALTH_TIMEOUT)
+            )
+            return response.status_code == 200
+        except Exception as e:
+            logger.debug(f"Ollama 헬스 체크 실패: {e}")
+            return False
+
+    def _set_state(self, healthy: bool) -> None:
+        with self._lock:
+            if healthy:
+                if self._available is False:
+                    logger.info("Ollama 서버 연결 복구 - 요청 차단 해제")
+                self._failures = 0
+            elif self._available is not False:
+                logger.error("Ollama 서버 사용 불가 - 헬스 체크 복구 시까지 요청 차단")
+            self._available = healthy
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(OLLAMA_HEALTH_INTERVAL)
+            self._set_state(self._probe())
+
+    def is_available(self) -> bool:
+        """캐시된 서버 상태를 반환합니다. (최초 1회만 동기 확인)"""
+        if self._available is None:
+            self._set_state(self._probe())
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="ollama-health", daemon=True
+                    )
+                    self._thread.start()
+        return self._available
+
+    def record_success(self) -> None:
+        """서버가 응답함 (HTTP 상태와 무관)"""
+        if self._failures or self._available is False:
+            self._set_state(True)
+
+    def record_failure(self) -> None:
+        """생성 요청 연결 실패"""
+        with self._lock:
+            self._failures += 1
+            tripped = self._failures >= OLLAMA_FAILURE_THRESHOLD
+        if tripped:
+            self._set_state(False)
+
 
 class OllamaClient:
     """Ollama API 클라이언트"""
@@ -58,7 +259,8 @@ class OllamaClient:
         # 환경변수에서 직접 읽기
         self.api_url = os.getenv("OLLAMA_API_URL", "http://localhost:11434/api")
         self.model = os.getenv("OLLAMA_MODEL", "llama3.2")
-        self.timeout = int(os.getenv("OLLAMA_TIMEOUT", "600"))  # 기본 10분 타임아웃
+        self.timeout = int(os.getenv("OLLAMA_TIMEOUT", "600"))  # 기본 10분 타임아웃 (응답 읽기)
+        self.connect_timeout = OLLAMA_CONNECT_TIMEOUT
         self.max_tokens = int(os.getenv("OLLAMA_MAX_TOKENS", "16384"))  # 환경변수로 제어 가능
         
         # API 헤더 설정
@@ -66,28 +268,71 @@ class OllamaClient:
             "Content-Type": "application/json"
         }
 
+        # 프로세스 공유 세션 (요청마다 새 연결을 만들지 않음) 및 서킷 브레이커
+        self.session = get_shared_session(self.api_url)
+        self.health = get_health_monitor(self.api_url)
+
+        # 응답 캐시 (프로세스 공유)
+        self.response_cache = get_llm_response_cache()
+
+        # 스트리밍 생성 / 조기 종료 설정 및 마지막 호출 지표
+        self.stream = OLLAMA_STREAM
+        self.early_stop = OLLAMA_EARLY_STOP
+        self.last_metrics: Optional[GenerationMetrics] = None
+
     def is_available(self) -> bool:
-        """Ollama 서버 상태를 확인합니다."""
-        try:
-            # Ollama health check endpoint
-            health_url = f"{self.api_url.replace('/api', '')}/api/tags"
-            response = requests.get(health_url, timeout=10)
-            return response.status_code == 200
-        except Exception as e:
-            logger.error(f"Ollama 서버 연결 실패: {e}")
-            return False
+        """Ollama 서버 상태를 확인합니다. (백그라운드 헬스 체크 결과, 네트워크 요청 없음)"""
+        return self.health.is_available()
+
+    def _generation_options(self) -> Dict[str, Any]:
+        """generate 요청 옵션 (응답 캐시 키에도 사용)"""
+        return {
+            # "temperature": 0.1,
+            "top_p": 0.9,
+            # "num_predict": self.max_tokens,
+            "num_predict": 2049,
+            # "stop": [ "</final>"],
+            # "repeat_penalty": 1.1
+        }
 
-    def generate_response(self, prompt: str, system_prompt: str = None) -> Optional[str]:
+    def _cache_key(self, prompt: str, system_prompt: str = None) -> str:
+        return LLMResponseCache.compute_key(
+            self.model, system_prompt or "", prompt, self._generation_options()
+        )
+
+    def discard_cached_response(self, prompt: str, system_prompt: str = None) -> None:
+        """캐시된 응답을 삭제합니다. (응답을 파싱할 수 없어 다음 처리 때 다시 생성해야 하는 경우)"""
+        self.response_cache.discard(self._cache_key(prompt, system_prompt))
+
+    def generate_response(
+        self,
+        prompt: str,
+        system_prompt: str = None,
+        use_cache: bool = True,
+        required_keys: Optional[Sequence[str]] = None,
+    ) -> Optional[str]:
         """
         Ollama API를 통해 응답을 생성합니다.
+        (OLLAMA_STREAM이면 스트리밍으로 받고, 호출별 TTFT / tokens/s는 last_metrics에 기록)
 
         Args:
             prompt: 사용자 프롬프트
             system_prompt: 시스템 프롬프트
+            use_cache: 같은 입력(모델/프롬프트/옵션)의 캐시된 응답이 있으면 생성 없이 반환
+            required_keys: 응답 JSON의 필수 최상위 키. 스트리밍 중 이 키를 모두 가진 JSON 객체가
+                완성되면 생성을 중단합니다. (None이면 조기 종료하지 않음)
 
         Returns:
             생성된 응답 또는 None
         """
+        self.last_metrics = None
+        cache_key = self._cache_key(prompt, system_prompt) if use_cache else None
+        if cache_key:
+            cached = self.response_cache.get(cache_key)
+            if cached:
+                logger.info(f"LLM 응답 캐시 적중 - 생성 생략 ({len(cached)} 문자)")
+                return cached
+
         try:
             logger.info(f"Ollama API 요청 전송 중... (모델: {self.model})")
             logger.info(f"요청 URL: {self.api_url}")
@@ -107,42 +352,47 @@ class OllamaClient:
                 "model": self.model,
                 "prompt": prompt,
                 "system": system_prompt if system_prompt else "",
-                "stream": False,
+                "stream": self.stream,
                 # "context": [],
-                "options": {
-                    # "temperature": 0.1,
-                    "top_p": 0.9,
-                    # "num_predict": self.max_tokens,
-                    "num_predict": 2049,
-                    # "stop": [ "</final>"],
-                    # "repeat_penalty": 1.1
-                }
+                "options": self._generation_options()
             }
 
             # Ollama generate API 호출
             generate_url = f"{self.api_url}/generate"
-            response = requests.post(
+            started = time.monotonic()
+            response = self.session.post(
                 generate_url,
                 headers=self.headers,
                 json=payload,
-                timeout=self.timeout
+                timeout=(self.connect_timeout, self.timeout),
+                stream=self.stream
             )
+            self.health.record_success()
 
             logger.debug(f"Ollama API 응답 수신: {response.status_code}")
 
             if response.status_code == 200:
-                result = response.json()
+                if self.stream:
+                    result = self._read_stream(response, started, required_keys)
+                else:
+                    result = response.json()
+                    self.last_metrics = self._metrics_from_result(result, started)
                 logger.info(f"result: {result}")
+                logger.info(f"Ollama 생성 지표: {self.last_metrics.summary()}")
 
                 generated_text = result.get('response', '').strip()
                 thinking_text = result.get('thinking', '').strip()
                 
                 if generated_text:
                     logger.info(f"Ollama API 응답 생성 완료: {len(generated_text)} 문자")
+                    if cache_key:
+                        self.response_cache.put(cache_key, generated_text, model=self.model)
                     return generated_text
                 elif thinking_text:
                     logger.warning(f"response 필드는 비어있지만 thinking 필드에 내용 있음: {len(thinking_text)} 문자")
                     logger.info(f"thinking 내용을 응답으로 사용")
+                    if cache_key:
+                        self.response_cache.put(cache_key, thinking_text, model=self.model)
                     return thinking_text
                 else:
                     logger.error(f"Ollama API 응답이 비어있음!")
@@ -153,6 +403,11 @@ class OllamaClient:
                 logger.error(f"응답 내용: {response.text}")
                 return None
 
+        except requests.ConnectionError as e:
+            self.health.record_failure()
+            logger.error(f"Ollama 서버 연결 실패: {e}")
+            return None
+
         except Exception as e:
             logger.error(f"Ollama API 호출 중 오류: {e}")
             if hasattr(e, 'response'):
@@ -160,10 +415,96 @@ class OllamaClient:
                 logger.error(f"응답 내용: {e.response.text if e.response else 'None'}")
             return None
 
+    def _read_stream(
+        self, response: requests.Response, started: float, required_keys: Optional[Sequence[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        스트리밍 응답을 읽어 비스트리밍 응답과 같은 형태({"response", "thinking", ...})로 합칩니다.
+
+        early_stop이 켜져 있고 required_keys가 주어지면 response 텍스트에서 필수 키를 모두 가진
+        JSON 객체가 완성되는 즉시 연결을 닫습니다. Ollama는 클라이언트 연결이 끊기면 생성을 중단하므로
+        JSON 뒤에 이어지는 설명 문장 생성에 GPU 시간을 쓰지 않습니다.
+        """
+        scanner = _JSONObjectScanner(required_keys) if self.early_stop and required_keys else None
+        response_parts = []
+        thinking_parts = []
+        final_chunk: Dict[str, Any] = {}
+        first_token_at = None
+        token_chunks = 0
+        json_object = None
+
+        try:
+            for line in response.iter_lines():
+                if not line:
+                    continue
+
+                chunk = json.loads(line)
+                if chunk.get("error"):
+                    raise RuntimeError(f"스트리밍 중 오류: {chunk['error']}")
+
+                text = chunk.get("response", "")
+                thinking = chunk.get("thinking", "")
+                if text or thinking:
+                    token_chunks += 1
+                    if first_token_at is None:
+                        first_token_at = time.monotonic()
+                if thinking:
+                    thinking_parts.append(thinking)
+                if text:
+                    response_parts.append(text)
+                    if scanner is not None:
+                        json_object = scanner.feed(text)
+                        if json_object is not None:
+                            break
+
+                if chunk.get("done"):
+                    final_chunk = chunk
+        finally:
+            # 조기 종료 시 남은 스트림을 읽지 않고 연결을 닫음 (서버 측 생성 중단)
+            response.close()
+
+        finished = time.monotonic()
+        metrics = GenerationMetrics(
+            streamed=True,
+            ttft=first_token_at - started if first_token_at is not None else None,
+            total_time=finished - started,
+            tokens=final_chunk.get("eval_count") or token_chunks,
+            prompt_tokens=final_chunk.get("prompt_eval_count"),
+            early_stopped=json_object is not None,
+        )
+        if final_chunk.get("eval_duration"):
+            metrics.tokens_per_second = metrics.tokens / (final_chunk["eval_duration"] / 1e9)
+        elif first_token_at is not None and finished > first_token_at:
+            # 조기 종료로 최종 통계가 없으면 스트리밍 청크(≈토큰) 수로 계산
+            metrics.tokens_per_second = token_chunks / (finished - first_token_at)
+        self.last_metrics = metrics
+
+        result = dict(final_chunk)
+        result["response"] = json_object if json_object is not None else "".join(response_parts)
+        result["thinking"] = "".join(thinking_parts)
+        return result
+
+    def _metrics_from_result(self, result: Dict[str, Any], started: float) -> GenerationMetrics:
+        """비스트리밍 응답의 Ollama 통계(ns 단위)로 지표를 계산합니다."""
+        metrics = GenerationMetrics(
+            streamed=False,
+            total_time=time.monotonic() - started,
+            tokens=result.get("eval_count") or 0,
+            prompt_tokens=result.get("prompt_eval_count"),
+        )
+        if "prompt_eval_duration" in result:
+            metrics.ttft = (result.get("load_duration", 0) + result["prompt_eval_duration"]) / 1e9
+        if result.get("eval_duration"):
+            metrics.tokens_per_second = metrics.tokens / (result["eval_duration"] / 1e9)
+        return metrics
+
 
 class AnnouncementAnalyzer:
     """공고 내용 분석 및 데이터 추출"""
 
+    # 스트리밍 조기 종료 판단용 응답 필수 키 (ollama_template.txt 응답 형식)
+    RESPONSE_KEYS = ("EXTRACTED_TARGET", "EXTRACTED_TITLE", "EXTRACTED_CONTENT")
+
     def __init__(self):
         self.ollama_client = OllamaClient()
         self.system_prompt = self._create_system_prompt()
@@ -258,7 +599,7 @@ class AnnouncementAnalyzer:
         elif "⚠️" in reason:
             logger.warning(f"인코딩 검증 경고: {reason}")
 
-        # Ollama 서버 상태 확인
+        # Ollama 서버 상태 확인 (서킷 브레이커 상태, 요청마다 헬스 체크하지 않음)
         if not self.ollama_client.is_available():
             logger.error("Ollama 서버를 사용할 수 없음")
             return self._create_empty_result("Ollama 서버 연결 실패"), ""
@@ -296,7 +637,8 @@ class AnnouncementAnalyzer:
             # Ollama를 통해 분석 수행
             response = self.ollama_client.generate_response(
                 prompt=user_prompt,
-                system_prompt=self.system_prompt
+                system_prompt=self.system_prompt,
+                required_keys=self.RESPONSE_KEYS
             )
 
             if not response:
@@ -323,6 +665,8 @@ class AnnouncementAnalyzer:
                 return parsed_result, full_prompt
             else:
                 logger.error("JSON 파싱 실패")
+                # 파싱할 수 없는 응답은 캐시에 남기지 않음 (재처리 시 다시 생성)
+                self.ollama_client.discard_cached_response(user_prompt, self.system_prompt)
                 return self._create_empty_result("응답 파싱 실패"), full_prompt
 
         except Exception as e:
@@ -472,6 +816,9 @@ class AnnouncementAnalyzer:
 class AnnouncementPrvAnalyzer:
     """공고 PRV 내용 분석 및 데이터 추출 (PRV용 별도 템플릿 사용)"""
 
+    # 스트리밍 조기 종료 판단용 응답 필수 키 (ollama_prv_template.txt 응답 형식)
+    RESPONSE_KEYS = ("EXTRACTED_TARGET", "EXTRACTED_TITLE", "IS_SUPPORT_PROGRAM")
+
     def __init__(self):
         self.ollama_client = OllamaClient()
         self.system_prompt = self._create_prv_system_prompt()
@@ -573,7 +920,7 @@ class AnnouncementPrvAnalyzer:
         elif "⚠️" in reason:
             logger.warning(f"PRV 인코딩 검증 경고: {reason}")
 
-        # Ollama 서버 상태 확인
+        # Ollama 서버 상태 확인 (서킷 브레이커 상태, 요청마다 헬스 체크하지 않음)
         if not self.ollama_client.is_available():
             logger.error("PRV Ollama 서버를 사용할 수 없음")
             return self._create_prv_empty_result("Ollama 서버 연결 실패"), ""
@@ -604,7 +951,8 @@ class AnnouncementPrvAnalyzer:
             # Ollama를 통해 분석 수행
             response = self.ollama_client.generate_response(
                 prompt=user_prompt,
-                system_prompt=self.system_prompt
+                system_prompt=self.system_prompt,
+                required_keys=self.RESPONSE_KEYS
             )
 
             if not response:
@@ -624,6 +972,8 @@ class AnnouncementPrvAnalyzer:
                 return parsed_result, full_prompt
             else:
                 logger.error("PRV JSON 파싱 실패")
+                # 파싱할 수 없는 응답은 캐시에 남기지 않음 (재처리 시 다시 생성)
+                self.ollama_client.discard_cached_response(user_prompt, self.system_prompt)
                 return self._create_prv_empty_result("응답 파싱 실패"), full_prompt
 
         except Exception as e:
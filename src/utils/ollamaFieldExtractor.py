@@ -2,17 +2,25 @@
 Ollama 기반 필드별 정보 추출 유틸리티
 
 LangExtract 대신 Ollama를 직접 사용하여 필드별로 정보를 추출합니다.
-각 필드별로 전문화된 프롬프트를 사용하여 정확도를 높입니다.
+
+추출 방식 (환경변수로 선택):
+- 일괄 추출 (OLLAMA_FIELD_ONE_SHOT=true, 기본): 모든 필드를 JSON 스키마(structured output)
+  요청 한 번으로 추출하고, 값이 비어 있는 필드만 필드별 프롬프트로 다시 요청
+- 필드별 추출 (OLLAMA_FIELD_ONE_SHOT=false): 필드별 전문 프롬프트로 개별 요청,
+  OLLAMA_FIELD_CONCURRENCY개까지 동시에 요청 (1이면 순차)
 """
 
 import os
 import json
+import re
 import requests
 import logging
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 
 try:
     from src.config.logConfig import setup_logging
+    from src.utils.llmResponseCache import LLMResponseCache, get_llm_response_cache
 except ImportError:
     # 절대 import 시도
     import sys
@@ -23,6 +31,7 @@ except ImportError:
     sys.path.insert(0, str(project_root))
     
     from src.config.logConfig import setup_logging
+    from src.utils.llmResponseCache import LLMResponseCache, get_llm_response_cache
 
 # 환경변수에서 로그 레벨 읽기
 try:
@@ -34,21 +43,62 @@ except ImportError:
 log_level = getattr(logging, os.getenv('LOG_LEVEL', 'INFO').upper(), logging.INFO)
 logger = setup_logging(__name__, log_level)
 
+NOT_FOUND = "찾을 수 없음"
+
+# 추출 필드 (결과 딕셔너리 순서)
+FIELDS = [
+    "지원대상", "시행기관", "제목", "지원내용",
+    "지원금액", "등록일", "접수기간", "모집일정"
+]
+
+# 일괄 추출용 필드 설명 (필드별 프롬프트의 요약)
+ONE_SHOT_FIELD_GUIDES = {
+    "지원대상": "이 지원사업에 신청할 수 있는 대상 (예: 중소기업, 소상공인, 개인사업자, 스타트업, 청년)",
+    "시행기관": "지원사업을 주관하는 기관 (예: 중소벤처기업부, 서울시, 한국산업기술진흥원)",
+    "제목": "공고의 공식 제목이나 사업명 (불필요한 기호나 번호 제외)",
+    "지원내용": "제공하는 지원의 종류 (예: 사업비 지원, 교육 지원, 컨설팅 지원, 시설비 지원)",
+    "지원금액": "구체적인 지원 금액이나 범위 (예: 최대 5,000만원, 3천만원 이내)",
+    "등록일": "공고 자체의 등록일(공고일) - 접수기간이나 심사일정이 아님",
+    "접수기간": "신청서 접수 시작일과 종료일",
+    "모집일정": "접수기간, 심사일정, 발표일 등 전체 일정",
+}
+
+_JSON_OBJECT_PATTERN = re.compile(r"\{.*\}", re.DOTALL)
+
 
 class OllamaFieldExtractor:
     """Ollama 기반 필드별 정보 추출기"""
     
-    def __init__(self):
+    def __init__(self, one_shot: Optional[bool] = None, max_concurrency: Optional[int] = None):
         # Ollama 설정
         self.model_id = os.getenv("OLLAMA_MODEL", "gpt-oss:20b")
         self.api_url = os.getenv("OLLAMA_API_URL", "http://localhost:11434").replace("/api", "").rstrip("/")
         self.timeout = int(os.getenv("OLLAMA_TIMEOUT", "120"))
         
-        logger.info(f"Ollama 필드 추출기 초기화 완료 - 모델: {self.model_id}, URL: {self.api_url}")
+        # 추출 방식: 일괄 추출 여부, 필드별 요청 동시 실행 수
+        if one_shot is None:
+            one_shot = os.getenv("OLLAMA_FIELD_ONE_SHOT", "true").lower() == "true"
+        self.one_shot = one_shot
+        self.max_concurrency = max(1, max_concurrency or int(os.getenv("OLLAMA_FIELD_CONCURRENCY", "4")))
+        self.options = {
+            "temperature": 0.1,
+            "top_p": 0.9
+        }
+        
+        # 응답 캐시 (프로세스 공유)
+        self.response_cache = get_llm_response_cache()
+        
+        logger.info(
+            f"Ollama 필드 추출기 초기화 완료 - 모델: {self.model_id}, URL: {self.api_url}, "
+            f"일괄 추출: {self.one_shot}, 동시 요청: {self.max_concurrency}"
+        )
     
     def extract_all_fields(self, content: str) -> Dict[str, Any]:
         """
-        공고 내용에서 모든 필드를 개별적으로 추출합니다.
+        공고 내용에서 모든 필드를 추출합니다.
+        
+        일괄 추출 모드에서는 한 번의 요청으로 모든 필드를 추출하고, 값이 비어 있는 필드만
+        필드별 프롬프트로 다시 요청합니다. 그 외에는 필드별 요청을 동시에 실행합니다.
         
         Args:
             content: 분석할 공고 내용 (content.md + 첨부파일)
@@ -56,35 +106,123 @@ class OllamaFieldExtractor:
         Returns:
             추출된 모든 필드 정보
         """
-        logger.info("Ollama 필드별 추출 시작")
-        
-        results = {}
-        
-        # 각 필드별로 순차 추출
-        fields = [
-            "지원대상", "시행기관", "제목", "지원내용", 
-            "지원금액", "등록일", "접수기간", "모집일정"
-        ]
+        if self.one_shot:
+            logger.info("Ollama 필드 일괄 추출 시작")
+            extracted = self._extract_fields_one_shot(content)
+            
+            # 비어 있거나 "찾을 수 없음"으로 답한 필드는 필드별 프롬프트로 다시 확인
+            missing = [field for field in FIELDS if extracted.get(field) in (None, "", NOT_FOUND)]
+            if missing:
+                logger.info(f"  일괄 추출에서 찾지 못한 필드 재요청: {', '.join(missing)}")
+                extracted.update(self._extract_fields_individually(missing, content))
+            
+            results = {field: extracted.get(field) or NOT_FOUND for field in FIELDS}
+            self._log_results(results)
+            logger.info(f"Ollama 필드 일괄 추출 완료 (요청 {1 + len(missing)}회)")
+            return results
         
-        for field in fields:
+        logger.info("Ollama 필드별 추출 시작")
+        results = self._extract_fields_individually(FIELDS, content)
+        self._log_results(results)
+        logger.info("Ollama 필드별 추출 완료")
+        return results
+    
+    def _extract_fields_individually(self, fields: List[str], content: str) -> Dict[str, str]:
+        """필드별 프롬프트로 추출합니다. (max_concurrency개까지 동시 요청)"""
+        def extract(field):
             try:
                 logger.info(f"  📋 {field} 추출 중...")
-                
-                extracted_value = self._extract_single_field(field, content)
-                results[field] = extracted_value
-                
-                # 결과 로깅
-                if extracted_value and extracted_value.strip() and extracted_value != "찾을 수 없음":
-                    logger.info(f"  ✓ {field} 추출 성공: {extracted_value[:50]}...")
-                else:
-                    logger.warning(f"  ⚠ {field} 추출 실패")
-                    
+                return self._extract_single_field(field, content)
             except Exception as e:
                 logger.error(f"  ❌ {field} 추출 중 오류: {e}")
-                results[field] = "찾을 수 없음"
+                return NOT_FOUND
         
-        logger.info("Ollama 필드별 추출 완료")
-        return results
+        workers = min(self.max_concurrency, len(fields))
+        if workers <= 1:
+            values = [extract(field) for field in fields]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="FieldExtract") as executor:
+                values = list(executor.map(extract, fields))
+        
+        return dict(zip(fields, values))
+    
+    def _log_results(self, results: Dict[str, str]) -> None:
+        for field, extracted_value in results.items():
+            if extracted_value and extracted_value.strip() and extracted_value != NOT_FOUND:
+                logger.info(f"  ✓ {field} 추출 성공: {extracted_value[:50]}...")
+            else:
+                logger.warning(f"  ⚠ {field} 추출 실패")
+    
+    def _build_one_shot_prompt(self, content: str) -> tuple[str, str, Dict[str, Any]]:
+        """일괄 추출용 (시스템 프롬프트, 사용자 프롬프트, JSON 스키마)를 생성합니다."""
+        field_lines = "\n".join(f"- {field}: {guide}" for field, guide in ONE_SHOT_FIELD_GUIDES.items())
+        system_prompt = f"""당신은 공고 문서에서 핵심 정보를 정확히 찾는 전문가입니다.
+공고 내용을 분석하여 아래 항목을 각각 간단명료하게 추출하고, 항목명을 키로 하는 JSON 객체로만 답변하세요.
+{field_lines}
+찾을 수 없는 항목은 "{NOT_FOUND}"으로 답변하세요."""
+        
+        user_prompt = f"다음 공고 내용에서 {', '.join(FIELDS)}을(를) 찾아주세요:\n\n{content[:3000]}..."  # 필드별 추출과 같이 첫 3000자만 사용
+        
+        schema = {
+            "type": "object",
+            "properties": {field: {"type": "string"} for field in FIELDS},
+            "required": FIELDS,
+        }
+        return system_prompt, user_prompt, schema
+    
+    def _extract_fields_one_shot(self, content: str) -> Dict[str, str]:
+        """
+        모든 필드를 한 번의 structured output 요청으로 추출합니다.
+        
+        Returns:
+            {필드명: 정제된 값} - 응답에 없거나 빈 값인 필드는 포함하지 않음
+        """
+        try:
+            system_prompt, user_prompt, schema = self._build_one_shot_prompt(content)
+            
+            print("    🔍 전체 필드 일괄 추출 중...")
+            
+            response = self._call_ollama(system_prompt, user_prompt, response_format=schema)
+            if not response:
+                return {}
+            
+            parsed = self._parse_one_shot_response(response)
+            if parsed is None:
+                logger.warning("일괄 추출 응답을 JSON으로 파싱할 수 없음 - 필드별 추출로 대체")
+                # 파싱할 수 없는 응답이 다음 처리 때 캐시에서 재사용되지 않도록 삭제
+                self.response_cache.discard(self._cache_key(system_prompt, user_prompt, schema))
+                return {}
+            
+            extracted = {}
+            for field in FIELDS:
+                value = parsed.get(field)
+                if isinstance(value, list):
+                    value = ", ".join(str(item) for item in value)
+                if value is None or not str(value).strip():
+                    continue
+                extracted[field] = self._clean_extracted_value(str(value))
+            return extracted
+            
+        except Exception as e:
+            print(f"    ❌ 일괄 추출 오류: {e}")
+            logger.error(f"일괄 추출 중 오류: {e}")
+            return {}
+    
+    def _parse_one_shot_response(self, response: str) -> Optional[Dict[str, Any]]:
+        """일괄 추출 응답에서 JSON 객체를 파싱합니다. (스키마 미지원 모델의 코드 블록/설명 문장 허용)"""
+        candidates = [response.strip()]
+        match = _JSON_OBJECT_PATTERN.search(response)
+        if match:
+            candidates.append(match.group(0))
+        
+        for candidate in candidates:
+            try:
+                parsed = json.loads(candidate)
+            except ValueError:
+                continue
+            if isinstance(parsed, dict):
+                return parsed
+        return None
     
     def _extract_single_field(self, field_name: str, content: str) -> str:
         """
@@ -168,8 +306,22 @@ class OllamaFieldExtractor:
         
         return system_prompt, user_prompt
     
-    def _call_ollama(self, system_prompt: str, user_prompt: str) -> Optional[str]:
-        """Ollama API를 직접 호출합니다."""
+    def _cache_key(self, system_prompt: str, user_prompt: str, response_format: Optional[Dict[str, Any]] = None) -> str:
+        cache_options = dict(self.options, format=response_format) if response_format else self.options
+        return LLMResponseCache.compute_key(self.model_id, system_prompt, user_prompt, cache_options)
+    
+    def _call_ollama(self, system_prompt: str, user_prompt: str, use_cache: bool = True, response_format: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Ollama API를 직접 호출합니다. (같은 입력의 캐시된 응답이 있으면 생성 생략)
+        
+        response_format: JSON 스키마를 지정하면 structured output(format)으로 요청
+        """
+        cache_key = self._cache_key(system_prompt, user_prompt, response_format)
+        cached = self.response_cache.get(cache_key) if use_cache else None
+        if cached:
+            logger.debug(f"LLM 응답 캐시 적중, 내용 길이: {len(cached)}")
+            return cached
+        
         try:
             payload = {
                 "model": self.model_id,
@@ -178,11 +330,10 @@ class OllamaFieldExtractor:
                     {"role": "user", "content": user_prompt}
                 ],
                 "stream": False,
-                "options": {
-                    "temperature": 0.1,
-                    "top_p": 0.9
-                }
+                "options": self.options
             }
+            if response_format:
+                payload["format"] = response_format
             
             url = f"{self.api_url}/api/chat"
             logger.debug(f"Ollama API 호출: {url}")
@@ -197,6 +348,7 @@ class OllamaFieldExtractor:
                 result = response.json()
                 content = result.get("message", {}).get("content", "")
                 logger.debug(f"API 응답 성공, 내용 길이: {len(content)}")
+                self.response_cache.put(cache_key, content, model=self.model_id)
                 return content
             else:
                 logger.error(f"Ollama API 오류 {response.status_code}: {response.text}")
@@ -232,7 +384,8 @@ class OllamaFieldExtractor:
             # 간단한 테스트
             response = self._call_ollama(
                 "당신은 문서에서 연도를 찾는 전문가입니다.", 
-                "다음 문서에서 연도를 찾아주세요: 테스트 문서입니다. 오늘은 2025년입니다."
+                "다음 문서에서 연도를 찾아주세요: 테스트 문서입니다. 오늘은 2025년입니다.",
+                use_cache=False  # 연결 확인이므로 캐시 사용 안 함
             )
             
             if response and "2025" in response:
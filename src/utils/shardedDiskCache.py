@@ -0,0 +1,194 @@
+"""
+샤딩된 디스크 캐시 공통 구현
+
+ConversionCache(첨부파일 변환 결과)와 LLMResponseCache(LLM 응답)가 공유하는
+저장 방식입니다. 하위 클래스는 캐시 키 계산과 항목 내용(직렬화/역직렬화)만 정의합니다.
+
+캐시 구조:
+{cache_dir}/
+├── ab/
+│   └── ab12...ef{ENTRY_SUFFIX}    # 키 앞 2자리로 샤딩
+└── ...
+
+- 적중 시 파일 mtime을 갱신하여 LRU 순서를 유지합니다.
+- 전체 크기가 max_size_mb를 넘으면 오래 사용되지 않은 항목부터 상한의 90%까지 삭제합니다.
+- 여러 프로세스가 같은 디렉토리를 공유해도 되도록 임시 파일 → os.replace로 기록합니다.
+"""
+
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.config.logConfig import setup_logging
+
+logger = setup_logging(__name__)
+
+
+class ShardedDiskCache(ABC):
+    """키 앞 2자리로 샤딩하고 mtime LRU로 크기를 제한하는 디스크 캐시"""
+
+    # 하위 클래스에서 지정
+    ENTRY_SUFFIX = ".cache"
+    CACHE_LABEL = "디스크 캐시"  # 로그 메시지용 이름
+
+    def __init__(self, cache_dir: str | Path, max_size_mb: int, enabled: bool = True):
+        self.enabled = enabled
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = int(max_size_mb) * 1024 * 1024
+
+        self._lock = threading.Lock()
+        self._current_size = None  # 첫 저장 시 계산
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+        if self.enabled:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                logger.warning(f"{self.CACHE_LABEL} 디렉토리 생성 실패, 캐시 비활성화: {e}")
+                self.enabled = False
+
+    @abstractmethod
+    def _dump_entry(self, value: Any, **metadata) -> bytes:
+        """저장할 값을 항목 파일 내용으로 변환합니다."""
+
+    @abstractmethod
+    def _load_entry(self, entry_path: Path, data: str) -> Optional[Any]:
+        """항목 파일 내용에서 값을 꺼냅니다. None이면 미스로 처리합니다. (만료 등)"""
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{self.ENTRY_SUFFIX}"
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self.stats[stat] += 1
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시된 값을 반환합니다. 없으면 None."""
+        if not self.enabled:
+            return None
+
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, "r", encoding="utf-8") as f:
+                value = self._load_entry(entry_path, f.read())
+        except FileNotFoundError:
+            self._count("misses")
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"{self.CACHE_LABEL} 읽기 실패 ({entry_path.name}): {e}")
+            self._count("misses")
+            return None
+
+        if value is None:
+            self._count("misses")
+            return None
+
+        # LRU 순서 갱신
+        try:
+            os.utime(entry_path, None)
+        except OSError:
+            pass
+
+        self._count("hits")
+        return value
+
+    def put(self, key: str, value: Any, **metadata) -> None:
+        """값을 캐시에 저장합니다."""
+        if not self.enabled or not value:
+            return
+
+        entry_path = self._entry_path(key)
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            data = self._dump_entry(value, **metadata)
+
+            fd, tmp_path = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, entry_path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+
+            with self._lock:
+                self.stats["stores"] += 1
+                if self._current_size is None:
+                    self._current_size = self._scan_size()
+                else:
+                    self._current_size += len(data)
+                over_limit = self._current_size > self.max_size_bytes
+
+            if over_limit:
+                self._evict()
+
+        except Exception as e:
+            logger.warning(f"{self.CACHE_LABEL} 저장 실패 ({entry_path.name}): {e}")
+
+    def discard(self, key: str) -> None:
+        """항목을 삭제합니다."""
+        if self.enabled:
+            self._remove(self._entry_path(key))
+
+    def _remove(self, entry_path: Path) -> None:
+        try:
+            size = entry_path.stat().st_size
+            os.unlink(entry_path)
+        except OSError:
+            return
+        with self._lock:
+            if self._current_size is not None:
+                self._current_size -= size
+
+    def _iter_entries(self):
+        for shard in os.scandir(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(self.ENTRY_SUFFIX):
+                    yield entry
+
+    def _scan_size(self) -> int:
+        return sum(entry.stat().st_size for entry in self._iter_entries())
+
+    def _evict(self) -> None:
+        """최근 사용 시각(mtime)이 오래된 항목부터 삭제하여 상한의 90%까지 줄입니다."""
+        target_size = int(self.max_size_bytes * 0.9)
+
+        with self._lock:
+            # 다른 프로세스가 같은 디렉토리를 쓰므로 실제 크기를 다시 계산
+            entries = []
+            total_size = 0
+            for entry in self._iter_entries():
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_size += stat.st_size
+
+            entries.sort()
+            evicted = 0
+            for _, size, path in entries:
+                if total_size <= target_size:
+                    break
+                try:
+                    os.unlink(path)
+                    total_size -= size
+                    evicted += 1
+                except FileNotFoundError:
+                    total_size -= size
+
+            self._current_size = total_size
+            self.stats["evictions"] += evicted
+
+        if evicted:
+            logger.info(
+                f"{self.CACHE_LABEL} 정리: {evicted}개 삭제 (현재 {total_size / 1024 / 1024:.1f}MB)"
+            )
+
+    def get_stats(self) -> Dict[str, int]:
+        """적중/미스 통계를 반환합니다."""
+        with self._lock:
+            return dict(self.stats)
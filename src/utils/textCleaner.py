@@ -15,6 +15,7 @@ EXTRACTED_TEXT 필드에서 원하지 않는 특수문자를 제거하는 유틸
 - 일반적인 한국어 문서에서 사용되는 기호들
 """
 
+import logging
 import re
 import unicodedata
 
@@ -113,6 +114,50 @@ def should_remove_char(char: str) -> bool:
     return False
 
 
+def _classify_code_point(code_point: int) -> int | None:
+    """
+    clean_extracted_text의 문자 필터 규칙으로 코드 포인트를 분류합니다.
+
+    Returns:
+        유지할 문자이면 code_point, 제거할 문자이면 None (str.translate 매핑 값)
+    """
+    char = chr(code_point)
+
+    # 1단계: 명시적 제거 패턴
+    if should_remove_char(char):
+        return None
+
+    # 2단계: 의미있는 문자
+    if is_meaningful_char(char):
+        return code_point
+
+    # CJK 표의문자 범위 내의 일반적인 한자는 보존 (한국어 문서에서 가끔 사용됨)
+    if 0x4E00 <= code_point <= 0x9FFF:
+        if unicodedata.name(char, "").startswith("CJK IDEOGRAPH"):
+            return code_point
+
+    return None
+
+
+class _CharFilterTable(dict):
+    """
+    str.translate용 코드 포인트 분류 테이블
+
+    문자 판정은 문자 자체에만 의존하므로, 처음 등장한 코드 포인트만
+    패턴/유니코드 속성 검사로 분류하고 이후에는 캐시된 결과를 사용합니다.
+    """
+
+    def __missing__(self, code_point: int) -> int | None:
+        value = _classify_code_point(code_point)
+        self[code_point] = value
+        return value
+
+
+_CHAR_FILTER_TABLE = _CharFilterTable()
+
+_WHITESPACE_RUN = re.compile(r"\s+")
+
+
 # 가이드 문서 및 무관한 섹션 패턴 정의
 GUIDE_SECTION_PATTERNS = [
     r"소상공인\s*확인\s*기준.*?(?=\n\n|\n[가-힣]{2,}|\Z)",
@@ -235,59 +280,24 @@ def clean_extracted_text(text: str | None, remove_guides: bool = True) -> str:
         cleaned_text = remove_guide_sections(cleaned_text)
         cleaned_text = mask_date_patterns(cleaned_text)
 
-    # 1단계: 명시적 제거 패턴 적용
-    removed_chars = set()
-
-    for pattern in REMOVAL_PATTERNS:
-        matches = re.findall(pattern, cleaned_text)
-        if matches:
-            removed_chars.update(matches)
-            cleaned_text = re.sub(pattern, "", cleaned_text)
-
-    # 2단계: 문자별 검증
-    final_chars = []
-    additional_removed = set()
-
-    for char in cleaned_text:
-        if should_remove_char(char):
-            additional_removed.add(char)
-            continue
-
-        if is_meaningful_char(char):
-            final_chars.append(char)
-        else:
-            # 의미없는 문자로 판단되는 경우
-            code_point = ord(char)
-
-            # CJK 표의문자 범위 내의 알려지지 않은 문자들 제거
-            if 0x4E00 <= code_point <= 0x9FFF:
-                # 하지만 일반적인 한자는 보존 (한국어 문서에서 가끔 사용됨)
-                try:
-                    char_name = unicodedata.name(char, "")
-                    # 'CJK IDEOGRAPH'로 시작하는 일반적인 한자는 보존
-                    if char_name.startswith("CJK IDEOGRAPH"):
-                        final_chars.append(char)
-                    else:
-                        additional_removed.add(char)
-                except ValueError:
-                    # 이름을 찾을 수 없는 문자는 제거
-                    additional_removed.add(char)
-            else:
-                additional_removed.add(char)
+    # 1~2단계: 제거 패턴 + 문자별 검증을 코드 포인트 분류 테이블로 한 번에 적용
+    # (_classify_code_point 참고 - 문자 단위 판정 결과는 기존 규칙과 동일)
+    result = cleaned_text.translate(_CHAR_FILTER_TABLE)
 
     # 3단계: 연속된 공백 정리
-    result = "".join(final_chars)
-    result = re.sub(r"\s+", " ", result)  # 연속된 공백을 하나로
+    result = _WHITESPACE_RUN.sub(" ", result)  # 연속된 공백을 하나로
     result = result.strip()  # 앞뒤 공백 제거
 
-    # 로깅
-    final_length = len(result)
-    if removed_chars or additional_removed:
-        all_removed = removed_chars.union(additional_removed)
-        logger.debug(f"텍스트 정리 완료: {original_length} -> {final_length} 문자")
-        logger.debug(
-            f"제거된 특수문자: {list(all_removed)[:20]}..."
-        )  # 처음 20개만 로깅
+    # 로깅 (제거 문자 집계는 DEBUG일 때만 수행)
+    if logger.isEnabledFor(logging.DEBUG):
+        all_removed = {
+            char for char in set(cleaned_text) if _CHAR_FILTER_TABLE[ord(char)] is None
+        }
+        if all_removed:
+            logger.debug(f"텍스트 정리 완료: {original_length} -> {len(result)} 문자")
+            logger.debug(
+                f"제거된 특수문자: {list(all_removed)[:20]}..."
+            )  # 처음 20개만 로깅
 
     return result
 
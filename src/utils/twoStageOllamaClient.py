@@ -41,6 +41,10 @@ logger = setup_logging(__name__, log_level)
 class TwoStageOllamaClient:
     """2단계 Ollama 처리 클라이언트"""
     
+    # 스트리밍 조기 종료 판단용 단계별 응답 필수 키 (각 템플릿의 응답 형식)
+    SIMPLE_RESPONSE_KEYS = ("지원대상", "제목", "지원내용")
+    FORMAT_RESPONSE_KEYS = ("SBVT_TITLE", "ANNC_DT", "SPOT_CONTS")
+    
     def __init__(self):
         self.ollama_client = OllamaClient()
         self.simple_prompt_template = self._load_simple_template()
@@ -160,7 +164,8 @@ class TwoStageOllamaClient:
             # Ollama를 통해 분석 수행
             response = self.ollama_client.generate_response(
                 prompt=user_prompt,
-                system_prompt=self.simple_prompt_template
+                system_prompt=self.simple_prompt_template,
+                required_keys=self.SIMPLE_RESPONSE_KEYS
             )
             
             duration = time.time() - start_time
@@ -180,6 +185,8 @@ class TwoStageOllamaClient:
                 return parsed_result, full_prompt, duration
             else:
                 logger.error("1단계 JSON 파싱 실패")
+                # 파싱할 수 없는 응답은 캐시에 남기지 않음 (재처리 시 다시 생성)
+                self.ollama_client.discard_cached_response(user_prompt, self.simple_prompt_template)
                 return self._create_empty_simple_result("1단계 응답 파싱 실패"), full_prompt, duration
                 
         except Exception as e:
@@ -230,7 +237,8 @@ class TwoStageOllamaClient:
             # Ollama를 통해 분석 수행
             response = self.ollama_client.generate_response(
                 prompt=user_prompt,
-                system_prompt=self.format_prompt_template
+                system_prompt=self.format_prompt_template,
+                required_keys=self.FORMAT_RESPONSE_KEYS
             )
             
             duration = time.time() - start_time
@@ -250,6 +258,7 @@ class TwoStageOllamaClient:
                 return parsed_result, full_prompt, duration
             else:
                 logger.error("2단계 JSON 파싱 실패")
+                self.ollama_client.discard_cached_response(user_prompt, self.format_prompt_template)
                 return self._create_empty_format_result("2단계 응답 파싱 실패"), full_prompt, duration
                 
         except Exception as e:
@@ -26,6 +26,9 @@ from .domainKeyExtractor import DomainKeyExtractor
 class UrlRegistryManager:
     """URL 레지스트리 통합 관리자"""
 
+    # executemany 1회당 행 수 (INSERT는 multi-row VALUES로 변환됨)
+    BULK_CHUNK_SIZE = 1000
+
     def __init__(self, db_connection_pool=None, db_config=None):
         """
         Args:
@@ -245,35 +248,39 @@ class UrlRegistryManager:
         Returns:
             수신 개수
         """
+        # URL 키 일괄 추출 (도메인별 그룹 처리, DB 조회 없음)
+        urls = [api_data['url'] for api_data in api_data_list]
+        url_keys, _ = self.key_extractor.bulk_extract_keys(urls)
+
+        rows = []
+        for api_data, url, url_key in zip(api_data_list, urls, url_keys):
+            if not url_key:
+                print(f"⚠️  URL 키 추출 실패 (건너뜀): {url}")
+                continue
+
+            rows.append((
+                url_key, url,
+                api_source, api_batch_id,
+                json.dumps(api_data.get('raw_data', {}), ensure_ascii=False)
+            ))
+
         conn = self._get_connection()
         cursor = conn.cursor()
 
         try:
             inserted_count = 0
 
-            for api_data in api_data_list:
-                url = api_data['url']
-                raw_data = api_data.get('raw_data', {})
-
-                # URL 키 추출
-                url_key = self.key_extractor.extract_url_key(url)
-                if not url_key:
-                    print(f"⚠️  URL 키 추출 실패 (건너뜀): {url}")
-                    continue
-
-                # API 버퍼에 저장
-                cursor.execute("""
+            # API 버퍼에 청크 단위로 저장 (한 트랜잭션)
+            for start in range(0, len(rows), self.BULK_CHUNK_SIZE):
+                chunk = rows[start:start + self.BULK_CHUNK_SIZE]
+                cursor.executemany("""
                     INSERT INTO api_url_buffer (
                         url_key, origin_url, api_source,
                         api_batch_id, api_raw_data
                     ) VALUES (%s, %s, %s, %s, %s)
-                """, (
-                    url_key, url,
-                    api_source, api_batch_id,
-                    json.dumps(raw_data, ensure_ascii=False)
-                ))
+                """, chunk)
 
-                inserted_count += 1
+                inserted_count += len(chunk)
 
             conn.commit()
             print(f"✅ API 데이터 {inserted_count}개 수신 완료")
@@ -302,68 +309,56 @@ class UrlRegistryManager:
             }
         """
         conn = self._get_connection()
-        cursor = conn.cursor(dictionary=True)
+        cursor = conn.cursor()
 
         try:
-            # 최적화된 단일 쿼리로 중복 검사
+            # 결과별 집합 UPDATE 3회 (한 트랜잭션)
+            # 스크래핑 완료 매칭을 먼저 처리하므로, 완료/진행중 레코드가 모두 매칭되면 duplicate 우선
+
+            # 1. 스크래핑 완료 → API 버림!
             cursor.execute("""
-                SELECT
-                    a.id as api_id,
-                    a.url_key_hash,
-                    a.url_key,
-                    s.id as scraped_id,
-                    s.processing_status
-                FROM api_url_buffer a
-                LEFT JOIN scraped_url_registry s
+                UPDATE api_url_buffer a
+                JOIN scraped_url_registry s
                     ON a.url_key_hash = s.url_key_hash
+                SET a.dedup_status = 'duplicate',
+                    a.scraped_url_id = s.id,
+                    a.dedup_checked_at = CURRENT_TIMESTAMP
                 WHERE a.api_batch_id = %s
                   AND a.dedup_status = 'pending'
+                  AND s.processing_status = 'completed'
             """, (api_batch_id,))
+            duplicate_count = cursor.rowcount
 
-            api_urls = cursor.fetchall()
+            # 2. 스크래핑 진행중 → API 대기
+            cursor.execute("""
+                UPDATE api_url_buffer a
+                JOIN scraped_url_registry s
+                    ON a.url_key_hash = s.url_key_hash
+                SET a.dedup_status = 'scraped_pending',
+                    a.scraped_url_id = s.id,
+                    a.dedup_checked_at = CURRENT_TIMESTAMP
+                WHERE a.api_batch_id = %s
+                  AND a.dedup_status = 'pending'
+            """, (api_batch_id,))
+            scraped_pending_count = cursor.rowcount
+
+            # 3. 스크래핑 없음 → API 유효! (1, 2에서 처리되지 않은 나머지)
+            cursor.execute("""
+                UPDATE api_url_buffer
+                SET dedup_status = 'unique',
+                    dedup_checked_at = CURRENT_TIMESTAMP
+                WHERE api_batch_id = %s
+                  AND dedup_status = 'pending'
+            """, (api_batch_id,))
+            unique_count = cursor.rowcount
 
             stats = {
-                'total': len(api_urls),
-                'duplicate': 0,
-                'unique': 0,
-                'scraped_pending': 0
+                'total': duplicate_count + scraped_pending_count + unique_count,
+                'duplicate': duplicate_count,
+                'unique': unique_count,
+                'scraped_pending': scraped_pending_count
             }
 
-            for api_url in api_urls:
-                if api_url['scraped_id']:
-                    # 스크래핑 데이터 존재!
-                    if api_url['processing_status'] == 'completed':
-                        # 완료 → API 버림!
-                        cursor.execute("""
-                            UPDATE api_url_buffer
-                            SET dedup_status = 'duplicate',
-                                scraped_url_id = %s,
-                                dedup_checked_at = CURRENT_TIMESTAMP
-                            WHERE id = %s
-                        """, (api_url['scraped_id'], api_url['api_id']))
-                        stats['duplicate'] += 1
-
-                    else:
-                        # 진행중 → API 대기
-                        cursor.execute("""
-                            UPDATE api_url_buffer
-                            SET dedup_status = 'scraped_pending',
-                                scraped_url_id = %s,
-                                dedup_checked_at = CURRENT_TIMESTAMP
-                            WHERE id = %s
-                        """, (api_url['scraped_id'], api_url['api_id']))
-                        stats['scraped_pending'] += 1
-
-                else:
-                    # 스크래핑 없음 → API 유효!
-                    cursor.execute("""
-                        UPDATE api_url_buffer
-                        SET dedup_status = 'unique',
-                            dedup_checked_at = CURRENT_TIMESTAMP
-                        WHERE id = %s
-                    """, (api_url['api_id'],))
-                    stats['unique'] += 1
-
             conn.commit()
 
             print(f"\n중복 제거 완료:")
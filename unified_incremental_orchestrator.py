@@ -18,11 +18,15 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import hashlib
 import unicodedata
 
+from src.utils.nodeScraperService import NodeDetailScraperService, NodeScraperServiceError
+
 class UnifiedIncrementalOrchestrator:
-    def __init__(self, test_mode=False, specific_sites=None, verbose=False):
+    def __init__(self, test_mode=False, specific_sites=None, verbose=False, use_detail_service=True):
         self.test_mode = test_mode
         self.specific_sites = specific_sites
         self.verbose = verbose
+        self.use_detail_service = use_detail_service
+        self.detail_service = None
         
         # 환경 변수 로드
         try:
@@ -239,39 +243,34 @@ class UnifiedIncrementalOrchestrator:
         if self.verbose:
             cmd.append('--verbose')
         
+        job_options = {
+            'site': site_code,
+            'url': announcement.get('url', ''),
+            'outputDir': str(output_dir),
+            'folderName': folder_name,
+            'title': announcement.get('title', ''),
+            'date': announcement.get('date', ''),
+            'onclick': announcement.get('onclick', ''),
+            'dataAction': announcement.get('dataAction', ''),
+            'verbose': self.verbose
+        }
+        
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            # stderr 디버그 출력
-            if self.verbose and result.stderr:
-                for line in result.stderr.split('\n'):
-                    if line.strip():
-                        self.logger.debug(f'[{site_code}] {line}')
+            response = self.run_detail_scraper(site_code, cmd, job_options)
             
-            if result.returncode == 0:
-                # 성공 응답 파싱
-                try:
-                    response = json.loads(result.stdout)
-                    if response['status'] == 'success':
-                        self.logger.info(f'  ✅ DOWNLOADED: [{announcement["id"]}] {announcement["title"][:50]}...')
-                        self.stats['downloaded'] += 1
-                        
-                        # DB에 저장
-                        self.save_to_database(site_code, announcement, folder_name, response.get('actualTitle'))
-                        return True
-                except:
-                    pass
+            if response and response.get('status') == 'success':
+                self.logger.info(f'  ✅ DOWNLOADED: [{announcement["id"]}] {announcement["title"][:50]}...')
+                self.stats['downloaded'] += 1
+                
+                # DB에 저장
+                self.save_to_database(site_code, announcement, folder_name, response.get('actualTitle'))
+                return True
             
             self.logger.error(f'  ❌ FAILED: [{announcement["id"]}] {announcement["title"][:50]}...')
             self.stats['errors'] += 1
             return False
             
-        except subprocess.TimeoutExpired:
+        except (subprocess.TimeoutExpired, TimeoutError):
             self.logger.error(f'  ⏱️  TIMEOUT: [{announcement["id"]}] {announcement["title"][:50]}...')
             self.stats['errors'] += 1
             return False
@@ -280,6 +279,44 @@ class UnifiedIncrementalOrchestrator:
             self.stats['errors'] += 1
             return False
     
+    def run_detail_scraper(self, site_code, cmd, job_options):
+        """상세 스크래퍼 실행 (상주 서비스 우선, 사용 불가 시 공고별 node 프로세스)"""
+        if self.use_detail_service:
+            if self.detail_service is None:
+                self.detail_service = NodeDetailScraperService(log_stderr=self.verbose)
+            try:
+                return self.detail_service.submit('unified', job_options, timeout=60)
+            except NodeScraperServiceError as e:
+                self.logger.warning(f'상세 스크래퍼 서비스 사용 불가, 프로세스 실행으로 대체: {e}')
+        
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=60
+        )
+        
+        # stderr 디버그 출력
+        if self.verbose and result.stderr:
+            for line in result.stderr.split('\n'):
+                if line.strip():
+                    self.logger.debug(f'[{site_code}] {line}')
+        
+        if result.returncode != 0:
+            return None
+        
+        # 성공 응답 파싱
+        try:
+            return json.loads(result.stdout)
+        except ValueError:
+            return None
+    
+    def close_detail_service(self):
+        """상세 스크래퍼 상주 서비스 종료"""
+        if self.detail_service is not None:
+            self.detail_service.close()
+            self.detail_service = None
+    
     def save_to_database(self, site_code, announcement, folder_name, actual_title=None):
         """DB에 저장"""
         conn = mysql.connector.connect(**self.db_config)
@@ -448,16 +485,22 @@ def main():
     parser.add_argument('--pages', type=int, default=3, help='수집할 페이지 수 (기본: 3)')
     parser.add_argument('--test', action='store_true', help='테스트 모드 (사이트당 2개만 처리)')
     parser.add_argument('--verbose', '-v', action='store_true', help='상세 로그 출력')
+    parser.add_argument('--no-detail-service', action='store_true',
+                        help='상주 상세 스크래퍼 서비스 대신 공고마다 node 프로세스 실행')
     
     args = parser.parse_args()
     
     orchestrator = UnifiedIncrementalOrchestrator(
         test_mode=args.test,
         specific_sites=args.sites,
-        verbose=args.verbose
+        verbose=args.verbose,
+        use_detail_service=not args.no_detail_service
     )
     
-    success = orchestrator.run(sites=args.sites, pages=args.pages)
+    try:
+        success = orchestrator.run(sites=args.sites, pages=args.pages)
+    finally:
+        orchestrator.close_detail_service()
     sys.exit(0 if success else 1)
 
 if __name__ == '__main__':